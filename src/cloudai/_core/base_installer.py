@@ -20,13 +20,17 @@ import shutil
 import subprocess
 from abc import ABC, abstractmethod
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import Iterable, Optional, final
+from typing import Callable, ClassVar, Iterable, Optional, final
 
 from cloudai.util import prepare_output_dir
 
+from .git_mirror import GitMirrorStore
+from .install_manifest import InstallManifest
+from .install_plan import InstallPlan
 from .install_status_result import InstallStatusResult
-from .installables import Installable
+from .installables import DockerImage, GitRepo, HFModel, Installable
 from .system import System
+from .uv_env import UvEnvBuilder
 
 TASK_LIMIT_THRESHOLD = 256
 
@@ -40,8 +44,11 @@ class BaseInstaller(ABC):
 
     Attributes
         system (System): The system schema object.
+        RESOURCE_LIMITS (dict[str, int]): Number of items of each resource class installed concurrently.
     """
 
+    RESOURCE_LIMITS: ClassVar[dict[str, int]] = {"network": 8, "import": 4, "cpu": 4}
+
     def __init__(self, system: System):
         """
         Initialize the BaseInstaller with a system object.
@@ -51,6 +58,8 @@ class BaseInstaller(ABC):
         """
         self.system = system
         self._low_thread_env = None
+        self._git_mirrors: Optional[GitMirrorStore] = None
+        self._uv: Optional[UvEnvBuilder] = None
         logging.debug(f"BaseInstaller initialized for {self.system.scheduler}.")
 
     @property
@@ -68,6 +77,27 @@ class BaseInstaller(ABC):
             self._low_thread_env = self._check_low_thread_environment(threshold)
         return self._low_thread_env
 
+    @property
+    def git_mirrors(self) -> Optional[GitMirrorStore]:
+        """Shared git object store for GitRepo installables, None unless enabled with the system's ``git_mirror``."""
+        config = self.system.git_mirror
+        if config is None:
+            return None
+        if self._git_mirrors is None:
+            root = config.path or self.system.install_path / ".git-mirrors"
+            self._git_mirrors = GitMirrorStore(root, config, self.is_low_thread_environment)
+        return self._git_mirrors
+
+    @property
+    def uv(self) -> Optional[UvEnvBuilder]:
+        """Builder of PythonExecutable virtual environments, None unless enabled with the system's ``uv``."""
+        config = self.system.uv
+        if config is None:
+            return None
+        if self._uv is None:
+            self._uv = UvEnvBuilder(config.cache_dir or self.system.install_path / ".uv-cache", config)
+        return self._uv
+
     def _check_low_thread_environment(self, threshold: int = TASK_LIMIT_THRESHOLD) -> bool:
         try:
             result = subprocess.run(
@@ -98,6 +128,22 @@ class BaseInstaller(ABC):
         """
         return 1 if self.is_low_thread_environment else None
 
+    def resource_class(self, item: Installable) -> str:
+        """
+        Get the resource class of an item, items of one class share a concurrency limit during installation.
+
+        Args:
+            item (Installable): The item to classify.
+
+        Returns:
+            str: One of the keys of RESOURCE_LIMITS.
+        """
+        if isinstance(item, DockerImage):
+            return "import"
+        if isinstance(item, (GitRepo, HFModel)):
+            return "network"
+        return "cpu"
+
     def _is_binary_installed(self, binary_name: str) -> bool:
         """
         Check if a given binary is installed on the system.
@@ -123,6 +169,9 @@ class BaseInstaller(ABC):
         logging.debug("Checking for common prerequisites.")
         return InstallStatusResult(True)
 
+    def load_manifest(self) -> InstallManifest:
+        return InstallManifest(self.system.install_path, type(self).__name__).load()
+
     def all_items(self, items: Iterable[Installable], with_duplicates: bool = False) -> list[Installable]:
         all_items = list(items) + self.system.system_installables()
         return list(set(all_items)) if not with_duplicates else all_items
@@ -132,7 +181,8 @@ class BaseInstaller(ABC):
         """
         Check if the installable items are installed.
 
-        Verify the installation status of each item.
+        Verify the installation status of all items in parallel. Items recorded in the install manifest with an
+        unchanged fingerprint are confirmed without running their checks.
 
         Args:
             items (Iterable[Installable]): Items to check for installation.
@@ -148,12 +198,26 @@ class BaseInstaller(ABC):
                 "This is expected if the path only exists on compute nodes."
             )
 
-        install_results: dict[Installable, InstallStatusResult] = {}
-        for item in self.all_items(items):
+        manifest = self.load_manifest()
+
+        def check(item: Installable) -> InstallStatusResult:
+            if manifest.confirm(item):
+                logging.debug(f"Installation check for {item!r}: confirmed by the install manifest")
+                return InstallStatusResult(True)
+
             logging.debug(f"Installation check for {item!r}")
             result = self.is_installed_one(item)
             logging.debug(f"Installation check for {item!r}: {result.success}, {result.message}")
-            install_results[item] = result
+            if result.success:
+                manifest.record(item)
+            else:
+                manifest.forget(item)
+            return result
+
+        all_items = self.all_items(items)
+        with ThreadPoolExecutor(max_workers=self.num_workers) as executor:
+            install_results = dict(zip(all_items, executor.map(check, all_items), strict=True))
+        manifest.save()
 
         self._populate_successful_install(items, install_results)
 
@@ -169,12 +233,19 @@ class BaseInstaller(ABC):
         return InstallStatusResult(True, "All test templates are installed.")
 
     @final
-    def install(self, items: Iterable[Installable]) -> InstallStatusResult:
+    def install(
+        self,
+        items: Iterable[Installable],
+        on_installed: Optional[Callable[[Installable, InstallStatusResult], None]] = None,
+    ) -> InstallStatusResult:
         """
         Install the necessary components if they are not already installed.
 
         Args:
             items (Iterable[TestTemplate]): items to install.
+            on_installed (Optional[Callable[[Installable, InstallStatusResult], None]]): Called from a worker thread
+                with every item and its result as soon as the item is done. Successfully installed items and their
+                duplicates are marked as installed before the call.
 
         Returns:
             InstallStatusResult: Result containing the installation status and error message if any.
@@ -193,27 +264,17 @@ class BaseInstaller(ABC):
 
         logging.debug(f"Going to install {len(set(items))} uniq item(s) (total is {len(list(items))})")
 
-        install_results: dict[Installable, InstallStatusResult] = {}
-        with ThreadPoolExecutor(max_workers=self.num_workers) as executor:
-            futures = {executor.submit(self.install_one, item): item for item in self.all_items(items)}
-            total, done = len(futures), 0
-            for future in as_completed(futures):
-                item = futures[future]
-                try:
-                    result = future.result()
-                    done += 1
-                    msg = f"{done}/{total} Installation of {item!r}: {result.message if result.message else 'OK'}"
-                    install_results[item] = result
-                    if result.success:
-                        logging.info(msg)
-                    else:
-                        logging.error(msg)
-                except Exception as e:
-                    done += 1
-                    logging.error(f"{done}/{total} Installation failed for {item!r}: {e}")
-                    install_results[item] = InstallStatusResult(False, str(e))
+        plan = InstallPlan(self.all_items(items), self.resource_class, self.RESOURCE_LIMITS)
+        with ThreadPoolExecutor(max_workers=self.num_workers or sum(self.RESOURCE_LIMITS.values())) as executor:
+            install_results = plan.run(executor, self.install_one, self._stream_results(items, on_installed))
+        plan.log_critical_path()
 
         self._populate_successful_install(items, install_results)
+        manifest = self.load_manifest()
+        for item, result in install_results.items():
+            if result.success:
+                manifest.record(item)
+        manifest.save()
 
         all_success = all(result.success for result in install_results.values())
         if all_success:
@@ -222,6 +283,25 @@ class BaseInstaller(ABC):
         nfailed = len([result for result in install_results.values() if not result.success])
         return InstallStatusResult(False, f"{nfailed} item(s) failed to install.", install_results)
 
+    def _stream_results(
+        self,
+        items: Iterable[Installable],
+        on_installed: Optional[Callable[[Installable, InstallStatusResult], None]],
+    ) -> Optional[Callable[[Installable, InstallStatusResult], None]]:
+        if on_installed is None:
+            return None
+
+        duplicates = self.all_items(items, with_duplicates=True)
+
+        def report(item: Installable, result: InstallStatusResult) -> None:
+            if result.success:
+                for duplicate in duplicates:
+                    if duplicate == item:
+                        self.mark_as_installed_one(duplicate)
+            on_installed(item, result)
+
+        return report
+
     def _populate_successful_install(
         self, items: Iterable[Installable], install_results: dict[Installable, InstallStatusResult]
     ):
@@ -256,6 +336,11 @@ class BaseInstaller(ABC):
                     logging.error(f"Uninstallation failed for {item!r}: {e}")
                     uninstall_results[item] = InstallStatusResult(False, str(e))
 
+        manifest = self.load_manifest()
+        for item in uninstall_results:
+            manifest.forget(item)
+        manifest.save()
+
         all_success = all(result.success for result in uninstall_results.values())
         if all_success:
             return InstallStatusResult(True, "All items uninstalled successfully.", uninstall_results)
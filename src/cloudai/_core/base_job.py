@@ -1,5 +1,5 @@
 # SPDX-FileCopyrightText: NVIDIA CORPORATION & AFFILIATES
-# Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# Copyright (c) 2024, 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
 # SPDX-License-Identifier: Apache-2.0
 #
 # Licensed under the Apache License, Version 2.0 (the "License");
@@ -14,8 +14,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 from dataclasses import dataclass, field
-from typing import Union
+from typing import Optional, Union
 
 from .test_scenario import TestRun
 
@@ -27,3 +28,4 @@ class BaseJob:
     test_run: TestRun
     id: Union[str, int]
     terminated_by_dependency: bool = field(default=False, init=False)
+    completion: Optional[asyncio.Future] = field(default=None, init=False, repr=False, compare=False)
@@ -68,7 +68,7 @@ class Reporter(ABC):
                         if tr_file.exists():
                             tr_file = toml.load(tr_file)
                             tr.test = tr.test.model_validate(tr_file["test_definition"])
-                        self.trs.append(copy.deepcopy(tr))
+                        self.trs.append(tr.fork())
                 else:
                     tr.current_iteration = int(iter.name)
                     tr.step = 0
@@ -14,11 +14,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
+import contextlib
 import logging
 import time
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Dict, List
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
 
 from .base_job import BaseJob
 from .command_gen_strategy import CommandGenStrategy
@@ -29,13 +31,18 @@ from .registry import Registry
 from .system import System
 from .test_scenario import TestRun, TestScenario
 
+if TYPE_CHECKING:
+    from .streaming_install import StreamingInstall
+
 
 class BaseRunner(ABC):
     """
     Abstract base class for a Runner that manages test execution.
 
     This class provides a framework for executing tests within a given test scenario, handling dependencies and
-    execution order.
+    execution order. Execution is driven by an asyncio event loop: job states are probed concurrently by a background
+    poller that resolves a per-job completion future, and delayed submissions and kills are scheduled as timers that
+    never block monitoring of other jobs.
 
     Attributes
         mode (str): The operation mode ('dry-run', 'run').
@@ -48,6 +55,16 @@ class BaseRunner(ABC):
         logger (logging.Logger): Logger for the runner.
         shutting_down (bool): A flag indicating whether a shutdown process has been initiated, preventing the start of
             new tests and ensuring a graceful termination of all running tests.
+        loop (Optional[asyncio.AbstractEventLoop]): The event loop driving the scenario, set only while it runs.
+        timers (set[asyncio.Task]): Pending delayed submissions and kills.
+        scheduled_test_runs (List[TestRun]): Test runs with a pending delayed submission.
+        completion_callbacks (List[Callable[[BaseJob], None]]): Functions called after a completed job is handled,
+            they may submit new tests to the running scenario.
+        monitor_callbacks (List[Callable[[], None]]): Functions called after every monitoring tick in which jobs were
+            probed, e.g. to inspect partial results of running jobs.
+        installation (Optional[StreamingInstall]): Installation running in the background, test runs are started only
+            once their installables are installed. None when everything is installed before the run.
+        awaiting_install (List[TestRun]): Test runs waiting for their installables.
     """
 
     def __init__(self, mode: str, system: System, test_scenario: TestScenario, output_path: Path):
@@ -69,32 +86,143 @@ class BaseRunner(ABC):
         self.testrun_to_job_map: Dict[TestRun, BaseJob] = {}
         logging.debug(f"{self.__class__.__name__} initialized")
         self.shutting_down = False
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self.wakeup: Optional[asyncio.Event] = None
+        self.timers: set[asyncio.Task] = set()
+        self.scheduled_test_runs: List[TestRun] = []
+        self.completion_callbacks: List[Callable[[BaseJob], None]] = []
+        self.monitor_callbacks: List[Callable[[], None]] = []
+        self.installation: Optional["StreamingInstall"] = None
+        self.awaiting_install: List[TestRun] = []
 
     def shutdown(self):
         """Gracefully shut down the runner, terminating all outstanding jobs."""
         self.shutting_down = True
+        self.awaiting_install.clear()
+        for timer in self.timers:
+            timer.cancel()
         logging.info("Terminating all jobs...")
         for job in self.jobs:
             logging.info(f"Terminating job {job.id} for test {job.test_run.name}")
             self.system.kill(job)
         logging.info("Waiting for all jobs to be killed.")
+        self.release_resources()
+
+    def release_resources(self) -> None:
+        """Release scheduler resources kept across test runs, e.g. an allocation DSE steps are dispatched into."""
+        return
 
     def run(self):
         """Run the test scenario."""
         if self.shutting_down:
             return
 
-        total_tests = len(self.test_scenario.test_runs)
-        dependency_free_trs = self.find_dependency_free_tests()
-        for tr in dependency_free_trs:
-            self.submit_test(tr)
+        asyncio.run(self.run_async())
+
+    async def run_async(self):
+        """
+        Run the test scenario on the current event loop.
+
+        Completion of every job is signaled by its completion future, which is resolved by the poller. The loop
+        reacts to each resolved future right away, so dependents of a finished job are scheduled without waiting for
+        the remaining jobs of the same monitoring tick.
+        """
+        self.loop = asyncio.get_running_loop()
+        self.wakeup = asyncio.Event()
+        if self.installation is not None:
+            self.installation.listeners.append(self.notify_threadsafe)
+        poller = asyncio.create_task(self.poll_jobs())
+        try:
+            total_tests = len(self.test_scenario.test_runs)
+            dependency_free_trs = self.find_dependency_free_tests()
+            self.submit_tests(self.installed_test_runs(dependency_free_trs))
+
+            logging.debug(
+                f"Total tests: {total_tests}, dependency free tests: {[tr.name for tr in dependency_free_trs]}"
+            )
+            while self.jobs or self.timers or self.awaiting_install:
+                self.wakeup.clear()
+                wakeup = asyncio.create_task(self.wakeup.wait())
+                futures = {job.completion for job in self.jobs if job.completion is not None}
+                await asyncio.wait({poller, wakeup, *self.timers, *futures}, return_when=asyncio.FIRST_COMPLETED)
+                wakeup.cancel()
+
+                self.reap_tasks(poller)
+                for job in list(self.jobs):
+                    if job.completion is not None and job.completion.done():
+                        self.handle_completed_job(job)
+                        for callback in self.completion_callbacks:
+                            callback(job)
+                self.submit_awaiting_install()
+        finally:
+            if self.installation is not None:
+                self.installation.listeners.remove(self.notify_threadsafe)
+            poller.cancel()
+            for timer in self.timers:
+                timer.cancel()
+            self.timers.clear()
+            self.scheduled_test_runs.clear()
+            self.loop, self.wakeup = None, None
+
+    def reap_tasks(self, poller: asyncio.Task) -> None:
+        """Re-raise errors of the poller and of finished timers, so they stop the scenario like before."""
+        if poller.done():
+            poller.result()
+
+        for timer in [timer for timer in self.timers if timer.done()]:
+            self.timers.discard(timer)
+            if not timer.cancelled():
+                timer.result()
+
+    def notify(self) -> None:
+        """Wake up the event loop to pick up newly submitted jobs or scheduled timers."""
+        if self.wakeup is not None:
+            self.wakeup.set()
+
+    def notify_threadsafe(self) -> None:
+        """Wake up the event loop from another thread, e.g. when the background installation made progress."""
+        loop = self.loop
+        if loop is None:
+            return
+        with contextlib.suppress(RuntimeError):  # the loop is closed
+            loop.call_soon_threadsafe(self.notify)
+
+    def installed_test_runs(self, trs: List[TestRun]) -> List[TestRun]:
+        """
+        Select test runs whose installables are installed.
 
-        logging.debug(f"Total tests: {total_tests}, dependency free tests: {[tr.name for tr in dependency_free_trs]}")
-        while self.jobs:
-            self.check_start_post_init_dependencies()
-            self.monitor_jobs()
-            logging.debug(f"sleeping for {self.monitor_interval} seconds")
-            time.sleep(self.monitor_interval)
+        Test runs with installables still being installed in the background are put aside until the installation
+        catches up, test runs with installables that failed to install are not started.
+
+        Args:
+            trs (List[TestRun]): Test runs to be started.
+
+        Returns:
+            List[TestRun]: Test runs that can be started now.
+        """
+        if self.installation is None:
+            return trs
+
+        ready = []
+        for tr in trs:
+            status = self.installation.status(tr)
+            if status is None:
+                if not any(waiting is tr for waiting in self.awaiting_install):
+                    logging.info(f"Test {tr.name} waits for its installables.")
+                    self.awaiting_install.append(tr)
+            elif status.success:
+                ready.append(tr)
+            else:
+                logging.error(f"Test {tr.name} is not started, its installables failed to install: {status.message}")
+        return ready
+
+    def submit_awaiting_install(self) -> None:
+        """Start test runs that were waiting for their installables and are ready now."""
+        if not self.awaiting_install:
+            return
+
+        waiting, self.awaiting_install = self.awaiting_install, []
+        self.submit_tests(self.installed_test_runs(waiting))
 
     def submit_test(self, tr: TestRun):
         """
@@ -107,27 +235,95 @@ class BaseRunner(ABC):
         logging.info(f"Starting test: {tr.name} (results at: {tr.output_path})")
         self.on_job_submit(tr)
         try:
-            job = self._submit_test(tr)
-            self.jobs.append(job)
-            self.testrun_to_job_map[tr] = job
+            self.track_job(self._submit_test(tr))
         except JobSubmissionError as e:
             logging.error(e)
             exit(1)
 
+    def submit_tests(self, trs: List[TestRun]) -> None:
+        """
+        Start several dependency-free tests at once.
+
+        Runners can override this method to submit the tests with fewer scheduler calls.
+
+        Args:
+            trs (List[TestRun]): The tests to be started.
+        """
+        for tr in trs:
+            self.submit_test(tr)
+
+    def track_job(self, job: BaseJob) -> None:
+        """Start monitoring a submitted job."""
+        if self.loop is not None:
+            job.completion = self.loop.create_future()
+        self.jobs.append(job)
+        self.testrun_to_job_map[job.test_run] = job
+        self.notify()
+
     def on_job_submit(self, tr: TestRun) -> None:
         return
 
+    def on_monitor_tick(self) -> None:
+        """
+        Call callback functions at the beginning of every monitoring tick.
+
+        This method can be overridden by subclasses to refresh scheduler state for all tracked jobs at once, before
+        per-job checks are made within the tick.
+        """
+        return
+
     def delayed_submit_test(self, tr: TestRun, delay: int = 5):
         """
         Delay the start of a test based on start_post_comp dependency.
 
+        The delay does not block monitoring of other jobs. In dry-run mode no delay is applied.
+
         Args:
             tr (TestRun): The test to start after a delay.
             delay (int): Delay in seconds before starting the test.
         """
+        delay = 0 if self.mode == "dry-run" else delay
         logging.debug(f"Delayed start for test {tr.name} by {delay} seconds.")
-        time.sleep(delay)
-        self.submit_test(tr)
+        self.scheduled_test_runs.append(tr)
+        self.call_later(delay, self._submit_scheduled_test, tr)
+
+    def _submit_scheduled_test(self, tr: TestRun) -> None:
+        self.scheduled_test_runs = [scheduled for scheduled in self.scheduled_test_runs if scheduled is not tr]
+        if self.shutting_down:
+            logging.info(f"Skipping start of test {tr.name} due to shutdown.")
+            return
+        for ready in self.installed_test_runs([tr]):
+            self.submit_test(ready)
+
+    def is_scheduled_or_submitted(self, tr: TestRun) -> bool:
+        return (
+            tr in self.testrun_to_job_map
+            or any(scheduled is tr for scheduled in self.scheduled_test_runs)
+            or any(waiting is tr for waiting in self.awaiting_install)
+        )
+
+    def call_later(self, delay: float, callback: Callable[..., Any], *args: Any) -> None:
+        """
+        Call a function after a delay without blocking the event loop.
+
+        When no event loop is running (e.g. the method is called directly), the call blocks for the delay instead.
+
+        Args:
+            delay (float): Delay in seconds.
+            callback (Callable[..., Any]): The function to call.
+            *args (Any): Arguments for the function.
+        """
+        if self.loop is None:
+            time.sleep(delay)
+            callback(*args)
+            return
+
+        async def delayed_call() -> None:
+            await asyncio.sleep(delay)
+            callback(*args)
+
+        self.timers.add(self.loop.create_task(delayed_call()))
+        self.notify()
 
     @abstractmethod
     def _submit_test(self, tr: TestRun) -> BaseJob:
@@ -142,28 +338,52 @@ class BaseRunner(ABC):
         """
         pass
 
-    def check_start_post_init_dependencies(self):
+    async def poll_jobs(self) -> None:
+        """Probe tracked jobs once per monitoring interval until cancelled."""
+        while True:
+            await self.probe_jobs()
+            interval = 0 if self.mode == "dry-run" else self.monitor_interval
+            logging.debug(f"sleeping for {interval} seconds")
+            await asyncio.sleep(interval)
+
+    async def probe_jobs(self) -> None:
         """
-        Check and handle start_post_init dependencies.
+        Probe all tracked jobs concurrently and resolve completion futures of finished jobs.
 
-        This method should be called periodically to ensure timely execution of tests with
-        start_post_init dependencies.
+        Tests with a start_post_init dependency are scheduled as soon as the job they depend on is running or completed.
         """
-        items = list(self.testrun_to_job_map.items())
+        jobs = [job for job in self.jobs if job.completion is not None and not job.completion.done()]
+        if not jobs:
+            return
 
-        for tr, job in items:
-            is_running, is_completed = False, False
-            if self.mode == "dry-run":
-                is_running, is_completed = True, True
-            else:
-                is_running, is_completed = (
-                    self.system.is_job_running(job),
-                    self.system.is_job_completed(job),
-                )
+        if self.mode == "dry-run":
+            states = [(True, True)] * len(jobs)
+        else:
+            await asyncio.to_thread(self.on_monitor_tick)
+            states = await asyncio.gather(*(asyncio.to_thread(self.probe_job, job) for job in jobs))
 
+        for job, (is_running, is_completed) in zip(jobs, states, strict=True):
+            tr = job.test_run
             logging.debug(f"start_post_init for test {tr.name} ({is_running=}, {is_completed=}, {self.mode=})")
             if is_running or is_completed:
                 self.check_and_schedule_start_post_init_dependent_tests(tr)
+            if is_completed and job.completion is not None and not job.completion.done():
+                job.completion.set_result(None)
+
+        for callback in self.monitor_callbacks:
+            callback()
+
+    def probe_job(self, job: BaseJob) -> tuple[bool, bool]:
+        """
+        Query the running and completed state of a job, called from a worker thread.
+
+        Args:
+            job (BaseJob): The job to probe.
+
+        Returns:
+            tuple[bool, bool]: Whether the job is running and whether it is completed.
+        """
+        return self.system.is_job_running(job), self.system.is_job_completed(job)
 
     def check_and_schedule_start_post_init_dependent_tests(self, started_test_run: TestRun):
         """
@@ -173,7 +393,7 @@ class BaseRunner(ABC):
             started_test_run (TestRun): The test that has just started.
         """
         for tr in self.test_scenario.test_runs:
-            if tr not in self.testrun_to_job_map:
+            if not self.is_scheduled_or_submitted(tr):
                 for dep_type, dep in tr.dependencies.items():
                     if (dep_type == "start_post_init") and (dep.test_run == started_test_run):
                         self.delayed_submit_test(tr)
@@ -228,51 +448,33 @@ class BaseRunner(ABC):
 
         return job_output_path
 
-    def monitor_jobs(self) -> int:
+    def handle_completed_job(self, job: BaseJob) -> None:
         """
-        Monitor the status of jobs, handle end_post_comp dependencies, and schedule start_post_comp dependent jobs.
+        Check the status of a completed job, then handle its dependencies and iterations.
 
-        Returns
-            int: The number of completed jobs.
-        """
-        successful_jobs_count = 0
-
-        logging.debug(f"Monitoring {len(self.jobs)} jobs")
-        for job in list(self.jobs):
-            is_completed = True if self.mode == "dry-run" else self.system.is_job_completed(job)
-
-            if is_completed:
-                logging.debug(f"Job {job.id} for test {job.test_run.name} completed ({self.mode=}, {is_completed=})")
-                self.on_job_completion(job)
-
-                if self.mode == "dry-run":
-                    successful_jobs_count += 1
-                    self.handle_job_completion(job)
-                else:
-                    if self.test_scenario.job_status_check:
-                        job_status_result = self.get_job_status(job)
-                        if job_status_result.is_successful:
-                            successful_jobs_count += 1
-                            self.handle_job_completion(job)
-                        else:
-                            error_message = (
-                                f"Job {job.id} for test {job.test_run.name} failed: {job_status_result.error_message}"
-                            )
-                            logging.error(error_message)
-                            self.handle_job_completion(job)
-                            self.shutdown()
-                            raise JobFailureError(job.test_run.name, error_message, job_status_result.error_message)
-                    else:
-                        job_status_result = self.get_job_status(job)
-                        if not job_status_result.is_successful:
-                            error_message = (
-                                f"Job {job.id} for test {job.test_run.name} failed: {job_status_result.error_message}"
-                            )
-                            logging.error(error_message)
-                        successful_jobs_count += 1
-                        self.handle_job_completion(job)
-
-        return successful_jobs_count
+        Args:
+            job (BaseJob): The job whose completion future has been resolved.
+
+        Raises:
+            JobFailureError: If the job failed and the test scenario requires a job status check.
+        """
+        logging.debug(f"Job {job.id} for test {job.test_run.name} completed ({self.mode=})")
+        self.on_job_completion(job)
+
+        if self.mode == "dry-run":
+            self.handle_job_completion(job)
+            return
+
+        job_status_result = self.get_job_status(job)
+        if not job_status_result.is_successful:
+            error_message = f"Job {job.id} for test {job.test_run.name} failed: {job_status_result.error_message}"
+            logging.error(error_message)
+            if self.test_scenario.job_status_check:
+                self.handle_job_completion(job)
+                self.shutdown()
+                raise JobFailureError(job.test_run.name, error_message, job_status_result.error_message)
+
+        self.handle_job_completion(job)
 
     def get_runner_job_status(self, job: BaseJob) -> JobStatusResult:
         return JobStatusResult(is_successful=True)
@@ -340,7 +542,7 @@ class BaseRunner(ABC):
         """
         # Handling start_post_comp dependencies
         for tr in self.test_scenario.test_runs:
-            if tr not in self.testrun_to_job_map:
+            if not self.is_scheduled_or_submitted(tr):
                 for dep_type, dep in tr.dependencies.items():
                     if dep_type == "start_post_comp" and dep.test_run == completed_job.test_run:
                         self.delayed_submit_test(tr)
@@ -360,7 +562,9 @@ class BaseRunner(ABC):
             delay (int): Delay in seconds after which the job should be terminated.
         """
         logging.info(f"Scheduling termination of job {job.id} after {delay} seconds.")
-        time.sleep(delay)
+        self.call_later(delay, self._kill_job_by_dependency, job)
+
+    def _kill_job_by_dependency(self, job: BaseJob) -> None:
         job.terminated_by_dependency = True
         self.system.kill(job)
 
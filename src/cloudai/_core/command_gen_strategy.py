@@ -27,6 +27,7 @@ class CommandGenStrategy(ABC):
 
     def __init__(self, system: System, test_run: TestRun) -> None:
         self.system = system
+        test_run.materialize()
         self.test_run = test_run
         self._final_env_vars: dict[str, str | list[str]] = {}
 
@@ -0,0 +1,172 @@
+# SPDX-FileCopyrightText: NVIDIA CORPORATION & AFFILIATES
+# Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import hashlib
+import logging
+import re
+import subprocess
+from pathlib import Path
+from shutil import rmtree
+from typing import Optional
+
+from pydantic import BaseModel, ConfigDict
+
+from cloudai.util import file_lock
+
+from .install_status_result import InstallStatusResult
+
+IMMUTABLE_REF_RE = re.compile(r"[0-9a-f]{7,40}")
+
+
+class GitMirrorConfig(BaseModel):
+    """
+    Shared git object store for GitRepo installables.
+
+    Attributes
+        path: Directory holding one bare mirror per repository URL. Defaults to ``.git-mirrors`` in the install path.
+        shallow: Fetch only the requested commit (``--depth 1``) instead of all branches and tags.
+        filter: Partial clone filter for fetches into the mirrors, e.g. ``blob:none``.
+    """
+
+    model_config = ConfigDict(extra="forbid")
+
+    path: Optional[Path] = None
+    shallow: bool = False
+    filter: Optional[str] = None
+
+
+class GitMirrorStore:
+    """
+    Bare mirrors of git repositories, each installed commit is a worktree of its repository's mirror.
+
+    Objects are downloaded once per repository URL and the mirror is fetched incrementally when a commit it does not
+    have yet is requested. Concurrent CloudAI invocations serialize on a lock file next to each mirror.
+    """
+
+    def __init__(self, root: Path, config: GitMirrorConfig, low_thread: bool = False) -> None:
+        self.root = root
+        self.config = config
+        self.low_thread = low_thread
+
+    def mirror_path(self, url: str) -> Path:
+        name = url.rstrip("/").rsplit("/", maxsplit=1)[-1].removesuffix(".git")
+        digest = hashlib.sha1(url.encode()).hexdigest()[:8]
+        return self.root / f"{name}-{digest}.git"
+
+    def add_worktree(self, url: str, commit: str, path: Path) -> InstallStatusResult:
+        """
+        Materialize a commit of a repository as a detached worktree at the given path.
+
+        Args:
+            url: Repository URL.
+            commit: Commit hash, branch or tag to check out.
+            path: Worktree location, must not exist.
+
+        Returns:
+            InstallStatusResult: Result of the fetch and worktree creation.
+        """
+        mirror = self.mirror_path(url)
+        self.root.mkdir(parents=True, exist_ok=True)
+        with file_lock(mirror.with_name(f".{mirror.name}.lock")):
+            res = self._init_mirror(url, mirror)
+            if not res.success:
+                return res
+
+            sha = self._resolve(mirror, commit) if IMMUTABLE_REF_RE.fullmatch(commit) else None
+            if sha is None:
+                res = self._fetch(mirror, commit)
+                if not res.success:
+                    return res
+                sha = self._resolve(mirror, commit)
+            if sha is None:
+                return InstallStatusResult(False, f"Commit {commit} not found in {url}")
+
+            self._git(["worktree", "prune"], mirror)
+            logging.debug(f"Adding worktree {path} of {mirror} at {sha}")
+            result = self._git(["worktree", "add", "--detach", str(path), sha], mirror)
+            if result.returncode != 0:
+                if path.exists():
+                    rmtree(path)
+                return InstallStatusResult(False, f"Failed to add worktree for {commit}: {result.stderr}")
+        return InstallStatusResult(True)
+
+    def remove_worktree(self, url: str, path: Path) -> InstallStatusResult:
+        """Remove a worktree, the objects stay in the mirror for other commits."""
+        mirror = self.mirror_path(url)
+        if not mirror.is_dir():
+            if path.exists():
+                rmtree(path)
+            return InstallStatusResult(True)
+
+        with file_lock(mirror.with_name(f".{mirror.name}.lock")):
+            result = self._git(["worktree", "remove", "--force", str(path)], mirror)
+            if result.returncode != 0:
+                logging.debug(f"Worktree removal failed, removing {path} directly: {result.stderr}")
+                if path.exists():
+                    rmtree(path)
+                self._git(["worktree", "prune"], mirror)
+        return InstallStatusResult(True)
+
+    def _git(self, args: list[str], cwd: Path) -> subprocess.CompletedProcess:
+        cmd = ["git"]
+        if self.low_thread:
+            cmd.extend(["-c", "pack.threads=4"])
+        cmd.extend(args)
+        logging.debug(f"Running git command in {cwd}: {' '.join(cmd)}")
+        return subprocess.run(cmd, cwd=str(cwd), capture_output=True, text=True)
+
+    def _init_mirror(self, url: str, mirror: Path) -> InstallStatusResult:
+        if mirror.is_dir():
+            return InstallStatusResult(True)
+
+        logging.debug(f"Creating git mirror {mirror} for {url}")
+        commands = [["init", "--bare", str(mirror)], ["-C", str(mirror), "remote", "add", "origin", url]]
+        if self.config.filter:
+            commands.append(["-C", str(mirror), "config", "remote.origin.promisor", "true"])
+            commands.append(["-C", str(mirror), "config", "remote.origin.partialclonefilter", self.config.filter])
+        for args in commands:
+            result = self._git(args, self.root)
+            if result.returncode != 0:
+                if mirror.exists():
+                    rmtree(mirror)
+                return InstallStatusResult(False, f"Failed to create git mirror for {url}: {result.stderr}")
+        return InstallStatusResult(True)
+
+    def _fetch(self, mirror: Path, commit: str) -> InstallStatusResult:
+        fetch = ["fetch", "--no-tags"]
+        if self.config.filter:
+            fetch.append(f"--filter={self.config.filter}")
+
+        if not self.config.shallow:
+            result = self._git([*fetch, "origin", "+refs/heads/*:refs/heads/*", "+refs/tags/*:refs/tags/*"], mirror)
+            if result.returncode != 0:
+                return InstallStatusResult(False, f"Failed to fetch {commit}: {result.stderr}")
+            if self._resolve(mirror, commit) is not None:
+                return InstallStatusResult(True)
+
+        # Commits not reachable from any branch or tag, and everything in shallow mode, are fetched by name. Branch and
+        # tag names are stored as local branches so that they resolve in the worktree.
+        refspec = commit if IMMUTABLE_REF_RE.fullmatch(commit) else f"+{commit}:refs/heads/{commit}"
+        if self.config.shallow:
+            fetch.append("--depth=1")
+        result = self._git([*fetch, "origin", refspec], mirror)
+        if result.returncode != 0:
+            return InstallStatusResult(False, f"Failed to fetch {commit}: {result.stderr}")
+        return InstallStatusResult(True)
+
+    def _resolve(self, mirror: Path, ref: str) -> Optional[str]:
+        result = self._git(["rev-parse", "--verify", "-q", f"{ref}^{{commit}}"], mirror)
+        return result.stdout.strip() if result.returncode == 0 else None
@@ -0,0 +1,169 @@
+# SPDX-FileCopyrightText: NVIDIA CORPORATION & AFFILIATES
+# Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Optional
+
+import toml
+
+from .installables import GitRepo, HFModel, Installable, PythonExecutable
+
+
+def git_head(repo_path: Path) -> str:
+    """Read HEAD of a git checkout without running git, following ``.git`` files of worktrees and submodules."""
+    git_dir = repo_path / ".git"
+    if git_dir.is_file():
+        git_dir = repo_path / git_dir.read_text().partition("gitdir:")[2].strip()
+    head = (git_dir / "HEAD").read_text().strip()
+    if head.startswith("ref:"):
+        ref = head.partition("ref:")[2].strip()
+        ref_file = git_dir / ref
+        if ref_file.is_file():
+            return ref_file.read_text().strip()
+    return head
+
+
+def stat_fingerprint(path: Path) -> str:
+    stat = path.stat()
+    return f"{stat.st_size}:{stat.st_mtime_ns}"
+
+
+class InstallManifest:
+    """
+    Installables confirmed as installed by previous checks, stored in the install path.
+
+    Each entry keeps the resolved paths of an installable and a fingerprint of its installation, e.g. the HEAD of a git
+    checkout or size and modification time of a venv. An unchanged fingerprint confirms the installation with a few
+    file reads instead of running ``git`` or ``huggingface_hub``. Only installables with such expensive checks are
+    recorded, any error while fingerprinting counts as a miss.
+
+    Attributes
+        path (Path): The manifest file.
+        entries (dict[str, dict[str, str]]): Manifest entries by installable key.
+    """
+
+    FILE_NAME = ".cloudai-install-manifest.toml"
+
+    def __init__(self, install_path: Path, scope: str):
+        self.path = install_path / self.FILE_NAME
+        self.scope = scope
+        self.entries: dict[str, dict[str, str]] = {}
+        self._lock = threading.Lock()
+        self._dirty = False
+
+    def load(self) -> InstallManifest:
+        try:
+            self.entries = toml.load(self.path).get(self.scope, {})
+        except (OSError, toml.TomlDecodeError) as e:
+            logging.debug(f"Install manifest {self.path} not loaded: {e}")
+            self.entries = {}
+        return self
+
+    def save(self) -> None:
+        """Write the manifest through a temporary file, keeping entries of other installers."""
+        if not self._dirty:
+            return
+        try:
+            data = toml.load(self.path) if self.path.is_file() else {}
+            data[self.scope] = self.entries
+            tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+            with tmp_path.open("w") as f:
+                toml.dump(data, f)
+            os.replace(tmp_path, self.path)
+            self._dirty = False
+        except (OSError, toml.TomlDecodeError) as e:
+            logging.debug(f"Install manifest {self.path} not saved: {e}")
+
+    @staticmethod
+    def key(item: Installable) -> Optional[str]:
+        if isinstance(item, GitRepo):
+            return f"git:{item.url}@{item.commit}"
+        if isinstance(item, PythonExecutable):
+            return f"python:{item.git_repo.url}@{item.git_repo.commit}"
+        if isinstance(item, HFModel):
+            return f"hf:{item.model_name}"
+        return None
+
+    @staticmethod
+    def resolved_paths(item: Installable) -> dict[str, str]:
+        if isinstance(item, GitRepo) and item.installed_path:
+            return {"installed_path": str(item.installed_path.absolute())}
+        if isinstance(item, PythonExecutable) and item.git_repo.installed_path and item.venv_path:
+            return {
+                "repo_path": str(item.git_repo.installed_path.absolute()),
+                "venv_path": str(item.venv_path.absolute()),
+            }
+        if isinstance(item, HFModel):
+            return {"installed_path": str(item.installed_path.absolute())}
+        return {}
+
+    @staticmethod
+    def fingerprint(item: Installable, paths: dict[str, str]) -> str:
+        """Return the fingerprint of an installation at the given paths, raise OSError if it is incomplete."""
+        if isinstance(item, GitRepo):
+            return f"head={git_head(Path(paths['installed_path']))}"
+        if isinstance(item, PythonExecutable):
+            venv_cfg = Path(paths["venv_path"]) / "pyvenv.cfg"
+            return f"head={git_head(Path(paths['repo_path']))},venv={stat_fingerprint(venv_cfg)}"
+        return f"dir={stat_fingerprint(Path(paths['installed_path']))}"
+
+    @staticmethod
+    def restore(item: Installable, paths: dict[str, str]) -> None:
+        if isinstance(item, PythonExecutable):
+            item.git_repo.installed_path = Path(paths["repo_path"])
+            item.venv_path = Path(paths["venv_path"])
+        elif isinstance(item, (GitRepo, HFModel)):
+            item.installed_path = Path(paths["installed_path"])
+
+    def confirm(self, item: Installable) -> bool:
+        """Check if an installable is recorded with an unchanged fingerprint, restoring its resolved paths if so."""
+        key = self.key(item)
+        entry = self.entries.get(key) if key else None
+        if not entry:
+            return False
+
+        paths = {name: value for name, value in entry.items() if name != "fingerprint"}
+        try:
+            if self.fingerprint(item, paths) != entry.get("fingerprint"):
+                return False
+        except (OSError, KeyError):
+            return False
+
+        self.restore(item, paths)
+        return True
+
+    def record(self, item: Installable) -> None:
+        key, paths = self.key(item), self.resolved_paths(item)
+        if not key or not paths:
+            return
+        try:
+            fingerprint = self.fingerprint(item, paths)
+        except (OSError, KeyError):
+            return
+        with self._lock:
+            self.entries[key] = {**paths, "fingerprint": fingerprint}
+            self._dirty = True
+
+    def forget(self, item: Installable) -> None:
+        key = self.key(item)
+        with self._lock:
+            if key and self.entries.pop(key, None) is not None:
+                self._dirty = True
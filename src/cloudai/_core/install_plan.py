@@ -0,0 +1,170 @@
+# SPDX-FileCopyrightText: NVIDIA CORPORATION & AFFILIATES
+# Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import logging
+import time
+from collections import defaultdict
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, wait
+from dataclasses import dataclass, field
+from typing import Callable, Iterable, Optional
+
+from .install_status_result import InstallStatusResult
+from .installables import Installable
+
+
+@dataclass(eq=False)
+class InstallNode:
+    """Installable in an install plan with its dependencies and the time it was installed."""
+
+    item: Installable
+    resource: str
+    dependencies: list["InstallNode"] = field(default_factory=list)
+    dependents: list["InstallNode"] = field(default_factory=list)
+    start: float = 0.0
+    end: float = 0.0
+    result: Optional[InstallStatusResult] = None
+
+
+class InstallPlan:
+    """
+    Dependency graph of installables, each item is started as soon as all its dependencies are installed.
+
+    Every item belongs to a resource class (e.g. network downloads, image imports or local CPU work) with its own
+    concurrency limit, so that slow items of one class do not hold back items of the others.
+    """
+
+    def __init__(
+        self, items: Iterable[Installable], resource_of: Callable[[Installable], str], limits: dict[str, int]
+    ) -> None:
+        self.resource_of = resource_of
+        self.limits = limits
+        self.nodes: dict[Installable, InstallNode] = {}
+        self.start = 0.0
+        self.on_result: Optional[Callable[[Installable, InstallStatusResult], None]] = None
+        for item in items:
+            self._add(item)
+
+    def _add(self, item: Installable) -> InstallNode:
+        if item in self.nodes:
+            return self.nodes[item]
+
+        node = InstallNode(item, self.resource_of(item))
+        self.nodes[item] = node
+        for dependency in item.dependencies:
+            dep_node = self._add(dependency)
+            node.dependencies.append(dep_node)
+            dep_node.dependents.append(node)
+        return node
+
+    def run(
+        self,
+        executor: Executor,
+        install_one: Callable[[Installable], InstallStatusResult],
+        on_result: Optional[Callable[[Installable, InstallStatusResult], None]] = None,
+    ) -> dict[Installable, InstallStatusResult]:
+        """
+        Install all items of the plan.
+
+        Args:
+            executor: Executor to run ``install_one`` in.
+            install_one: Function installing a single item.
+            on_result: Function called with every item and its result as soon as the item is installed or skipped.
+
+        Returns:
+            dict[Installable, InstallStatusResult]: Result of every item, including dependencies of the given items.
+        """
+        self.start = time.monotonic()
+        self.on_result = on_result
+        waiting = {node: len(node.dependencies) for node in self.nodes.values()}
+        ready = [node for node in self.nodes.values() if not node.dependencies]
+        running: dict[Future, InstallNode] = {}
+        busy: dict[str, int] = defaultdict(int)
+        done = 0
+
+        while ready or running:
+            for node in list(ready):
+                if busy[node.resource] >= self.limits.get(node.resource, 1):
+                    continue
+                ready.remove(node)
+                busy[node.resource] += 1
+                node.start = time.monotonic()
+                running[executor.submit(install_one, node.item)] = node
+
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                node = running.pop(future)
+                busy[node.resource] -= 1
+                node.end = time.monotonic()
+                done = self._complete(node, future, done)
+                for dependent in node.dependents:
+                    waiting[dependent] -= 1
+                    if node.result is not None and not node.result.success:
+                        done = self._skip(dependent, node, done)
+                    elif waiting[dependent] == 0 and dependent.result is None:
+                        ready.append(dependent)
+
+        return {node.item: node.result for node in self.nodes.values() if node.result is not None}
+
+    def _complete(self, node: InstallNode, future: Future, done: int) -> int:
+        done += 1
+        try:
+            result: InstallStatusResult = future.result()
+            node.result = result
+            msg = f"{done}/{len(self.nodes)} Installation of {node.item!r}: {result.message or 'OK'}"
+            if result.success:
+                logging.info(msg)
+            else:
+                logging.error(msg)
+        except Exception as e:
+            logging.error(f"{done}/{len(self.nodes)} Installation failed for {node.item!r}: {e}")
+            node.result = InstallStatusResult(False, str(e))
+        self._report(node)
+        return done
+
+    def _skip(self, node: InstallNode, failed: InstallNode, done: int) -> int:
+        if node.result is not None:
+            return done
+
+        done += 1
+        node.result = InstallStatusResult(False, f"Dependency {failed.item!r} failed to install.")
+        logging.error(f"{done}/{len(self.nodes)} Installation of {node.item!r}: {node.result.message}")
+        self._report(node)
+        for dependent in node.dependents:
+            done = self._skip(dependent, failed, done)
+        return done
+
+    def _report(self, node: InstallNode) -> None:
+        if self.on_result is not None and node.result is not None:
+            self.on_result(node.item, node.result)
+
+    def critical_path(self) -> list[InstallNode]:
+        """Chain of dependencies that finished last, it bounds the total install time."""
+        installed = [node for node in self.nodes.values() if node.end]
+        if not installed:
+            return []
+
+        path = [max(installed, key=lambda node: node.end)]
+        while path[-1].dependencies:
+            path.append(max(path[-1].dependencies, key=lambda node: node.end))
+        return path[::-1]
+
+    def log_critical_path(self) -> None:
+        path = self.critical_path()
+        if not path:
+            return
+
+        steps = " -> ".join(f"{node.item} ({node.end - node.start:.1f}s)" for node in path)
+        logging.info(f"Install critical path ({path[-1].end - self.start:.1f}s): {steps}")
@@ -31,6 +31,11 @@ class Installable(ABC):
     @abstractmethod
     def __hash__(self) -> int: ...
 
+    @property
+    def dependencies(self) -> list["Installable"]:
+        """Installables that must be installed before this one."""
+        return []
+
 
 @dataclass
 class DockerImage(Installable):
@@ -149,6 +154,10 @@ class PythonExecutable(Installable):
     def venv_name(self) -> str:
         return f"{self.git_repo.repo_name}-venv"
 
+    @property
+    def dependencies(self) -> list[Installable]:
+        return [self.git_repo]
+
 
 @dataclass
 class File(Installable):
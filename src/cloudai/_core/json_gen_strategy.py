@@ -35,6 +35,7 @@ class JsonGenStrategy(ABC):
 
     def __init__(self, system: System, test_run: TestRun) -> None:
         self.system = system
+        test_run.materialize()
         self.test_run = test_run
 
     def sanitize_k8s_job_name(self, job_name: str) -> str:
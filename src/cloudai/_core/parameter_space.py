@@ -0,0 +1,195 @@
+# SPDX-FileCopyrightText: NVIDIA CORPORATION & AFFILIATES
+# Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import itertools
+import logging
+import math
+import random
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Any, Callable, Iterator, Optional, overload
+
+from ..util.lazy_imports import lazy
+
+if TYPE_CHECKING:
+    import numpy as np
+
+GridConstraint = Callable[["ParameterColumns"], Any]
+"""Vectorized constraint, returns a boolean mask (or a scalar) broadcastable to the grid shape."""
+
+
+class ParameterSpace(Sequence[dict[str, Any]]):
+    """
+    Lazy, indexable cartesian product of DSE parameter values.
+
+    Points are ordered the same way as ``itertools.product``: the last parameter changes fastest. A point is decoded
+    from its index as a mixed-radix number on access, so the product is never materialized. A space without parameters
+    is empty.
+
+    A space can be restricted to a subset of grid indices (e.g. feasible points, see ``feasible``), in which case it
+    is indexed by the position in that subset.
+
+    Attributes
+        dimensions (dict[str, list[Any]]): Parameter names mapped to their candidate values.
+        indices (Optional[np.ndarray]): Sorted grid indices the space is restricted to, None for the full grid.
+    """
+
+    def __init__(self, dimensions: dict[str, list[Any]], indices: Optional[np.ndarray] = None):
+        self.dimensions = dimensions
+        self.indices = indices
+        self._keys = list(dimensions.keys())
+        self._radices = [len(values) for values in dimensions.values()]
+        self._grid_size = math.prod(self._radices) if self._radices else 0
+        self._size = self._grid_size if indices is None else len(indices)
+
+    @property
+    def grid_size(self) -> int:
+        """Number of points in the full grid, regardless of the restriction."""
+        return self._grid_size
+
+    def __len__(self) -> int:
+        return self._size
+
+    @overload
+    def __getitem__(self, index: int) -> dict[str, Any]: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[dict[str, Any]]: ...
+
+    def __getitem__(self, index: int | slice) -> dict[str, Any] | list[dict[str, Any]]:
+        if isinstance(index, slice):
+            return [self.decode(self.grid_index(i)) for i in range(*index.indices(self._size))]
+
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError(f"Parameter space index {index} is out of range (size {self._size})")
+        return self.decode(self.grid_index(index))
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        if not self._size:
+            return
+        if self.indices is not None:
+            for index in self.indices:
+                yield self.decode(int(index))
+            return
+        for combination in itertools.product(*self.dimensions.values()):
+            yield dict(zip(self._keys, combination, strict=True))
+
+    def __contains__(self, action: object) -> bool:
+        return isinstance(action, dict) and self.encode(action) is not None
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.dimensions!r})"
+
+    def grid_index(self, position: int) -> int:
+        return position if self.indices is None else int(self.indices[position])
+
+    def decode(self, index: int) -> dict[str, Any]:
+        """Build the point for a non-negative index, the last parameter is the least significant digit."""
+        action: dict[str, Any] = {}
+        for key, radix in zip(reversed(self._keys), reversed(self._radices), strict=True):
+            index, digit = divmod(index, radix)
+            action[key] = self.dimensions[key][digit]
+        return {key: action[key] for key in self._keys}
+
+    def encode(self, action: dict[str, Any]) -> Optional[int]:
+        """Return the index of the first point equal to the action, or None if the action is not in the space."""
+        if not self._size or set(action.keys()) != set(self._keys):
+            return None
+
+        index = 0
+        for key, radix in zip(self._keys, self._radices, strict=True):
+            values = self.dimensions[key]
+            if action[key] not in values:
+                return None
+            index = index * radix + values.index(action[key])
+
+        if self.indices is None:
+            return index
+        position = int(lazy.np.searchsorted(self.indices, index))
+        if position < self._size and self.indices[position] == index:
+            return position
+        return None
+
+    def sample(self, k: int, rng: Optional[random.Random] = None) -> list[dict[str, Any]]:
+        """
+        Pick ``k`` distinct points uniformly at random.
+
+        Args:
+            k (int): Number of points, must not exceed the size of the space.
+            rng (Optional[random.Random]): Random generator to use, the module-level one if not provided.
+
+        Returns:
+            list[dict[str, Any]]: The sampled points.
+        """
+        positions = (rng or random).sample(range(self._size), k)
+        return [self.decode(self.grid_index(i)) for i in positions]
+
+    def feasible(self, constraints: list[GridConstraint], values: dict[str, Any]) -> ParameterSpace:
+        """
+        Restrict the space to points satisfying all constraints, evaluated over the whole grid at once.
+
+        Each constraint gets ``ParameterColumns`` and returns a boolean mask. Constraints that cannot be evaluated
+        vectorized (e.g. a column mixes numbers and None) are skipped, they are expected to be enforced per point.
+
+        Args:
+            constraints (list[GridConstraint]): Vectorized constraints.
+            values (dict[str, Any]): Values of parameters that are not swept, by their action names.
+
+        Returns:
+            ParameterSpace: The restricted space.
+        """
+        if not self._grid_size or not constraints:
+            return self
+
+        np = lazy.np
+        columns = ParameterColumns(self, values)
+        mask = np.ones(self._radices, dtype=bool)
+        for constraint in constraints:
+            try:
+                with np.errstate(divide="ignore", invalid="ignore"):
+                    result = np.asarray(constraint(columns), dtype=bool)
+                mask &= np.broadcast_to(result, mask.shape)
+            except (TypeError, ValueError, KeyError) as e:
+                logging.debug(f"Skipping vectorized constraint {constraint}: {e}")
+
+        indices = np.flatnonzero(mask)
+        if self.indices is not None:
+            indices = np.intersect1d(indices, self.indices, assume_unique=True)
+        return ParameterSpace(self.dimensions, indices)
+
+
+class ParameterColumns:
+    """
+    Parameter values over the whole grid of a ``ParameterSpace``, used to evaluate vectorized constraints.
+
+    A swept parameter is an array shaped to broadcast along its own grid axis, other parameters are scalars.
+    """
+
+    def __init__(self, space: ParameterSpace, values: dict[str, Any]):
+        self.space = space
+        self.values = values
+
+    def __getitem__(self, name: str) -> Any:
+        if name not in self.space.dimensions:
+            return self.values[name]
+
+        keys = list(self.space.dimensions.keys())
+        shape = [1] * len(keys)
+        shape[keys.index(name)] = -1
+        return lazy.np.asarray(self.space.dimensions[name]).reshape(shape)
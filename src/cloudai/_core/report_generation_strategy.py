@@ -1,5 +1,5 @@
 # SPDX-FileCopyrightText: NVIDIA CORPORATION & AFFILIATES
-# Copyright (c) 2024-2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# Copyright (c) 2024-2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
 # SPDX-License-Identifier: Apache-2.0
 #
 # Licensed under the Apache License, Version 2.0 (the "License");
@@ -15,7 +15,7 @@
 # limitations under the License.
 
 from abc import ABC, abstractmethod
-from typing import ClassVar
+from typing import ClassVar, Optional
 
 from .system import System
 from .test_scenario import TestRun
@@ -33,6 +33,18 @@ class ReportGenerationStrategy(ABC):
     def get_metric(self, metric: str) -> float:
         return 0.0
 
+    def get_progress(self) -> Optional[int]:
+        """
+        Progress of the test reached by its current results, e.g. the last training step reported.
+
+        Metrics read at the same progress are comparable between test runs, which early stopping of DSE trials relies
+        on.
+
+        Returns:
+            Optional[int]: The progress, None if the workload does not report it.
+        """
+        return None
+
     @abstractmethod
     def can_handle_directory(self) -> bool: ...
 
@@ -0,0 +1,100 @@
+# SPDX-FileCopyrightText: NVIDIA CORPORATION & AFFILIATES
+# Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import logging
+import threading
+from typing import Callable, Iterable, List, Optional
+
+from .base_installer import BaseInstaller
+from .install_status_result import InstallStatusResult
+from .installables import Installable
+from .test_scenario import TestRun
+
+
+class StreamingInstall:
+    """
+    Installation running in a background thread, so that test runs can start as soon as their installables are ready.
+
+    Attributes
+        installer (BaseInstaller): The installer of the system.
+        items (List[Installable]): Items to install.
+        results (dict[Installable, InstallStatusResult]): Results of the items done so far.
+        result (Optional[InstallStatusResult]): Result of the whole installation, None while it is running.
+        listeners (List[Callable[[], None]]): Functions called from the installation thread whenever an item is done.
+    """
+
+    def __init__(self, installer: BaseInstaller, items: Iterable[Installable]) -> None:
+        self.installer = installer
+        self.items = list(items)
+        self.results: dict[Installable, InstallStatusResult] = {}
+        self.result: Optional[InstallStatusResult] = None
+        self.listeners: List[Callable[[], None]] = []
+        self.lock = threading.Lock()
+        self.thread = threading.Thread(target=self._install, name="cloudai-install", daemon=True)
+
+    def start(self) -> None:
+        logging.info(f"Installing {len(set(self.items))} item(s) in the background.")
+        self.thread.start()
+
+    def wait(self) -> InstallStatusResult:
+        """Wait for the installation to finish and return its result."""
+        self.thread.join()
+        assert self.result is not None
+        return self.result
+
+    def _install(self) -> None:
+        try:
+            result = self.installer.install(self.items, on_installed=self._on_installed)
+        except Exception as e:
+            logging.error(f"Installation failed: {e}")
+            result = InstallStatusResult(False, str(e))
+        with self.lock:
+            self.result = result
+        self._notify()
+
+    def _on_installed(self, item: Installable, result: InstallStatusResult) -> None:
+        with self.lock:
+            self.results[item] = result
+        self._notify()
+
+    def _notify(self) -> None:
+        for listener in self.listeners:
+            listener()
+
+    def status(self, tr: TestRun) -> Optional[InstallStatusResult]:
+        """
+        Get the installation status of a test run.
+
+        Args:
+            tr (TestRun): The test run to check.
+
+        Returns:
+            Optional[InstallStatusResult]: None while some of its installables are not installed yet, a failure if any
+                of them could not be installed, a success otherwise.
+        """
+        items = tr.test.installables + self.installer.system.system_installables()
+        with self.lock:
+            results = {item: self.results.get(item) for item in items}
+            finished = self.result
+
+        failed = [f"{item!r}: {res.message}" for item, res in results.items() if res is not None and not res.success]
+        if failed:
+            return InstallStatusResult(False, "; ".join(failed))
+        if all(res is not None for res in results.values()):
+            return InstallStatusResult(True)
+        if finished is not None:
+            return InstallStatusResult(False, finished.message)
+        return None
@@ -1,5 +1,5 @@
 # SPDX-FileCopyrightText: NVIDIA CORPORATION & AFFILIATES
-# Copyright (c) 2024-2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# Copyright (c) 2024-2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
 # SPDX-License-Identifier: Apache-2.0
 #
 # Licensed under the Apache License, Version 2.0 (the "License");
@@ -18,11 +18,13 @@
 import logging
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Optional
 
 from pydantic import BaseModel, ConfigDict, Field
 
+from .git_mirror import GitMirrorConfig
 from .installables import Installable
+from .uv_env import UvConfig
 
 if TYPE_CHECKING:
     from .base_job import BaseJob
@@ -40,6 +42,8 @@ class System(ABC, BaseModel):
     hf_home_path: Path = Field(default_factory=lambda data: data["install_path"] / "huggingface")
     global_env_vars: dict[str, Any] = Field(default_factory=dict)
     monitor_interval: int = 1
+    git_mirror: Optional[GitMirrorConfig] = None
+    uv: Optional[UvConfig] = None
 
     @abstractmethod
     def update(self) -> None:
@@ -118,3 +122,28 @@ class System(ABC, BaseModel):
 
     def system_installables(self) -> list[Installable]:
         return []
+
+    def fingerprint(self) -> dict[str, Any]:
+        """
+        Describe the system properties that affect workload results.
+
+        Used to tell results collected on different systems apart, e.g. by the persistent DSE result cache.
+
+        Returns:
+            dict[str, Any]: JSON-serializable system properties.
+        """
+        return {"name": self.name, "scheduler": self.scheduler}
+
+    def placement(self, nodes: list[str]) -> dict[str, Any]:
+        """
+        Describe where on the system a test run with the given node specification runs.
+
+        Used together with ``fingerprint`` to tell apart results collected on different parts of the same system.
+
+        Args:
+            nodes (list[str]): Node specification of the test run.
+
+        Returns:
+            dict[str, Any]: JSON-serializable placement properties.
+        """
+        return {}
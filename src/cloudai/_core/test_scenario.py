@@ -17,12 +17,14 @@
 from __future__ import annotations
 
 import copy
-import itertools
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, List, Optional, Set, Type, Union
+from typing import TYPE_CHECKING, Any, List, Mapping, Optional, Set, Type, Union
+
+from pydantic import BaseModel
 
 from ..util import flatten_dict
+from .parameter_space import ParameterSpace
 from .system import System
 
 if TYPE_CHECKING:
@@ -76,6 +78,8 @@ class TestRun:
     post_test: Optional[TestScenario] = None
     reports: Set[Type[ReportGenerationStrategy]] = field(default_factory=set)
     extra_srun_args: str | None = None
+    overrides: Mapping[str, Any] = field(default_factory=dict, repr=False, compare=False)
+    shares_test: bool = field(default=False, repr=False, compare=False)
 
     def __hash__(self) -> int:
         return hash(self.name + self.test.name + str(self.iterations) + str(self.current_iteration))
@@ -110,6 +114,13 @@ class TestRun:
 
         return report(system, self).get_metric(metric)
 
+    def get_progress(self, system: System) -> Optional[int]:
+        report = self.metric_reporter
+        if report is None:
+            return None
+
+        return report(system, self).get_progress()
+
     @property
     def is_dse_job(self) -> bool:
         return self.test.is_dse_job or isinstance(self.num_nodes, list)
@@ -122,58 +133,123 @@ class TestRun:
         return self.num_nodes
 
     @property
-    def param_space(self) -> dict[str, Any]:
-        cmd_args_dict = flatten_dict(self.test.cmd_args.model_dump())
-        extra_env_vars_dict = self.test.extra_env_vars
-
-        action_space: dict[str, Any] = {
-            **{key: value for key, value in cmd_args_dict.items() if isinstance(value, list)},
-            **{f"extra_env_vars.{key}": value for key, value in extra_env_vars_dict.items() if isinstance(value, list)},
+    def parameter_values(self) -> dict[str, Any]:
+        """Values of all parameters by their action names, swept parameters are lists."""
+        return {
+            **flatten_dict(self.test.cmd_args.model_dump()),
+            **{f"extra_env_vars.{key}": value for key, value in self.test.extra_env_vars.items()},
+            "NUM_NODES": self.num_nodes if isinstance(self.num_nodes, list) else self.nnodes,
         }
-        if isinstance(self.num_nodes, list):
-            action_space["NUM_NODES"] = self.num_nodes
 
-        return action_space
+    @property
+    def param_space(self) -> dict[str, Any]:
+        return {key: value for key, value in self.parameter_values.items() if isinstance(value, list)}
 
     @property
-    def all_combinations(self) -> list[dict[str, Any]]:
+    def all_combinations(self) -> ParameterSpace:
         if not self.is_dse_job:
-            return []
+            return ParameterSpace({})
 
-        param_space: dict[str, Any] = self.param_space
-        if not param_space:
-            return []
+        return ParameterSpace(self.param_space)
 
-        parameter_values: list[Any] = []
-        for _, values in param_space.items():
-            parameter_values.append(values)
-        action_combinations = list(itertools.product(*parameter_values))
+    def feasible_combinations(self, system: Optional[System]) -> ParameterSpace:
+        """All combinations that pass the vectorized constraints of the workload."""
+        return self.filter_feasible(self.all_combinations, system)
 
-        keys = list(param_space.keys())
-        all_combinations = [dict(zip(keys, combination, strict=True)) for combination in action_combinations]
+    def filter_feasible(self, space: ParameterSpace, system: Optional[System]) -> ParameterSpace:
+        """
+        Prune points violating the vectorized constraints of the workload, before any TestRun is built for them.
 
-        return all_combinations
+        Args:
+            space (ParameterSpace): The space to prune, its parameters must be parameters of this test run.
+            system (Optional[System]): The system the test runs on.
+
+        Returns:
+            ParameterSpace: The space restricted to feasible points.
+        """
+        return space.feasible(self.test.grid_constraints(system), self.parameter_values)
 
     def apply_params_set(self, action: dict[str, Any]) -> "TestRun":
-        tdef = self.test.model_copy(deep=True)
+        """
+        Build a test run with the action applied on top of this one.
+
+        The test definition is copied on write: only models on the paths of changed fields are copied, everything else
+        is shared with this test run, and only the changed fields and the models containing them are validated. The
+        returned test run records all applied ``overrides`` and is materialized into an independent copy once a command
+        is generated for it.
+
+        Args:
+            action (dict[str, Any]): Parameter values by their action names.
+
+        Returns:
+            TestRun: The new test run.
+        """
+        tdef = self.test.model_copy()
+        owned: set[int] = {id(tdef)}
+        extra_env_vars: Optional[dict[str, Any]] = None
         for key, value in action.items():
             if key.startswith("extra_env_vars."):
-                tdef.extra_env_vars[key[len("extra_env_vars.") :]] = value
+                extra_env_vars = dict(tdef.extra_env_vars) if extra_env_vars is None else extra_env_vars
+                extra_env_vars[key[len("extra_env_vars.") :]] = value
             else:
-                attrs = key.split(".")
-                obj = tdef.cmd_args
-                for attr in attrs[:-1]:
-                    obj = getattr(obj, attr)
-                setattr(obj, attrs[-1], value)
+                _set_copy_on_write(tdef, ["cmd_args", *key.split(".")], value, owned)
 
-        type(tdef)(**tdef.model_dump())  # trigger validation
+        if extra_env_vars is not None:
+            type(tdef).__pydantic_validator__.validate_assignment(tdef, "extra_env_vars", extra_env_vars)
 
-        new_tr = copy.deepcopy(self)
+        new_tr = self.fork()
         new_tr.test = tdef
+        new_tr.overrides = {**self.overrides, **action}
         if "NUM_NODES" in action:
             new_tr.num_nodes = action["NUM_NODES"]
         return new_tr
 
+    def fork(self) -> "TestRun":
+        """Return a copy of the test run that shares its test definition until ``materialize`` is called."""
+        new_tr = copy.copy(self)
+        new_tr.nodes = list(self.nodes)
+        new_tr.exclude_nodes = list(self.exclude_nodes)
+        new_tr.dependencies = dict(self.dependencies)
+        new_tr.reports = set(self.reports)
+        new_tr.shares_test = True
+        return new_tr
+
+    def materialize(self) -> None:
+        """Replace state shared with other test runs by independent copies, so it can be modified safely."""
+        if not self.shares_test:
+            return
+
+        self.test = self.test.model_copy(deep=True)
+        self.pre_test = copy.deepcopy(self.pre_test)
+        self.post_test = copy.deepcopy(self.post_test)
+        self.shares_test = False
+
+
+def _set_copy_on_write(root: Any, attrs: list[str], value: Any, owned: set[int]) -> None:
+    """
+    Set a nested attribute, copying objects on the path that are not owned yet.
+
+    Only models on the path are validated, bottom-up: assigning a model instance does not re-run its validators
+    (``revalidate_instances='never'``), so each parent is validated after its changed child.
+    """
+    path: list[tuple[Any, str, Any]] = []
+    obj = root
+    for attr in attrs[:-1]:
+        child = getattr(obj, attr)
+        if id(child) not in owned:
+            child = child.model_copy() if isinstance(child, BaseModel) else copy.copy(child)
+            owned.add(id(child))
+            setattr(obj, attr, child)
+        path.append((obj, attr, child))
+        obj = child
+
+    path.append((obj, attrs[-1], value))
+    for parent, attr, child in reversed(path):
+        if isinstance(parent, BaseModel):
+            type(parent).__pydantic_validator__.validate_assignment(parent, attr, child)
+        else:
+            setattr(parent, attr, child)
+
 
 @dataclass
 class TestScenario:
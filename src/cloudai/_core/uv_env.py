@@ -0,0 +1,119 @@
+# SPDX-FileCopyrightText: NVIDIA CORPORATION & AFFILIATES
+# Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import logging
+import shutil
+import subprocess
+import time
+from pathlib import Path
+from shutil import rmtree
+from typing import Optional
+
+from pydantic import BaseModel, ConfigDict
+
+from .install_status_result import InstallStatusResult
+
+
+class UvConfig(BaseModel):
+    """
+    Virtual environments of PythonExecutable installables built with ``uv``.
+
+    Attributes
+        cache_dir: uv cache shared by all virtual environments. Defaults to ``.uv-cache`` in the install path, which
+            keeps it on the same filesystem as the environments so that packages are hardlinked instead of copied.
+        wheelhouse: Directory with wheels to install from instead of the package index, no network access is made.
+        lockfile: Name of a pinned requirements file in the project directory, e.g. produced by ``uv pip compile``.
+            When present, the environment is synced to exactly these pins.
+        python: Python interpreter for ``uv venv``.
+    """
+
+    model_config = ConfigDict(extra="forbid")
+
+    cache_dir: Optional[Path] = None
+    wheelhouse: Optional[Path] = None
+    lockfile: Optional[str] = None
+    python: str = "python"
+
+
+class UvEnvBuilder:
+    """Create virtual environments and install dependencies with ``uv``, logging the time spent in each step."""
+
+    def __init__(self, cache_dir: Path, config: UvConfig) -> None:
+        self.cache_dir = cache_dir
+        self.config = config
+
+    def create_venv(self, venv_path: Path) -> InstallStatusResult:
+        if shutil.which("uv") is None:
+            return InstallStatusResult(False, "uv is not found in PATH, it is required by the system's 'uv' option.")
+
+        # Seed pip into the environment, workloads install extra packages with `<venv>/bin/python -m pip`
+        args = ["venv", "--seed", "--python", self.config.python, *self._index_args(), str(venv_path)]
+        res = self._run("venv", venv_path, args)
+        if not res.success and venv_path.exists():
+            rmtree(venv_path)
+        return res
+
+    def install_pyproject(self, venv_path: Path, project_dir: Path) -> InstallStatusResult:
+        lockfile = self._lockfile(project_dir)
+        if lockfile is None:
+            return self._run("install", venv_path, ["pip", "install", *self._pip_args(venv_path), str(project_dir)])
+
+        res = self._sync(venv_path, lockfile)
+        if not res.success:
+            return res
+        args = ["pip", "install", *self._pip_args(venv_path), "--no-deps", str(project_dir)]
+        return self._run("install", venv_path, args)
+
+    def install_requirements(self, venv_path: Path, requirements_txt: Path) -> InstallStatusResult:
+        lockfile = self._lockfile(requirements_txt.parent)
+        if lockfile is not None:
+            return self._sync(venv_path, lockfile)
+        args = ["pip", "install", *self._pip_args(venv_path), "-r", str(requirements_txt)]
+        return self._run("install", venv_path, args)
+
+    def _sync(self, venv_path: Path, lockfile: Path) -> InstallStatusResult:
+        return self._run("sync", venv_path, ["pip", "sync", *self._pip_args(venv_path), str(lockfile)])
+
+    def _lockfile(self, project_dir: Path) -> Optional[Path]:
+        if not self.config.lockfile:
+            return None
+        lockfile = project_dir / self.config.lockfile
+        if not lockfile.is_file():
+            logging.warning(f"Lockfile {lockfile} does not exist, dependencies are resolved without pins.")
+            return None
+        return lockfile
+
+    def _pip_args(self, venv_path: Path) -> list[str]:
+        return ["--python", str(venv_path / "bin" / "python"), "--link-mode", "hardlink", *self._index_args()]
+
+    def _index_args(self) -> list[str]:
+        if self.config.wheelhouse:
+            return ["--offline", "--no-index", "--find-links", str(self.config.wheelhouse)]
+        return []
+
+    def _run(self, step: str, venv_path: Path, args: list[str]) -> InstallStatusResult:
+        cmd = ["uv", "--cache-dir", str(self.cache_dir), *args]
+        logging.debug(f"Running uv {step} using: {' '.join(cmd)}")
+        start = time.monotonic()
+        result = subprocess.run(cmd, capture_output=True, text=True)
+        elapsed = time.monotonic() - start
+        logging.info(f"uv {step} for {venv_path.name} took {elapsed:.1f}s")
+
+        if result.returncode != 0:
+            return InstallStatusResult(
+                False, f"uv {step} failed for {venv_path}:\nSTDOUT:\n{result.stdout}\nSTDERR:\n{result.stderr}"
+            )
+        return InstallStatusResult(True)
@@ -1,5 +1,5 @@
 # SPDX-FileCopyrightText: NVIDIA CORPORATION & AFFILIATES
-# Copyright (c) 2024-2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# Copyright (c) 2024-2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
 # SPDX-License-Identifier: Apache-2.0
 #
 # Licensed under the Apache License, Version 2.0 (the "License");
@@ -123,6 +123,12 @@ cache_without_check_opt = click.option(
 single_sbatch_opt = click.option(
     "--single-sbatch", is_flag=True, default=False, help="Use single sbatch for all test runs (Slurm only)."
 )
+stream_install_opt = click.option(
+    "--stream-install",
+    is_flag=True,
+    default=False,
+    help="Start test runs as soon as their own components are installed, install the rest in the background.",
+)
 
 
 @click.group(name="CloudAI", context_settings={"help_option_names": ["-h", "--help"]})
@@ -174,6 +180,7 @@ def dry_run(
         mode="dry-run",
         enable_cache_without_check=enable_cache_without_check,
         single_sbatch=single_sbatch,
+        stream_install=False,
     )
     exit(handle_dry_run_and_run(args))
 
@@ -183,6 +190,7 @@ def dry_run(
 @output_dir_opt
 @cache_without_check_opt
 @single_sbatch_opt
+@stream_install_opt
 def run(
     system_cfg: Path,
     tests_dir: Path,
@@ -190,6 +198,7 @@ def run(
     output_dir: Path,
     enable_cache_without_check: bool,
     single_sbatch: bool,
+    stream_install: bool,
 ):
     """
     Run all the workloads from a scenario.
@@ -204,6 +213,7 @@ def run(
         mode="run",
         enable_cache_without_check=enable_cache_without_check,
         single_sbatch=single_sbatch,
+        stream_install=stream_install,
     )
     exit(handle_dry_run_and_run(args))
 
@@ -27,14 +27,18 @@ import toml
 import yaml
 
 from cloudai.core import (
+    BaseAgent,
+    BaseAgentConfig,
     BaseInstaller,
     CloudAIGymEnv,
+    DSEResultCache,
     Installable,
     InstallStatusResult,
     MissingTestError,
     Parser,
     Registry,
     Runner,
+    StreamingInstall,
     System,
     TestParser,
     TestScenario,
@@ -150,18 +154,18 @@ def handle_dse_job(runner: Runner, args: argparse.Namespace) -> int:
             logging.info(f"Using deterministic first sweep for the chosen agent: {env.first_sweep}.")
 
         agent = agent_class(env, agent_config)
+        if agent_config.result_cache and args.mode == "run":
+            env.result_cache = DSEResultCache(
+                runner.runner.system.install_path / DSEResultCache.FILE_NAME, agent_config.result_cache_ttl
+            )
+            logging.info(f"Using persistent DSE result cache: {env.result_cache.path}")
 
-        for step in range(agent.max_steps):
-            result = agent.select_action()
-            if result is None:
-                break
-            step, action = result
-            env.test_run.step = step
-            logging.info(f"Running step {step} (of {agent.max_steps}) with action {action}")
-            observation, reward, *_ = env.step(action)
-            feedback = {"trial_index": step, "value": reward}
-            agent.update_policy(feedback)
-            logging.info(f"Step {step}: Observation: {[round(obs, 4) for obs in observation]}, Reward: {reward:.4f}")
+        try:
+            run_dse_trials(env, agent, agent_type, agent_config)
+        finally:
+            runner.runner.release_resources()
+            if env.result_cache is not None:
+                env.result_cache.close()
 
     if args.mode == "run":
         runner.runner.test_scenario.test_runs = original_test_runs
@@ -171,6 +175,27 @@ def handle_dse_job(runner: Runner, args: argparse.Namespace) -> int:
     return err
 
 
+def run_dse_trials(env: CloudAIGymEnv, agent: BaseAgent, agent_type: str, agent_config: BaseAgentConfig) -> None:
+    if agent.supports_batched_trials and (agent_config.max_parallel_trials > 1 or agent.supports_early_stopping):
+        logging.info(f"Running up to {agent_config.max_parallel_trials} trials concurrently.")
+        env.run_trials(agent, agent_config.max_parallel_trials)
+        return
+    if agent_config.max_parallel_trials > 1:
+        logging.warning(f"Agent {agent_type} does not support concurrent trials, running them one by one.")
+
+    for step in range(agent.max_steps):
+        result = agent.select_action()
+        if result is None:
+            break
+        step, action = result
+        env.test_run.step = step
+        logging.info(f"Running step {step} (of {agent.max_steps}) with action {action}")
+        observation, reward, *_ = env.step(action)
+        feedback = {"trial_index": step, "value": reward}
+        agent.update_policy(feedback)
+        logging.info(f"Step {step}: Observation: {[round(obs, 4) for obs in observation]}, Reward: {reward:.4f}")
+
+
 def generate_reports(system: System, test_scenario: TestScenario, result_dir: Path) -> None:
     registry = Registry()
 
@@ -202,6 +227,20 @@ def handle_non_dse_job(runner: Runner, args: argparse.Namespace) -> None:
     logging.info("All jobs are complete.")
 
 
+def handle_streaming_install_job(runner: Runner, args: argparse.Namespace, installation: StreamingInstall) -> int:
+    runner.runner.installation = installation
+    installation.start()
+    handle_non_dse_job(runner, args)
+
+    result = installation.wait()
+    if not result.success:
+        logging.error("Failed to install workloads components.")
+        logging.error(result.message)
+        return 1
+    _log_installation_dirs("CloudAI is successfully installed into", runner.runner.system)
+    return 0
+
+
 def register_signal_handlers(signal_handler: Callable) -> None:
     """Register signal handlers for handling termination-related signals."""
     signals = [
@@ -265,21 +304,18 @@ def _check_installation(
     return result
 
 
-def handle_dry_run_and_run(args: argparse.Namespace) -> int:
-    setup_result = _setup_system_and_scenario(args)
-    if setup_result is None:
-        return 1
-    system, test_scenario, tests = setup_result
-
-    if not _handle_single_sbatch(args, system):
-        return 1
-
-    logging.info(f"System Name: {system.name}")
-    logging.info(f"Scheduler: {system.scheduler}")
-    logging.info(f"Test Scenario Name: {test_scenario.name}")
-
+def _install_components(
+    args: argparse.Namespace, system: System, tests: list[TestDefinition], test_scenario: TestScenario, has_dse: bool
+) -> tuple[bool, Optional[StreamingInstall]]:
+    """Install missing components, or prepare their installation in the background when installs are streamed."""
     result = _check_installation(args, system, tests, test_scenario)
-    if args.mode == "run" and not result.success:
+    if args.mode == "run" and not result.success and args.stream_install and not (has_dse or args.single_sbatch):
+        logging.info("Not all workloads components are installed. Installing while tests are running...")
+        installables, installer = prepare_installation(system, tests, test_scenario)
+        return True, StreamingInstall(installer, installables)
+    elif args.mode == "run" and not result.success:
+        if args.stream_install:
+            logging.warning("Streaming installation is not supported for DSE and single sbatch runs.")
         logging.info("Not all workloads components are installed. Installing...")
         installables, installer = prepare_installation(system, tests, test_scenario)
 
@@ -289,7 +325,7 @@ def handle_dry_run_and_run(args: argparse.Namespace) -> int:
         else:
             logging.error("Failed to install workloads components.")
             logging.error(result.message)
-            return 1
+            return False, None
     elif args.mode == "dry-run":
         # simulate installation for dry-run
         installables, installer = prepare_installation(system, tests, test_scenario)
@@ -297,13 +333,36 @@ def handle_dry_run_and_run(args: argparse.Namespace) -> int:
         if not result.success:
             logging.warning("Failed to mark workloads components as installed for dry-run.")
 
+    return True, None
+
+
+def handle_dry_run_and_run(args: argparse.Namespace) -> int:
+    setup_result = _setup_system_and_scenario(args)
+    if setup_result is None:
+        return 1
+    system, test_scenario, tests = setup_result
+
+    if not _handle_single_sbatch(args, system):
+        return 1
+
+    logging.info(f"System Name: {system.name}")
+    logging.info(f"Scheduler: {system.scheduler}")
+    logging.info(f"Test Scenario Name: {test_scenario.name}")
+
+    has_dse = any(tr.is_dse_job for tr in test_scenario.test_runs)
+    ok, installation = _install_components(args, system, tests, test_scenario, has_dse)
+    if not ok:
+        return 1
+
     logging.info(test_scenario.pretty_print())
 
     runner = Runner(args.mode, system, test_scenario)
     register_signal_handlers(runner.cancel_on_signal)
     logging.info(f"Scenario results will be stored at: {runner.runner.scenario_root}")
 
-    has_dse = any(tr.is_dse_job for tr in test_scenario.test_runs)
+    log_feasible_spaces(test_scenario, system)
+    if installation is not None:
+        return handle_streaming_install_job(runner, args, installation)
     if args.single_sbatch or not has_dse:  # in this mode cases are unrolled using grid search
         handle_non_dse_job(runner, args)
         return 0
@@ -315,6 +374,17 @@ def handle_dry_run_and_run(args: argparse.Namespace) -> int:
     return 1
 
 
+def log_feasible_spaces(test_scenario: TestScenario, system: System) -> None:
+    for tr in test_scenario.test_runs:
+        if not tr.is_dse_job:
+            continue
+        space = tr.feasible_combinations(system)
+        fraction = len(space) / space.grid_size if space.grid_size else 0.0
+        logging.info(
+            f"DSE space of {tr.name}: {len(space):,} of {space.grid_size:,} combinations are feasible ({fraction:.1%})."
+        )
+
+
 def handle_generate_report(args: argparse.Namespace) -> int:
     """
     Generate a report based on the existing configuration and test results.
@@ -18,11 +18,17 @@ from .base_agent import BaseAgent
 from .base_gym import BaseGym
 from .cloudai_gym import CloudAIGymEnv, TrajectoryEntry
 from .grid_search import GridSearchAgent
+from .hyperband import HyperbandAgent, HyperbandAgentConfig
+from .result_cache import CachedResult, DSEResultCache
 
 __all__ = [
     "BaseAgent",
     "BaseGym",
+    "CachedResult",
     "CloudAIGymEnv",
+    "DSEResultCache",
     "GridSearchAgent",
+    "HyperbandAgent",
+    "HyperbandAgentConfig",
     "TrajectoryEntry",
 ]
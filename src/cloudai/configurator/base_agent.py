@@ -15,9 +15,9 @@
 # limitations under the License.
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Literal
+from typing import Any, Dict, Literal, Optional
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field
 
 from .base_gym import BaseGym
 
@@ -29,6 +29,9 @@ class BaseAgentConfig(BaseModel):
 
     random_seed: int = 42
     start_action: Literal["random", "first"] = "random"
+    max_parallel_trials: int = Field(default=1, ge=1)
+    result_cache: bool = False
+    result_cache_ttl: Optional[int] = Field(default=None, gt=0)
 
 
 class BaseAgent(ABC):
@@ -36,8 +39,18 @@ class BaseAgent(ABC):
     Base class for all agents in the CloudAI framework.
 
     Provides a unified interface and parameter management for action spaces.
+
+    Agents that set ``supports_batched_trials`` can have several trials in flight at once: actions are requested in
+    batches with ``select_actions`` and feedback for them is passed to ``update_policy`` in completion order, which may
+    differ from the order actions were selected in.
+
+    Agents that set ``supports_early_stopping`` are asked with ``should_stop_trial`` whether a running trial is worth
+    finishing, based on the reward computed from its partial results and the progress these results were read at.
     """
 
+    supports_batched_trials: bool = False
+    supports_early_stopping: bool = False
+
     def __init__(self, env: BaseGym, config: BaseAgentConfig):
         """
         Initialize the agent with the environment.
@@ -68,21 +81,56 @@ class BaseAgent(ABC):
         pass
 
     @abstractmethod
-    def select_action(self) -> tuple[int, dict[str, Any]]:
+    def select_action(self) -> Optional[tuple[int, dict[str, Any]]]:
         """
         Select an action from the action space.
 
         Returns:
-            Tuple[int, Dict[str, Any]]: The current step index and a dictionary mapping action keys to selected values.
+            Optional[Tuple[int, Dict[str, Any]]]: The current step index and a dictionary mapping action keys to
+                selected values. None if there is nothing to run now, either because the action space is exhausted or
+                because the agent waits for feedback of trials in flight.
         """
         pass
 
+    def select_actions(self, n: int) -> list[tuple[int, dict[str, Any]]]:
+        """
+        Select up to ``n`` actions to be run concurrently.
+
+        Args:
+            n (int): Maximum number of actions to select.
+
+        Returns:
+            list[tuple[int, dict[str, Any]]]: Steps and actions, fewer than ``n`` if the action space is exhausted.
+        """
+        actions = []
+        for _ in range(n):
+            result = self.select_action()
+            if result is None:
+                break
+            actions.append(result)
+        return actions
+
     @abstractmethod
     def update_policy(self, _feedback: Dict[str, Any]) -> None:
         """
         Update the agent state based on feedback from the environment.
 
         Args:
-            feedback (Dict[str, Any]): Feedback information from the environment.
+            feedback (Dict[str, Any]): Feedback information from the environment. ``trial_index`` identifies the step
+                the feedback belongs to, with concurrent trials feedback can arrive out of order.
         """
         pass
+
+    def should_stop_trial(self, trial_index: int, value: float, progress: int) -> bool:
+        """
+        Decide whether a running trial should be stopped early.
+
+        Args:
+            trial_index (int): The step of the running trial.
+            value (float): The reward computed from partial results of the trial.
+            progress (int): Progress the partial results were read at, e.g. the last training step reported.
+
+        Returns:
+            bool: True if the trial should be stopped.
+        """
+        return False
@@ -14,6 +14,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import bisect
 import copy
 import csv
 import dataclasses
@@ -21,10 +22,12 @@ import logging
 from pathlib import Path
 from typing import Any, Dict, Optional, Tuple
 
-from cloudai.core import METRIC_ERROR, BaseRunner, Registry, TestRun
+from cloudai.core import METRIC_ERROR, BaseJob, BaseRunner, ParameterSpace, Registry, TestRun
 from cloudai.util.lazy_imports import lazy
 
+from .base_agent import BaseAgent
 from .base_gym import BaseGym
+from .result_cache import DSEResultCache
 
 
 @dataclasses.dataclass(frozen=True)
@@ -58,11 +61,19 @@ class CloudAIGymEnv(BaseGym):
         self.max_steps = test_run.test.agent_steps
         self.reward_function = Registry().get_reward_function(test_run.test.agent_reward_function)
         self.trajectory: dict[int, list[TrajectoryEntry]] = {}
+        self.pending_trials: dict[int, dict[str, Any]] = {}
+        self.stopped_trials: set[int] = set()
+        self.selected_trials = 0
+        self.result_cache: Optional[DSEResultCache] = None
         super().__init__()
 
     def define_action_space(self) -> Dict[str, list[Any]]:
         return self.test_run.param_space
 
+    def feasible_action_space(self, space: ParameterSpace) -> ParameterSpace:
+        """Prune points of the action space that violate vectorized constraints of the workload."""
+        return self.original_test_run.filter_feasible(space, self.runner.system)
+
     @property
     def first_sweep(self) -> dict[str, Any]:
         """Builds a sweep using first elements of each explorable parameter."""
@@ -129,7 +140,11 @@ class CloudAIGymEnv(BaseGym):
             logging.info("Constraint check failed. Skipping step.")
             return [-1.0], -1.0, True, {}
 
-        new_tr = copy.deepcopy(self.test_run)
+        persisted = self.get_persisted_result(self.test_run, action)
+        if persisted is not None:
+            return persisted.observation, persisted.reward, False, {}
+
+        new_tr = self.test_run.fork()
         new_tr.output_path = self.runner.get_job_output_path(new_tr)
         self.runner.test_scenario.test_runs = [new_tr]
 
@@ -145,12 +160,13 @@ class CloudAIGymEnv(BaseGym):
         if self.runner.test_scenario.test_runs and self.runner.test_scenario.test_runs[0].output_path.exists():
             self.test_run = self.runner.test_scenario.test_runs[0]
         else:
-            self.test_run = copy.deepcopy(self.original_test_run)
+            self.test_run = self.original_test_run.fork()
             self.test_run.step = new_tr.step
             self.test_run.output_path = new_tr.output_path
 
         observation = self.get_observation(action)
         reward = self.compute_reward(observation)
+        self.persist_result(new_tr, observation, reward)
 
         self.write_trajectory(
             TrajectoryEntry(
@@ -163,6 +179,175 @@ class CloudAIGymEnv(BaseGym):
 
         return observation, reward, False, {}
 
+    def run_trials(self, agent: BaseAgent, max_parallel_trials: int) -> None:
+        """
+        Run up to ``agent.max_steps`` trials, keeping up to ``max_parallel_trials`` of them in flight.
+
+        All trials are run by a single runner scenario. Whenever a trial completes, its reward is reported to the agent
+        and new actions are requested to refill the free slots, so feedback can reach the agent out of order. A failed
+        trial does not stop the others, it is recorded with the observation that could be collected for it.
+
+        If the agent supports early stopping, partial results of running trials are evaluated on every monitoring tick
+        and trials the agent is not interested in anymore are killed. Only workloads whose reports provide the progress
+        of partial results can be stopped early.
+
+        Args:
+            agent (BaseAgent): The agent selecting actions, must support batched trials.
+            max_parallel_trials (int): Maximum number of trials running at the same time.
+        """
+        self.pending_trials.clear()
+        self.stopped_trials.clear()
+        self.selected_trials = 0
+
+        def on_monitor_tick() -> None:
+            self.stop_unpromising_trials(agent)
+
+        def on_job_completion(job: BaseJob) -> None:
+            if job.test_run.step not in self.pending_trials:
+                return
+            self.complete_trial(agent, job.test_run)
+            trials = self.next_trials(agent, max_parallel_trials)
+            self.runner.test_scenario.test_runs.extend(trials)
+            self.runner.submit_tests(trials)
+
+        self.runner.test_scenario.test_runs = self.next_trials(agent, max_parallel_trials)
+        self.runner.shutting_down = False
+        self.runner.jobs.clear()
+        self.runner.testrun_to_job_map.clear()
+
+        job_status_check = self.runner.test_scenario.job_status_check
+        self.runner.test_scenario.job_status_check = False
+        self.runner.completion_callbacks.append(on_job_completion)
+        if agent.supports_early_stopping:
+            self.runner.monitor_callbacks.append(on_monitor_tick)
+        try:
+            self.runner.run()
+        except Exception as e:
+            logging.error(f"Error running trials {sorted(self.pending_trials)}: {e}")
+        finally:
+            self.runner.completion_callbacks.remove(on_job_completion)
+            if on_monitor_tick in self.runner.monitor_callbacks:
+                self.runner.monitor_callbacks.remove(on_monitor_tick)
+            self.runner.test_scenario.job_status_check = job_status_check
+
+        for tr in self.runner.test_scenario.test_runs:
+            if tr.step in self.pending_trials:
+                self.complete_trial(agent, tr)
+
+    def next_trials(self, agent: BaseAgent, max_parallel_trials: int) -> list[TestRun]:
+        """Select actions for the free trial slots and return test runs of the trials that have to run."""
+        trials: list[TestRun] = []
+        while len(self.pending_trials) < max_parallel_trials and self.selected_trials < agent.max_steps:
+            n = min(max_parallel_trials - len(self.pending_trials), agent.max_steps - self.selected_trials)
+            actions = agent.select_actions(n)
+            if not actions:
+                break
+            for step, action in actions:
+                self.selected_trials += 1
+                tr = self.prepare_trial(agent, step, action)
+                if tr is not None:
+                    self.pending_trials[step] = action
+                    trials.append(tr)
+        return trials
+
+    def stop_unpromising_trials(self, agent: BaseAgent) -> None:
+        """Compute rewards from partial results of running trials and kill the ones the agent wants to stop."""
+        for job in list(self.runner.jobs):
+            step = job.test_run.step
+            if step not in self.pending_trials or step in self.stopped_trials:
+                continue
+
+            progress = job.test_run.get_progress(self.runner.system)
+            if progress is None:
+                continue
+
+            observation = self.get_trial_observation(job.test_run)
+            if any(v == -1.0 for v in observation):
+                continue
+
+            reward = self.compute_reward(observation)
+            if agent.should_stop_trial(step, reward, progress):
+                logging.info(
+                    f"Stopping step {step} early, partial reward {reward:.4f} at progress {progress} is not promising."
+                )
+                self.stopped_trials.add(step)
+                self.runner.system.kill(job)
+
+    def complete_trial(self, agent: BaseAgent, tr: TestRun) -> None:
+        """Record the result of a finished trial and report it to the agent."""
+        action = self.pending_trials.pop(tr.step)
+        observation = self.get_trial_observation(tr)
+        reward = self.compute_reward(observation)
+        if tr.step not in self.stopped_trials:
+            self.persist_result(tr, observation, reward)
+        self.write_trajectory(TrajectoryEntry(step=tr.step, action=action, reward=reward, observation=observation))
+        agent.update_policy({"trial_index": tr.step, "value": reward})
+        logging.info(f"Step {tr.step}: Observation: {[round(obs, 4) for obs in observation]}, Reward: {reward:.4f}")
+
+    def prepare_trial(self, agent: BaseAgent, step: int, action: dict[str, Any]) -> Optional[TestRun]:
+        """
+        Build the test run for a trial, or report the result right away if the trial does not need to run.
+
+        Cached and constraint-violating actions are resolved the same way ``step`` does it.
+
+        Returns:
+            Optional[TestRun]: The test run to submit, None if the trial was resolved without running.
+        """
+        tr = self.original_test_run.apply_params_set(action)
+        tr.step = step
+        logging.info(f"Running step {step} (of {agent.max_steps}) with action {action}")
+
+        cached_result = self.get_cached_trajectory_result(action)
+        if cached_result is not None:
+            logging.info(
+                "Retrieved cached result from trajectory with reward %s. Skipping step.",
+                cached_result.reward,
+            )
+            agent.update_policy({"trial_index": step, "value": cached_result.reward})
+            return None
+
+        if not tr.test.constraint_check(tr, self.runner.system):
+            logging.info("Constraint check failed. Skipping step.")
+            agent.update_policy({"trial_index": step, "value": -1.0})
+            return None
+
+        persisted = self.get_persisted_result(tr, action)
+        if persisted is not None:
+            agent.update_policy({"trial_index": step, "value": persisted.reward})
+            return None
+
+        return tr
+
+    def get_persisted_result(self, tr: TestRun, action: dict[str, Any]) -> Optional[TrajectoryEntry]:
+        """
+        Look up the trial in the persistent result cache and record a hit in the trajectory.
+
+        Args:
+            tr (TestRun): The test run with the trial parameters applied.
+            action (dict[str, Any]): The action of the trial.
+
+        Returns:
+            Optional[TrajectoryEntry]: The recorded trajectory entry, None if there is no cache or no usable result.
+        """
+        if self.result_cache is None:
+            return None
+
+        cached = self.result_cache.get(DSEResultCache.key(tr, self.runner.system))
+        if cached is None:
+            return None
+
+        logging.info(
+            "Retrieved cached result from %s with reward %s. Skipping step.", self.result_cache.path, cached.reward
+        )
+        entry = TrajectoryEntry(step=tr.step, action=action, reward=cached.reward, observation=cached.observation)
+        self.write_trajectory(entry)
+        return entry
+
+    def persist_result(self, tr: TestRun, observation: list, reward: float) -> None:
+        if self.result_cache is None or not DSEResultCache.is_cacheable(observation):
+            return
+        self.result_cache.put(DSEResultCache.key(tr, self.runner.system), observation, reward)
+
     def render(self, mode: str = "human"):
         """
         Render the current state of the TestRun.
@@ -204,31 +389,51 @@ class CloudAIGymEnv(BaseGym):
         Returns:
             list: The observation.
         """
-        all_metrics = self.test_run.test.agent_metrics
+        return self.get_trial_observation(self.test_run)
+
+    def get_trial_observation(self, tr: TestRun) -> list:
+        """
+        Get the observation from the results of a given trial.
+
+        Args:
+            tr (TestRun): The test run of the trial.
+
+        Returns:
+            list: The observation.
+        """
+        all_metrics = tr.test.agent_metrics
         if not all_metrics:
             raise ValueError("No agent metrics defined for the test run")
 
         observation = []
         for metric in all_metrics:
-            v = self.test_run.get_metric_value(self.runner.system, metric)
+            v = tr.get_metric_value(self.runner.system, metric)
             if v == METRIC_ERROR:
                 v = -1.0
             observation.append(v)
         return observation
 
     def write_trajectory(self, entry: TrajectoryEntry):
-        """Append the trajectory to the CSV file and to the local attribute."""
-        self.current_trajectory.append(entry)
+        """
+        Add the entry to the local attribute and the CSV file, keeping both ordered by step.
+
+        Entries of concurrent trials can arrive out of order. An in-order entry is appended to the file, otherwise the
+        file is rewritten from the local attribute.
+        """
+        trajectory = self.current_trajectory
+        in_order = not trajectory or trajectory[-1].step <= entry.step
+        bisect.insort(trajectory, entry, key=lambda e: e.step)
 
         file_exists = self.trajectory_file_path.exists()
-        logging.debug(f"Writing trajectory into {self.trajectory_file_path} (exists: {file_exists})")
+        logging.debug(f"Writing trajectory into {self.trajectory_file_path} (exists: {file_exists}, {in_order=})")
         self.trajectory_file_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(self.trajectory_file_path, mode="a", newline="") as file:
+        rows = [entry] if in_order else trajectory
+        with open(self.trajectory_file_path, mode="a" if in_order else "w", newline="") as file:
             writer = csv.writer(file)
-            if not file_exists:
+            if not file_exists or not in_order:
                 writer.writerow(["step", "action", "reward", "observation"])
-            writer.writerow([entry.step, entry.action, entry.reward, entry.observation])
+            writer.writerows([e.step, e.action, e.reward, e.observation] for e in rows)
 
     @property
     def trajectory_file_path(self) -> Path:
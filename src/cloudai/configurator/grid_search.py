@@ -14,9 +14,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import itertools
 from typing import Any, Dict, List, Tuple
 
+from cloudai.core import ParameterSpace
+
 from .base_agent import BaseAgent, BaseAgentConfig
 from .cloudai_gym import CloudAIGymEnv
 
@@ -28,6 +29,8 @@ class GridSearchAgent(BaseAgent):
     Iterates through all possible parameter combinations.
     """
 
+    supports_batched_trials = True
+
     def __init__(self, env: CloudAIGymEnv, config: BaseAgentConfig):
         """
         Initialize the GridSearchAgent with the TestRun object.
@@ -39,7 +42,7 @@ class GridSearchAgent(BaseAgent):
         self.action_space = env.define_action_space()
         self.env = env
         self.config = config
-        self.action_combinations = []
+        self.action_combinations = ParameterSpace({})
         self.index = 0
         self.configure(self.action_space)
 
@@ -49,16 +52,12 @@ class GridSearchAgent(BaseAgent):
 
     def configure(self, config: Dict[str, Any]) -> None:
         """
-        Configure the grid search by precomputing all parameter combinations.
+        Configure the grid search over a lazily indexed space of all feasible parameter combinations.
 
         Args:
             config (Dict[str, Any]): The action space to configure.
         """
-        parameter_values = []
-        for _, values in config.items():
-            parameter_values.append(values)
-
-        self.action_combinations = list(itertools.product(*parameter_values))
+        self.action_combinations = self.env.feasible_action_space(ParameterSpace(config))
         self.max_steps = len(self.action_combinations)
 
     def get_all_combinations(self) -> List[Dict[str, Any]]:
@@ -68,8 +67,7 @@ class GridSearchAgent(BaseAgent):
         Returns:
             List[Dict[str, Any]]: A list of dictionaries, each representing a unique combination of parameters.
         """
-        keys = list(self.action_space.keys())
-        return [dict(zip(keys, combination, strict=True)) for combination in self.action_combinations]
+        return list(self.action_combinations)
 
     def select_action(self) -> Tuple[int, Dict[str, Any]]:
         """
@@ -79,11 +77,24 @@ class GridSearchAgent(BaseAgent):
             Tuple[int, Dict[str, Any]]: The current step and a dictionary mapping action keys to selected
             values.
         """
-        action = dict(zip(self.action_space.keys(), self.action_combinations[self.index], strict=True))
+        action = self.action_combinations[self.index]
         self.index += 1
         step = self.index
         return step, action
 
+    def select_actions(self, n: int) -> List[Tuple[int, Dict[str, Any]]]:
+        """
+        Select the next ``n`` actions from the grid, fewer if the grid is exhausted.
+
+        Args:
+            n (int): Maximum number of actions to select.
+
+        Returns:
+            List[Tuple[int, Dict[str, Any]]]: Steps and actions in grid order.
+        """
+        n = min(n, len(self.action_combinations) - self.index)
+        return [self.select_action() for _ in range(n)]
+
     def update_policy(self, _feedback: Dict[str, Any]) -> None:
         """
         Update the agent based on feedback (not used in grid search).
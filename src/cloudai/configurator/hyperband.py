@@ -0,0 +1,228 @@
+# SPDX-FileCopyrightText: NVIDIA CORPORATION & AFFILIATES
+# Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import logging
+import math
+import random
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, Tuple
+
+from pydantic import Field, model_validator
+from typing_extensions import Self
+
+from cloudai.core import ParameterSpace
+
+from .base_agent import BaseAgent, BaseAgentConfig
+from .cloudai_gym import CloudAIGymEnv
+
+
+class HyperbandAgentConfig(BaseAgentConfig):
+    """
+    Configuration of the Hyperband agent.
+
+    Attributes
+        fidelity_param (str): Action name of the parameter controlling the trial budget, e.g. ``trainer.max_steps``.
+        min_fidelity (int): Budget of trials in the lowest rung.
+        max_fidelity (int): Budget of trials in the highest rung.
+        eta (int): Only the top ``1/eta`` trials of a rung are promoted to the next rung with ``eta`` times the budget.
+    """
+
+    fidelity_param: str
+    min_fidelity: int = Field(gt=0)
+    max_fidelity: int = Field(gt=0)
+    eta: int = Field(default=3, ge=2)
+
+    @model_validator(mode="after")
+    def check_fidelity_range(self) -> Self:
+        if self.min_fidelity > self.max_fidelity:
+            raise ValueError("min_fidelity must not be greater than max_fidelity")
+        return self
+
+
+@dataclass
+class Rung:
+    """
+    Trials of one successive halving round, all run with the same budget.
+
+    ``checkpoints`` holds the partial rewards of each trial by the progress they were read at, e.g. the training step.
+    """
+
+    fidelity: int
+    configs: list[dict[str, Any]]
+    promote: int
+    trials: dict[int, dict[str, Any]] = field(default_factory=dict)
+    rewards: dict[int, float] = field(default_factory=dict)
+    stopped: set[int] = field(default_factory=set)
+    checkpoints: dict[int, dict[int, float]] = field(default_factory=dict)
+
+    @property
+    def is_issued(self) -> bool:
+        return len(self.trials) == len(self.configs)
+
+    @property
+    def is_complete(self) -> bool:
+        return self.is_issued and len(self.rewards) == len(self.trials)
+
+    def ranked(self) -> list[int]:
+        """Trial indexes from best to worst, trials stopped early rank last."""
+        return sorted(self.rewards, key=lambda idx: (idx not in self.stopped, self.rewards[idx]), reverse=True)
+
+
+class HyperbandAgent(BaseAgent):
+    """
+    Agent implementing Hyperband, successive halving over several brackets of budgets.
+
+    Each bracket samples configurations from the feasible action space and runs them with a low budget (the fidelity
+    parameter, e.g. a number of training steps). Only the top ``1/eta`` of a rung are promoted to the next rung, which
+    runs with ``eta`` times the budget, until the maximum budget is reached. Trials whose partial results show they
+    cannot be promoted are stopped early.
+
+    Early stopping compares partial rewards at the same progress only, e.g. the reward of a running trial at training
+    step 40 against rewards finished trials of the rung had at step 40 while they were running.
+    """
+
+    supports_batched_trials = True
+    supports_early_stopping = True
+
+    def __init__(self, env: CloudAIGymEnv, config: HyperbandAgentConfig):
+        self.env = env
+        self.config = config
+        self.rng = random.Random(config.random_seed)
+        self.action_space = env.define_action_space()
+        self.space = ParameterSpace({})
+        self.brackets: list[list[tuple[int, int]]] = []
+        self.bracket = -1
+        self.rung: Optional[Rung] = None
+        self.rung_index = 0
+        self.trial_index = 0
+        self.max_steps = 0
+        self.configure(self.action_space)
+
+    @staticmethod
+    def get_config_class() -> type[HyperbandAgentConfig]:
+        return HyperbandAgentConfig
+
+    def configure(self, config: Dict[str, Any]) -> None:
+        """
+        Plan all brackets over the feasible action space without the fidelity parameter.
+
+        Args:
+            config (Dict[str, Any]): The action space to configure.
+        """
+        dimensions = {key: values for key, values in config.items() if key != self.config.fidelity_param}
+        self.space = self.env.feasible_action_space(ParameterSpace(dimensions))
+
+        eta = self.config.eta
+        ratio = self.config.max_fidelity / self.config.min_fidelity
+        s_max = int(math.log(ratio, eta) + 1e-9)
+        self.brackets = []
+        for s in range(s_max, -1, -1):
+            n = min(math.ceil((s_max + 1) / (s + 1) * eta**s), len(self.space))
+            rungs: list[tuple[int, int]] = []
+            for i in range(s + 1):
+                n_i = max(n // eta**i, 1)
+                fidelity = min(round(self.config.min_fidelity * ratio / eta ** (s - i)), self.config.max_fidelity)
+                rungs.append((n_i, fidelity))
+            self.brackets.append(rungs)
+
+        self.max_steps = sum(n_i for rungs in self.brackets for n_i, _ in rungs) if len(self.space) else 0
+        self.bracket, self.rung, self.trial_index = -1, None, 0
+
+    def select_action(self) -> Optional[Tuple[int, Dict[str, Any]]]:
+        """
+        Select the next trial of the current rung, advancing to the next rung or bracket when it is complete.
+
+        Returns:
+            Optional[Tuple[int, Dict[str, Any]]]: The step and the action, None if the current rung still waits for
+            results or all brackets are done.
+        """
+        if (self.rung is None or self.rung.is_complete) and not self.advance():
+            return None
+
+        assert self.rung is not None
+        if self.rung.is_issued:
+            return None
+
+        config = self.rung.configs[len(self.rung.trials)]
+        self.trial_index += 1
+        self.rung.trials[self.trial_index] = config
+        return self.trial_index, {**config, self.config.fidelity_param: self.rung.fidelity}
+
+    def advance(self) -> bool:
+        if self.rung is not None and self.rung_index + 1 < len(self.brackets[self.bracket]):
+            self.rung_index += 1
+            promoted = [self.rung.trials[idx] for idx in self.rung.ranked()[: self.rung.promote]]
+        elif self.bracket + 1 < len(self.brackets) and len(self.space):
+            self.bracket += 1
+            self.rung_index = 0
+            promoted = self.sample_configs(self.brackets[self.bracket][0][0])
+        else:
+            return False
+
+        rungs = self.brackets[self.bracket]
+        _, fidelity = rungs[self.rung_index]
+        next_n = rungs[self.rung_index + 1][0] if self.rung_index + 1 < len(rungs) else 1
+        self.rung = Rung(fidelity=fidelity, configs=promoted, promote=next_n)
+        logging.info(
+            f"Hyperband bracket {self.bracket + 1}/{len(self.brackets)}, rung {self.rung_index + 1}/{len(rungs)}: "
+            f"{len(promoted)} configurations with {self.config.fidelity_param}={fidelity}"
+        )
+        return True
+
+    def sample_configs(self, n: int) -> list[dict[str, Any]]:
+        configs = self.space.sample(n, self.rng)
+        if self.bracket == 0 and self.config.start_action == "first":
+            first = {key: self.env.first_sweep[key] for key in self.space.dimensions}
+            if first in self.space and first not in configs:
+                configs[0] = first
+        return configs
+
+    def update_policy(self, _feedback: Dict[str, Any]) -> None:
+        """
+        Record the reward of a trial of the current rung.
+
+        Args:
+            feedback (Dict[str, Any]): Feedback with ``trial_index`` and ``value`` (the reward).
+        """
+        if self.rung is not None and _feedback["trial_index"] in self.rung.trials:
+            self.rung.rewards[_feedback["trial_index"]] = _feedback["value"]
+
+    def should_stop_trial(self, trial_index: int, value: float, progress: int) -> bool:
+        """
+        Stop a running trial if its partial reward is below the reward needed to be promoted.
+
+        The partial reward is compared at the same progress: the promotion threshold is the partial reward of the last
+        promoted trial among already finished trials of the rung that were observed at this progress, so a trial is
+        only stopped once enough finished trials were better than it at the same point of training.
+        """
+        rung = self.rung
+        if rung is None or trial_index not in rung.trials or trial_index in rung.rewards:
+            return False
+
+        rung.checkpoints.setdefault(trial_index, {})[progress] = value
+        finished = sorted(
+            (
+                rung.checkpoints[idx][progress]
+                for idx in rung.rewards
+                if idx not in rung.stopped and progress in rung.checkpoints.get(idx, {})
+            ),
+            reverse=True,
+        )
+        if len(finished) < rung.promote or value >= finished[rung.promote - 1]:
+            return False
+
+        rung.stopped.add(trial_index)
+        return True
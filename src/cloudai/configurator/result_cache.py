@@ -0,0 +1,139 @@
+# SPDX-FileCopyrightText: NVIDIA CORPORATION & AFFILIATES
+# Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import hashlib
+import json
+import logging
+import sqlite3
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Optional
+
+from cloudai.core import System, TestRun
+
+# Agent settings do not change what a trial measures, so they are not part of the cache key.
+KEY_EXCLUDED_TEST_FIELDS = {"agent", "agent_steps", "agent_config"}
+
+
+@dataclass(frozen=True)
+class CachedResult:
+    """Represents a DSE result stored in the persistent cache."""
+
+    observation: list
+    reward: float
+    created_at: float
+
+
+class DSEResultCache:
+    """
+    Persistent, content-addressed cache of DSE trial results.
+
+    Results are stored in an SQLite database and keyed by a hash of the test definition with the trial parameters
+    applied, the number of nodes and the system fingerprint. The same configuration run on the same system gets a cache
+    hit across scenario runs and iterations.
+
+    Attributes
+        path (Path): Path to the SQLite database.
+        ttl (Optional[int]): Time to live of entries in seconds, entries never expire if None.
+        hits (int): Number of lookups served from the cache.
+        misses (int): Number of lookups not found in the cache.
+    """
+
+    FILE_NAME = "dse_results.sqlite"
+
+    def __init__(self, path: Path, ttl: Optional[int] = None):
+        self.path = path
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(self.path)
+        with self.conn:
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS results ("
+                "key TEXT PRIMARY KEY, observation TEXT NOT NULL, reward REAL NOT NULL, created_at REAL NOT NULL)"
+            )
+        self.prune()
+
+    @staticmethod
+    def key(tr: TestRun, system: System) -> str:
+        """
+        Build the cache key for a trial.
+
+        Args:
+            tr (TestRun): The test run with the trial parameters applied.
+            system (System): The system the trial runs on.
+
+        Returns:
+            str: SHA-256 hex digest of the canonical JSON representation of the trial.
+        """
+        content = {
+            "test": tr.test.model_dump(exclude=KEY_EXCLUDED_TEST_FIELDS),
+            "num_nodes": tr.num_nodes,
+            "system": system.fingerprint(),
+            "placement": system.placement(tr.nodes),
+        }
+        canonical = json.dumps(content, sort_keys=True, separators=(",", ":"), default=str)
+        return hashlib.sha256(canonical.encode()).hexdigest()
+
+    def get(self, key: str) -> Optional[CachedResult]:
+        row = self.conn.execute("SELECT observation, reward, created_at FROM results WHERE key = ?", (key,)).fetchone()
+        if row is None or self.is_expired(row[2]):
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return CachedResult(observation=json.loads(row[0]), reward=row[1], created_at=row[2])
+
+    def put(self, key: str, observation: list, reward: float) -> None:
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO results (key, observation, reward, created_at) VALUES (?, ?, ?, ?)",
+                (key, json.dumps(observation), reward, time.time()),
+            )
+
+    def invalidate(self, key: Optional[str] = None) -> None:
+        """Remove a single entry, or all entries if no key is given."""
+        with self.conn:
+            if key is None:
+                self.conn.execute("DELETE FROM results")
+            else:
+                self.conn.execute("DELETE FROM results WHERE key = ?", (key,))
+
+    def prune(self) -> int:
+        """Remove expired entries and return how many were removed."""
+        if self.ttl is None:
+            return 0
+
+        with self.conn:
+            cursor = self.conn.execute("DELETE FROM results WHERE created_at < ?", (time.time() - self.ttl,))
+        if cursor.rowcount:
+            logging.debug(f"Removed {cursor.rowcount} expired DSE results from {self.path}")
+        return cursor.rowcount
+
+    def is_expired(self, created_at: float) -> bool:
+        return self.ttl is not None and created_at < time.time() - self.ttl
+
+    def close(self) -> None:
+        logging.debug(f"DSE result cache {self.path}: {self.hits} hits, {self.misses} misses")
+        self.conn.close()
+
+    @staticmethod
+    def is_cacheable(observation: list[Any]) -> bool:
+        """Failed metrics are reported as -1.0, such results are not worth reusing in other runs."""
+        return bool(observation) and all(v != -1.0 for v in observation)
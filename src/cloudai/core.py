@@ -30,19 +30,26 @@ from ._core.exceptions import (
     TestScenarioParsingError,
     format_validation_error,
 )
+from ._core.git_mirror import GitMirrorConfig, GitMirrorStore
 from ._core.grader import Grader
 from ._core.grading_strategy import GradingStrategy
+from ._core.install_plan import InstallPlan
 from ._core.installables import DockerImage, File, GitRepo, HFModel, Installable, PythonExecutable
 from ._core.job_status_result import JobStatusResult
 from ._core.json_gen_strategy import JsonGenStrategy
+from ._core.parameter_space import GridConstraint, ParameterColumns, ParameterSpace
 from ._core.registry import Registry
 from ._core.report_generation_strategy import ReportGenerationStrategy
 from ._core.runner import Runner
+from ._core.streaming_install import StreamingInstall
 from ._core.system import System
 from ._core.test_scenario import METRIC_ERROR, TestDependency, TestRun, TestScenario
+from ._core.uv_env import UvConfig, UvEnvBuilder
 from .configurator.base_agent import BaseAgent, BaseAgentConfig
 from .configurator.cloudai_gym import CloudAIGymEnv
 from .configurator.grid_search import GridSearchAgent
+from .configurator.hyperband import HyperbandAgent
+from .configurator.result_cache import DSEResultCache
 from .models.workload import CmdArgs, NsysConfiguration, PredictorConfig, TestDefinition
 from .parser import Parser
 from .reporter import PerTestReporter, StatusReporter, TarballReporter
@@ -60,13 +67,19 @@ __all__ = [
     "CloudAIGymEnv",
     "CmdArgs",
     "CommandGenStrategy",
+    "DSEResultCache",
     "DockerImage",
     "File",
+    "GitMirrorConfig",
+    "GitMirrorStore",
     "GitRepo",
     "Grader",
     "GradingStrategy",
+    "GridConstraint",
     "GridSearchAgent",
     "HFModel",
+    "HyperbandAgent",
+    "InstallPlan",
     "InstallStatusResult",
     "Installable",
     "JobIdRetrievalError",
@@ -74,6 +87,8 @@ __all__ = [
     "JsonGenStrategy",
     "MissingTestError",
     "NsysConfiguration",
+    "ParameterColumns",
+    "ParameterSpace",
     "Parser",
     "PerTestReporter",
     "PredictorConfig",
@@ -83,6 +98,7 @@ __all__ = [
     "Reporter",
     "Runner",
     "StatusReporter",
+    "StreamingInstall",
     "System",
     "SystemConfigParsingError",
     "TarballReporter",
@@ -94,6 +110,8 @@ __all__ = [
     "TestScenario",
     "TestScenarioParser",
     "TestScenarioParsingError",
+    "UvConfig",
+    "UvEnvBuilder",
     "case_name",
     "format_validation_error",
 ]
@@ -21,7 +21,16 @@ from typing import Any, Dict, List, Optional, Union
 from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 from typing_extensions import Self
 
-from cloudai.core import GitRepo, Installable, JobStatusResult, PythonExecutable, Registry, System, TestRun
+from cloudai.core import (
+    GitRepo,
+    GridConstraint,
+    Installable,
+    JobStatusResult,
+    PythonExecutable,
+    Registry,
+    System,
+    TestRun,
+)
 
 
 class CmdArgs(BaseModel):
@@ -129,6 +138,15 @@ class TestDefinition(BaseModel, ABC):
     def constraint_check(self, tr: TestRun, system: Optional[System]) -> bool:
         return True
 
+    def grid_constraints(self, system: Optional[System]) -> list[GridConstraint]:
+        """
+        Vectorized constraints used to prune a DSE grid before any test run is built.
+
+        Each constraint gets parameter columns by action names (e.g. ``cmd_args`` field paths, ``NUM_NODES``) and
+        returns a boolean mask. Constraints must not be stricter than ``constraint_check``, which still runs per point.
+        """
+        return []
+
     @property
     def is_dse_job(self) -> bool:
         def check_dict(d: dict) -> bool:
@@ -36,6 +36,7 @@ def register_entrypoint_agents():
 def register_all():
     """Register all workloads, systems, runners, installers, and strategies."""
     from cloudai.configurator.grid_search import GridSearchAgent
+    from cloudai.configurator.hyperband import HyperbandAgent
     from cloudai.configurator.reward_functions import (
         ai_dynamo_log_scale_reward,
         ai_dynamo_ratio_normalized_reward,
@@ -277,6 +278,7 @@ def register_all():
     Registry().add_test_definition("vllm", VllmTestDefinition)
 
     Registry().add_agent("grid_search", GridSearchAgent)
+    Registry().add_agent("hyperband", HyperbandAgent)
 
     Registry().add_report(ChakraReplayTestDefinition, ChakraReplayReportGenerationStrategy)
     Registry().add_report(DeepEPTestDefinition, DeepEPReportGenerationStrategy)
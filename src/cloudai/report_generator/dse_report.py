@@ -308,7 +308,8 @@ def _build_iteration_summary(
 
     total_observed_runtime_sec = sum(elapsed_times)
     avg_step_duration_sec = total_observed_runtime_sec / len(elapsed_times)
-    total_space = len(test_case.all_combinations)
+    param_space = test_case.all_combinations
+    total_space = len(param_space)
     projected_runtime_sec = avg_step_duration_sec * total_space
     saved_runtime_sec = max(projected_runtime_sec - total_observed_runtime_sec, 0.0)
 
@@ -334,7 +335,7 @@ def _build_iteration_summary(
         efficiency_ratio=f"~{format_float(reduction_factor, 1)}x",
         efficiency_steps=f"{len(trajectory_steps):,} / {total_space:,} steps",
         best_config_toml=toml.dumps(test_run_details.test_definition.model_dump()),
-        parameter_rows=_build_parameter_rows(test_case.param_space, best_step.action),
+        parameter_rows=_build_parameter_rows(param_space.dimensions, best_step.action),
         reward_chart_data=_build_reward_chart_data(trajectory_steps),
     )
 
@@ -22,7 +22,7 @@ from typing import TYPE_CHECKING, List, Tuple
 import toml
 
 from cloudai.core import TestRun
-from cloudai.systems.slurm import SlurmSystemMetadata
+from cloudai.systems.slurm import SlurmSystemMetadata, read_step_exit_code
 from cloudai.util.lazy_imports import lazy
 
 if TYPE_CHECKING:
@@ -206,3 +206,11 @@ def load_system_metadata(run_dir: Path, results_root: Path) -> SlurmSystemMetada
         except Exception as exc:
             logging.debug(f"Error validating metadata for {node_files[0]}: {exc}")
             return None
+
+
+def load_step_state(run_dir: Path) -> str | None:
+    """Return the state of a single sbatch step as recorded by the sbatch script, None if it is not recorded."""
+    exit_code = read_step_exit_code(run_dir)
+    if exit_code is None:
+        return None
+    return "completed" if exit_code == 0 else f"failed (exit code {exit_code})"
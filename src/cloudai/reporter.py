@@ -28,7 +28,7 @@ from rich.console import Console
 from rich.table import Table
 
 from cloudai.report_generator.dse_report import build_dse_summaries
-from cloudai.report_generator.util import load_system_metadata
+from cloudai.report_generator.util import load_step_state, load_system_metadata
 from cloudai.util.lazy_imports import lazy
 
 from .core import CommandGenStrategy, Reporter, TestRun, case_name
@@ -43,6 +43,7 @@ class ReportItem:
     description: str
     logs_path: Optional[str] = None
     nodes: Optional[str] = None
+    state: Optional[str] = None
 
     @classmethod
     def from_test_runs(cls, test_runs: list[TestRun], results_root: Path) -> list["ReportItem"]:
@@ -53,6 +54,7 @@ class ReportItem:
                 ri.logs_path = f"./{tr.output_path.relative_to(results_root)}"
             if metadata := load_system_metadata(tr.output_path, results_root):
                 ri.nodes = metadata.slurm.node_list
+            ri.state = load_step_state(tr.output_path)
             report_items.append(ri)
 
         return report_items
@@ -173,16 +173,21 @@ class KubernetesInstaller(BaseInstaller):
         return InstallStatusResult(True)
 
     def _clone_and_setup_repo(self, item: GitRepo, repo_path: Path) -> InstallStatusResult:
-        res = self._clone_repository(item.url, repo_path)
-        if not res.success:
-            return res
+        if self.git_mirrors is not None:
+            res = self.git_mirrors.add_worktree(item.url, item.commit, repo_path)
+            if not res.success:
+                return res
+        else:
+            res = self._clone_repository(item.url, repo_path)
+            if not res.success:
+                return res
 
-        res = self._checkout_commit(item.commit, repo_path)
-        if not res.success:
-            logging.error(f"Checkout failed, removing cloned repository at {repo_path}")
-            if repo_path.exists():
-                rmtree(repo_path)
-            return res
+            res = self._checkout_commit(item.commit, repo_path)
+            if not res.success:
+                logging.error(f"Checkout failed, removing cloned repository at {repo_path}")
+                if repo_path.exists():
+                    rmtree(repo_path)
+                return res
 
         if item.init_submodules:
             res = self._init_submodules(repo_path)
@@ -316,16 +321,21 @@ class KubernetesInstaller(BaseInstaller):
             logging.debug(msg)
             return InstallStatusResult(True, msg)
 
-        cmd = ["python", "-m", "venv", str(venv_path)]
-        logging.debug(f"Creating venv using cmd: {' '.join(cmd)}")
-        result = subprocess.run(cmd, capture_output=True, text=True)
-        logging.debug(f"venv creation STDOUT:\n{result.stdout}\nSTDERR:\n{result.stderr}")
-        if result.returncode != 0:
-            if venv_path.exists():
-                rmtree(venv_path)
-            return InstallStatusResult(
-                False, f"Failed to create venv:\nSTDOUT:\n{result.stdout}\nSTDERR:\n{result.stderr}"
-            )
+        if self.uv is not None:
+            res = self.uv.create_venv(venv_path)
+            if not res.success:
+                return res
+        else:
+            cmd = ["python", "-m", "venv", str(venv_path)]
+            logging.debug(f"Creating venv using cmd: {' '.join(cmd)}")
+            result = subprocess.run(cmd, capture_output=True, text=True)
+            logging.debug(f"venv creation STDOUT:\n{result.stdout}\nSTDERR:\n{result.stderr}")
+            if result.returncode != 0:
+                if venv_path.exists():
+                    rmtree(venv_path)
+                return InstallStatusResult(
+                    False, f"Failed to create venv:\nSTDOUT:\n{result.stdout}\nSTDERR:\n{result.stderr}"
+                )
 
         res = self._install_dependencies(item)
         if not res.success:
@@ -338,6 +348,9 @@ class KubernetesInstaller(BaseInstaller):
         return InstallStatusResult(True)
 
     def _install_pyproject(self, venv_dir: Path, project_dir: Path) -> InstallStatusResult:
+        if self.uv is not None:
+            return self.uv.install_pyproject(venv_dir, project_dir)
+
         install_cmd = [str(venv_dir / "bin" / "python"), "-m", "pip", "install", str(project_dir)]
         logging.debug(f"Installing dependencies using: {' '.join(install_cmd)}")
         result = subprocess.run(install_cmd, capture_output=True, text=True)
@@ -351,6 +364,9 @@ class KubernetesInstaller(BaseInstaller):
         if not requirements_txt.is_file():
             return InstallStatusResult(False, f"Requirements file is invalid or does not exist: {requirements_txt}")
 
+        if self.uv is not None:
+            return self.uv.install_requirements(venv_dir, requirements_txt)
+
         install_cmd = [str(venv_dir / "bin" / "python"), "-m", "pip", "install", "-r", str(requirements_txt)]
         logging.debug(f"Installing dependencies using: {' '.join(install_cmd)}")
         result = subprocess.run(install_cmd, capture_output=True, text=True)
@@ -367,8 +383,13 @@ class KubernetesInstaller(BaseInstaller):
             msg = f"Repository {item.url} is not cloned."
             return InstallStatusResult(True, msg)
 
-        logging.debug(f"Removing folder {repo_path}")
-        shutil.rmtree(repo_path)
+        if self.git_mirrors is not None:
+            res = self.git_mirrors.remove_worktree(item.url, repo_path)
+            if not res.success:
+                return res
+        else:
+            logging.debug(f"Removing folder {repo_path}")
+            shutil.rmtree(repo_path)
         item.installed_path = None
 
         return InstallStatusResult(True)
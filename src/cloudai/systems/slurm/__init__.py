@@ -1,5 +1,5 @@
 # SPDX-FileCopyrightText: NVIDIA CORPORATION & AFFILIATES
-# Copyright (c) 2024-2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# Copyright (c) 2024-2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
 # SPDX-License-Identifier: Apache-2.0
 #
 # Licensed under the Apache License, Version 2.0 (the "License");
@@ -14,28 +14,39 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from .single_sbatch_runner import SingleSbatchRunner
+from .hostlist import HostList
+from .node_staging import NodeLocalStaging
+from .single_sbatch_runner import SingleSbatchRunner, read_step_exit_code
+from .slurm_cluster_state import SlurmClusterStateSnapshot
 from .slurm_command_gen_strategy import SlurmCommandGenStrategy
 from .slurm_installer import SlurmInstaller
 from .slurm_job import SlurmJob
+from .slurm_job_states import SlurmJobStateSnapshot
 from .slurm_metadata import SlurmJobMetadata, SlurmStepMetadata, SlurmSystemMetadata
 from .slurm_node import SlurmNode, SlurmNodeState
+from .slurm_rest import SlurmRestConfig
 from .slurm_runner import SlurmRunner
 from .slurm_system import SlurmGroup, SlurmPartition, SlurmSystem, parse_node_list
 
 __all__ = [
+    "HostList",
+    "NodeLocalStaging",
     "SingleSbatchRunner",
+    "SlurmClusterStateSnapshot",
     "SlurmCommandGenStrategy",
     "SlurmGroup",
     "SlurmInstaller",
     "SlurmJob",
     "SlurmJobMetadata",
+    "SlurmJobStateSnapshot",
     "SlurmNode",
     "SlurmNodeState",
     "SlurmPartition",
+    "SlurmRestConfig",
     "SlurmRunner",
     "SlurmStepMetadata",
     "SlurmSystem",
     "SlurmSystemMetadata",
     "parse_node_list",
+    "read_step_exit_code",
 ]
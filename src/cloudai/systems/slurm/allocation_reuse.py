@@ -0,0 +1,123 @@
+# SPDX-FileCopyrightText: NVIDIA CORPORATION & AFFILIATES
+# Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import os
+import re
+import subprocess
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Optional, cast
+
+from .slurm_job import SlurmJob
+from .slurm_metadata import SlurmStepMetadata
+
+
+@dataclass
+class SlurmAllocation:
+    """
+    Nodes held by a ``salloc --no-shell`` allocation that consecutive test runs are dispatched into.
+
+    Attributes
+        job_id (int): ID of the allocation.
+        nodes (list[str]): Names of the allocated nodes.
+        end_time (Optional[datetime]): When the allocation expires, None if unknown.
+    """
+
+    job_id: int
+    nodes: list[str]
+    end_time: Optional[datetime] = None
+
+    GRANTED_RE = re.compile(r"Granted job allocation (\d+)")
+
+    @property
+    def num_nodes(self) -> int:
+        return len(self.nodes)
+
+    def fits(self, num_nodes: int, time_limit: Optional[timedelta], now: Optional[datetime] = None) -> bool:
+        """Check if a test run with the given node count and time limit can run in this allocation now."""
+        if num_nodes != self.num_nodes:
+            return False
+        if self.end_time is None:
+            return True
+        return (now or datetime.now()) + (time_limit or timedelta()) < self.end_time
+
+    def env(self) -> dict[str, str]:
+        """Return environment variables making ``srun`` launch steps inside this allocation."""
+        return {
+            "SLURM_JOB_ID": str(self.job_id),
+            "SLURM_JOBID": str(self.job_id),
+            "SLURM_JOB_NODELIST": ",".join(self.nodes),
+            "SLURM_NODELIST": ",".join(self.nodes),
+            "SLURM_JOB_NUM_NODES": str(self.num_nodes),
+            "SLURM_NNODES": str(self.num_nodes),
+        }
+
+    def dispatch(self, script: Path, output_path: Path) -> subprocess.Popen:
+        """Run a batch script on the submit host, its ``srun`` commands become steps of this allocation."""
+        with (output_path / "stdout.txt").open("w") as stdout, (output_path / "stderr.txt").open("w") as stderr:
+            return subprocess.Popen(
+                ["bash", str(script.absolute())],
+                cwd=output_path,
+                env=os.environ | self.env(),
+                stdout=stdout,
+                stderr=stderr,
+            )
+
+
+@dataclass
+class AllocatedJob(SlurmJob):
+    """
+    A test run executed as steps of a reused allocation, its ``id`` is the ID of the allocation.
+
+    Attributes
+        process (Optional[subprocess.Popen]): The batch script running on the submit host.
+        start_time (datetime): When the batch script was started.
+    """
+
+    process: Optional[subprocess.Popen] = field(default=None, repr=False, compare=False)
+    start_time: datetime = field(default_factory=datetime.now, compare=False)
+
+    @property
+    def exit_code(self) -> Optional[int]:
+        return self.process.poll() if self.process else 0
+
+    @property
+    def is_running(self) -> bool:
+        return self.exit_code is None
+
+    def metadata(self) -> SlurmStepMetadata:
+        """Describe the batch script like ``sacct`` describes a job, from the exit code of its process."""
+        exit_code = self.exit_code
+        state = "RUNNING" if exit_code is None else ("COMPLETED" if exit_code == 0 else "FAILED")
+        end_time = "Unknown" if exit_code is None else datetime.now().strftime("%Y-%m-%dT%H:%M:%S")
+        return SlurmStepMetadata(
+            job_id=int(self.id),
+            step_id="",
+            name=self.test_run.name,
+            state=state,
+            exit_code=f"{exit_code or 0}:0",
+            start_time=self.start_time.strftime("%Y-%m-%dT%H:%M:%S"),
+            end_time=end_time,
+            elapsed_time_sec=int((datetime.now() - self.start_time).total_seconds()),
+            submit_line=" ".join(cast(list[str], self.process.args)) if self.process else "",
+        )
+
+    def terminate(self) -> None:
+        if self.process and self.is_running:
+            self.process.terminate()
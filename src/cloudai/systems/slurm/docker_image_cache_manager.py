@@ -1,5 +1,5 @@
 # SPDX-FileCopyrightText: NVIDIA CORPORATION & AFFILIATES
-# Copyright (c) 2024-2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# Copyright (c) 2024-2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
 # SPDX-License-Identifier: Apache-2.0
 #
 # Licensed under the Apache License, Version 2.0 (the "License");
@@ -20,13 +20,109 @@ import logging
 import os
 import shutil
 import subprocess
+import time
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Iterator, Optional
+
+import toml
+
+from cloudai.util import file_lock
 
 if TYPE_CHECKING:
     from cloudai.systems.slurm import SlurmSystem
 
+DISK_ERRORS = ("Disk quota exceeded", "Write error")
+
+
+class DockerImageCacheIndex:
+    """
+    Sizes and last use times of Docker images cached in the install path, shared by concurrent CloudAI invocations.
+
+    Only images recorded in the index are evicted, other files in the install path are never touched.
+
+    Attributes
+        root (Path): Directory with cached images.
+        max_size (Optional[int]): Size budget of recorded images in bytes, None for no budget.
+        pinned (set[str]): Images used by the current scenario, they are never evicted.
+    """
+
+    INDEX_FILE = ".cloudai-image-cache.toml"
+
+    def __init__(self, root: Path, max_size: Optional[int] = None) -> None:
+        self.root = root
+        self.max_size = max_size
+        self.pinned: set[str] = set()
+
+    @contextmanager
+    def locked(self) -> Iterator[dict[str, dict[str, float]]]:
+        """Load the index under the index lock and write it back on exit."""
+        with file_lock(self.root / f"{self.INDEX_FILE}.lock"):
+            index_path = self.root / self.INDEX_FILE
+            try:
+                entries: dict[str, dict[str, float]] = toml.load(index_path)
+            except FileNotFoundError:
+                entries = {}
+            yield entries
+            tmp_path = index_path.with_name(f"{index_path.name}.{os.getpid()}.tmp")
+            with tmp_path.open("w") as f:
+                toml.dump(entries, f)
+            os.replace(tmp_path, index_path)
+
+    def record_use(self, filename: str) -> None:
+        try:
+            size = (self.root / filename).stat().st_size
+        except OSError:
+            return
+        with self.locked() as entries:
+            entries[filename] = {"last_used": time.time(), "size": size}
+
+    def forget(self, filename: str) -> None:
+        if not self.root.is_dir():
+            return
+        with self.locked() as entries:
+            entries.pop(filename, None)
+
+    def evict(self, extra_space: int = 0) -> list[str]:
+        """
+        Remove least recently used images that are not pinned until recorded images fit into the budget.
+
+        Args:
+            extra_space (int): Bytes to free in addition to the budget, also applies when there is no budget.
+
+        Returns:
+            list[str]: Evicted images.
+        """
+        if self.max_size is None and extra_space <= 0:
+            return []
+
+        evicted: list[str] = []
+        with self.locked() as entries:
+            for filename in [name for name in entries if not (self.root / name).is_file()]:
+                del entries[filename]
+
+            total = sum(int(entry["size"]) for entry in entries.values())
+            limit = (self.max_size if self.max_size is not None else total) - extra_space
+            for filename, entry in sorted(entries.items(), key=lambda item: item[1]["last_used"]):
+                if total <= limit:
+                    break
+                if filename in self.pinned:
+                    continue
+                (self.root / filename).unlink(missing_ok=True)
+                total -= int(entry["size"])
+                evicted.append(filename)
+            for filename in evicted:
+                del entries[filename]
+
+        if evicted:
+            logging.info(f"Evicted cached Docker images: {', '.join(evicted)}")
+        return evicted
+
+    def largest_size(self) -> int:
+        with self.locked() as entries:
+            return max((int(entry["size"]) for entry in entries.values()), default=0)
+
 
 class PrerequisiteCheckResult:
     """
@@ -113,12 +209,21 @@ class DockerImageCacheManager:
     """
     Manages the caching of Docker images for installation strategies.
 
+    Images are imported into a temporary file which is renamed once the import succeeds, under a per-image lock, so
+    concurrent installs of the same image wait for a single import. With ``docker_image_cache_max_size_gb`` set, least
+    recently used images not used by the current scenario are evicted to stay within the budget.
+
     Attributes
         system (SlurmSystem): The Slurm system configuration.
+        index (DockerImageCacheIndex): Sizes and last use times of cached images.
     """
 
     def __init__(self, system: SlurmSystem) -> None:
         self.system = system
+        max_size_gb = system.docker_image_cache_max_size_gb
+        self.index = DockerImageCacheIndex(
+            system.install_path, int(max_size_gb * 1024**3) if max_size_gb is not None else None
+        )
 
     def ensure_docker_image(self, docker_image_url: str, docker_image_filename: str) -> DockerImageCacheResult:
         """
@@ -180,6 +285,7 @@ class DockerImageCacheManager:
         if docker_image_path.is_file() and docker_image_path.exists():
             message = f"Cached Docker image already exists at {docker_image_path}."
             logging.debug(message)
+            self.index.record_use(docker_image_filename)
             return DockerImageCacheResult(True, docker_image_path.absolute(), message)
 
         message = f"Docker image does not exist at the specified path: {docker_image_path}."
@@ -195,13 +301,18 @@ class DockerImageCacheManager:
         else:
             job_name = f"{job_name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
 
+        # Import into a temporary file, so that an interrupted import never leaves a partial image behind
+        tmp_path = docker_image_path.with_name(f".{docker_image_path.name}.partial")
+        tmp_path.unlink(missing_ok=True)
+
         # Use -N1 --ntasks=1 to ensure only one compute node downloads the image
-        enroot_import_cmd = f"{srun_prefix} -N1 --ntasks=1 --job-name={job_name} enroot import -o {docker_image_path} docker://{docker_image_url}"
+        enroot_import_cmd = f"{srun_prefix} -N1 --ntasks=1 --job-name={job_name} enroot import -o {tmp_path} docker://{docker_image_url}"
         logging.debug(f"Importing Docker image: {enroot_import_cmd}")
         try:
             p = subprocess.run(enroot_import_cmd, shell=True, check=True, capture_output=True, text=True)
 
-            if "Disk quota exceeded" in p.stderr or "Write error" in p.stderr:
+            if any(error in p.stderr for error in DISK_ERRORS):
+                tmp_path.unlink(missing_ok=True)
                 error_message = (
                     f"Failed to cache Docker image {docker_image_url}. Command: {enroot_import_cmd}. "
                     f"Error: '{p.stderr}'\n\n"
@@ -211,13 +322,16 @@ class DockerImageCacheManager:
                 logging.error(error_message)
                 return DockerImageCacheResult(False, Path(), error_message)
 
+            os.replace(tmp_path, docker_image_path)
             success_message = f"Docker image cached successfully at {docker_image_path}."
             logging.debug(success_message)
             logging.debug(f"Command used: {enroot_import_cmd}, stdout: {p.stdout}, stderr: {p.stderr}")
             return DockerImageCacheResult(True, docker_image_path.absolute(), success_message)
-        except subprocess.CalledProcessError as e:
+        except (subprocess.CalledProcessError, OSError) as e:
+            tmp_path.unlink(missing_ok=True)
             error_message = (
-                f"Failed to import Docker image {docker_image_url}. Command: {enroot_import_cmd}. Error: {e.stderr}"
+                f"Failed to import Docker image {docker_image_url}. Command: {enroot_import_cmd}. "
+                f"Error: {getattr(e, 'stderr', None) or e}"
             )
             logging.debug(error_message)
             return DockerImageCacheResult(False, message=error_message)
@@ -238,6 +352,7 @@ class DockerImageCacheManager:
         if docker_image_path.is_file():
             success_message = f"Cached Docker image already exists at {docker_image_path}."
             logging.info(success_message)
+            self.index.record_use(docker_image_filename)
             return DockerImageCacheResult(True, docker_image_path.absolute(), success_message)
 
         if not self.system.install_path.exists():
@@ -263,7 +378,28 @@ class DockerImageCacheManager:
         if self.system.extra_srun_args:
             srun_prefix += f" {self.system.extra_srun_args}"
 
-        return self._import_docker_image(srun_prefix, docker_image_url, docker_image_path)
+        return self._import_shared(srun_prefix, docker_image_url, docker_image_path)
+
+    def _import_shared(self, srun_prefix: str, url: str, docker_image_path: Path) -> DockerImageCacheResult:
+        """Import an image unless another process imported it meanwhile, evicting old images to make space."""
+        with file_lock(docker_image_path.with_name(f".{docker_image_path.name}.lock")):
+            if docker_image_path.is_file():
+                success_message = f"Docker image was cached by another process at {docker_image_path}."
+                logging.info(success_message)
+                self.index.record_use(docker_image_path.name)
+                return DockerImageCacheResult(True, docker_image_path.absolute(), success_message)
+
+            self.index.evict()
+            result = self._import_docker_image(srun_prefix, url, docker_image_path)
+            disk_error = not result.success and any(error in result.message for error in DISK_ERRORS)
+            if disk_error and self.index.evict(extra_space=self.index.largest_size()):
+                logging.info(f"Retrying import of {url} after evicting cached images.")
+                result = self._import_docker_image(srun_prefix, url, docker_image_path)
+
+        if result.success:
+            self.index.record_use(docker_image_path.name)
+            self.index.evict()
+        return result
 
     def _check_prerequisites(self) -> PrerequisiteCheckResult:
         """
@@ -299,6 +435,7 @@ class DockerImageCacheManager:
         if docker_image_path.is_file():
             try:
                 docker_image_path.unlink()
+                self.index.forget(docker_image_filename)
                 success_message = f"Cached Docker image removed successfully from {docker_image_path}."
                 logging.info(success_message)
                 return DockerImageCacheResult(True, docker_image_path.absolute(), success_message)
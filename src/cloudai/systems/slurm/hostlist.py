@@ -0,0 +1,285 @@
+# SPDX-FileCopyrightText: NVIDIA CORPORATION & AFFILIATES
+# Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import bisect
+import collections.abc
+import itertools
+import re
+from typing import Any, Iterable, Iterator, Optional
+
+Interval = tuple[int, int]
+"""Inclusive range of node numbers."""
+
+RangeKey = tuple[str, int, str]
+"""Prefix, zero-padded width of the number and suffix of node names sharing a numeric range."""
+
+_NAME_RE = re.compile(r"^(.*?)(\d+)(\D*)$")
+_OUTER_RE = re.compile(r"^(.*?)(\d+)(\D+)$")
+_COMPONENT_SPLIT_RE = re.compile(r",\s*(?![^[]*\])")
+_BRACKET_RE = re.compile(r"(\[[^\]]*\])")
+
+
+def merge_intervals(intervals: Iterable[Interval]) -> list[Interval]:
+    """Sort intervals and merge the overlapping and adjacent ones."""
+    merged: list[Interval] = []
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1] + 1:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def intersect_intervals(left: list[Interval], right: list[Interval]) -> list[Interval]:
+    result: list[Interval] = []
+    i = j = 0
+    while i < len(left) and j < len(right):
+        start, end = max(left[i][0], right[j][0]), min(left[i][1], right[j][1])
+        if start <= end:
+            result.append((start, end))
+        if left[i][1] < right[j][1]:
+            i += 1
+        else:
+            j += 1
+    return result
+
+
+def subtract_intervals(left: list[Interval], right: list[Interval]) -> list[Interval]:
+    result: list[Interval] = []
+    j = 0
+    for start, end in left:
+        while j < len(right) and right[j][1] < start:
+            j += 1
+        k = j
+        while k < len(right) and right[k][0] <= end:
+            if right[k][0] > start:
+                result.append((start, right[k][0] - 1))
+            start = max(start, right[k][1] + 1)
+            k += 1
+        if start <= end:
+            result.append((start, end))
+    return result
+
+
+def format_intervals(intervals: list[Interval], width: int) -> str:
+    return ",".join(
+        f"{start:0{width}d}" if start == end else f"{start:0{width}d}-{end:0{width}d}" for start, end in intervals
+    )
+
+
+class HostList(collections.abc.Set[str]):
+    """
+    Immutable set of node names stored as sorted integer intervals, Slurm hostlist ranges are never expanded.
+
+    Names are split into a prefix, a zero-padded number and a suffix, names sharing the prefix, the width of the
+    number and the suffix are kept as a list of disjoint intervals. Union, intersection, difference, membership and
+    size work on the intervals. Names without a number are kept as they are.
+
+    Padding follows ``parse_node_list``: numbers of a range are padded to the width of its end, e.g. ``node[8-10]`` is
+    ``node08,node09,node10``. In multi-bracket forms like ``rack[1-2]-node[01-64]`` all brackets but the last one are
+    expanded into prefixes.
+    """
+
+    __slots__ = ("_names", "_ranges")
+
+    def __init__(self, ranges: Optional[dict[RangeKey, list[Interval]]] = None, names: Iterable[str] = ()):
+        self._ranges: dict[RangeKey, list[Interval]] = {
+            key: intervals for key, intervals in sorted((ranges or {}).items()) if intervals
+        }
+        self._names = frozenset(names)
+
+    @classmethod
+    def parse(cls, spec: str) -> HostList:
+        """
+        Parse a Slurm hostlist expression, e.g. ``node[001-004,007],login``.
+
+        Args:
+            spec (str): The hostlist expression, may be empty.
+
+        Returns:
+            HostList: The node set.
+        """
+        ranges: dict[RangeKey, list[Interval]] = {}
+        names: set[str] = set()
+        spec = spec.strip()
+        for component in _COMPONENT_SPLIT_RE.split(spec) if spec else []:
+            parts = _BRACKET_RE.split(component.strip())
+            if len(parts) == 1:
+                cls._add_name(parts[0], ranges, names)
+                continue
+
+            *head, last, suffix = parts
+            for prefix in cls._expand_prefixes(head):
+                for start, end, width in cls._parse_bracket(last):
+                    ranges.setdefault((prefix, width, suffix), []).append((start, end))
+
+        return cls({key: merge_intervals(intervals) for key, intervals in ranges.items()}, names)
+
+    @classmethod
+    def from_names(cls, node_names: Iterable[str]) -> HostList:
+        ranges: dict[RangeKey, list[Interval]] = {}
+        names: set[str] = set()
+        for name in node_names:
+            cls._add_name(name, ranges, names)
+        return cls({key: merge_intervals(intervals) for key, intervals in ranges.items()}, names)
+
+    _from_iterable = from_names
+
+    @staticmethod
+    def _add_name(name: str, ranges: dict[RangeKey, list[Interval]], names: set[str]) -> None:
+        match = _NAME_RE.match(name)
+        if not match:
+            names.add(name)
+            return
+        prefix, number, suffix = match.groups()
+        ranges.setdefault((prefix, len(number), suffix), []).append((int(number), int(number)))
+
+    @staticmethod
+    def _parse_bracket(bracket: str) -> list[tuple[int, int, int]]:
+        """Parse ``[01-04,7]`` into ``(start, end, width)`` tuples."""
+        items = []
+        for item in bracket.strip("[]").split(","):
+            start, sep, end = item.strip().partition("-")
+            end = end if sep else start
+            if not start.isdigit() or not end.isdigit() or int(start) > int(end):
+                raise ValueError(f"Invalid node range '{item}' in '{bracket}'")
+            items.append((int(start), int(end), len(end)))
+        return items
+
+    @classmethod
+    def _expand_prefixes(cls, parts: list[str]) -> list[str]:
+        """Expand literal and bracket parts preceding the last bracket into all prefixes they describe."""
+        choices: list[list[str]] = []
+        for part in parts:
+            if part.startswith("["):
+                choices.append(
+                    [f"{n:0{width}d}" for start, end, width in cls._parse_bracket(part) for n in range(start, end + 1)]
+                )
+            else:
+                choices.append([part])
+        return ["".join(combination) for combination in itertools.product(*choices)]
+
+    def _binary(self, other: Any, op: str) -> HostList:
+        if not isinstance(other, HostList):
+            if not isinstance(other, collections.abc.Iterable):
+                return NotImplemented
+            other = HostList.from_names(other)
+
+        ranges: dict[RangeKey, list[Interval]] = {}
+        if op == "|":
+            for key in self._ranges.keys() | other._ranges.keys():
+                ranges[key] = merge_intervals(self._ranges.get(key, []) + other._ranges.get(key, []))
+            return HostList(ranges, self._names | other._names)
+        if op == "&":
+            for key in self._ranges.keys() & other._ranges.keys():
+                ranges[key] = intersect_intervals(self._ranges[key], other._ranges[key])
+            return HostList(ranges, self._names & other._names)
+        for key, intervals in self._ranges.items():
+            ranges[key] = subtract_intervals(intervals, other._ranges[key]) if key in other._ranges else intervals
+        return HostList(ranges, self._names - other._names)
+
+    def __or__(self, other: Any) -> HostList:
+        """Return the union of both node sets."""
+        return self._binary(other, "|")
+
+    def __and__(self, other: Any) -> HostList:
+        """Return the nodes present in both node sets."""
+        return self._binary(other, "&")
+
+    def __sub__(self, other: Any) -> HostList:
+        """Return the nodes not present in the other node set."""
+        return self._binary(other, "-")
+
+    union = __or__
+    intersection = __and__
+    difference = __sub__
+
+    def isdisjoint(self, other: Iterable[Any]) -> bool:
+        return not self & other
+
+    def __contains__(self, name: object) -> bool:
+        """Check membership with a binary search over the intervals of the name's range."""
+        if not isinstance(name, str):
+            return False
+        if name in self._names:
+            return True
+
+        match = _NAME_RE.match(name)
+        if not match:
+            return False
+        prefix, number, suffix = match.groups()
+        intervals = self._ranges.get((prefix, len(number), suffix))
+        if not intervals:
+            return False
+        n = int(number)
+        index = bisect.bisect_right(intervals, (n, float("inf"))) - 1
+        return index >= 0 and intervals[index][0] <= n <= intervals[index][1]
+
+    def __len__(self) -> int:
+        """Return the number of nodes without expanding the ranges."""
+        in_ranges = sum(end - start + 1 for intervals in self._ranges.values() for start, end in intervals)
+        return len(self._names) + in_ranges
+
+    def __iter__(self) -> Iterator[str]:
+        """Expand node names lazily: plain names first, then ranges ordered by prefix."""
+        yield from sorted(self._names)
+        for (prefix, width, suffix), intervals in self._ranges.items():
+            for start, end in intervals:
+                for n in range(start, end + 1):
+                    yield f"{prefix}{n:0{width}d}{suffix}"
+
+    def __eq__(self, other: object) -> bool:
+        """Compare node sets, structurally if both are host lists."""
+        if isinstance(other, HostList):
+            return self._ranges == other._ranges and self._names == other._names
+        return super().__eq__(other)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __str__(self) -> str:
+        """Compact Slurm hostlist expression, ranges sharing the same numbers in another field use two brackets."""
+        grouped: dict[tuple, list[Interval]] = {}
+        singles: list[str] = sorted(self._names)
+        for (prefix, width, suffix), intervals in self._ranges.items():
+            match = _OUTER_RE.match(prefix)
+            if match:
+                head, outer, tail = match.groups()
+                key = (head, len(outer), tail, width, suffix, tuple(intervals))
+                grouped.setdefault(key, []).append((int(outer), int(outer)))
+            else:
+                grouped.setdefault(("", 0, prefix, width, suffix, tuple(intervals)), []).append((-1, -1))
+
+        components = singles
+        for (head, outer_width, tail, width, suffix, intervals), outers in grouped.items():
+            inner = format_intervals(list(intervals), width)
+            if len(intervals) > 1 or intervals[0][0] != intervals[0][1]:
+                inner = f"[{inner}]"
+            if outers == [(-1, -1)]:
+                components.append(f"{tail}{inner}{suffix}")
+                continue
+
+            merged = merge_intervals(outers)
+            if len(outers) == 1:
+                components.append(f"{head}{format_intervals(merged, outer_width)}{tail}{inner}{suffix}")
+            else:
+                components.append(f"{head}[{format_intervals(merged, outer_width)}]{tail}{inner}{suffix}")
+        return ",".join(components)
+
+    def __repr__(self) -> str:
+        """Return the representation with the compact hostlist expression."""
+        return f"{self.__class__.__name__}({str(self)!r})"
@@ -0,0 +1,105 @@
+# SPDX-FileCopyrightText: NVIDIA CORPORATION & AFFILIATES
+# Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+from importlib.metadata import version
+from pathlib import Path
+from typing import Optional
+
+from cloudai.core import TestRun
+
+from .hostlist import format_intervals, merge_intervals
+
+# Directives that differ between tasks of an array, they are replaced by the array script.
+PER_TASK_DIRECTIVES = ("#SBATCH --job-name=", "#SBATCH --output=", "#SBATCH --error=")
+
+
+def sbatch_script_path(exec_cmd: str) -> Optional[Path]:
+    """Return the batch script of a plain ``sbatch <script>`` command, None for any other command."""
+    parts = exec_cmd.split()
+    return Path(parts[1]) if len(parts) == 2 and parts[0] == "sbatch" else None
+
+
+def array_index(tr: TestRun) -> int:
+    """Array task index of a test run, it matches the name of its output directory."""
+    return tr.step if tr.step > 0 else tr.current_iteration
+
+
+def array_group_key(tr: TestRun, script: Path) -> Optional[tuple]:
+    """
+    Return the key grouping test runs that can be tasks of the same array, None if the test run cannot be one.
+
+    Tasks must share all sbatch directives but the per-task ones, and must have their batch scripts in output
+    directories named after the task index under the same parent directory.
+    """
+    output_path = tr.output_path.absolute()
+    if script.absolute().parent != output_path or output_path.name != str(array_index(tr)):
+        return None
+
+    return output_path.parent, script.name, shared_directives(script)
+
+
+def shared_directives(script: Path) -> tuple[str, ...]:
+    """Return sbatch directives of a batch script that are shared by all tasks of an array."""
+    return tuple(
+        line
+        for line in script.read_text().splitlines()
+        if line.startswith("#SBATCH") and not line.startswith(PER_TASK_DIRECTIVES)
+    )
+
+
+def array_spec(indices: list[int], max_running: Optional[int]) -> str:
+    """Format task indices for ``--array``, e.g. ``0-9%2``."""
+    spec = format_intervals(merge_intervals((index, index) for index in indices), 0)
+    return f"{spec}%{max_running}" if max_running else spec
+
+
+def write_array_script(tasks: list[tuple[TestRun, Path]], max_running: Optional[int]) -> Path:
+    """
+    Write the batch script of a job array running the batch script of every task in its own array task.
+
+    Args:
+        tasks (list[tuple[TestRun, Path]]): Test runs with their batch scripts, all with the same array group key.
+        max_running (Optional[int]): Maximum number of tasks running at the same time.
+
+    Returns:
+        Path: The array batch script, written next to the output directories of the tasks.
+    """
+    first_tr, first_script = tasks[0]
+    parent = first_tr.output_path.absolute().parent
+    indices = sorted(array_index(tr) for tr, _ in tasks)
+    job_name = next(
+        (line for line in first_script.read_text().splitlines() if line.startswith("#SBATCH --job-name=")), None
+    )
+
+    content = ["#!/bin/bash", f"# generated by CloudAI@{version('cloudai')}"]
+    if job_name:
+        content.append(job_name)
+    content.extend(shared_directives(first_script))
+    content.extend(
+        [
+            f"#SBATCH --array={array_spec(indices, max_running)}",
+            f"#SBATCH --output={parent / '%a' / 'stdout.txt'}",
+            f"#SBATCH --error={parent / '%a' / 'stderr.txt'}",
+            "",
+            f'bash "{parent}/${{SLURM_ARRAY_TASK_ID}}/{first_script.name}"',
+        ]
+    )
+
+    array_script = parent / f"cloudai_array_{indices[0]}-{indices[-1]}.sh"
+    array_script.write_text("\n".join(content))
+    return array_script
@@ -0,0 +1,119 @@
+# SPDX-FileCopyrightText: NVIDIA CORPORATION & AFFILIATES
+# Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Optional
+
+from cloudai.core import TestRun
+from cloudai.util import parse_time_limit
+
+from .hostlist import HostList
+from .slurm_node import SlurmNode, SlurmNodeState
+
+# Nodes in these states can be used by a packed test run right away.
+PACKABLE_NODE_STATES = (SlurmNodeState.IDLE, SlurmNodeState.RESERVED, SlurmNodeState.COMPLETING)
+
+
+@dataclass(frozen=True)
+class PackingRequest:
+    """
+    Request of a test run for a number of nodes from a partition group.
+
+    Attributes
+        tr (TestRun): The test run to place.
+        partition (str): Partition name.
+        group (str): Group name within the partition.
+        num_nodes (int): Number of nodes the test run needs.
+        time_limit (timedelta): Time limit of the test run, ``timedelta.max`` if it is not set.
+        exclude_nodes (HostList): Nodes the test run must not be placed on.
+    """
+
+    tr: TestRun
+    partition: str
+    group: str
+    num_nodes: int
+    time_limit: timedelta
+    exclude_nodes: HostList
+
+    @classmethod
+    def from_test_run(cls, tr: TestRun) -> Optional[PackingRequest]:
+        """
+        Build the request for a test run with a single ``partition:group:num_nodes`` node specification.
+
+        Returns:
+            Optional[PackingRequest]: The request, None if the test run uses explicit nodes or ``max_avail``.
+        """
+        if len(tr.nodes) != 1 or tr.nodes[0].count(":") != 2:
+            return None
+
+        partition, group, num_nodes = tr.nodes[0].split(":")
+        if not num_nodes.isdigit():
+            return None
+
+        return cls(
+            tr=tr,
+            partition=partition,
+            group=group,
+            num_nodes=int(num_nodes),
+            time_limit=parse_time_limit(tr.time_limit) if tr.time_limit else timedelta.max,
+            exclude_nodes=HostList.parse(",".join(tr.exclude_nodes)),
+        )
+
+
+class NodePackingPlanner:
+    """
+    Places concurrent test runs onto disjoint node subsets of partition groups.
+
+    Queued requests are packed first-fit-decreasing: the largest requests go first, longer time limits break ties, so
+    small and short test runs fill the nodes that are left. Requests that do not fit stay queued, in submission order,
+    until nodes are released.
+
+    Attributes
+        queue (list[PackingRequest]): Requests waiting for nodes.
+    """
+
+    def __init__(self) -> None:
+        self.queue: list[PackingRequest] = []
+
+    def plan(self, free_nodes: dict[tuple[str, str], list[SlurmNode]]) -> list[tuple[PackingRequest, list[SlurmNode]]]:
+        """
+        Place as many queued requests as possible and remove them from the queue.
+
+        Args:
+            free_nodes (dict[tuple[str, str], list[SlurmNode]]): Free nodes by partition and group names, in order of
+                preference. Placed nodes are removed from the lists.
+
+        Returns:
+            list[tuple[PackingRequest, list[SlurmNode]]]: Placed requests with the nodes assigned to them.
+        """
+        placements: list[tuple[PackingRequest, list[SlurmNode]]] = []
+        for request in sorted(self.queue, key=lambda r: (r.num_nodes, r.time_limit), reverse=True):
+            pool = free_nodes.get((request.partition, request.group), [])
+            candidates = [node for node in pool if node.name not in request.exclude_nodes]
+            if len(candidates) < request.num_nodes:
+                continue
+
+            nodes = candidates[: request.num_nodes]
+            for node in nodes:
+                pool.remove(node)
+            placements.append((request, nodes))
+
+        placed = {id(request) for request, _ in placements}
+        self.queue = [request for request in self.queue if id(request) not in placed]
+        return placements
@@ -0,0 +1,114 @@
+# SPDX-FileCopyrightText: NVIDIA CORPORATION & AFFILIATES
+# Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class NodeLocalStaging(BaseModel):
+    """
+    Copying of container images and HF models to node-local storage before multi-node jobs start.
+
+    Attributes
+        path (str): Node-local directory on compute nodes, a per-job subdirectory is created in it and removed when the
+            job ends.
+        min_nodes (int): Minimal number of nodes of a job to stage for.
+        hf_models (bool): Also stage HF models used by the test, otherwise only the container image is staged.
+    """
+
+    model_config = ConfigDict(extra="forbid")
+
+    path: str = "/tmp"
+    min_nodes: int = Field(default=2, ge=1)
+    hf_models: bool = True
+
+
+@dataclass(frozen=True)
+class StagingPlan:
+    """
+    Files to broadcast to node-local storage of all nodes of a job.
+
+    The image is broadcast with ``sbcast``. HF models are packed into a single archive on the batch host, broadcast with
+    ``sbcast`` and unpacked on every node, so the shared filesystem is read once instead of once per node.
+
+    Attributes
+        root (str): Node-local staging directory, expanded by the batch script.
+        num_nodes (int): Number of nodes of the job.
+        image (Optional[Path]): Container image on the shared filesystem.
+        hf_home (Optional[Path]): HF home on the shared filesystem.
+        hf_models (tuple[str, ...]): Directories of the models in ``hf_home/hub``.
+    """
+
+    ROOT_VAR = "CLOUDAI_STAGE_DIR"
+
+    root: str
+    num_nodes: int
+    image: Optional[Path] = None
+    hf_home: Optional[Path] = None
+    hf_models: tuple[str, ...] = ()
+
+    @property
+    def local_image(self) -> Optional[str]:
+        return f"${self.ROOT_VAR}/{self.image.name}" if self.image else None
+
+    @property
+    def local_hf_home(self) -> Optional[str]:
+        return f"${self.ROOT_VAR}/huggingface" if self.hf_home and self.hf_models else None
+
+    def rewrite_mount(self, mount: str) -> str:
+        """Point a container mount of the shared HF home to its node-local copy."""
+        src, sep, dst = mount.partition(":")
+        if self.local_hf_home and self.hf_home and src == str(self.hf_home.absolute()):
+            return f"{self.local_hf_home}{sep}{dst}"
+        return mount
+
+    def srun(self, *cmd: str) -> str:
+        return " ".join(["srun", f"-N{self.num_nodes}", f"--ntasks={self.num_nodes}", "--ntasks-per-node=1", *cmd])
+
+    def commands(self) -> list[str]:
+        """Return batch script lines staging the files, verifying them on every node and removing them on exit."""
+        root = f"${self.ROOT_VAR}"
+        checks: list[str] = []
+        lines = [
+            f"export {self.ROOT_VAR}={self.root}",
+            f'trap "rm -f {root}.tar; {self.srun("rm", "-rf", root)}" EXIT',
+            self.srun("mkdir", "-p", f"{root}/huggingface/hub"),
+        ]
+
+        if self.image and self.local_image:
+            lines.append(f"sbcast --force {self.image.absolute()} {self.local_image}")
+            checks.append(f"test -s {self.local_image}")
+
+        if self.hf_home and self.local_hf_home:
+            archive, hub = f"{root}/hf-models.tar", f"{self.local_hf_home}/hub"
+            lines.extend(
+                [
+                    f"tar -C {self.hf_home.absolute() / 'hub'} -cf {root}.tar {' '.join(self.hf_models)}",
+                    f"sbcast --force {root}.tar {archive}",
+                    f"rm -f {root}.tar",
+                    self.srun("bash", "-c", f'"tar -C {hub} -xf {archive} && rm -f {archive}"'),
+                ]
+            )
+            checks.extend(f"test -d {hub}/{model}" for model in self.hf_models)
+
+        check = self.srun("bash", "-c", '"' + " && ".join(checks) + '"')
+        lines.append(f'{check} || {{ echo "Staging to node-local {root} failed" >&2; exit 1; }}')
+        return lines
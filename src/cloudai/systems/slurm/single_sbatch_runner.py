@@ -17,28 +17,130 @@
 import copy
 import logging
 import time
+from dataclasses import dataclass, field
 from datetime import timedelta
 from pathlib import Path
-from typing import Generator, Optional, cast
+from typing import Any, Generator, Optional, cast
 
 from cloudai.configurator import CloudAIGymEnv, TrajectoryEntry
-from cloudai.core import BaseJob, JobIdRetrievalError, System, TestRun, TestScenario
+from cloudai.core import BaseJob, CommandGenStrategy, JobIdRetrievalError, System, TestRun, TestScenario
+from cloudai.models.scenario import ReportConfig
 from cloudai.util import CommandShell, format_time_limit, parse_time_limit
 
+from .hostlist import HostList
 from .slurm_command_gen_strategy import SlurmCommandGenStrategy
 from .slurm_metadata import SlurmJobMetadata, SlurmStepMetadata
 from .slurm_runner import SlurmJob, SlurmRunner
 from .slurm_system import SlurmSystem
+from .step_packing import PackedStep, StepPackingPlanner, StepWave
+
+# Written by the sbatch script into the output directory of a test run once its srun step ends.
+STEP_EXIT_CODE_FILE = "step-exit-code.txt"
+
+
+def read_step_exit_code(output_path: Path) -> Optional[int]:
+    """Return the exit code of the srun step of a single sbatch test run, None if the step has not ended yet."""
+    try:
+        return int((output_path / STEP_EXIT_CODE_FILE).read_text().strip())
+    except (OSError, ValueError):
+        return None
+
+
+@dataclass(frozen=True)
+class PlannedRun:
+    """
+    Test run of a single sbatch execution plan.
+
+    Attributes
+        tr (TestRun): The test run, a DSE trial with the action applied for DSE test runs.
+        source (TestRun): Test run of the scenario it comes from.
+        step (int): DSE step, 0 for non-DSE test runs.
+        output_path (Path): Output directory of the test run.
+        action (dict[str, Any]): Parameters applied for the DSE step.
+        scheduled (bool): Whether the test run is part of the sbatch job, DSE trials failing the constraint check are
+            not.
+    """
+
+    tr: TestRun
+    source: TestRun
+    step: int
+    output_path: Path
+    action: dict[str, Any] = field(default_factory=dict)
+    scheduled: bool = True
+
+
+@dataclass(frozen=True)
+class ExecutionPlan:
+    """
+    Test runs of a single sbatch job with DSE test runs unrolled into their trials.
+
+    Attributes
+        runs (tuple[PlannedRun, ...]): Planned test runs in scenario order.
+    """
+
+    runs: tuple[PlannedRun, ...]
+
+    @property
+    def test_runs(self) -> list[TestRun]:
+        """Test runs that are part of the sbatch job."""
+        return [run.tr for run in self.runs if run.scheduled]
+
+    @property
+    def dse_steps(self) -> list[PlannedRun]:
+        """All DSE trials, including those failing the constraint check."""
+        return [run for run in self.runs if run.step > 0]
 
 
 class SingleSbatchRunner(SlurmRunner):
-    """Slurm runner that puts all tests from a scenario into a single sbatch job."""
+    """
+    Slurm runner that puts all tests from a scenario into a single sbatch job.
+
+    Attributes
+        plan (ExecutionPlan): Test runs of the job, DSE test runs are unrolled once per runner.
+        reported_runs (set[int]): Indices of planned runs whose completion has been handled.
+        gyms (dict[int, CloudAIGymEnv]): Gym environments writing trajectories, by ``id`` of the DSE test run.
+    """
 
     def __init__(self, mode: str, system: System, test_scenario: TestScenario, output_path: Path) -> None:
         super().__init__(mode, system, test_scenario, output_path)
         self.cmd_shell = CommandShell()
         self.system = cast(SlurmSystem, system)
         self.job_name = "cloudai-single-sbatch"
+        self._plan: Optional[ExecutionPlan] = None
+        self.reported_runs: set[int] = set()
+        self.gyms: dict[int, CloudAIGymEnv] = {}
+
+    @property
+    def plan(self) -> ExecutionPlan:
+        if self._plan is None:
+            self._plan = self.build_plan()
+        return self._plan
+
+    def build_plan(self) -> ExecutionPlan:
+        """Unroll DSE test runs into trials and create output directories of all test runs."""
+        runs: list[PlannedRun] = []
+        for tr in self.test_scenario.test_runs:
+            if not tr.is_dse_job:
+                tr.output_path = self.get_job_output_path(tr)
+                runs.append(PlannedRun(tr=tr, source=tr, step=0, output_path=tr.output_path))
+                continue
+
+            for idx, combination in enumerate(tr.feasible_combinations(self.system), start=1):
+                next_tr = tr.apply_params_set(combination)
+                next_tr.step = idx
+                next_tr.output_path = self.get_job_output_path(next_tr)
+                runs.append(
+                    PlannedRun(
+                        tr=next_tr,
+                        source=tr,
+                        step=idx,
+                        output_path=next_tr.output_path,
+                        action=combination,
+                        scheduled=next_tr.test.constraint_check(next_tr, self.system),
+                    )
+                )
+
+        return ExecutionPlan(runs=tuple(runs))
 
     def get_sbatch_directives(self) -> list[str]:
         max_nodes, node_list = self.extract_sbatch_nodes_spec()
@@ -83,16 +185,25 @@ class SingleSbatchRunner(SlurmRunner):
         if trs_with_time_limit != 0 and trs_with_time_limit != total_trs:
             raise ValueError("All tests must have a time limit or none of them must have a time limit")
 
+        if self.system.step_packing:
+            total_time_limit = StepPackingPlanner.total_time_limit(self.plan_steps()) or total_time_limit
         return format_time_limit(total_time_limit)
 
     def extract_sbatch_nodes_spec(self) -> tuple[int, list[str]]:
         max_nodes = 1
-        all_node_lists: list[str] = []
+        node_specs: list[str] = []
+        hosts = HostList()
         for tr in self.all_trs:
             max_nodes = max(max_nodes, tr.nnodes)
-            all_node_lists.extend(tr.nodes)
-
-        _, node_list = self.system.get_nodes_by_spec(max_nodes, all_node_lists)
+            for spec in tr.nodes:
+                if ":" in spec:
+                    node_specs.append(spec)
+                else:
+                    hosts |= HostList.parse(spec)
+
+        if hosts:
+            node_specs.append(str(hosts))
+        _, node_list = self.system.get_nodes_by_spec(max_nodes, node_specs)
         if node_list:
             if max_nodes <= len(node_list):
                 max_nodes = len(node_list)
@@ -104,19 +215,39 @@ class SingleSbatchRunner(SlurmRunner):
 
         return max_nodes, node_list
 
+    def get_cmd_gen_strategy(self, system: System, test_run: TestRun) -> CommandGenStrategy:
+        strategy = super().get_cmd_gen_strategy(system, test_run)
+        if isinstance(strategy, SlurmCommandGenStrategy):
+            # Staging is emitted by per-test sbatch scripts only, steps of this script read shared paths.
+            strategy.stage_to_node_local = False
+        return strategy
+
     def aux_commands(self) -> list[str]:
-        tr = copy.deepcopy(next(self.all_trs))
+        tr = copy.deepcopy(self.all_trs[0])
         tr.output_path = self.scenario_root
         max_nodes, _ = self.extract_sbatch_nodes_spec()
         tr.num_nodes = max_nodes
         cmd_gen = cast(SlurmCommandGenStrategy, self.get_cmd_gen_strategy(self.system, tr))
         return [cmd_gen._metadata_cmd(), cmd_gen._ranks_mapping_cmd()]
 
-    def get_single_tr_block(self, tr: TestRun) -> str:
+    def get_single_tr_block(self, tr: TestRun, nodes: Optional[list[str]] = None) -> str:
+        """
+        Generate the srun command of a test run.
+
+        Args:
+            tr (TestRun): The test run.
+            nodes (Optional[list[str]]): Nodes of the allocation assigned to a packed step, which is also limited by
+                the time limit of the test run. By default the nodes are taken from the test run.
+        """
         cmd_gen = cast(SlurmCommandGenStrategy, self.get_cmd_gen_strategy(self.system, tr))
         srun_cmd = cmd_gen.gen_srun_command()
-        nnodes, node_list = self.system.get_nodes_by_spec(tr.nnodes, tr.nodes)
-        node_arg = f"--nodelist={','.join(node_list)}" if node_list else f"-N{nnodes}"
+        if nodes is None:
+            nnodes, node_list = self.system.get_nodes_by_spec(tr.nnodes, tr.nodes)
+            node_arg = f"--nodelist={','.join(node_list)}" if node_list else f"-N{nnodes}"
+        else:
+            node_arg = f"--nodelist={','.join(nodes)}" if nodes else f"-N{tr.nnodes}"
+            if tr.time_limit:
+                node_arg += f" --time={format_time_limit(parse_time_limit(tr.time_limit))}"
         extra_args = (
             f"{node_arg} --output={tr.output_path.absolute()}/stdout.txt --error={tr.output_path.absolute()}/stderr.txt"
         )
@@ -124,14 +255,37 @@ class SingleSbatchRunner(SlurmRunner):
 
         return srun_cmd
 
-    def unroll_dse(self, tr: TestRun) -> Generator[TestRun, None, None]:
-        for idx, combination in enumerate(tr.all_combinations):
-            next_tr = tr.apply_params_set(combination)
-            next_tr.step = idx + 1
-            next_tr.output_path = self.get_job_output_path(next_tr)
+    def plan_steps(self) -> list[StepWave]:
+        """
+        Pack srun steps of all test runs into waves running concurrently on disjoint nodes of the allocation.
+
+        When the allocation is requested by node count, its nodes are only known inside the job, so steps refer to
+        them through the ``CLOUDAI_NODES`` array set by the sbatch script.
+        """
+        max_nodes, node_list = self.extract_sbatch_nodes_spec()
+        allocation = node_list or [f"${{CLOUDAI_NODES[{idx}]}}" for idx in range(max_nodes)]
+        steps: list[PackedStep] = []
+        for tr in self.all_trs:
+            nnodes, nodes = self.system.get_nodes_by_spec(tr.nnodes, tr.nodes)
+            time_limit = parse_time_limit(tr.time_limit) if tr.time_limit else None
+            steps.append(PackedStep(tr=tr, num_nodes=nnodes, nodes=nodes, time_limit=time_limit))
+        return StepPackingPlanner(allocation).plan(steps)
+
+    def get_packed_steps_block(self) -> str:
+        waves = self.plan_steps()
+        content: list[str] = ['CLOUDAI_NODES=($(scontrol show hostnames "$SLURM_JOB_NODELIST"))', ""]
+        for idx, wave in enumerate(waves, start=1):
+            content.append(f"# wave {idx} of {len(waves)}")
+            for step, nodes in wave.placements:
+                self.on_job_submit(step.tr)
+                content.extend(["{", self.get_single_tr_block(step.tr, nodes), self.step_exit_code_cmd(step.tr), "} &"])
+            content.extend(["wait", ""])
+        return "\n".join(content)
 
-            if next_tr.test.constraint_check(next_tr, self.system):
-                yield next_tr
+    def unroll_dse(self, tr: TestRun) -> Generator[TestRun, None, None]:
+        for run in self.plan.runs:
+            if run.source is tr and run.step > 0 and run.scheduled:
+                yield run.tr
 
     def get_global_env_vars(self) -> str:
         vars: list[str] = ["export SLURM_JOB_MASTER_NODE=$(scontrol show hostname $SLURM_JOB_NODELIST | head -n 1)"]
@@ -153,13 +307,21 @@ class SingleSbatchRunner(SlurmRunner):
         if tr.pre_test:
             content.append(self.add_pre_tests(tr.pre_test, tr))
 
+        if self.system.step_packing:
+            content.append(self.get_packed_steps_block())
+            return "\n".join(content)
+
         for tr in self.all_trs:
             self.on_job_submit(tr)
             content.append(self.get_single_tr_block(tr))
+            content.append(self.step_exit_code_cmd(tr))
             content.append("")
 
         return "\n".join(content)
 
+    def step_exit_code_cmd(self, tr: TestRun) -> str:
+        return f"echo $? > {tr.output_path.absolute() / STEP_EXIT_CODE_FILE}"
+
     def add_pre_tests(self, pre_tc: TestScenario, base_tr: TestRun) -> str:
         content = []
         cmd_gen = cast(SlurmCommandGenStrategy, self.get_cmd_gen_strategy(self.system, base_tr))
@@ -171,14 +333,8 @@ class SingleSbatchRunner(SlurmRunner):
         return "\n".join(content)
 
     @property
-    def all_trs(self) -> Generator[TestRun, None, None]:
-        for tr in self.test_scenario.test_runs:
-            if tr.is_dse_job:
-                for _tr in self.unroll_dse(tr):
-                    yield _tr
-            else:
-                tr.output_path = self.get_job_output_path(tr)
-                yield tr
+    def all_trs(self) -> list[TestRun]:
+        return self.plan.test_runs
 
     def run(self):
         if self.shutting_down:
@@ -193,36 +349,74 @@ class SingleSbatchRunner(SlurmRunner):
             if self.shutting_down:
                 break
             is_completed = True if self.mode == "dry-run" else self.system.is_job_completed(job)
+            self.handle_completed_steps()
             time.sleep(self.system.monitor_interval)
 
         self.handle_dse()
 
         self.on_job_completion(job)
 
-    def handle_dse(self):
-        for tr in self.test_scenario.test_runs:
-            if not tr.is_dse_job:
-                continue
+    def handle_completed_steps(self) -> None:
+        """
+        Handle test runs whose srun steps ended since the last call, while the job is still running.
+
+        Trajectory entries of DSE trials are written right away and the status report is refreshed, so partial results
+        are available before the whole job ends.
+        """
+        completed = [
+            idx
+            for idx, run in enumerate(self.plan.runs)
+            if idx not in self.reported_runs and run.scheduled and read_step_exit_code(run.output_path) is not None
+        ]
+        for idx in completed:
+            run = self.plan.runs[idx]
+            logging.info(f"Step completed: {run.tr.name} (results at: {run.output_path})")
+            self.report_run(idx)
+
+        if completed:
+            done = sum(1 for idx, run in enumerate(self.plan.runs) if idx in self.reported_runs and run.scheduled)
+            logging.info(f"Completed {done} of {len(self.all_trs)} steps")
+            self.update_status_report()
+
+    def report_run(self, idx: int) -> None:
+        self.reported_runs.add(idx)
+        run = self.plan.runs[idx]
+        if run.step <= 0:
+            return
 
-            for idx, combination in enumerate(tr.all_combinations, start=1):
-                next_tr = tr.apply_params_set(combination)
-                next_tr.step = idx
-                next_tr.output_path = self.get_job_output_path(next_tr)
+        if id(run.source) not in self.gyms:
+            self.gyms[id(run.source)] = CloudAIGymEnv(run.source, self)
+        gym = self.gyms[id(run.source)]
+        observation = gym.get_trial_observation(run.tr)
+        reward = gym.compute_reward(observation)
+        gym.write_trajectory(
+            TrajectoryEntry(
+                step=run.step,
+                action=run.action,
+                reward=reward,
+                observation=observation,
+            )
+        )
 
-                gym = CloudAIGymEnv(next_tr, self)
-                observation = gym.get_observation({})
-                reward = gym.compute_reward(observation)
-                gym.write_trajectory(
-                    TrajectoryEntry(
-                        step=idx,
-                        action=combination,
-                        reward=reward,
-                        observation=observation,
-                    )
-                )
+    def update_status_report(self) -> None:
+        # imported here, the reporter depends on Slurm system modules
+        from cloudai.core import StatusReporter
+
+        try:
+            reporter = StatusReporter(self.system, self.test_scenario, self.scenario_root, ReportConfig(enable=True))
+            reporter.load_test_runs()
+            reporter.generate_scenario_report()
+        except Exception as e:
+            logging.debug(f"Failed to update the status report: {e}", exc_info=True)
+
+    def handle_dse(self):
+        """Write trajectory entries of DSE trials that have not been reported while the job was running."""
+        for idx, run in enumerate(self.plan.runs):
+            if run.step > 0 and idx not in self.reported_runs:
+                self.report_run(idx)
 
     def completed_test_runs(self, job: BaseJob) -> list[TestRun]:
-        return list(self.all_trs)
+        return self.all_trs
 
     def _submit_test(self, tr: TestRun) -> SlurmJob:
         with open(self.scenario_root / "cloudai_sbatch_script.sh", "w") as f:
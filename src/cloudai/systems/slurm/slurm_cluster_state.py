@@ -0,0 +1,71 @@
+# SPDX-FileCopyrightText: NVIDIA CORPORATION & AFFILIATES
+# Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass, field
+from typing import Iterable, Optional
+
+
+@dataclass
+class SlurmClusterStateSnapshot:
+    """
+    Time-stamped view of node states used for allocation decisions.
+
+    Node states are refreshed with ``sinfo`` and ``squeue`` only when the snapshot of a partition is older than the
+    TTL or was invalidated, all other allocations are served from the node states already known to the system. Nodes
+    allocated by CloudAI itself are locked in place, so they do not require a refresh.
+
+    Attributes
+        refreshed_at (dict[str, float]): Monotonic time of the last refresh by partition name.
+        hits (int): Number of allocations served from the snapshot.
+        misses (int): Number of allocations that required a refresh.
+    """
+
+    refreshed_at: dict[str, float] = field(default_factory=dict)
+    hits: int = 0
+    misses: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def age(self, partition: Optional[str] = None) -> Optional[float]:
+        """
+        Return seconds since the oldest refresh of a partition, or of all refreshed partitions if none is given.
+
+        Returns:
+            Optional[float]: The age, None if the snapshot was never refreshed or was invalidated.
+        """
+        if partition is not None:
+            refreshed_at = self.refreshed_at.get(partition)
+        else:
+            refreshed_at = min(self.refreshed_at.values(), default=None)
+        return None if refreshed_at is None else time.monotonic() - refreshed_at
+
+    def is_fresh(self, ttl: float, partition: Optional[str] = None) -> bool:
+        age = self.age(partition)
+        return age is not None and age < ttl
+
+    def mark_refreshed(self, partitions: Iterable[str]) -> None:
+        now = time.monotonic()
+        self.refreshed_at.update((partition, now) for partition in partitions)
+
+    def invalidate(self) -> None:
+        """Force a refresh on the next allocation, e.g. after nodes were released by a finished job."""
+        self.refreshed_at.clear()
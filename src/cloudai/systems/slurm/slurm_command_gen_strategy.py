@@ -23,9 +23,10 @@ from typing import Any, Dict, List, Optional, cast, final
 
 import toml
 
-from cloudai.core import CommandGenStrategy, Registry, System, TestRun, TestScenario
+from cloudai.core import CommandGenStrategy, HFModel, Registry, System, TestRun, TestScenario
 from cloudai.models.scenario import TestRunDetails
 
+from .node_staging import StagingPlan
 from .slurm_system import SlurmSystem
 
 
@@ -36,6 +37,8 @@ class SlurmCommandGenStrategy(CommandGenStrategy):
     Attributes
         system (SlurmSystem): A casted version of the `system` attribute, which provides Slurm-specific
             properties and methods.
+        stage_to_node_local (bool): Whether the sbatch script of this test run stages its files to node-local storage
+            when the system enables it, False for hooks and tests sharing a single sbatch script.
     """
 
     CONTAINER_MOUNT_INSTALL = "/cloudai_install"
@@ -55,6 +58,7 @@ class SlurmCommandGenStrategy(CommandGenStrategy):
         self.test_run = test_run
 
         self._node_spec_cache: dict[str, tuple[int, list[str]]] = {}
+        self.stage_to_node_local = True
 
     @property
     def nodelist_in_use(self) -> bool:
@@ -90,6 +94,8 @@ class SlurmCommandGenStrategy(CommandGenStrategy):
             *repo_mounts,
             *self._container_mounts(),
         ]
+        if staging := self.staging_plan():
+            mounts = [staging.rewrite_mount(mount) for mount in mounts]
 
         merged_env = self.system.global_env_vars.copy()
         merged_env.update(self.test_run.test.extra_env_vars)
@@ -148,6 +154,7 @@ class SlurmCommandGenStrategy(CommandGenStrategy):
         """
         strategy_cls = Registry().get_command_gen_strategy(type(self.system), type(tr.test))
         strategy = cast(SlurmCommandGenStrategy, strategy_cls(self.system, tr))
+        strategy.stage_to_node_local = False
         return strategy
 
     def _set_hook_output_path(self, tr: TestRun, base_output_path: Path) -> None:
@@ -246,6 +253,43 @@ class SlurmCommandGenStrategy(CommandGenStrategy):
     def image_path(self) -> Optional[str]:
         return None
 
+    def staging_plan(self) -> Optional[StagingPlan]:
+        """
+        Return files to stage to node-local storage of this job, None if staging does not apply.
+
+        Only a container image cached on the shared filesystem and HF models of the test are staged.
+        """
+        config = self.system.node_local_staging
+        if config is None or not self.stage_to_node_local:
+            return None
+        num_nodes, _ = self.get_cached_nodes_spec()
+        if num_nodes < config.min_nodes:
+            return None
+
+        image_path = self.image_path()
+        image = Path(image_path) if image_path and Path(image_path).is_file() else None
+        hf_models: tuple[str, ...] = ()
+        if config.hf_models:
+            hf_models = tuple(
+                sorted(
+                    {
+                        f"models--{item.model_name.replace('/', '--')}"
+                        for item in self.test_run.test.installables
+                        if isinstance(item, HFModel)
+                    }
+                )
+            )
+        if not image and not hf_models:
+            return None
+
+        return StagingPlan(
+            root=f"{config.path.rstrip('/')}/cloudai-$SLURM_JOB_ID",
+            num_nodes=num_nodes,
+            image=image,
+            hf_home=self.system.hf_home_path if hf_models else None,
+            hf_models=hf_models,
+        )
+
     def gen_srun_prefix(self, use_pretest_extras: bool = False, with_num_nodes: bool = True) -> List[str]:
         num_nodes, _ = self.get_cached_nodes_spec()
         srun_command_parts = ["srun", "--export=ALL", f"--mpi={self.system.mpi}"]
@@ -256,6 +300,9 @@ class SlurmCommandGenStrategy(CommandGenStrategy):
                 srun_command_parts.extend(self._get_cmd_gen_strategy(pre_tr).pre_test_srun_extra_args(self.test_run))
 
         if image_path := self.image_path():
+            staging = self.staging_plan()
+            if staging and staging.local_image:
+                image_path = staging.local_image
             srun_command_parts.append(f"--container-image={image_path}")
             mounts = self.container_mounts()
             if mounts:
@@ -355,6 +402,9 @@ class SlurmCommandGenStrategy(CommandGenStrategy):
 
         batch_script_content.extend([self._format_env_vars(self.final_env_vars)])
 
+        if staging := self.staging_plan():
+            batch_script_content.extend(["", *staging.commands(), ""])
+
         if self.final_env_vars.get("ENABLE_VBOOST") == "1":
             batch_script_content.extend([self._enable_vboost_cmd(), ""])
         batch_script_content.extend([self._ranks_mapping_cmd(), ""])
@@ -0,0 +1,97 @@
+# SPDX-FileCopyrightText: NVIDIA CORPORATION & AFFILIATES
+# Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Union
+
+from .slurm_metadata import SlurmStepMetadata
+
+
+@dataclass
+class SlurmJobStateSnapshot:
+    """
+    Per-tick snapshot of sacct records for all jobs tracked by a runner.
+
+    The snapshot is filled by a single batched ``sacct`` call and then serves all job state lookups made during the
+    same monitoring tick. Jobs that are not part of the snapshot are reported as missing so callers can fall back to
+    querying them individually.
+
+    Attributes
+        records (dict[str, list[SlurmStepMetadata]]): sacct records (job and its steps) keyed by job ID.
+        sacct_calls (int): Number of scheduler calls made to fill the snapshot during the current tick.
+        lookups (int): Number of job state lookups served from the snapshot during the current tick.
+    """
+
+    records: dict[str, list[SlurmStepMetadata]] = field(default_factory=dict)
+    sacct_calls: int = 0
+    lookups: int = 0
+
+    @property
+    def saved_calls(self) -> int:
+        """Number of per-job scheduler calls avoided during the current tick."""
+        return max(self.lookups - self.sacct_calls, 0)
+
+    def reset(self, records: dict[str, list[SlurmStepMetadata]] | None = None, sacct_calls: int = 0) -> None:
+        self.records = records or {}
+        self.sacct_calls = sacct_calls
+        self.lookups = 0
+
+    def get(self, job_id: Union[str, int]) -> list[SlurmStepMetadata] | None:
+        records = self.records.get(str(job_id))
+        if records is not None:
+            self.lookups += 1
+        return records
+
+    def states(self, job_id: Union[str, int]) -> list[str] | None:
+        """
+        Return all state tokens reported for a job and its steps, or None if the job is not in the snapshot.
+
+        Tokens are split on whitespace to match ``sacct --format=State`` output, e.g. ``CANCELLED by 123``.
+        """
+        records = self.get(job_id)
+        if records is None:
+            return None
+        return [token for record in records for token in record.state.split()]
+
+    @classmethod
+    def group_by_job(cls, steps: list[SlurmStepMetadata]) -> dict[str, list[SlurmStepMetadata]]:
+        """
+        Group records by job ID, tasks of job arrays are grouped by ``<array job>_<task>``.
+
+        Tasks that did not start yet are reported by sacct as a single record like ``123_[4-7%2]``, the record is
+        grouped under every task it covers.
+        """
+        grouped: dict[str, list[SlurmStepMetadata]] = {}
+        for step in steps:
+            task = step.array_task_id
+            if task is not None and task.startswith("["):
+                for task_id in cls.array_task_ids(task):
+                    grouped.setdefault(f"{step.job_id}_{task_id}", []).append(step)
+            else:
+                grouped.setdefault(step.job_key, []).append(step)
+        return grouped
+
+    @staticmethod
+    def array_task_ids(spec: str) -> list[int]:
+        """Expand a pending array task range like ``[4-7,9%2]`` into task IDs."""
+        task_ids: list[int] = []
+        for item in spec.strip("[]").split("%")[0].split(","):
+            start, _, end = item.partition("-")
+            if start.isdigit():
+                task_ids.extend(range(int(start), int(end or start) + 1))
+        return task_ids
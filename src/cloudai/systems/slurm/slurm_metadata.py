@@ -1,5 +1,5 @@
 # SPDX-FileCopyrightText: NVIDIA CORPORATION & AFFILIATES
-# Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# Copyright (c) 2025-2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
 # SPDX-License-Identifier: Apache-2.0
 #
 # Licensed under the Apache License, Version 2.0 (the "License");
@@ -42,6 +42,12 @@ class SlurmStepMetadata(_SlurmStepMetadataBase):
 
     step_id: str
     submit_line: str
+    array_task_id: str | None = None
+
+    @property
+    def job_key(self) -> str:
+        """Job ID as used with ``sacct -j``, ``<array job>_<task>`` for tasks of job arrays."""
+        return f"{self.job_id}_{self.array_task_id}" if self.array_task_id is not None else str(self.job_id)
 
     @classmethod
     def from_sacct_output(cls, output: str, delimiter: str) -> list[SlurmStepMetadata]:
@@ -57,11 +63,13 @@ class SlurmStepMetadata(_SlurmStepMetadataBase):
         if len(data) < 8:
             return None
 
-        job_id, step_id = data[0].split(".") if "." in data[0] else (data[0], "")
+        job_id, _, step_id = data[0].partition(".")
+        job_id, _, array_task_id = job_id.partition("_")
 
         return cls(
             job_id=int(job_id),
             step_id=step_id,
+            array_task_id=array_task_id or None,
             name=data[1],
             state=data[2],
             exit_code=data[3],
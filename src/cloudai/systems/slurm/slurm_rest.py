@@ -0,0 +1,297 @@
+# SPDX-FileCopyrightText: NVIDIA CORPORATION & AFFILIATES
+# Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import logging
+import os
+from datetime import datetime
+from typing import Any, Iterable, Optional, Union
+
+import requests
+from pydantic import BaseModel, ConfigDict, Field
+from requests.adapters import HTTPAdapter
+
+from .hostlist import HostList
+from .slurm_metadata import SlurmStepMetadata
+from .slurm_node import SlurmNode, SlurmNodeState
+
+
+class SlurmRestConfig(BaseModel):
+    """
+    Connection to slurmrestd.
+
+    Attributes
+        url (str): Base URL of slurmrestd, e.g. ``http://slurmctl:6820``.
+        api_version (str): OpenAPI plugin version used in request paths.
+        user_name (Optional[str]): Value of the ``X-SLURM-USER-NAME`` header, defaults to ``$USER``.
+        token_env (str): Environment variable holding the JWT sent as ``X-SLURM-USER-TOKEN``, as set by
+            ``scontrol token``.
+        timeout (float): Timeout of a single request in seconds.
+        pool_size (int): Maximum number of keep-alive connections kept open.
+    """
+
+    model_config = ConfigDict(extra="forbid")
+
+    url: str
+    api_version: str = "v0.0.40"
+    user_name: Optional[str] = None
+    token_env: str = "SLURM_JWT"
+    timeout: float = Field(default=30.0, gt=0)
+    pool_size: int = Field(default=4, gt=0)
+
+
+class SlurmRestError(Exception):
+    """Raised when slurmrestd cannot be reached or reports an error."""
+
+
+REST_NODE_STATES = {
+    "MIXED": SlurmNodeState.MIXED_ALLOCATION,
+    "PLANNED": SlurmNodeState.PLANNED_STATE,
+    "UNKNOWN": SlurmNodeState.UNKNOWN_STATE,
+}
+
+
+def rest_node_state(flags: list[str]) -> SlurmNodeState:
+    """
+    Convert node state flags reported by slurmrestd, e.g. ``["IDLE", "DRAIN"]``, to the state shown by ``sinfo``.
+
+    Args:
+        flags (list[str]): Base state followed by state flags.
+
+    Returns:
+        SlurmNodeState: The node state, UNKNOWN_STATE for unmatched states.
+    """
+    if not flags:
+        return SlurmNodeState.UNKNOWN_STATE
+
+    base, extra = flags[0].upper(), {flag.upper() for flag in flags[1:]}
+    if "NOT_RESPONDING" in extra:
+        return SlurmNodeState.NOT_RESPONDING
+    if "DRAIN" in extra:
+        return SlurmNodeState.DRAINING if base in {"ALLOCATED", "MIXED"} else SlurmNodeState.DRAINED
+    for flag in ("COMPLETING", "MAINTENANCE", "RESERVED"):
+        if flag in extra:
+            return SlurmNodeState(flag)
+
+    if base in REST_NODE_STATES:
+        return REST_NODE_STATES[base]
+    try:
+        return SlurmNodeState(base)
+    except ValueError:
+        logging.debug(f"Unknown node state: {flags}")
+        return SlurmNodeState.UNKNOWN_STATE
+
+
+def _number(value: Any) -> int:
+    """Unwrap numbers reported either as plain integers or as ``{"set": true, "number": 1}``."""
+    if isinstance(value, dict):
+        return int(value.get("number", 0)) if value.get("set", True) else 0
+    return int(value or 0)
+
+
+def _states(value: Any) -> list[str]:
+    if isinstance(value, dict):
+        value = value.get("current", [])
+    return [value] if isinstance(value, str) else list(value)
+
+
+def _timestamp(value: Any) -> str:
+    seconds = _number(value)
+    return datetime.fromtimestamp(seconds).strftime("%Y-%m-%dT%H:%M:%S") if seconds else "Unknown"
+
+
+def _exit_code(value: Any) -> str:
+    if not isinstance(value, dict):
+        return f"{_number(value)}:0"
+    signal = value.get("signal", {})
+    return f"{_number(value.get('return_code'))}:{_number(signal.get('id') if isinstance(signal, dict) else signal)}"
+
+
+class SlurmRestClient:
+    """
+    Minimal slurmrestd client reusing keep-alive HTTP connections of a single session.
+
+    Responses are converted to the same objects the CLI parsers produce, so ``SlurmSystem`` can use either source.
+
+    Attributes
+        config (SlurmRestConfig): Connection settings.
+        session (requests.Session): Session pooling connections to slurmrestd.
+    """
+
+    def __init__(self, config: SlurmRestConfig):
+        self.config = config
+        self.base_url = config.url.rstrip("/")
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=config.pool_size, max_retries=1)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers.update({"Accept": "application/json"})
+        self.user_name = config.user_name or os.environ.get("USER")
+        if self.user_name:
+            self.session.headers["X-SLURM-USER-NAME"] = self.user_name
+
+    def request(self, method: str, path: str, params: Optional[dict[str, str]] = None) -> dict[str, Any]:
+        """
+        Send a request and decode its JSON response.
+
+        Args:
+            method (str): HTTP method.
+            path (str): Path below the base URL, e.g. ``/slurm/v0.0.40/nodes``.
+            params (Optional[dict[str, str]]): Query parameters.
+
+        Returns:
+            dict[str, Any]: The decoded JSON response.
+
+        Raises:
+            SlurmRestError: If the request fails or slurmrestd reports errors.
+        """
+        headers = {}
+        token = os.environ.get(self.config.token_env)
+        if token:
+            headers["X-SLURM-USER-TOKEN"] = token
+
+        try:
+            response = self.session.request(
+                method, f"{self.base_url}{path}", params=params, headers=headers, timeout=self.config.timeout
+            )
+        except requests.RequestException as e:
+            raise SlurmRestError(f"{method} {path} failed: {e}") from e
+
+        try:
+            data = response.json() if response.content else {}
+        except ValueError as e:
+            raise SlurmRestError(f"{method} {path} returned invalid JSON (HTTP {response.status_code})") from e
+
+        errors = data.get("errors") or []
+        if not response.ok or errors:
+            details = "; ".join(str(err.get("description") or err.get("error") or err) for err in errors)
+            raise SlurmRestError(
+                f"{method} {path} failed with HTTP {response.status_code}: {details or response.text[:200]}"
+            )
+        return data
+
+    def nodes(self, partition: Optional[str] = None) -> list[SlurmNode]:
+        """Return one entry per node and partition, like ``sinfo``."""
+        data = self.request("GET", f"/slurm/{self.config.api_version}/nodes")
+        nodes: list[SlurmNode] = []
+        for node in data.get("nodes", []):
+            state = rest_node_state(_states(node.get("state", [])))
+            for part in node.get("partitions", []):
+                if partition and part != partition:
+                    continue
+                nodes.append(
+                    SlurmNode.model_construct(
+                        name=node["name"], partition=part, state=state, user=node.get("owner") or ""
+                    )
+                )
+        return nodes
+
+    def active_job_nodes(self, partition: Optional[str] = None) -> list[SlurmNode]:
+        """Return nodes of running and pending jobs as allocated, like ``squeue --states=running,pending``."""
+        data = self.request("GET", f"/slurm/{self.config.api_version}/jobs")
+        nodes: list[SlurmNode] = []
+        for job in data.get("jobs", []):
+            if not {"RUNNING", "PENDING"} & set(_states(job.get("job_state", []))):
+                continue
+            if partition and job.get("partition") != partition:
+                continue
+            nodes.extend(
+                SlurmNode.model_construct(
+                    name=name,
+                    partition=job.get("partition", ""),
+                    state=SlurmNodeState.ALLOCATED,
+                    user=job.get("user_name", ""),
+                )
+                for name in HostList.parse(job.get("nodes") or "")
+            )
+        return nodes
+
+    def accounting(
+        self, job_ids: Iterable[Union[str, int]], since: Optional[datetime] = None
+    ) -> list[SlurmStepMetadata]:
+        """
+        Return accounting records of jobs and their steps with a single request, like ``sacct -j``.
+
+        The query is restricted to jobs of the user and to the accounting window, records of other jobs are dropped.
+
+        Args:
+            job_ids (Iterable[Union[str, int]]): IDs of the jobs.
+            since (Optional[datetime]): Start of the accounting window.
+
+        Returns:
+            list[SlurmStepMetadata]: Records of the jobs, each followed by records of its steps.
+        """
+        params: dict[str, str] = {}
+        if self.user_name:
+            params["users"] = self.user_name
+        if since:
+            params["start_time"] = str(int(since.timestamp()))
+        data = self.request("GET", f"/slurmdb/{self.config.api_version}/jobs", params or None)
+        return self._records(data, {str(job_id) for job_id in job_ids})
+
+    def job_accounting(self, job_id: Union[str, int]) -> list[SlurmStepMetadata]:
+        """
+        Return accounting records of a single job and its steps, like ``sacct -j <job_id>``.
+
+        Args:
+            job_id (Union[str, int]): ID of the job, ``<job_id>_<task_id>`` for array tasks.
+
+        Returns:
+            list[SlurmStepMetadata]: Record of the job followed by records of its steps.
+        """
+        data = self.request("GET", f"/slurmdb/{self.config.api_version}/job/{job_id}")
+        return self._records(data, {str(job_id)})
+
+    @classmethod
+    def _records(cls, data: dict[str, Any], wanted: set[str]) -> list[SlurmStepMetadata]:
+        records: list[SlurmStepMetadata] = []
+        for job in data.get("jobs", []):
+            job_id, task = _number(job.get("job_id")), None
+            array = job.get("array") or {}
+            if _number(array.get("job_id")):
+                job_id, task = _number(array.get("job_id")), str(_number(array.get("task_id")))
+            if (f"{job_id}_{task}" if task is not None else str(job_id)) not in wanted:
+                continue
+            records.append(cls._step_metadata(job_id, task, "", job, job.get("submit_line", "")))
+            for step in job.get("steps", []):
+                step_id = step.get("step", {}).get("id", "")
+                if isinstance(step_id, dict):
+                    step_id = step_id.get("step_id", "")
+                records.append(cls._step_metadata(job_id, task, str(step_id).rpartition(".")[2], step, ""))
+        return records
+
+    @staticmethod
+    def _step_metadata(
+        job_id: int, task: Optional[str], step_id: str, data: dict[str, Any], submit_line: str
+    ) -> SlurmStepMetadata:
+        times = data.get("time", {})
+        name = data.get("name") or data.get("step", {}).get("name", "")
+        return SlurmStepMetadata(
+            job_id=job_id,
+            array_task_id=task,
+            step_id=step_id,
+            name=name,
+            state=" ".join(_states(data.get("state", []))),
+            exit_code=_exit_code(data.get("exit_code")),
+            start_time=_timestamp(times.get("start")),
+            end_time=_timestamp(times.get("end")),
+            elapsed_time_sec=_number(times.get("elapsed")),
+            submit_line=submit_line,
+        )
+
+    def cancel(self, job_id: Union[str, int]) -> dict[str, Any]:
+        return self.request("DELETE", f"/slurm/{self.config.api_version}/job/{job_id}")
@@ -14,16 +14,22 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import atexit
 import logging
 import re
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import cast
+from typing import Optional, cast
 
 import toml
 
 from cloudai.core import BaseJob, BaseRunner, JobIdRetrievalError, System, TestRun, TestScenario
-from cloudai.util import CommandShell
+from cloudai.util import CommandShell, parse_time_limit
 
+from .allocation_reuse import AllocatedJob, SlurmAllocation
+from .hostlist import HostList
+from .job_array import array_group_key, array_index, sbatch_script_path, write_array_script
+from .node_packing import PACKABLE_NODE_STATES, NodePackingPlanner, PackingRequest
 from .slurm_command_gen_strategy import SlurmCommandGenStrategy
 from .slurm_job import SlurmJob
 from .slurm_metadata import SlurmJobMetadata, SlurmStepMetadata
@@ -36,12 +42,30 @@ class SlurmRunner(BaseRunner):
 
     Attributes
         cmd_shell (CommandShell): An instance of CommandShell for executing system commands.
+        job_states_since (datetime): Start of the sacct accounting window used for batched job state queries.
+        packing (NodePackingPlanner): Planner placing test runs onto disjoint nodes when ``node_packing`` is enabled
+            for the system.
+        packed_test_runs (dict[TestRun, list[str]]): Test runs running on packed nodes, mapped to their original node
+            specifications.
+        iteration_tasks (list[tuple[TestRun, TestRun]]): Running per-iteration copies of test runs submitted as job
+            arrays, paired with the original test runs.
+        allocation (Optional[SlurmAllocation]): Allocation DSE steps are dispatched into when ``reuse_allocation`` is
+            enabled for the system.
+        allocated_job (Optional[AllocatedJob]): The last test run dispatched into the allocation.
     """
 
+    JOB_STATES_WINDOW_SLACK = timedelta(minutes=10)
+
     def __init__(self, mode: str, system: System, test_scenario: TestScenario, output_path: Path) -> None:
         super().__init__(mode, system, test_scenario, output_path)
         self.system = cast(SlurmSystem, system)
         self.cmd_shell = CommandShell()
+        self.job_states_since = datetime.now() - self.JOB_STATES_WINDOW_SLACK
+        self.packing = NodePackingPlanner()
+        self.packed_test_runs: dict[TestRun, list[str]] = {}
+        self.iteration_tasks: list[tuple[TestRun, TestRun]] = []
+        self.allocation: Optional[SlurmAllocation] = None
+        self.allocated_job: Optional[AllocatedJob] = None
 
     def get_job_id(self, stdout: str, stderr: str) -> int | None:
         match = re.search(r"Submitted batch job (\d+)", stdout)
@@ -54,9 +78,273 @@ class SlurmRunner(BaseRunner):
 
         return None
 
+    @property
+    def job_arrays_enabled(self) -> bool:
+        return self.system.job_arrays and not self.system.node_packing
+
+    @property
+    def node_packing_enabled(self) -> bool:
+        """Node packing needs the live cluster state, so it is not used in dry-run mode."""
+        return self.system.node_packing and self.mode != "dry-run"
+
+    def submit_test(self, tr: TestRun):
+        if self.job_arrays_enabled and tr.iterations > 1 and tr.current_iteration == 0 and tr.step <= 0:
+            iterations = [tr.fork() for _ in range(tr.iterations)]
+            for i, iteration in enumerate(iterations):
+                iteration.current_iteration = i
+            self.iteration_tasks.extend((iteration, tr) for iteration in iterations)
+            self.submit_test_array(iterations, self.system.job_array_max_running or 1, pin_nodes=True)
+            return
+
+        request = PackingRequest.from_test_run(tr) if self.node_packing_enabled else None
+        if request is None or request.group not in self.system.groups.get(request.partition, {}):
+            super().submit_test(tr)
+            return
+
+        self.packing.queue.append(request)
+        self.submit_packed_test_runs()
+
+    def submit_packed_test_runs(self) -> None:
+        """
+        Submit queued test runs that fit onto free nodes, pinning each of them to its own subset of nodes.
+
+        If nothing is running on packed nodes, the oldest queued test run is submitted with its original node
+        specification, so requests that never fit (e.g. nodes are taken by other users) are left to Slurm.
+        """
+        if not self.packing.queue:
+            return
+
+        free_nodes = {}
+        for request in self.packing.queue:
+            key = (request.partition, request.group)
+            if key not in free_nodes:
+                self.system.refresh_cluster_state(request.partition)
+                grouped = self.system.group_nodes_by_state(*key)
+                free_nodes[key] = [node for state in PACKABLE_NODE_STATES for node in grouped[state]]
+
+        for request, nodes in self.packing.plan(free_nodes):
+            self.system.lock_nodes(nodes)
+            self.packed_test_runs[request.tr] = request.tr.nodes
+            request.tr.nodes = [node.name for node in nodes]
+            logging.info(f"Packing test {request.tr.name} onto nodes {request.tr.nodes}")
+            super().submit_test(request.tr)
+
+        if self.packing.queue and not self.packed_test_runs:
+            request = self.packing.queue.pop(0)
+            logging.warning(f"Not enough free nodes to pack test {request.tr.name}, submitting it to the Slurm queue.")
+            super().submit_test(request.tr)
+        elif self.packing.queue:
+            logging.info(f"Tests waiting for free nodes: {[request.tr.name for request in self.packing.queue]}")
+
+    def iteration_origin(self, tr: TestRun) -> TestRun | None:
+        """Return the original test run of a per-iteration copy, None for other test runs."""
+        return next((origin for copy, origin in self.iteration_tasks if copy is tr), None)
+
+    def is_scheduled_or_submitted(self, tr: TestRun) -> bool:
+        return (
+            super().is_scheduled_or_submitted(tr)
+            or any(origin is tr for _, origin in self.iteration_tasks)
+            or any(request.tr is tr for request in self.packing.queue)
+        )
+
+    def check_and_schedule_start_post_init_dependent_tests(self, started_test_run: TestRun):
+        super().check_and_schedule_start_post_init_dependent_tests(
+            self.iteration_origin(started_test_run) or started_test_run
+        )
+
+    def handle_job_completion(self, completed_job: BaseJob):
+        origin = self.iteration_origin(completed_job.test_run)
+        if origin is None:
+            super().handle_job_completion(completed_job)
+            return
+
+        tr = completed_job.test_run
+        logging.info(f"Job completed: {tr.name} (iteration {tr.current_iteration + 1} of {tr.iterations})")
+        self.jobs.remove(completed_job)
+        del self.testrun_to_job_map[tr]
+        self.iteration_tasks = [(copy, o) for copy, o in self.iteration_tasks if copy is not tr]
+        if any(o is origin for _, o in self.iteration_tasks):
+            return
+
+        origin.current_iteration, origin.output_path = tr.current_iteration, tr.output_path
+        self.handle_dependencies(SlurmJob(origin, id=completed_job.id))
+
+    def submit_tests(self, trs: list[TestRun]) -> None:
+        """Submit DSE trials of the same test run as tasks of one job array when job arrays are enabled."""
+        if not self.job_arrays_enabled:
+            super().submit_tests(trs)
+            return
+
+        trials: dict[tuple[str, int], list[TestRun]] = {}
+        for tr in trs:
+            if tr.step > 0:
+                trials.setdefault((tr.name, tr.current_iteration), []).append(tr)
+            else:
+                self.submit_test(tr)
+        for group in trials.values():
+            self.submit_test_array(group, self.system.job_array_max_running)
+
+    def submit_test_array(self, trs: list[TestRun], max_running: int | None, pin_nodes: bool = False) -> None:
+        """
+        Submit test runs as tasks of a job array, every task runs the batch script generated for its test run.
+
+        Test runs whose batch scripts differ in anything but per-task directives (job name, output files) are submitted
+        as separate jobs, and so are test runs of workloads not submitted with a plain ``sbatch <script>``.
+
+        Args:
+            trs (list[TestRun]): Test runs to submit.
+            max_running (int | None): Maximum number of tasks running at the same time.
+            pin_nodes (bool): Run all test runs on the nodes allocated for the first one, e.g. for iterations.
+        """
+        groups: dict[tuple, list[tuple[TestRun, Path]]] = {}
+        for tr in trs:
+            tr.output_path = self.get_job_output_path(tr)
+            logging.info(f"Starting test: {tr.name} (results at: {tr.output_path})")
+            self.on_job_submit(tr)
+            cmd_gen = cast(SlurmCommandGenStrategy, self.get_cmd_gen_strategy(self.system, tr))
+            exec_cmd = cmd_gen.gen_exec_command()
+            if pin_nodes and tr is trs[0]:
+                _, node_list = cmd_gen.get_cached_nodes_spec()
+                for other in trs[1:]:
+                    other.nodes = node_list or other.nodes
+
+            script = sbatch_script_path(exec_cmd)
+            key = array_group_key(tr, script) if script else None
+            if script is None or key is None:
+                self.track_job(SlurmJob(tr, id=self.run_submission(tr, exec_cmd)))
+                continue
+            groups.setdefault(key, []).append((tr, script))
+
+        for tasks in groups.values():
+            if len(tasks) == 1:
+                tr, script = tasks[0]
+                self.track_job(SlurmJob(tr, id=self.run_submission(tr, f"sbatch {script}")))
+                continue
+
+            array_script = write_array_script(tasks, max_running)
+            array_id = self.run_submission(tasks[0][0], f"sbatch {array_script}")
+            for tr, _ in tasks:
+                self.track_job(SlurmJob(tr, id=f"{array_id}_{array_index(tr)}"))
+
     def _submit_test(self, tr: TestRun) -> SlurmJob:
         logging.info(f"Running test: {tr.name}")
+        if self.system.reuse_allocation and self.mode == "run" and tr.step > 0:
+            job = self.submit_to_allocation(tr)
+            if job is not None:
+                return job
+
         exec_cmd = self.get_cmd_gen_strategy(self.system, tr).gen_exec_command()
+        return SlurmJob(tr, id=self.run_submission(tr, exec_cmd))
+
+    def submit_to_allocation(self, tr: TestRun) -> Optional[AllocatedJob]:
+        """
+        Run a DSE step as steps of the reused allocation, acquiring a new one if the step does not fit into it.
+
+        Returns:
+            Optional[AllocatedJob]: The dispatched job, None if the step has to be submitted with ``sbatch``: the
+                allocation is busy with another step, cannot be acquired, or the workload is not submitted with a
+                plain ``sbatch <script>``.
+        """
+        if self.allocated_job is not None and self.allocated_job.is_running:
+            return None
+
+        cmd_gen = cast(SlurmCommandGenStrategy, self.get_cmd_gen_strategy(self.system, tr))
+        num_nodes, node_list = cmd_gen.get_cached_nodes_spec()
+        time_limit = parse_time_limit(tr.time_limit) if tr.time_limit else None
+        if self.allocation is not None:
+            self.allocation = self.query_allocation(self.allocation.job_id)
+        if self.allocation is None or not self.allocation.fits(num_nodes, time_limit):
+            self.release_allocation()
+            self.allocation = self.acquire_allocation(tr, num_nodes, node_list)
+            if self.allocation is None:
+                return None
+
+        nodes, tr.nodes = tr.nodes, list(self.allocation.nodes)
+        script = sbatch_script_path(self.get_cmd_gen_strategy(self.system, tr).gen_exec_command())
+        if script is None:
+            tr.nodes = nodes
+            return None
+
+        logging.info(f"Dispatching test {tr.name} into allocation {self.allocation.job_id}")
+        self.allocated_job = AllocatedJob(
+            tr, id=self.allocation.job_id, process=self.allocation.dispatch(script, tr.output_path)
+        )
+        return self.allocated_job
+
+    def acquire_allocation(self, tr: TestRun, num_nodes: int, node_list: list[str]) -> Optional[SlurmAllocation]:
+        """
+        Allocate nodes with ``salloc --no-shell`` for consecutive DSE steps.
+
+        ``salloc`` gives up if the allocation is not granted within ``reuse_allocation_wait`` seconds, so the runner is
+        not blocked while the request waits in the queue, the step is submitted with ``sbatch`` instead.
+        """
+        cmd = ["salloc", "--no-shell", f"--immediate={self.system.reuse_allocation_wait}", f"-N{num_nodes}"]
+        cmd.append(f"--partition={self.system.default_partition}")
+        cmd.append(f"--job-name={self.system.account + '-' if self.system.account else ''}CloudAI_allocation")
+        if self.system.account:
+            cmd.append(f"--account={self.system.account}")
+        if node_list:
+            cmd.append(f"--nodelist={','.join(node_list)}")
+        if self.system.gpus_per_node and self.system.supports_gpu_directives:
+            cmd.append(f"--gpus-per-node={self.system.gpus_per_node}")
+        if self.system.reuse_allocation_time_limit:
+            cmd.append(f"--time={self.system.reuse_allocation_time_limit}")
+        cmd.extend(self.system.extra_sbatch_args)
+
+        logging.info(f"Acquiring allocation of {num_nodes} node(s) for test {tr.name}: {' '.join(cmd)}")
+        stdout, stderr = self.cmd_shell.execute(" ".join(cmd)).communicate()
+        match = SlurmAllocation.GRANTED_RE.search(stdout + stderr)
+        if match is None:
+            logging.warning(f"Failed to acquire allocation, submitting test {tr.name} with sbatch: {stderr}")
+            return None
+
+        atexit.unregister(self.release_allocation)
+        atexit.register(self.release_allocation)
+        self.system.cluster_state.invalidate()
+        allocation = self.query_allocation(int(match.group(1)))
+        if allocation is None:
+            self.system.scancel(match.group(1))
+        return allocation
+
+    def query_allocation(self, job_id: int) -> Optional[SlurmAllocation]:
+        """Return nodes and end time of an allocation, None if it is no longer running."""
+        stdout, _ = self.system.fetch_command_output(f"squeue -h -j {job_id} -o '%T|%N|%e'")
+        state, _, rest = stdout.strip().partition("|")
+        nodes, _, end = rest.partition("|")
+        if state != "RUNNING":
+            logging.info(f"Allocation {job_id} is not running (state: {state or 'gone'})")
+            return None
+
+        try:
+            end_time: Optional[datetime] = datetime.fromisoformat(end)
+        except ValueError:
+            end_time = None
+        return SlurmAllocation(job_id, list(HostList.parse(nodes)), end_time)
+
+    def release_allocation(self) -> None:
+        if self.allocation is None:
+            return
+        if self.allocated_job is not None:
+            self.allocated_job.terminate()
+        logging.info(f"Releasing allocation {self.allocation.job_id}")
+        self.system.scancel(self.allocation.job_id)
+        self.system.unlock_nodes(HostList.from_names(self.allocation.nodes))
+        self.allocation, self.allocated_job = None, None
+        atexit.unregister(self.release_allocation)
+
+    def release_resources(self) -> None:
+        self.release_allocation()
+
+    def run_submission(self, tr: TestRun, exec_cmd: str) -> int:
+        """
+        Run the submission command of a test run.
+
+        Returns:
+            int: The Slurm job ID, 0 in dry-run mode.
+
+        Raises:
+            JobIdRetrievalError: If the job ID cannot be found in the output of the command.
+        """
         logging.debug(f"Executing command for test {tr.name}: {exec_cmd}")
         job_id = 0
         if self.mode == "run":
@@ -71,12 +359,31 @@ class SlurmRunner(BaseRunner):
                     message="Failed to retrieve job ID.",
                 )
         logging.info(f"Submitted slurm job: {job_id}")
-        return SlurmJob(tr, id=job_id)
+        if self.mode == "run" and not self.nodes_locked_by_cloudai(tr):
+            self.system.cluster_state.invalidate()
+        return job_id
+
+    def nodes_locked_by_cloudai(self, tr: TestRun) -> bool:
+        """
+        Check if nodes of a submitted test run are locked by CloudAI, so cached node states already account for it.
+
+        Nodes are locked for group specifications and packed test runs. Otherwise Slurm picks the nodes or they are
+        given explicitly, and the cluster state snapshot has to be refreshed before the next allocation.
+        """
+        if tr in self.packed_test_runs:
+            return True
+        return bool(tr.nodes) and all(spec.count(":") == 2 for spec in tr.nodes)
 
     def on_job_submit(self, tr: TestRun) -> None:
         cmd_gen = self.get_cmd_gen_strategy(self.system, tr)
         cmd_gen.store_test_run()
 
+    def on_monitor_tick(self) -> None:
+        if self.mode == "dry-run":
+            return
+        job_ids = [job.id for job in self.jobs if not isinstance(job, AllocatedJob)]
+        self.system.refresh_job_states(job_ids, since=self.job_states_since)
+
     def completed_test_runs(self, job: BaseJob) -> list[TestRun]:
         return [cast(SlurmJob, job).test_run]
 
@@ -89,6 +396,16 @@ class SlurmRunner(BaseRunner):
                 self.get_cmd_gen_strategy(self.system, tr).cleanup_job_artifacts()
             except Exception:
                 logging.warning(f"Cleanup failed for test run at {tr.output_path}", exc_info=True)
+            self.release_packed_nodes(tr)
+
+        self.submit_packed_test_runs()
+
+    def release_packed_nodes(self, tr: TestRun) -> None:
+        spec = self.packed_test_runs.pop(tr, None)
+        if spec is None:
+            return
+        self.system.unlock_nodes(HostList.from_names(tr.nodes))
+        tr.nodes = spec
 
     def _mock_job_metadata(self) -> SlurmStepMetadata:
         return SlurmStepMetadata(
@@ -108,7 +425,7 @@ class SlurmRunner(BaseRunner):
     ) -> tuple[Path, SlurmJobMetadata]:
         cmd_gen = cast(SlurmCommandGenStrategy, self.get_cmd_gen_strategy(self.system, job.test_run))
         return job.test_run.output_path / "slurm-job.toml", SlurmJobMetadata(
-            job_id=int(job.id),
+            job_id=int(str(job.id).split("_")[0]),
             name=steps_metadata[0].name,
             state=steps_metadata[0].state,
             exit_code=steps_metadata[0].exit_code,
@@ -17,20 +17,32 @@
 from __future__ import annotations
 
 import logging
-import re
 from copy import copy
+from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+from typing import Any, Callable, Collection, Dict, Iterable, List, Optional, Tuple, TypeVar, Union
 
-from pydantic import BaseModel, ConfigDict, Field, field_serializer, field_validator
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, field_serializer, field_validator
 
 from cloudai.core import BaseJob, File, Installable, System
 from cloudai.models.scenario import ReportConfig, parse_reports_spec
 from cloudai.util import CommandShell
 
+from .allocation_reuse import AllocatedJob
+from .hostlist import HostList
+from .node_staging import NodeLocalStaging
+from .slurm_cluster_state import SlurmClusterStateSnapshot
 from .slurm_job import SlurmJob
+from .slurm_job_states import SlurmJobStateSnapshot
 from .slurm_metadata import SlurmStepMetadata
 from .slurm_node import SlurmNode, SlurmNodeState
+from .slurm_rest import SlurmRestClient, SlurmRestConfig, SlurmRestError
+
+T = TypeVar("T")
+
+SACCT_STEPS_FORMAT = (
+    "--format=JobID,JobName,State,ExitCode,Start,End,ElapsedRAW,SubmitLine --delimiter='|' -p --noheader"
+)
 
 
 class DataRepositoryConfig(BaseModel):
@@ -44,36 +56,15 @@ def parse_node_list(node_list: str) -> List[str]:
     """
     Expand a list of node names (with ranges) into a flat list of individual node names, keeping leading zeroes.
 
+    Prefer ``HostList`` where the names do not have to be listed one by one, it keeps ranges unexpanded.
+
     Args:
         node_list (str): A list of node names, possibly including ranges.
 
     Returns:
-        List[str]: A flat list of expanded node names with preserved zeroes.
+        List[str]: A flat list of expanded node names with preserved zeroes, without duplicates.
     """
-    node_list = node_list.strip()
-    nodes = []
-    if not node_list:
-        return []
-
-    components = re.split(r",\s*(?![^[]*\])", node_list)
-    for component in components:
-        if "[" not in component:
-            nodes.append(component)
-        else:
-            header, node_number = component.split("[")
-            node_number = node_number.replace("]", "")
-            ranges = node_number.split(",")
-            for r in ranges:
-                if "-" in r:
-                    start_node, end_node = r.split("-")
-                    number_of_digits = len(end_node)
-                    nodes.extend(
-                        [f"{header}{str(i).zfill(number_of_digits)}" for i in range(int(start_node), int(end_node) + 1)]
-                    )
-                else:
-                    nodes.append(f"{header}{r}")
-
-    return nodes
+    return list(HostList.parse(node_list))
 
 
 class SlurmGroup(BaseModel):
@@ -90,8 +81,30 @@ class SlurmPartition(BaseModel):
     model_config = ConfigDict(extra="forbid")
     name: str
     groups: List[SlurmGroup] = []
+    gpu_type: Optional[str] = None
     slurm_nodes: list[SlurmNode] = Field(default_factory=list[SlurmNode], exclude=True)
 
+    _node_index: dict[str, SlurmNode] = PrivateAttr(default_factory=dict)
+    _node_index_key: tuple[int, int] = PrivateAttr(default=(0, 0))
+
+    @property
+    def nodes_key(self) -> tuple[int, int]:
+        """Identity and length of ``slurm_nodes``, changes when the list is replaced or nodes are added or removed."""
+        return id(self.slurm_nodes), len(self.slurm_nodes)
+
+    @property
+    def node_index(self) -> dict[str, SlurmNode]:
+        """Nodes of the partition by name, rebuilt if ``slurm_nodes`` was replaced or modified directly."""
+        if self._node_index_key != self.nodes_key:
+            self._node_index = {node.name: node for node in self.slurm_nodes}
+            self._node_index_key = self.nodes_key
+        return self._node_index
+
+    def add_node(self, node: SlurmNode) -> None:
+        self.node_index[node.name] = node
+        self.slurm_nodes.append(node)
+        self._node_index_key = self.nodes_key
+
 
 class SlurmSystem(System):
     """Represents a Slurm system."""
@@ -111,11 +124,29 @@ class SlurmSystem(System):
     extra_sbatch_args: list[str] = Field(default_factory=list)
     supports_gpu_directives_cache: Optional[bool] = Field(default=None, exclude=True)
     container_mount_home: bool = False
+    node_packing: bool = False
+    cluster_state_ttl: float = Field(default=10.0, ge=0)
+    cluster_state_incremental: bool = False
+    rest: Optional[SlurmRestConfig] = None
+    job_arrays: bool = False
+    job_array_max_running: Optional[int] = Field(default=None, gt=0)
+    step_packing: bool = False
+    docker_image_cache_max_size_gb: Optional[float] = Field(default=None, gt=0)
+    node_local_staging: Optional[NodeLocalStaging] = None
+    reuse_allocation: bool = False
+    reuse_allocation_time_limit: Optional[str] = None
+    reuse_allocation_wait: int = Field(default=10, gt=0)
 
     data_repository: Optional[DataRepositoryConfig] = None
     reports: Optional[dict[str, ReportConfig]] = None
 
     group_allocated: set[SlurmNode] = Field(default_factory=set, exclude=True)
+    job_states: SlurmJobStateSnapshot = Field(default_factory=SlurmJobStateSnapshot, exclude=True)
+    cluster_state: SlurmClusterStateSnapshot = Field(default_factory=SlurmClusterStateSnapshot, exclude=True)
+
+    _groups: Optional[Dict[str, Dict[str, List[SlurmNode]]]] = PrivateAttr(default=None)
+    _groups_key: tuple = PrivateAttr(default=())
+    _rest_client: Optional[SlurmRestClient] = PrivateAttr(default=None)
 
     @field_validator("reports", mode="before")
     @classmethod
@@ -124,17 +155,26 @@ class SlurmSystem(System):
 
     @property
     def groups(self) -> Dict[str, Dict[str, List[SlurmNode]]]:
+        """
+        Nodes of every group by partition and group names.
+
+        Group membership is cached and rebuilt when nodes are inserted by an update, or the nodes or the partitions are
+        replaced. States of cached nodes are always current, as updates modify node objects in place.
+        """
+        key = tuple((id(part), id(part.groups), part.nodes_key) for part in self.partitions)
+        if self._groups is not None and self._groups_key == key:
+            return self._groups
+
         groups: Dict[str, Dict[str, List[SlurmNode]]] = {}
         for part in self.partitions:
             groups[part.name] = {}
+            node_index = part.node_index
             for group in part.groups:
-                node_names = set()
-                for group_nodes in group.nodes:
-                    node_names.update(set(parse_node_list(group_nodes)))
+                node_names = HostList.parse(",".join(group.nodes))
 
                 groups[part.name][group.name] = []
                 for node_name in node_names:
-                    node_in_partition = next((node for node in part.slurm_nodes if node.name == node_name), None)
+                    node_in_partition = node_index.get(node_name)
                     if not node_in_partition:
                         logging.error(f"Node '{node_name}' not found in partition '{part.name}'")
                         groups[part.name][group.name].append(
@@ -143,8 +183,41 @@ class SlurmSystem(System):
                     else:
                         groups[part.name][group.name].append(node_in_partition)
 
+        self._groups, self._groups_key = groups, key
         return groups
 
+    @property
+    def rest_client(self) -> Optional[SlurmRestClient]:
+        """Slurmrestd client sharing keep-alive connections, None if ``rest`` is not configured."""
+        if self.rest is None:
+            return None
+        if self._rest_client is None or self._rest_client.config is not self.rest:
+            self._rest_client = SlurmRestClient(self.rest)
+        return self._rest_client
+
+    def query_rest(self, query: Callable[[SlurmRestClient], T]) -> Optional[T]:
+        """
+        Run a query against slurmrestd.
+
+        Returns:
+            Optional[T]: The query result, None if slurmrestd is not configured or the query failed and the Slurm CLI
+                has to be used instead.
+        """
+        client = self.rest_client
+        if client is None:
+            return None
+        try:
+            return query(client)
+        except SlurmRestError as e:
+            logging.warning(f"slurmrestd query failed, falling back to Slurm CLI: {e}")
+            return None
+
+    def rest_job_states(self, job_id: Union[str, int]) -> Optional[list[str]]:
+        records = self.query_rest(lambda rest: rest.job_accounting(job_id))
+        if records is None:
+            return None
+        return [token for record in records for token in record.state.split()]
+
     @property
     def supports_gpu_directives(self) -> bool:
         if self.supports_gpu_directives_cache is not None:
@@ -168,21 +241,97 @@ class SlurmSystem(System):
     def _path_serializer(self, v: Path) -> str:
         return str(v)
 
-    def update(self) -> None:
+    def fingerprint(self) -> dict[str, Any]:
+        return super().fingerprint() | {
+            "default_partition": self.default_partition,
+            "gpus_per_node": self.gpus_per_node,
+            "ntasks_per_node": self.ntasks_per_node,
+            "mpi": self.mpi,
+            "extra_srun_args": self.extra_srun_args,
+            "extra_sbatch_args": self.extra_sbatch_args,
+        }
+
+    def placement(self, nodes: list[str]) -> dict[str, Any]:
+        placements = set()
+        for spec in nodes:
+            if ":" in spec:
+                partition_name, group_name = spec.split(":")[:2]
+                placements.add((partition_name, group_name))
+            else:
+                placements.add((self.partition_of(spec), None))
+        if not placements:
+            placements.add((self.default_partition, None))
+
+        return {
+            "partitions": [
+                {"partition": name, "group": group, "gpu_type": self.partition_gpu_type(name)}
+                for name, group in sorted(placements, key=str)
+            ]
+        }
+
+    def partition_of(self, node_spec: str) -> str:
+        """Name of the first partition listing any of the given nodes, the default partition if none does."""
+        hosts = HostList.parse(node_spec)
+        for part in self.partitions:
+            if any(node in hosts for node in part.node_index):
+                return part.name
+            if any(hosts & HostList.parse(",".join(group.nodes)) for group in part.groups):
+                return part.name
+        return self.default_partition
+
+    def partition_gpu_type(self, name: str) -> Optional[str]:
+        return next((part.gpu_type for part in self.partitions if part.name == name), None)
+
+    def update(self, partition: Optional[str] = None) -> None:
         """
         Update the system object for a SLURM system.
 
         This method updates the system object by querying the current state of each node using the 'sinfo' and 'squeue'
         commands, and correlating this information to determine the state of each node and the user running jobs on
         each node.
+
+        Args:
+            partition (Optional[str]): Only query nodes of this partition, nodes of other partitions keep their states.
         """
-        all_nodes = self.nodes_from_sinfo()
+        all_nodes = self.nodes_from_sinfo(partition)
         self.update_nodes_state_and_user(all_nodes, insert_new=True)
-        self.update_nodes_state_and_user(self.nodes_from_squeue())
+        self.update_nodes_state_and_user(self.nodes_from_squeue(partition))
         self.update_nodes_state_and_user(self.group_allocated)
+        self.cluster_state.mark_refreshed([partition] if partition else [part.name for part in self.partitions])
+
+    def refresh_cluster_state(self, partition: str) -> None:
+        """
+        Refresh node states of a partition unless the cluster state snapshot is younger than ``cluster_state_ttl``.
+
+        With ``cluster_state_incremental`` only the requested partition is queried once its nodes are known, otherwise
+        the whole cluster is.
+
+        Args:
+            partition (str): The partition nodes are about to be allocated from.
+        """
+        snapshot = self.cluster_state
+        age = snapshot.age(partition)
+        if snapshot.is_fresh(self.cluster_state_ttl, partition):
+            snapshot.hits += 1
+        else:
+            snapshot.misses += 1
+            known = any(part.slurm_nodes for part in self.partitions if part.name == partition)
+            self.update(partition if self.cluster_state_incremental and known else None)
+
+        logging.debug(
+            f"Cluster state snapshot for partition '{partition}': "
+            + (f"age {age:.1f}s" if age is not None else "refreshed")
+            + f", hit rate {snapshot.hit_rate:.0%} ({snapshot.hits} hits, {snapshot.misses} refreshes)"
+        )
 
-    def nodes_from_sinfo(self) -> list[SlurmNode]:
-        sinfo_output, _ = self.fetch_command_output("sinfo --noheader -o '%P|%t|%u|%N'")
+    def nodes_from_sinfo(self, partition: Optional[str] = None) -> list[SlurmNode]:
+        if (rest_nodes := self.query_rest(lambda rest: rest.nodes(partition))) is not None:
+            return rest_nodes
+
+        command = "sinfo --noheader -o '%P|%t|%u|%N'"
+        if partition:
+            command += f" --partition={partition}"
+        sinfo_output, _ = self.fetch_command_output(command)
         nodes: list[SlurmNode] = []
         for line in sinfo_output.split("\n"):
             if not line.strip():
@@ -192,44 +341,51 @@ class SlurmSystem(System):
                 continue
             partition, state, user, nodelist = parts[:4]
             partition = partition.rstrip("*").strip()
-            node_names = parse_node_list(nodelist)
+            node_names = HostList.parse(nodelist)
             logging.debug(f"{partition=}, {state=}, {nodelist=}, {node_names=}")
-            for node_name in node_names:
-                nodes.append(
-                    SlurmNode(name=node_name, partition=partition, state=self.convert_state_to_enum(state), user=user)
-                )
+            if not node_names:
+                continue
+            node_state = self.convert_state_to_enum(state)
+            nodes.extend(
+                SlurmNode.model_construct(name=node_name, partition=partition, state=node_state, user=user)
+                for node_name in node_names
+            )
         return nodes
 
-    def nodes_from_squeue(self) -> list[SlurmNode]:
-        squeue_output, _ = self.fetch_command_output("squeue --states=running,pending --noheader -o '%P|%T|%N|%u'")
+    def nodes_from_squeue(self, partition: Optional[str] = None) -> list[SlurmNode]:
+        if (rest_nodes := self.query_rest(lambda rest: rest.active_job_nodes(partition))) is not None:
+            return rest_nodes
+
+        command = "squeue --states=running,pending --noheader -o '%P|%T|%N|%u'"
+        if partition:
+            command += f" --partition={partition}"
+        squeue_output, _ = self.fetch_command_output(command)
         nodes: list[SlurmNode] = []
         for line in squeue_output.split("\n"):
             parts = line.split("|")
             if len(parts) < 4:
                 continue
             partition, _, nodelist, user = parts[:4]
-            node_names = parse_node_list(nodelist)
-            for node in node_names:
-                nodes.append(SlurmNode(name=node, partition=partition, state=SlurmNodeState.ALLOCATED, user=user))
+            node_names = HostList.parse(nodelist)
+            nodes.extend(
+                SlurmNode.model_construct(name=node, partition=partition, state=SlurmNodeState.ALLOCATED, user=user)
+                for node in node_names
+            )
         return nodes
 
     def update_nodes_state_and_user(self, nodes: Iterable[SlurmNode], insert_new: bool = False) -> None:
+        partitions = {part.name: part for part in self.partitions}
         for node in nodes:
-            for part in self.partitions:
-                if part.name != node.partition:
-                    continue
-
-                found = False
-                for pnode in part.slurm_nodes:
-                    if pnode.name != node.name:
-                        continue
-                    pnode.state = node.state
-                    pnode.user = node.user
-                    found = True
-                    break
-
-                if not found and insert_new:
-                    part.slurm_nodes.append(node)
+            part = partitions.get(node.partition)
+            if part is None:
+                continue
+
+            pnode = part.node_index.get(node.name)
+            if pnode is not None:
+                pnode.state = node.state
+                pnode.user = node.user
+            elif insert_new:
+                part.add_node(node)
 
     def is_job_running(self, job: BaseJob, retry_threshold: int = 3) -> bool:
         """
@@ -249,6 +405,15 @@ class SlurmSystem(System):
             RuntimeError: If an error occurs that prevents determination of the job's running status, or if the status
                         cannot be determined after the specified number of retries.
         """
+        if isinstance(job, AllocatedJob):
+            return job.is_running
+
+        states = self.job_states.states(job.id)
+        if states is None:
+            states = self.rest_job_states(job.id)
+        if states is not None:
+            return "RUNNING" in states
+
         retry_count = 0
         command = f"sacct -j {job.id} --format=State --noheader"
 
@@ -297,6 +462,15 @@ class SlurmSystem(System):
         Raises:
             RuntimeError: If unable to determine job status after retries, or if a non-retryable error is encountered.
         """
+        if isinstance(job, AllocatedJob):
+            return not job.is_running
+
+        states = self.job_states.states(job.id)
+        if states is None:
+            states = self.rest_job_states(job.id)
+        if states is not None:
+            return self.are_states_completed(states)
+
         retry_count = 0
         command = f"sacct -j {job.id} --format=State --noheader"
 
@@ -314,11 +488,7 @@ class SlurmSystem(System):
                 logging.error(error_message)
                 raise RuntimeError(error_message)
 
-            job_states = stdout.strip().split()
-            if "RUNNING" in job_states:
-                return False
-
-            if any(state in ["COMPLETED", "FAILED", "CANCELLED", "TIMEOUT", "CANCELLED+"] for state in job_states):
+            if self.are_states_completed(stdout.strip().split()):
                 return True
 
             break
@@ -330,12 +500,77 @@ class SlurmSystem(System):
 
         return False
 
+    @staticmethod
+    def are_states_completed(job_states: list[str]) -> bool:
+        if "RUNNING" in job_states:
+            return False
+        return any(state in ["COMPLETED", "FAILED", "CANCELLED", "TIMEOUT", "CANCELLED+"] for state in job_states)
+
+    def refresh_job_states(
+        self, job_ids: list[Union[str, int]], since: Optional[datetime] = None, retry_threshold: int = 3
+    ) -> None:
+        """
+        Refresh the job state snapshot with a single sacct call for all given jobs.
+
+        The snapshot then serves `is_job_running`, `is_job_completed` and `get_job_status` for these jobs until the
+        next refresh. If the query fails, the snapshot is left empty so that lookups fall back to per-job queries.
+
+        Args:
+            job_ids (list[Union[str, int]]): IDs of all jobs to track.
+            since (Optional[datetime]): Start of the accounting window passed to sacct as `-S`.
+            retry_threshold (int): Maximum number of retries for transient errors.
+        """
+        if self.job_states.lookups:
+            logging.debug(
+                f"Job state snapshot served {self.job_states.lookups} lookups with {self.job_states.sacct_calls} "
+                f"sacct call(s), saved {self.job_states.saved_calls} scheduler calls"
+            )
+        self.job_states.reset()
+        if not job_ids:
+            return
+
+        rest_records = self.query_rest(lambda rest: rest.accounting(job_ids, since))
+        if rest_records is not None:
+            records: dict[str, list[SlurmStepMetadata]] = {str(job_id): [] for job_id in job_ids}
+            records.update(SlurmJobStateSnapshot.group_by_job(rest_records))
+            self.job_states.reset(records, sacct_calls=1)
+            return
+
+        command = f"sacct -j {','.join(str(job_id) for job_id in job_ids)} {SACCT_STEPS_FORMAT}"
+        if since:
+            command += f" -S {since.strftime('%Y-%m-%dT%H:%M:%S')}"
+
+        for attempt in range(1, retry_threshold + 1):
+            stdout, stderr = self.cmd_shell.execute(command).communicate()
+            logging.debug(f"Job states: {command=} {stdout=} {stderr=}")
+
+            if "Socket timed out" in stderr or "slurm_load_jobs error" in stderr:
+                logging.warning(f"Retrying job states query (attempt {attempt}/{retry_threshold})")
+                continue
+
+            if stderr:
+                logging.warning(f"Error querying job states, falling back to per-job queries: {stderr}")
+                return
+
+            records = {str(job_id): [] for job_id in job_ids}
+            records.update(SlurmJobStateSnapshot.group_by_job(SlurmStepMetadata.from_sacct_output(stdout, "|")))
+            self.job_states.reset(records, sacct_calls=attempt)
+            return
+
+        logging.warning(f"Failed to query job states after {retry_threshold} attempts, falling back to per-job queries")
+
     def get_job_status(self, job: BaseJob, retry_threshold: int = 3) -> list[SlurmStepMetadata]:
+        if isinstance(job, AllocatedJob):
+            return [job.metadata()]
+
+        records = self.job_states.get(job.id)
+        if records is None:
+            records = self.query_rest(lambda rest: rest.job_accounting(job.id))
+        if records is not None:
+            return records
+
         retry_count = 0
-        command = (
-            f"sacct -j {job.id} --format=JobID,JobName,State,ExitCode,Start,End,ElapsedRAW,SubmitLine "
-            "--delimiter='|' -p --noheader"
-        )
+        command = f"sacct -j {job.id} {SACCT_STEPS_FORMAT}"
 
         while retry_count < retry_threshold:
             stdout, stderr = self.cmd_shell.execute(command).communicate()
@@ -362,7 +597,9 @@ class SlurmSystem(System):
         Args:
             job (BaseJob): The job to be terminated.
         """
-        assert isinstance(job.id, int)
+        if isinstance(job, AllocatedJob):
+            job.terminate()
+            return
         self.scancel(job.id)
 
     @classmethod
@@ -379,75 +616,14 @@ class SlurmSystem(System):
         Returns:
             A string representing the condensed node list, with numerically adjacent nodes shown as ranges.
         """
-
-        def extract_parts(name: str) -> tuple:
-            """
-            Extract the prefix and numeric part of a node name, along with the length of the numeric part.
-
-            Zero-padding is used.
-
-            Args:
-                name: The node name to be parsed.
-
-            Returns:
-                A tuple containing the prefix (str), numeric part (int), and
-                the length of the numeric part (int).
-            """
-            match = re.match(r"^(.*?-)(\d+)$", name)
-            if not match:
-                raise ValueError(f"Cannot extract numeric part from '{name}'")
-            prefix, num = match.groups()
-            return prefix, int(num), len(num)
-
-        def format_range(lst: List[int], padding: int) -> List[str]:
-            """
-            Format a list of integers into string ranges, considering zero-padding.
-
-            Args:
-                lst: A sorted list of node numbers.
-                padding: The number of digits for zero-padding the node numbers.
-
-            Returns:
-                A list of formatted string ranges.
-            """
-            if not lst:
-                return []
-            lst.sort()
-            start = lst[0]
-            end = lst[0]
-            ranges = []
-            for num in lst[1:]:
-                if num == end + 1:
-                    end = num
-                else:
-                    range_str = f"{start:0{padding}d}-{end:0{padding}d}" if start != end else f"{start:0{padding}d}"
-                    ranges.append(range_str)
-                    start = end = num
-            range_str = f"{start:0{padding}d}-{end:0{padding}d}" if start != end else f"{start:0{padding}d}"
-            ranges.append(range_str)
-            return ranges
-
-        nodes_by_prefix = {}
-        for name in node_names:
-            prefix, num, length = extract_parts(name)
-            nodes_by_prefix.setdefault(prefix, {"nums": [], "padding": 0})
-            nodes_by_prefix[prefix]["nums"].append(num)
-            nodes_by_prefix[prefix]["padding"] = max(nodes_by_prefix[prefix]["padding"], length)
-
-        formatted_ranges = []
-        for prefix, details in nodes_by_prefix.items():
-            ranges = format_range(details["nums"], details["padding"])
-            range_str = f"[{','.join(ranges)}]" if ranges else ""
-            formatted_ranges.append(f"{prefix}{range_str}")
-
-        return ", ".join(formatted_ranges)
+        return str(HostList.from_names(node_names))
 
     def get_available_nodes_from_group(
         self,
         partition_name: str,
         group_name: str,
         number_of_nodes: Union[int, str],
-        exclude_nodes: list[str] | None = None,
+        exclude_nodes: Collection[str] | None = None,
     ) -> List[SlurmNode]:
         """
         Retrieve a specific number of potentially available nodes from a group within a partition.
@@ -460,7 +636,7 @@ class SlurmSystem(System):
             group_name (str): The name of the group.
             number_of_nodes (Union[int,str]): The number of nodes to retrieve.
                 Could also be 'all' to retrieve all the nodes from the group.
-            exclude_nodes (list[str] | None): Node names to exclude from the pool before selection.
+            exclude_nodes (Collection[str] | None): Node names to exclude from the pool before selection.
 
         Returns:
             List[SlurmNode]: Objects that are potentially available for use.
@@ -469,7 +645,7 @@ class SlurmSystem(System):
             ValueError: If the partition or group is not found, or if the requested number of nodes exceeds the
                 available nodes.
         """
-        self.update()
+        self.refresh_cluster_state(partition_name)
 
         self.validate_partition_and_group(partition_name, group_name)
 
@@ -514,7 +690,7 @@ class SlurmSystem(System):
         self,
         partition_name: str,
         group_name: str,
-        exclude_nodes: list[str] | None = None,
+        exclude_nodes: Collection[str] | None = None,
     ) -> Dict[SlurmNodeState, List[SlurmNode]]:
         """
         Group nodes by their states, excluding nodes allocated to the current user.
@@ -522,7 +698,8 @@ class SlurmSystem(System):
         Args:
             partition_name (str): The name of the partition.
             group_name (str): The name of the group.
-            exclude_nodes (list[str] | None): Node names to exclude from the pool before grouping.
+            exclude_nodes (Collection[str] | None): Node names to exclude from the pool before grouping, pass a
+                ``HostList`` for constant time lookups.
 
         Returns:
             Dict[SlurmNodeState, List[SlurmNode]]: A dictionary grouping nodes by their state.
@@ -598,20 +775,31 @@ class SlurmSystem(System):
                 "Please correct the input."
             )
 
-        for node in allocated_nodes:
+        self.lock_nodes(allocated_nodes)
+        return allocated_nodes
+
+    def lock_nodes(self, nodes: List[SlurmNode]) -> None:
+        """Mark nodes as allocated by CloudAI, so they are not picked again until released with ``unlock_nodes``."""
+        for node in nodes:
             node.state = SlurmNodeState.ALLOCATED
-        self.group_allocated.update(copy(node) for node in allocated_nodes)
+        self.group_allocated.update(copy(node) for node in nodes)
 
-        return allocated_nodes
+    def unlock_nodes(self, hosts: HostList) -> None:
+        """Release nodes locked with ``lock_nodes``, their states are queried again on the next allocation."""
+        to_unlock = [node for node in self.group_allocated if node.name in hosts]
+        self.group_allocated.difference_update(to_unlock)
+        if to_unlock:
+            self.cluster_state.invalidate()
 
-    def scancel(self, job_id: int) -> None:
+    def scancel(self, job_id: Union[str, int]) -> None:
         """
         Terminates a specified Slurm job by sending a cancellation command.
 
         Args:
-            job_id (int): The ID of the job to cancel.
+            job_id (Union[str, int]): The ID of the job to cancel, ``<array job>_<task>`` for a task of a job array.
         """
-        self.cmd_shell.execute(f"scancel {job_id}")
+        if self.query_rest(lambda rest: rest.cancel(job_id)) is None:
+            self.cmd_shell.execute(f"scancel {job_id}")
 
     def fetch_command_output(self, command: str) -> Tuple[str, str]:
         """
@@ -699,7 +887,7 @@ class SlurmSystem(System):
                 partition, and "num_nodes" is the number of nodes requested. Node ranges should be specified with
                 square brackets and dashes, e.g., "node[01-03]" for "node01", "node02", "node03".
             exclude_nodes (list[str] | None): Node names (or Slurm range expressions) to exclude from group pools
-                before selection. Ranges are expanded internally.
+                before selection. Ranges are not expanded, exclusion is done on node ranges.
 
         Returns:
             List[str]: A list of node names. For specifications, it includes names of allocated nodes based on the
@@ -709,10 +897,10 @@ class SlurmSystem(System):
             ValueError: If a specification is malformed, a specified node is not found, or a node range cannot be
                 parsed. This ensures users are aware of incorrect inputs.
         """
-        if exclude_nodes:
-            exclude_nodes = [n for spec in exclude_nodes for n in parse_node_list(spec)]
+        excluded = HostList.parse(",".join(exclude_nodes)) if exclude_nodes else HostList()
 
-        parsed_nodes = []
+        group_nodes: list[str] = []
+        hosts = HostList()
         for node_spec in nodes:
             if ":" in node_spec:
                 parts = node_spec.split(":")
@@ -720,19 +908,15 @@ class SlurmSystem(System):
                     raise ValueError("Format should be partition:group:num_nodes")
                 partition_name, group_name, num_nodes_spec = parts
                 num_nodes = int(num_nodes_spec) if num_nodes_spec != "max_avail" else num_nodes_spec
-                group_nodes = self.get_available_nodes_from_group(
-                    partition_name, group_name, num_nodes, exclude_nodes=exclude_nodes
+                allocated = self.get_available_nodes_from_group(
+                    partition_name, group_name, num_nodes, exclude_nodes=excluded or None
                 )
-                parsed_nodes += [node.name for node in group_nodes]
+                group_nodes += [node.name for node in allocated]
             else:
-                expanded_nodes = parse_node_list(node_spec)
-                if exclude_nodes:
-                    expanded_nodes = [n for n in expanded_nodes if n not in exclude_nodes]
-                parsed_nodes += expanded_nodes
+                hosts |= HostList.parse(node_spec) - excluded
 
         # Remove duplicates while preserving order
-        parsed_nodes = list(dict.fromkeys(parsed_nodes))
-        return parsed_nodes
+        return list(dict.fromkeys([*group_nodes, *hosts]))
 
     def get_nodes_by_spec(
         self, num_nodes: int, nodes: list[str], exclude_nodes: list[str] | None = None
@@ -775,8 +959,8 @@ class SlurmSystem(System):
         return [File(Path(__file__).parent.absolute() / "slurm-metadata.sh")]
 
     def complete_job(self, job: SlurmJob) -> None:
+        if isinstance(job, AllocatedJob):
+            return  # nodes stay with the reused allocation until it is released
         out, _ = self.fetch_command_output(f"sacct -j {job.id} -p --noheader -X --format=NodeList")
         spec = out.splitlines()[0] if out.splitlines() else out
-        nodelist = set(parse_node_list(spec.strip().replace("|", "")))
-        to_unlock = [node for node in self.group_allocated if node.name in nodelist]
-        self.group_allocated.difference_update(to_unlock)
+        self.unlock_nodes(HostList.parse(spec.strip().replace("|", "")))
@@ -0,0 +1,123 @@
+# SPDX-FileCopyrightText: NVIDIA CORPORATION & AFFILIATES
+# Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import timedelta
+from typing import Optional
+
+from cloudai.core import TestRun
+
+
+@dataclass(frozen=True)
+class PackedStep:
+    """
+    srun step of a test run placed into a single sbatch allocation.
+
+    Attributes
+        tr (TestRun): The test run.
+        num_nodes (int): Number of nodes of the step.
+        nodes (list[str]): Nodes the step must run on, empty if it can run on any nodes of the allocation.
+        time_limit (Optional[timedelta]): Time limit of the step, None if it is not set.
+    """
+
+    tr: TestRun
+    num_nodes: int
+    nodes: list[str]
+    time_limit: Optional[timedelta]
+
+
+@dataclass
+class StepWave:
+    """
+    srun steps running at the same time on disjoint nodes of the allocation.
+
+    Attributes
+        placements (list[tuple[PackedStep, list[str]]]): Steps with the nodes assigned to them.
+        free (list[str]): Nodes of the allocation not used by any step of the wave.
+    """
+
+    placements: list[tuple[PackedStep, list[str]]] = field(default_factory=list)
+    free: list[str] = field(default_factory=list)
+
+    @property
+    def time_limit(self) -> Optional[timedelta]:
+        """Time limit of the longest step, None if no step has a time limit."""
+        limits = [step.time_limit for step, _ in self.placements if step.time_limit is not None]
+        return max(limits) if limits else None
+
+    def place(self, step: PackedStep) -> Optional[list[str]]:
+        """Assign free nodes to a step, return None if the step does not fit."""
+        if step.nodes:
+            if not set(step.nodes).issubset(self.free):
+                return None
+            nodes = list(step.nodes)
+        elif len(self.free) >= step.num_nodes:
+            nodes = self.free[: step.num_nodes]
+        else:
+            return None
+
+        self.free = [node for node in self.free if node not in nodes]
+        self.placements.append((step, nodes))
+        return nodes
+
+
+class StepPackingPlanner:
+    """
+    Packs srun steps of a single sbatch job into waves of steps running concurrently on disjoint nodes.
+
+    Steps are placed first-fit in submission order: every step goes to the earliest wave with enough free nodes that
+    starts after the waves of the test runs it depends on (``start_post_comp``). A step that cannot fit into an empty
+    wave, e.g. because its nodes are not part of the allocation, gets a wave of its own.
+
+    Attributes
+        allocation (list[str]): Nodes of the allocation.
+    """
+
+    def __init__(self, allocation: list[str]) -> None:
+        self.allocation = allocation
+
+    def plan(self, steps: list[PackedStep]) -> list[StepWave]:
+        waves: list[StepWave] = []
+        wave_of: dict[str, int] = {}
+        for step in steps:
+            first = max(
+                (
+                    wave_of[dep.test_run.name] + 1
+                    for dep_type, dep in step.tr.dependencies.items()
+                    if dep_type == "start_post_comp" and dep.test_run.name in wave_of
+                ),
+                default=0,
+            )
+
+            index = next((i for i in range(first, len(waves)) if waves[i].place(step) is not None), None)
+            if index is None:
+                waves.append(StepWave(free=list(self.allocation)))
+                index = len(waves) - 1
+                if waves[index].place(step) is None:
+                    waves[index] = StepWave(placements=[(step, step.nodes)])
+
+            wave_of[step.tr.name] = max(wave_of.get(step.tr.name, 0), index)
+
+        return waves
+
+    @staticmethod
+    def total_time_limit(waves: list[StepWave]) -> Optional[timedelta]:
+        """Time limit of all waves running one after another, None if no step has a time limit."""
+        limits = [wave.time_limit for wave in waves if wave.time_limit is not None]
+        return sum(limits, timedelta()) if limits else None
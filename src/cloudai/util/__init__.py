@@ -1,5 +1,5 @@
 # SPDX-FileCopyrightText: NVIDIA CORPORATION & AFFILIATES
-# Copyright (c) 2024-2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# Copyright (c) 2024-2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
 # SPDX-License-Identifier: Apache-2.0
 #
 # Licensed under the Apache License, Version 2.0 (the "License");
@@ -20,7 +20,7 @@ from pathlib import Path
 from typing import Any, Optional
 
 from .command_shell import CommandShell
-from .utils import format_time_limit, parse_time_limit
+from .utils import file_lock, format_time_limit, parse_time_limit
 
 
 def _validate_path_format(path: Path) -> Optional[Path]:
@@ -128,6 +128,7 @@ def flatten_dict(d: dict[str, Any], parent_key: str = "", sep: str = ".") -> dic
 __all__ = [
     "CommandShell",
     "deep_merge",
+    "file_lock",
     "flatten_dict",
     "format_time_limit",
     "parse_time_limit",
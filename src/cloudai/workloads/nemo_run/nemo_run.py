@@ -16,12 +16,22 @@
 
 import logging
 from pathlib import Path
-from typing import List, Optional, Union, cast
+from typing import Any, List, Optional, Union, cast
 
 from pydantic import BaseModel, ConfigDict, Field
 
-from cloudai.core import DockerImage, File, Installable, JobStatusResult, System, TestRun
+from cloudai.core import (
+    DockerImage,
+    File,
+    GridConstraint,
+    Installable,
+    JobStatusResult,
+    ParameterColumns,
+    System,
+    TestRun,
+)
 from cloudai.models.workload import CmdArgs, TestDefinition
+from cloudai.util.lazy_imports import lazy
 
 
 class Plugin(BaseModel):
@@ -152,11 +162,16 @@ class NeMoRunTestDefinition(TestDefinition):
         vp = cast(Optional[int], self.cmd_args.trainer.strategy.virtual_pipeline_model_parallel_size)
         num_gpus = tr.nnodes * 8
         num_layers = cast(int, self.cmd_args.num_layers)
-        dp = num_gpus // (tp * pp * cp)
+        model_parallel = tp * pp * cp
+        if model_parallel <= 0 or (vp is not None and vp <= 0):
+            logging.error(f"Parallelism sizes must be positive. Values: tp={tp}, pp={pp}, cp={cp}, vp={vp}")
+            return False
+
+        dp = num_gpus // model_parallel
         mbs = cast(int, self.cmd_args.data.micro_batch_size)
         gbs = cast(int, self.cmd_args.data.global_batch_size)
 
-        constraint1 = num_gpus % (tp * pp * cp) == 0
+        constraint1 = num_gpus % model_parallel == 0
         if not constraint1:
             logging.error(
                 "Constraint 1 failed: num_gpus %% (tp * pp * cp) != 0. "
@@ -182,6 +197,31 @@ class NeMoRunTestDefinition(TestDefinition):
 
         return constraint1 and constraint2 and constraint3 and constraint4
 
+    def grid_constraints(self, system: Optional[System]) -> list[GridConstraint]:
+        """Vectorized counterparts of the constraints checked by ``constraint_check``."""
+        tp_key, pp_key = "trainer.strategy.tensor_model_parallel_size", "trainer.strategy.pipeline_model_parallel_size"
+        cp_key, vp_key = (
+            "trainer.strategy.context_parallel_size",
+            "trainer.strategy.virtual_pipeline_model_parallel_size",
+        )
+
+        def parallelism(c: ParameterColumns) -> Any:
+            model_parallel = c[tp_key] * c[pp_key] * c[cp_key]
+            divisor = lazy.np.maximum(model_parallel, 1)
+            num_gpus = c["NUM_NODES"] * 8
+            dp = num_gpus // divisor
+            batch_divisible = c["data.global_batch_size"] % (c["data.micro_batch_size"] * lazy.np.maximum(dp, 1)) == 0
+            return (model_parallel > 0) & (num_gpus % divisor == 0) & (dp != 0) & batch_divisible
+
+        def virtual_pipeline(c: ParameterColumns) -> Any:
+            if c[vp_key] is None:
+                return True
+            pp, vp = c[pp_key], c[vp_key]
+            layers_per_stage = c["num_layers"] // lazy.np.maximum(pp, 1)
+            return (pp > 0) & (vp > 0) & (layers_per_stage % lazy.np.maximum(vp, 1) == 0)
+
+        return [parallelism, virtual_pipeline]
+
     @property
     def update_num_train_samples(self) -> Optional[int]:
         """Calculate num_train_samples based on global_batch_size and max_steps."""
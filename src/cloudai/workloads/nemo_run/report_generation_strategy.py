@@ -1,5 +1,5 @@
 # SPDX-FileCopyrightText: NVIDIA CORPORATION & AFFILIATES
-# Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# Copyright (c) 2025-2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
 # SPDX-License-Identifier: Apache-2.0
 #
 # Licensed under the Apache License, Version 2.0 (the "License");
@@ -20,19 +20,41 @@ import logging
 import os
 from functools import cache
 from pathlib import Path
-from typing import ClassVar, List
+from typing import ClassVar, List, Optional
 
 from cloudai.core import METRIC_ERROR, ReportGenerationStrategy
 from cloudai.report_generator.tool.bokeh_report_tool import BokehReportTool
 from cloudai.util.lazy_imports import lazy
 
 
-@cache
 def extract_timings(stdout_file: Path) -> list[float]:
     if not stdout_file.exists():
         logging.debug(f"{stdout_file} not found")
         return []
 
+    # Keyed by modification time and size, so partial results of a running test are parsed again once they grow
+    stat = stdout_file.stat()
+    return _extract_timings(stdout_file, stat.st_mtime_ns, stat.st_size)
+
+
+def extract_last_step(stdout_file: Path) -> Optional[int]:
+    """Return the last global step reported with a train step timing, None if no step was reported yet."""
+    if not stdout_file.exists():
+        return None
+
+    last_step: Optional[int] = None
+    with open(stdout_file, "r", encoding="utf-8", errors="ignore") as f:
+        for line in f:
+            if "train_step_timing in s:" in line and "global_step:" in line:
+                try:
+                    last_step = int(line.split("global_step:")[1].split("|")[0].strip())
+                except (ValueError, IndexError):
+                    continue
+    return last_step
+
+
+@cache
+def _extract_timings(stdout_file: Path, _mtime_ns: int, _size: int) -> list[float]:
     train_step_timings: list[float] = []
     step_timings: list[float] = []
 
@@ -112,6 +134,9 @@ class NeMoRunReportGenerationStrategy(ReportGenerationStrategy):
 
         return float(lazy.np.mean(step_timings))
 
+    def get_progress(self) -> Optional[int]:
+        return extract_last_step(self.results_file)
+
     def generate_bokeh_report(self, step_timings: List[float]) -> None:
         if not step_timings:
             return
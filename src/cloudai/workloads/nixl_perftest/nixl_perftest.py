@@ -14,11 +14,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Literal, Optional
+from typing import Any, Literal, Optional
 
 from pydantic import Field, model_validator
 
-from cloudai.core import CmdArgs, System, TestRun
+from cloudai.core import CmdArgs, GridConstraint, ParameterColumns, System, TestRun
 from cloudai.workloads.common.nixl import NIXLBaseCmdArgs, NIXLBaseTestDefinition
 
 
@@ -98,3 +98,9 @@ class NixlPerftestTestDefinition(NIXLBaseTestDefinition[NixlPerftestCmdArgs]):
         prefill_nodes = int(tr.test.cmd_args.num_prefill_nodes)
 
         return decode_tp / decode_nodes == prefill_tp / prefill_nodes
+
+    def grid_constraints(self, system: Optional[System]) -> list[GridConstraint]:
+        def tp_per_node(c: ParameterColumns) -> Any:
+            return c["decode_tp"] / c["num_decode_nodes"] == c["prefill_tp"] / c["num_prefill_nodes"]
+
+        return [tp_per_node]
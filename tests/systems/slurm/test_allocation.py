@@ -19,6 +19,7 @@ from unittest.mock import Mock, patch
 import pytest
 
 from cloudai.systems.slurm import (
+    HostList,
     SlurmGroup,
     SlurmJob,
     SlurmNode,
@@ -134,3 +135,58 @@ class TestGroupAllocation:
         assert "node01" not in nodes_list
         assert "node05" not in nodes_list
         assert len(nodes_list) == 3
+
+
+class TestClusterStateSnapshot:
+    @pytest.fixture
+    def system(self, slurm_system: SlurmSystem, monkeypatch: pytest.MonkeyPatch) -> tuple[SlurmSystem, Mock, Mock]:
+        slurm_system.partitions = [
+            SlurmPartition(name="main", groups=[SlurmGroup(name="group1", nodes=["node0[1-5]"])])
+        ]
+        sinfo = Mock(
+            return_value=[SlurmNode(name=f"node0{i}", partition="main", state=SlurmNodeState.IDLE) for i in range(1, 6)]
+        )
+        squeue = Mock(return_value=[])
+        mod_path = "cloudai.systems.slurm.slurm_system.SlurmSystem"
+        monkeypatch.setattr(f"{mod_path}.nodes_from_sinfo", sinfo)
+        monkeypatch.setattr(f"{mod_path}.nodes_from_squeue", squeue)
+        return slurm_system, sinfo, squeue
+
+    def test_allocations_within_ttl_reuse_snapshot(self, system: tuple[SlurmSystem, Mock, Mock]):
+        slurm_system, sinfo, squeue = system
+
+        first = slurm_system.get_nodes_by_spec(1, ["main:group1:2"])[1]
+        second = slurm_system.get_nodes_by_spec(1, ["main:group1:2"])[1]
+
+        assert sinfo.call_count == squeue.call_count == 1
+        assert set(first).isdisjoint(second), "locked nodes are not picked from the snapshot again"
+        assert (slurm_system.cluster_state.hits, slurm_system.cluster_state.misses) == (1, 1)
+
+    def test_refresh_after_ttl(self, system: tuple[SlurmSystem, Mock, Mock]):
+        slurm_system, sinfo, _ = system
+        slurm_system.cluster_state_ttl = 0
+
+        slurm_system.get_nodes_by_spec(1, ["main:group1:1"])
+        slurm_system.get_nodes_by_spec(1, ["main:group1:1"])
+
+        assert sinfo.call_count == 2
+
+    def test_unlock_invalidates(self, system: tuple[SlurmSystem, Mock, Mock]):
+        slurm_system, sinfo, _ = system
+        _, nodes = slurm_system.get_nodes_by_spec(1, ["main:group1:1"])
+
+        slurm_system.unlock_nodes(HostList.from_names(nodes))
+        slurm_system.get_nodes_by_spec(1, ["main:group1:1"])
+
+        assert sinfo.call_count == 2
+
+    def test_incremental_refresh_queries_one_partition(self, system: tuple[SlurmSystem, Mock, Mock]):
+        slurm_system, sinfo, squeue = system
+        slurm_system.cluster_state_incremental = True
+
+        slurm_system.get_nodes_by_spec(1, ["main:group1:1"])
+        slurm_system.cluster_state.invalidate()
+        slurm_system.get_nodes_by_spec(1, ["main:group1:1"])
+
+        assert [c.args for c in sinfo.call_args_list] == [(None,), ("main",)]
+        assert [c.args for c in squeue.call_args_list] == [(None,), ("main",)]
@@ -0,0 +1,186 @@
+# SPDX-FileCopyrightText: NVIDIA CORPORATION & AFFILIATES
+# Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import dataclasses
+import subprocess
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Iterator, cast
+from unittest.mock import Mock, patch
+
+import pytest
+
+from cloudai.core import TestRun, TestScenario
+from cloudai.systems.slurm import SlurmRunner, SlurmSystem
+from cloudai.systems.slurm.allocation_reuse import AllocatedJob, SlurmAllocation
+
+from .test_job_array import write_script
+
+
+class TestSlurmAllocation:
+    def test_fits(self):
+        now = datetime(2026, 1, 1, 12)
+        allocation = SlurmAllocation(1, ["node01", "node02"], end_time=now + timedelta(hours=1))
+
+        assert allocation.fits(2, None, now)
+        assert allocation.fits(2, timedelta(minutes=30), now)
+        assert not allocation.fits(1, None, now)
+        assert not allocation.fits(2, timedelta(hours=2), now)
+        assert not allocation.fits(2, None, now + timedelta(hours=1))
+        assert SlurmAllocation(1, ["node01"]).fits(1, timedelta(days=1))
+
+    def test_dispatch(self, tmp_path: Path):
+        script = tmp_path / "script.sh"
+        script.write_text('echo "$SLURM_JOB_ID $SLURM_JOB_NODELIST $SLURM_NNODES"\necho err >&2\nexit 3')
+
+        process = SlurmAllocation(7, ["node01", "node02"]).dispatch(script, tmp_path)
+
+        assert process.wait() == 3
+        assert (tmp_path / "stdout.txt").read_text() == "7 node01,node02 2\n"
+        assert (tmp_path / "stderr.txt").read_text() == "err\n"
+
+
+class TestAllocatedJob:
+    def test_states(self, slurm_system: SlurmSystem, base_tr: TestRun):
+        process = Mock(spec=subprocess.Popen, args=["bash", "s.sh"])
+        process.poll.return_value = None
+        job = AllocatedJob(base_tr, id=7, process=process)
+
+        assert slurm_system.is_job_running(job) and not slurm_system.is_job_completed(job)
+        assert slurm_system.get_job_status(job)[0].state == "RUNNING"
+
+        slurm_system.kill(job)
+        process.terminate.assert_called_once()
+
+        process.poll.return_value = 1
+        assert not slurm_system.is_job_running(job) and slurm_system.is_job_completed(job)
+        metadata = slurm_system.get_job_status(job)
+        assert [(m.job_id, m.state, m.exit_code, m.submit_line) for m in metadata] == [
+            (7, "FAILED", "1:0", "bash s.sh")
+        ]
+
+
+class TestRunnerAllocationReuse:
+    @pytest.fixture
+    def runner(self, slurm_system: SlurmSystem) -> Iterator[SlurmRunner]:
+        slurm_system.reuse_allocation = True
+        slurm_system.reuse_allocation_time_limit = "4:00:00"
+        runner = SlurmRunner("run", slurm_system, TestScenario(name="s", test_runs=[]), slurm_system.output_path)
+        runner.cmd_shell = Mock()
+        runner.cmd_shell.execute.return_value.communicate.side_effect = [
+            ("", "salloc: Granted job allocation 100"),
+            ("", "salloc: Granted job allocation 200"),
+        ]
+        self.squeue = {
+            100: "RUNNING|node[01-02]|2099-01-01T00:00:00",
+            200: "RUNNING|node03|2099-01-01T00:00:00",
+        }
+
+        def fetch(_: SlurmSystem, cmd: str) -> tuple[str, str]:
+            return self.squeue.get(int(cmd.split()[3]), ""), ""
+
+        with (
+            patch.object(SlurmSystem, "fetch_command_output", fetch),
+            patch.object(SlurmSystem, "scancel") as self.scancel,
+            patch.object(SlurmAllocation, "dispatch") as self.dispatch,
+        ):
+            self.dispatch.return_value.poll.return_value = 0
+            yield runner
+            runner.release_allocation()
+
+    @pytest.fixture(autouse=True)
+    def cmd_gen(self):
+        def get_cmd_gen(_: SlurmSystem, tr: TestRun) -> Mock:
+            cmd_gen = Mock()
+            cmd_gen.gen_exec_command.side_effect = lambda: f"sbatch {write_script(tr)}"
+            cmd_gen.get_cached_nodes_spec.return_value = (tr.nnodes, [])
+            return cmd_gen
+
+        with patch.object(SlurmRunner, "get_cmd_gen_strategy", side_effect=get_cmd_gen):
+            yield
+
+    def step(self, base_tr: TestRun, step: int, num_nodes: int = 2) -> TestRun:
+        return dataclasses.replace(base_tr, step=step, num_nodes=num_nodes)
+
+    def test_consecutive_steps_share_allocation(self, runner: SlurmRunner, base_tr: TestRun):
+        jobs = [runner._submit_test(self.step(base_tr, step)) for step in (1, 2)]
+
+        assert all(isinstance(job, AllocatedJob) and job.id == 100 for job in jobs)
+        salloc = cast(Mock, runner.cmd_shell).execute.call_args_list
+        assert len(salloc) == 1
+        assert salloc[0].args[0].startswith("salloc --no-shell --immediate=10 -N2 --partition=")
+        assert "--time=4:00:00" in salloc[0].args[0]
+        assert [job.test_run.nodes for job in jobs] == [["node01", "node02"]] * 2
+        self.scancel.assert_not_called()
+
+    def test_reallocates_on_node_count_change(self, runner: SlurmRunner, base_tr: TestRun):
+        runner._submit_test(self.step(base_tr, 1))
+        job = runner._submit_test(self.step(base_tr, 2, num_nodes=1))
+
+        assert job.id == 200 and job.test_run.nodes == ["node03"]
+        self.scancel.assert_called_once_with(100)
+
+    def test_reallocates_when_expired(self, runner: SlurmRunner, base_tr: TestRun):
+        runner._submit_test(self.step(base_tr, 1))
+        self.squeue[100] = ""
+        self.squeue[200] = "RUNNING|node[04-05]|2099-01-01T00:00:00"
+
+        job = runner._submit_test(self.step(base_tr, 2))
+
+        assert job.id == 200
+
+    def test_busy_allocation_falls_back_to_sbatch(self, runner: SlurmRunner, base_tr: TestRun):
+        runner._submit_test(self.step(base_tr, 1))
+        self.dispatch.return_value.poll.return_value = None
+        cast(Mock, runner.cmd_shell).execute.return_value.communicate.side_effect = [("Submitted batch job 42", "")]
+
+        job = runner._submit_test(self.step(base_tr, 2))
+
+        assert not isinstance(job, AllocatedJob) and job.id == 42
+
+    def test_not_granted_falls_back_to_sbatch(self, runner: SlurmRunner, base_tr: TestRun):
+        cast(Mock, runner.cmd_shell).execute.return_value.communicate.side_effect = [
+            ("", "salloc: error: Unable to allocate resources: Immediate execution impossible"),
+            ("Submitted batch job 42", ""),
+        ]
+
+        job = runner._submit_test(self.step(base_tr, 1))
+
+        assert not isinstance(job, AllocatedJob) and job.id == 42
+        assert runner.allocation is None
+
+    def test_only_dse_steps(self, runner: SlurmRunner, base_tr: TestRun):
+        cast(Mock, runner.cmd_shell).execute.return_value.communicate.side_effect = [("Submitted batch job 42", "")]
+
+        job = runner._submit_test(self.step(base_tr, 0))
+
+        assert job.id == 42
+
+    def test_shutdown_releases_allocation(self, runner: SlurmRunner, base_tr: TestRun):
+        runner._submit_test(self.step(base_tr, 1))
+
+        runner.shutdown()
+
+        self.scancel.assert_called_once_with(100)
+        assert runner.allocation is None
+
+    def test_release_resources(self, runner: SlurmRunner, base_tr: TestRun):
+        runner._submit_test(self.step(base_tr, 1))
+
+        runner.release_resources()
+
+        self.scancel.assert_called_once_with(100)
+        assert runner.allocation is None and not runner.shutting_down
@@ -0,0 +1,85 @@
+# SPDX-FileCopyrightText: NVIDIA CORPORATION & AFFILIATES
+# Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+
+from cloudai.systems.slurm import HostList
+
+
+class TestParse:
+    @pytest.mark.parametrize(
+        "spec,expected",
+        [
+            ("", []),
+            ("login", ["login"]),
+            ("node[1-3]", ["node1", "node2", "node3"]),
+            ("node[08-10],login", ["login", "node08", "node09", "node10"]),
+            ("node[001-002,005]", ["node001", "node002", "node005"]),
+            ("rack[1-2]-node[01-02]", ["rack1-node01", "rack1-node02", "rack2-node01", "rack2-node02"]),
+        ],
+    )
+    def test_names(self, spec: str, expected: list[str]):
+        assert list(HostList.parse(spec)) == expected
+
+    def test_large_range_is_not_expanded(self):
+        hosts = HostList.parse("node[0000001-9000000]")
+
+        assert len(hosts) == 9_000_000
+        assert "node4500000" in hosts
+        assert "node9000001" not in hosts
+        assert "node45" not in hosts, "different zero-padding is a different node"
+
+    @pytest.mark.parametrize("spec", ["node[3-1]", "node[a-b]", "node[1-]"])
+    def test_invalid(self, spec: str):
+        with pytest.raises(ValueError):
+            HostList.parse(spec)
+
+
+class TestFormat:
+    @pytest.mark.parametrize(
+        "spec",
+        ["node[01-04,07]", "login,node[1-3]", "node05", "rack[1-2]-node[01-64]", "gpu[1-2]-ib,rack1-node[01-02]"],
+    )
+    def test_round_trip(self, spec: str):
+        assert str(HostList.parse(spec)) == spec
+
+    def test_from_names(self):
+        assert str(HostList.from_names(["node03", "node01", "node02", "node05", "login"])) == "login,node[01-03,05]"
+
+
+class TestSetOperations:
+    def test_union(self):
+        assert str(HostList.parse("node[01-04]") | HostList.parse("node[05-08],node10")) == "node[01-08,10]"
+
+    def test_intersection(self):
+        assert str(HostList.parse("node[01-10]") & HostList.parse("node[05-20]")) == "node[05-10]"
+
+    def test_difference(self):
+        hosts = HostList.parse("node[01-10],login") - HostList.parse("node[03-04,10],login")
+
+        assert str(hosts) == "node[01-02,05-09]"
+        assert len(hosts) == 7
+
+    def test_with_plain_iterables(self):
+        hosts = HostList.parse("node[01-04]")
+
+        assert str(hosts - ["node02"]) == "node[01,03-04]"
+        assert hosts.isdisjoint(["node05"])
+        assert not hosts.isdisjoint({"node04"})
+
+    def test_equality(self):
+        assert HostList.parse("node[01-02]") == HostList.from_names(["node02", "node01"])
+        assert HostList.parse("node[01-02]") == {"node01", "node02"}
@@ -21,7 +21,7 @@ from unittest.mock import Mock, patch
 
 import pytest
 
-from cloudai.core import DockerImage, File, GitRepo, InstallStatusResult, PythonExecutable
+from cloudai.core import DockerImage, File, GitRepo, InstallStatusResult, PythonExecutable, UvConfig
 from cloudai.systems.slurm.slurm_installer import SlurmInstaller
 from cloudai.systems.slurm.slurm_system import SlurmSystem
 from cloudai.workloads.nemo_launcher import NeMoLauncherCmdArgs, NeMoLauncherTestDefinition
@@ -382,3 +382,31 @@ def test_mark_as_installed_duplicate_local_containers_preserve_local_path(slurm_
     assert result.success
     assert first.installed_path == local_image
     assert second.installed_path == local_image
+
+
+class TestUvMode:
+    def test_venv_and_requirements_use_uv(self, installer: SlurmInstaller):
+        installer.system.uv = UvConfig()
+        git = GitRepo(url="./git_url", commit="commit_hash")
+        git.installed_path = installer.system.install_path / git.repo_name
+        git.installed_path.mkdir()
+        (git.installed_path / "requirements.txt").touch()
+        py = PythonExecutable(git)
+        venv_path = installer.system.install_path / py.venv_name
+
+        with (
+            patch("shutil.which", return_value="/usr/bin/uv"),
+            patch("subprocess.run", return_value=CompletedProcess(args=[], returncode=0)) as mock_run,
+        ):
+            res = installer._create_venv(py)
+
+        assert res.success, res.message
+        assert py.venv_path == venv_path
+        cmds = [call.args[0] for call in mock_run.call_args_list]
+        assert [cmd[:5] for cmd in cmds] == [
+            ["uv", "--cache-dir", str(installer.system.install_path / ".uv-cache"), "venv", "--seed"],
+            ["uv", "--cache-dir", str(installer.system.install_path / ".uv-cache"), "pip", "install"],
+        ]
+
+    def test_disabled_by_default(self, installer: SlurmInstaller):
+        assert installer.uv is None
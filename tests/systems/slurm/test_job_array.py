@@ -0,0 +1,174 @@
+# SPDX-FileCopyrightText: NVIDIA CORPORATION & AFFILIATES
+# Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import dataclasses
+from pathlib import Path
+from typing import cast
+from unittest.mock import Mock, patch
+
+import pytest
+
+from cloudai.core import TestRun, TestScenario
+from cloudai.systems.slurm import SlurmJob, SlurmRunner, SlurmSystem
+from cloudai.systems.slurm.job_array import array_group_key, array_spec, write_array_script
+from cloudai.systems.slurm.slurm_job_states import SlurmJobStateSnapshot
+from cloudai.systems.slurm.slurm_metadata import SlurmStepMetadata
+
+
+def write_script(tr: TestRun, *directives: str) -> Path:
+    tr.output_path.mkdir(parents=True, exist_ok=True)
+    script = tr.output_path / "cloudai_sbatch_script.sh"
+    lines = [
+        "#!/bin/bash",
+        f"#SBATCH --job-name={tr.name}-{tr.current_iteration}",
+        f"#SBATCH --output={tr.output_path}/stdout.txt",
+        f"#SBATCH --error={tr.output_path}/stderr.txt",
+        *directives,
+        "srun hostname",
+    ]
+    script.write_text("\n".join(lines))
+    return script
+
+
+def shell(runner: SlurmRunner) -> Mock:
+    return cast(Mock, runner.cmd_shell)
+
+
+def iteration(base_tr: TestRun, root: Path, index: int) -> TestRun:
+    return dataclasses.replace(base_tr, current_iteration=index, output_path=root / base_tr.name / str(index))
+
+
+class TestArrayMetadata:
+    def test_array_task_records(self):
+        output = "123_4|job|COMPLETED|0:0|start|end|10|sbatch a.sh\n123_4.batch|batch|COMPLETED|0:0|s|e|10|"
+        records = SlurmStepMetadata.from_sacct_output(output, delimiter="|")
+
+        assert [(r.job_id, r.array_task_id, r.step_id) for r in records] == [(123, "4", ""), (123, "4", "batch")]
+        assert records[1].job_key == "123_4"
+
+    def test_pending_tasks_are_expanded(self):
+        output = "123_[4-6,9%2]|job|PENDING|0:0|Unknown|Unknown|0|sbatch a.sh\n124|job|RUNNING|0:0|s|e|1|sbatch b.sh"
+        grouped = SlurmJobStateSnapshot.group_by_job(SlurmStepMetadata.from_sacct_output(output, delimiter="|"))
+
+        assert set(grouped) == {"123_4", "123_5", "123_6", "123_9", "124"}
+
+
+class TestArrayScript:
+    @pytest.mark.parametrize(
+        "indices,max_running,expected", [([0, 1, 2], 1, "0-2%1"), ([1, 3, 4], None, "1,3-4"), ([7], 2, "7%2")]
+    )
+    def test_array_spec(self, indices: list[int], max_running: int | None, expected: str):
+        assert array_spec(indices, max_running) == expected
+
+    def test_per_task_directives_are_ignored(self, base_tr: TestRun, tmp_path: Path):
+        trs = [iteration(base_tr, tmp_path, i) for i in range(2)]
+        keys = [array_group_key(tr, write_script(tr, "#SBATCH -N 1")) for tr in trs]
+
+        assert keys[0] is not None and keys[0] == keys[1]
+
+    def test_different_directives(self, base_tr: TestRun, tmp_path: Path):
+        trs = [iteration(base_tr, tmp_path, i) for i in range(2)]
+        keys = [array_group_key(tr, write_script(tr, f"#SBATCH -N {i + 1}")) for i, tr in enumerate(trs)]
+
+        assert keys[0] != keys[1]
+
+    def test_script_outside_of_output_dir(self, base_tr: TestRun, tmp_path: Path):
+        tr = iteration(base_tr, tmp_path, 0)
+        script = write_script(tr)
+        tr.output_path = tmp_path / "other" / "0"
+
+        assert array_group_key(tr, script) is None
+
+    def test_write_array_script(self, base_tr: TestRun, tmp_path: Path):
+        trs = [iteration(base_tr, tmp_path, i) for i in range(3)]
+        tasks = [(tr, write_script(tr, "#SBATCH -N 1")) for tr in trs]
+
+        script = write_array_script(tasks, 1)
+
+        parent = tmp_path / base_tr.name
+        assert script == parent / "cloudai_array_0-2.sh"
+        lines = script.read_text().splitlines()
+        assert f"#SBATCH --job-name={base_tr.name}-0" in lines
+        assert "#SBATCH -N 1" in lines
+        assert "#SBATCH --array=0-2%1" in lines
+        assert f"#SBATCH --output={parent}/%a/stdout.txt" in lines
+        assert lines[-1] == f'bash "{parent}/${{SLURM_ARRAY_TASK_ID}}/cloudai_sbatch_script.sh"'
+
+
+class TestRunnerJobArrays:
+    @pytest.fixture
+    def runner(self, slurm_system: SlurmSystem) -> SlurmRunner:
+        slurm_system.job_arrays = True
+        runner = SlurmRunner("run", slurm_system, TestScenario(name="s", test_runs=[]), slurm_system.output_path)
+        runner.cmd_shell = Mock()
+        runner.cmd_shell.execute.return_value.communicate.return_value = ("Submitted batch job 42", "")
+        return runner
+
+    @pytest.fixture(autouse=True)
+    def cmd_gen(self):
+        def get_cmd_gen(_: SlurmSystem, tr: TestRun) -> Mock:
+            cmd_gen = Mock()
+            cmd_gen.gen_exec_command.side_effect = lambda: f"sbatch {write_script(tr, '#SBATCH -N 1')}"
+            cmd_gen.get_cached_nodes_spec.return_value = (1, ["node01"])
+            return cmd_gen
+
+        with patch.object(SlurmRunner, "get_cmd_gen_strategy", side_effect=get_cmd_gen):
+            yield
+
+    def test_iterations_are_one_array(self, runner: SlurmRunner, base_tr: TestRun):
+        base_tr.iterations = 3
+
+        runner.submit_test(base_tr)
+
+        array_script = runner.scenario_root / base_tr.name / "cloudai_array_0-2.sh"
+        shell(runner).execute.assert_called_once_with(f"sbatch {array_script}")
+        assert [job.id for job in runner.jobs] == ["42_0", "42_1", "42_2"]
+        assert [job.test_run.nodes for job in runner.jobs] == [[], ["node01"], ["node01"]]
+        assert all(job.test_run.shares_test and job.test_run.nodes is not base_tr.nodes for job in runner.jobs)
+        assert runner.is_scheduled_or_submitted(base_tr)
+
+    def test_dependencies_after_last_iteration(self, runner: SlurmRunner, base_tr: TestRun):
+        base_tr.iterations = 2
+        runner.submit_test(base_tr)
+
+        with patch.object(SlurmRunner, "handle_dependencies") as handle_dependencies:
+            for job in list(runner.jobs):
+                runner.handle_job_completion(job)
+
+        assert runner.jobs == [] and runner.iteration_tasks == []
+        handle_dependencies.assert_called_once()
+        completed = handle_dependencies.call_args.args[0]
+        assert isinstance(completed, SlurmJob) and completed.test_run is base_tr
+        assert base_tr.current_iteration == 1
+        shell(runner).execute.assert_called_once()
+
+    def test_dse_trials_are_one_array(self, runner: SlurmRunner, base_tr: TestRun):
+        trials = [dataclasses.replace(base_tr, step=step) for step in (1, 2)]
+
+        runner.submit_tests(trials)
+
+        shell(runner).execute.assert_called_once()
+        assert [job.id for job in runner.jobs] == ["42_1", "42_2"]
+
+    def test_disabled_with_node_packing(self, runner: SlurmRunner, base_tr: TestRun):
+        runner.system.node_packing = True
+        base_tr.iterations = 2
+
+        runner.submit_test(base_tr)
+
+        assert [job.id for job in runner.jobs] == [42]
+        assert runner.iteration_tasks == []
@@ -0,0 +1,170 @@
+# SPDX-FileCopyrightText: NVIDIA CORPORATION & AFFILIATES
+# Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import dataclasses
+from datetime import timedelta
+from unittest.mock import patch
+
+import pytest
+
+from cloudai.core import BaseRunner, TestRun, TestScenario
+from cloudai.systems.slurm import SlurmGroup, SlurmNode, SlurmNodeState, SlurmPartition, SlurmRunner, SlurmSystem
+from cloudai.systems.slurm.node_packing import NodePackingPlanner, PackingRequest
+
+
+def make_tr(base_tr: TestRun, name: str, spec: str, time_limit: str | None = None) -> TestRun:
+    return dataclasses.replace(base_tr, name=name, nodes=[spec], time_limit=time_limit)
+
+
+def make_nodes(*names: str) -> list[SlurmNode]:
+    return [SlurmNode(name=name, partition="main", state=SlurmNodeState.IDLE) for name in names]
+
+
+class TestPackingRequest:
+    def test_group_spec(self, base_tr: TestRun):
+        tr = make_tr(base_tr, "a", "main:group1:2", "1:00:00")
+        tr.exclude_nodes = ["node0[1-2]"]
+
+        request = PackingRequest.from_test_run(tr)
+
+        assert request is not None
+        assert (request.partition, request.group, request.num_nodes) == ("main", "group1", 2)
+        assert request.time_limit == timedelta(hours=1)
+        assert set(request.exclude_nodes) == {"node01", "node02"}
+
+    @pytest.mark.parametrize("nodes", [[], ["node01"], ["main:group1:max_avail"], ["main:group1:1", "node01"]])
+    def test_not_packable(self, base_tr: TestRun, nodes: list[str]):
+        base_tr.nodes = nodes
+        assert PackingRequest.from_test_run(base_tr) is None
+
+
+class TestNodePackingPlanner:
+    def test_first_fit_decreasing(self, base_tr: TestRun):
+        planner = NodePackingPlanner()
+        for name, spec in [("small", "main:group1:1"), ("big", "main:group1:3"), ("mid", "main:group1:2")]:
+            request = PackingRequest.from_test_run(make_tr(base_tr, name, spec))
+            assert request is not None
+            planner.queue.append(request)
+        free = {("main", "group1"): make_nodes("n1", "n2", "n3", "n4")}
+
+        placements = planner.plan(free)
+
+        assert [(r.tr.name, [n.name for n in nodes]) for r, nodes in placements] == [
+            ("big", ["n1", "n2", "n3"]),
+            ("small", ["n4"]),
+        ]
+        assert [r.tr.name for r in planner.queue] == ["mid"]
+        assert free[("main", "group1")] == []
+
+    def test_longer_time_limit_goes_first(self, base_tr: TestRun):
+        planner = NodePackingPlanner()
+        for name, limit in [("short", "0:10:00"), ("long", "2:00:00")]:
+            request = PackingRequest.from_test_run(make_tr(base_tr, name, "main:group1:1", limit))
+            assert request is not None
+            planner.queue.append(request)
+
+        placements = planner.plan({("main", "group1"): make_nodes("n1")})
+
+        assert [r.tr.name for r, _ in placements] == ["long"]
+
+    def test_excluded_nodes_are_skipped(self, base_tr: TestRun):
+        tr = make_tr(base_tr, "a", "main:group1:1")
+        tr.exclude_nodes = ["n1"]
+        request = PackingRequest.from_test_run(tr)
+        assert request is not None
+        planner = NodePackingPlanner()
+        planner.queue.append(request)
+
+        placements = planner.plan({("main", "group1"): make_nodes("n1", "n2")})
+
+        assert [n.name for n in placements[0][1]] == ["n2"]
+
+
+class TestRunnerPacking:
+    @pytest.fixture
+    def runner(self, slurm_system: SlurmSystem, monkeypatch: pytest.MonkeyPatch) -> SlurmRunner:
+        slurm_system.node_packing = True
+        slurm_system.partitions = [
+            SlurmPartition(name="main", groups=[SlurmGroup(name="group1", nodes=["node0[1-5]"])])
+        ]
+        mod_path = "cloudai.systems.slurm.slurm_system.SlurmSystem"
+        monkeypatch.setattr(f"{mod_path}.nodes_from_sinfo", lambda *_: make_nodes(*(f"node0{i}" for i in range(1, 6))))
+        monkeypatch.setattr(f"{mod_path}.nodes_from_squeue", lambda *_: [])
+        return SlurmRunner("run", slurm_system, TestScenario(name="s", test_runs=[]), slurm_system.output_path)
+
+    def test_queued_until_nodes_are_released(self, runner: SlurmRunner, base_tr: TestRun):
+        trs = [make_tr(base_tr, name, f"main:group1:{n}") for name, n in [("a", 3), ("b", 2), ("c", 2)]]
+
+        with patch.object(BaseRunner, "submit_test") as submit:
+            for tr in trs:
+                runner.submit_test(tr)
+
+            assert [call.args[0].name for call in submit.call_args_list] == ["a", "b"]
+            assert set(trs[0].nodes).isdisjoint(trs[1].nodes)
+            assert len(trs[0].nodes) == 3 and len(trs[1].nodes) == 2
+            assert [r.tr.name for r in runner.packing.queue] == ["c"]
+
+            runner.release_packed_nodes(trs[1])
+            runner.submit_packed_test_runs()
+
+        assert trs[1].nodes == ["main:group1:2"], "original node specification is restored"
+        assert [call.args[0].name for call in submit.call_args_list] == ["a", "b", "c"]
+        assert set(trs[2].nodes).isdisjoint(trs[0].nodes)
+
+    def test_request_that_never_fits_is_left_to_slurm(self, runner: SlurmRunner, base_tr: TestRun):
+        tr = make_tr(base_tr, "huge", "main:group1:10")
+
+        with patch.object(BaseRunner, "submit_test") as submit:
+            runner.submit_test(tr)
+
+        submit.assert_called_once_with(tr)
+        assert tr.nodes == ["main:group1:10"]
+        assert runner.packing.queue == []
+
+    def test_disabled(self, runner: SlurmRunner, base_tr: TestRun):
+        runner.system.node_packing = False
+        trs = [make_tr(base_tr, name, "main:group1:5") for name in ("a", "b")]
+
+        with patch.object(BaseRunner, "submit_test") as submit:
+            for tr in trs:
+                runner.submit_test(tr)
+
+        assert submit.call_count == 2
+        assert all(tr.nodes == ["main:group1:5"] for tr in trs)
+
+    def test_queued_test_run_is_scheduled(self, runner: SlurmRunner, base_tr: TestRun):
+        trs = [make_tr(base_tr, name, "main:group1:5") for name in ("a", "b")]
+
+        with patch.object(BaseRunner, "submit_test"):
+            for tr in trs:
+                runner.submit_test(tr)
+
+        assert [r.tr.name for r in runner.packing.queue] == ["b"]
+        assert runner.is_scheduled_or_submitted(trs[1])
+
+    def test_disabled_in_dry_run(self, runner: SlurmRunner, base_tr: TestRun):
+        runner.mode = "dry-run"
+        tr = make_tr(base_tr, "a", "main:group1:5")
+
+        with (
+            patch.object(BaseRunner, "submit_test") as submit,
+            patch.object(SlurmSystem, "refresh_cluster_state") as refresh,
+        ):
+            runner.submit_test(tr)
+
+        submit.assert_called_once_with(tr)
+        refresh.assert_not_called()
+        assert tr.nodes == ["main:group1:5"]
@@ -0,0 +1,126 @@
+# SPDX-FileCopyrightText: NVIDIA CORPORATION & AFFILIATES
+# Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from pathlib import Path
+from typing import Optional
+from unittest.mock import PropertyMock, patch
+
+import pytest
+
+from cloudai.core import HFModel, TestRun
+from cloudai.systems.slurm import NodeLocalStaging, SlurmCommandGenStrategy, SlurmSystem
+from cloudai.systems.slurm.node_staging import StagingPlan
+from cloudai.workloads.nccl_test import NCCLCmdArgs, NCCLTestDefinition
+
+
+class ImageStrategy(SlurmCommandGenStrategy):
+    image: Optional[Path] = None
+
+    def _container_mounts(self) -> list[str]:
+        return [f"{self.system.hf_home_path.absolute()}:{self.CONTAINER_MOUNT_HF_HOME}"]
+
+    def image_path(self) -> Optional[str]:
+        return str(self.image) if self.image else None
+
+
+@pytest.fixture
+def image(tmp_path: Path) -> Path:
+    image = tmp_path / "nccl.sqsh"
+    image.write_text("image")
+    return image
+
+
+@pytest.fixture
+def strategy(slurm_system: SlurmSystem, tmp_path: Path, image: Path) -> ImageStrategy:
+    slurm_system.node_local_staging = NodeLocalStaging(path="/local/")
+    tdef = NCCLTestDefinition(
+        name="nccl", description="", test_template_name="nccl", cmd_args=NCCLCmdArgs(docker_image_url="fake://nccl")
+    )
+    strategy = ImageStrategy(slurm_system, TestRun(name="tr", test=tdef, output_path=tmp_path, num_nodes=2, nodes=[]))
+    strategy.image = image
+    return strategy
+
+
+def test_disabled_by_default(strategy: ImageStrategy):
+    strategy.system.node_local_staging = None
+    assert strategy.staging_plan() is None
+    assert f"--container-image={strategy.image}" in strategy.gen_srun_prefix()
+
+
+def test_single_node_jobs_are_not_staged(strategy: ImageStrategy):
+    strategy.test_run.num_nodes = 1
+    assert strategy.staging_plan() is None
+
+
+def test_remote_image_is_not_staged(strategy: ImageStrategy, tmp_path: Path):
+    strategy.image = tmp_path / "missing.sqsh"
+    assert strategy.staging_plan() is None
+
+
+def test_image_is_staged(strategy: ImageStrategy, image: Path):
+    plan = strategy.staging_plan()
+
+    assert plan == StagingPlan(root="/local/cloudai-$SLURM_JOB_ID", num_nodes=2, image=image)
+    assert "--container-image=$CLOUDAI_STAGE_DIR/nccl.sqsh" in strategy.gen_srun_prefix()
+    assert f"{strategy.system.hf_home_path.absolute()}:/cloudai_install/huggingface" in strategy.container_mounts()
+
+
+def test_hf_models_are_staged(strategy: ImageStrategy):
+    models = [HFModel(model_name="org/model"), HFModel(model_name="org/model")]
+    with patch.object(NCCLTestDefinition, "installables", new_callable=PropertyMock, return_value=models):
+        plan = strategy.staging_plan()
+        mounts = strategy.container_mounts()
+
+    assert plan and plan.hf_models == ("models--org--model",)
+    assert "$CLOUDAI_STAGE_DIR/huggingface:/cloudai_install/huggingface" in mounts
+
+
+def test_hooks_are_not_staged(strategy: ImageStrategy):
+    hook = strategy._get_cmd_gen_strategy(strategy.test_run)
+    assert hook.staging_plan() is None
+
+
+def test_sbatch_script(strategy: ImageStrategy, image: Path):
+    sbatch_cmd = strategy._write_sbatch_script(strategy._gen_srun_command())
+    script = Path(sbatch_cmd.split()[-1]).read_text()
+
+    srun = "srun -N2 --ntasks=2 --ntasks-per-node=1"
+    lines = script.splitlines()
+    assert "export CLOUDAI_STAGE_DIR=/local/cloudai-$SLURM_JOB_ID" in lines
+    assert f'trap "rm -f $CLOUDAI_STAGE_DIR.tar; {srun} rm -rf $CLOUDAI_STAGE_DIR" EXIT' in lines
+    assert f"sbcast --force {image} $CLOUDAI_STAGE_DIR/nccl.sqsh" in lines
+    assert (
+        f'{srun} bash -c "test -s $CLOUDAI_STAGE_DIR/nccl.sqsh" || '
+        '{ echo "Staging to node-local $CLOUDAI_STAGE_DIR failed" >&2; exit 1; }'
+    ) in lines
+    assert script.index("sbcast") < script.index("--container-image=$CLOUDAI_STAGE_DIR/nccl.sqsh")
+
+
+def test_plan_commands_with_models(tmp_path: Path):
+    plan = StagingPlan(root="/local/x", num_nodes=4, hf_home=tmp_path / "hf", hf_models=("models--a--b", "models--c"))
+    srun = "srun -N4 --ntasks=4 --ntasks-per-node=1"
+
+    assert plan.local_image is None
+    assert plan.commands()[3:] == [
+        f"tar -C {tmp_path / 'hf' / 'hub'} -cf $CLOUDAI_STAGE_DIR.tar models--a--b models--c",
+        "sbcast --force $CLOUDAI_STAGE_DIR.tar $CLOUDAI_STAGE_DIR/hf-models.tar",
+        "rm -f $CLOUDAI_STAGE_DIR.tar",
+        f'{srun} bash -c "tar -C $CLOUDAI_STAGE_DIR/huggingface/hub -xf $CLOUDAI_STAGE_DIR/hf-models.tar '
+        '&& rm -f $CLOUDAI_STAGE_DIR/hf-models.tar"',
+        f'{srun} bash -c "test -d $CLOUDAI_STAGE_DIR/huggingface/hub/models--a--b && '
+        'test -d $CLOUDAI_STAGE_DIR/huggingface/hub/models--c" || '
+        '{ echo "Staging to node-local $CLOUDAI_STAGE_DIR failed" >&2; exit 1; }',
+    ]
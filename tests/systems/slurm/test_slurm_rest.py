@@ -0,0 +1,217 @@
+# SPDX-FileCopyrightText: NVIDIA CORPORATION & AFFILIATES
+# Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import threading
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Iterator
+from unittest.mock import patch
+
+import pytest
+
+from cloudai.systems.slurm import SlurmJob, SlurmNodeState, SlurmSystem
+from cloudai.systems.slurm.slurm_rest import SlurmRestConfig, rest_node_state
+
+API = "v0.0.40"
+
+
+class FakeSlurmRestd:
+    """Local stand-in for slurmrestd serving canned JSON responses."""
+
+    def __init__(self) -> None:
+        self.responses: dict[tuple[str, str], tuple[int, dict[str, Any]]] = {}
+        self.requests: list[tuple[str, str, dict[str, str]]] = []
+        self.connections = 0
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def setup(self) -> None:
+                super().setup()
+                fake.connections += 1
+
+            def handle_any(self) -> None:
+                path = self.path.split("?")[0]
+                fake.requests.append((self.command, self.path, dict(self.headers)))
+                status, data = fake.responses.get((self.command, path), (404, {"errors": [{"error": "not found"}]}))
+                body = json.dumps(data).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            do_GET = do_DELETE = handle_any
+
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+
+    def serve(self, method: str, path: str, data: dict[str, Any], status: int = 200) -> None:
+        self.responses[(method, path)] = (status, data)
+
+
+@pytest.fixture
+def slurmrestd() -> Iterator[FakeSlurmRestd]:
+    fake = FakeSlurmRestd()
+    thread = threading.Thread(target=fake.server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True)
+    thread.start()
+    yield fake
+    fake.server.shutdown()
+    fake.server.server_close()
+
+
+@pytest.fixture
+def rest_system(slurm_system: SlurmSystem, slurmrestd: FakeSlurmRestd, monkeypatch: pytest.MonkeyPatch) -> SlurmSystem:
+    monkeypatch.setenv("SLURM_JWT", "token")
+    slurm_system.rest = SlurmRestConfig(url=slurmrestd.url, user_name="cloudai")
+    return slurm_system
+
+
+NODES = {
+    "nodes": [
+        {"name": "node01", "partitions": ["main"], "state": ["IDLE"], "owner": ""},
+        {"name": "node02", "partitions": ["main", "backup"], "state": ["MIXED"]},
+        {"name": "node03", "partitions": ["main"], "state": ["IDLE", "DRAIN"]},
+    ]
+}
+
+SLURMDB_JOBS = {
+    "jobs": [
+        {
+            "job_id": 42,
+            "name": "nccl",
+            "state": {"current": ["COMPLETED"]},
+            "exit_code": {"status": ["SUCCESS"], "return_code": {"set": True, "number": 0}},
+            "time": {"start": 1700000000, "end": 1700000060, "elapsed": 60},
+            "submit_line": "sbatch cloudai_sbatch_script.sh",
+            "steps": [
+                {
+                    "step": {"id": "42.0", "name": "all_reduce_perf"},
+                    "state": ["COMPLETED"],
+                    "exit_code": {"return_code": {"set": True, "number": 0}},
+                    "time": {"start": 1700000001, "end": 1700000059, "elapsed": 58},
+                }
+            ],
+        },
+        {"job_id": 7, "name": "other", "state": {"current": ["RUNNING"]}, "time": {}},
+    ]
+}
+
+
+@pytest.mark.parametrize(
+    "flags,expected",
+    [
+        (["IDLE"], SlurmNodeState.IDLE),
+        (["MIXED"], SlurmNodeState.MIXED_ALLOCATION),
+        (["IDLE", "DRAIN"], SlurmNodeState.DRAINED),
+        (["ALLOCATED", "DRAIN"], SlurmNodeState.DRAINING),
+        (["IDLE", "COMPLETING"], SlurmNodeState.COMPLETING),
+        (["DOWN", "NOT_RESPONDING"], SlurmNodeState.NOT_RESPONDING),
+        (["BOGUS"], SlurmNodeState.UNKNOWN_STATE),
+        ([], SlurmNodeState.UNKNOWN_STATE),
+    ],
+)
+def test_rest_node_state(flags: list[str], expected: SlurmNodeState):
+    assert rest_node_state(flags) == expected
+
+
+class TestSlurmRestBackend:
+    def test_nodes(self, rest_system: SlurmSystem, slurmrestd: FakeSlurmRestd):
+        slurmrestd.serve("GET", f"/slurm/{API}/nodes", NODES)
+
+        nodes = rest_system.nodes_from_sinfo()
+
+        assert [(n.name, n.partition, n.state) for n in nodes] == [
+            ("node01", "main", SlurmNodeState.IDLE),
+            ("node02", "main", SlurmNodeState.MIXED_ALLOCATION),
+            ("node02", "backup", SlurmNodeState.MIXED_ALLOCATION),
+            ("node03", "main", SlurmNodeState.DRAINED),
+        ]
+        assert [n.name for n in rest_system.nodes_from_sinfo("backup")] == ["node02"]
+
+    def test_active_jobs(self, rest_system: SlurmSystem, slurmrestd: FakeSlurmRestd):
+        jobs = [
+            {"job_id": 1, "partition": "main", "job_state": ["RUNNING"], "nodes": "node[01-02]", "user_name": "u"},
+            {"job_id": 2, "partition": "main", "job_state": ["COMPLETED"], "nodes": "node03", "user_name": "u"},
+        ]
+        slurmrestd.serve("GET", f"/slurm/{API}/jobs", {"jobs": jobs})
+
+        nodes = rest_system.nodes_from_squeue()
+
+        assert [(n.name, n.state, n.user) for n in nodes] == [
+            ("node01", SlurmNodeState.ALLOCATED, "u"),
+            ("node02", SlurmNodeState.ALLOCATED, "u"),
+        ]
+
+    def test_bulk_job_states(self, rest_system: SlurmSystem, slurmrestd: FakeSlurmRestd):
+        slurmrestd.serve("GET", f"/slurmdb/{API}/jobs", SLURMDB_JOBS)
+
+        rest_system.refresh_job_states([42, 43], since=datetime.fromtimestamp(1699999000))
+
+        assert slurmrestd.requests[0][1] == f"/slurmdb/{API}/jobs?users=cloudai&start_time=1699999000"
+        records = rest_system.job_states.records
+        assert sorted(records) == ["42", "43"]
+        assert [(r.step_id, r.name, r.state, r.exit_code, r.elapsed_time_sec) for r in records["42"]] == [
+            ("", "nccl", "COMPLETED", "0:0", 60),
+            ("0", "all_reduce_perf", "COMPLETED", "0:0", 58),
+        ]
+        assert records["42"][0].submit_line == "sbatch cloudai_sbatch_script.sh"
+        assert records["43"] == []
+
+    def test_job_queries_without_snapshot(self, rest_system: SlurmSystem, slurmrestd: FakeSlurmRestd, base_tr):
+        for job in SLURMDB_JOBS["jobs"]:
+            slurmrestd.serve("GET", f"/slurmdb/{API}/job/{job['job_id']}", {"jobs": [job]})
+
+        assert rest_system.is_job_completed(SlurmJob(base_tr, id=42))
+        assert rest_system.is_job_running(SlurmJob(base_tr, id=7))
+        assert len(rest_system.get_job_status(SlurmJob(base_tr, id=42))) == 2
+        assert [path for _, path, _ in slurmrestd.requests] == [
+            f"/slurmdb/{API}/job/42",
+            f"/slurmdb/{API}/job/7",
+            f"/slurmdb/{API}/job/42",
+        ]
+
+    def test_connection_is_reused(self, rest_system: SlurmSystem, slurmrestd: FakeSlurmRestd):
+        slurmrestd.serve("GET", f"/slurm/{API}/nodes", NODES)
+
+        for _ in range(5):
+            rest_system.nodes_from_sinfo()
+
+        assert len(slurmrestd.requests) == 5
+        assert slurmrestd.connections == 1
+
+    def test_auth_headers(self, rest_system: SlurmSystem, slurmrestd: FakeSlurmRestd):
+        slurmrestd.serve("DELETE", f"/slurm/{API}/job/42", {})
+
+        with patch.object(rest_system.cmd_shell, "execute") as execute:
+            rest_system.scancel(42)
+
+        execute.assert_not_called()
+        headers = slurmrestd.requests[0][2]
+        assert (headers["X-SLURM-USER-NAME"], headers["X-SLURM-USER-TOKEN"]) == ("cloudai", "token")
+
+    def test_falls_back_to_cli_on_error(self, rest_system: SlurmSystem):
+        output = ("main|idle||node01", "")
+        with patch.object(SlurmSystem, "fetch_command_output", return_value=output) as fetch:
+            nodes = rest_system.nodes_from_sinfo()
+
+        fetch.assert_called_once()
+        assert [n.name for n in nodes] == ["node01"]
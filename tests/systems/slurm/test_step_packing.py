@@ -0,0 +1,80 @@
+# SPDX-FileCopyrightText: NVIDIA CORPORATION & AFFILIATES
+# Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import dataclasses
+from datetime import timedelta
+from typing import Optional
+
+from cloudai.core import TestDependency, TestRun
+from cloudai.systems.slurm.step_packing import PackedStep, StepPackingPlanner
+
+
+def make_step(
+    base_tr: TestRun, name: str, num_nodes: int, nodes: Optional[list[str]] = None, minutes: Optional[int] = None
+) -> PackedStep:
+    tr = dataclasses.replace(base_tr, name=name)
+    time_limit = timedelta(minutes=minutes) if minutes is not None else None
+    return PackedStep(tr=tr, num_nodes=num_nodes, nodes=nodes or [], time_limit=time_limit)
+
+
+def names(waves) -> list[list[tuple[str, list[str]]]]:
+    return [[(step.tr.name, nodes) for step, nodes in wave.placements] for wave in waves]
+
+
+class TestStepPackingPlanner:
+    def test_first_fit(self, base_tr: TestRun):
+        steps = [make_step(base_tr, "a", 2), make_step(base_tr, "b", 3), make_step(base_tr, "c", 1)]
+
+        waves = StepPackingPlanner(["n1", "n2", "n3", "n4"]).plan(steps)
+
+        assert names(waves) == [[("a", ["n1", "n2"]), ("c", ["n3"])], [("b", ["n1", "n2", "n3"])]]
+
+    def test_explicit_nodes(self, base_tr: TestRun):
+        steps = [make_step(base_tr, "a", 1, ["n1"]), make_step(base_tr, "b", 1, ["n1"]), make_step(base_tr, "c", 1)]
+
+        waves = StepPackingPlanner(["n1", "n2"]).plan(steps)
+
+        assert names(waves) == [[("a", ["n1"]), ("c", ["n2"])], [("b", ["n1"])]]
+
+    def test_step_that_never_fits_runs_alone(self, base_tr: TestRun):
+        steps = [make_step(base_tr, "a", 1), make_step(base_tr, "huge", 3), make_step(base_tr, "c", 1, ["other"])]
+
+        waves = StepPackingPlanner(["n1", "n2"]).plan(steps)
+
+        assert names(waves) == [[("a", ["n1"])], [("huge", [])], [("c", ["other"])]]
+
+    def test_dependent_step_starts_after_dependency(self, base_tr: TestRun):
+        first = make_step(base_tr, "a", 1)
+        dependent = make_step(base_tr, "b", 1)
+        dependent.tr.dependencies = {"start_post_comp": TestDependency(test_run=first.tr)}
+
+        waves = StepPackingPlanner(["n1", "n2"]).plan([first, dependent])
+
+        assert names(waves) == [[("a", ["n1"])], [("b", ["n1"])]]
+
+    def test_total_time_limit_is_critical_path(self, base_tr: TestRun):
+        steps = [make_step(base_tr, "a", 1, minutes=30), make_step(base_tr, "b", 1, minutes=10)]
+        steps.append(make_step(base_tr, "c", 2, minutes=5))
+
+        waves = StepPackingPlanner(["n1", "n2"]).plan(steps)
+
+        assert StepPackingPlanner.total_time_limit(waves) == timedelta(minutes=35)
+
+    def test_no_time_limits(self, base_tr: TestRun):
+        waves = StepPackingPlanner(["n1"]).plan([make_step(base_tr, "a", 1)])
+
+        assert StepPackingPlanner.total_time_limit(waves) is None
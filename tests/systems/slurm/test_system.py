@@ -15,6 +15,7 @@
 # limitations under the License.
 
 import re
+from datetime import datetime
 from pathlib import Path
 from unittest.mock import Mock, patch
 
@@ -123,6 +124,62 @@ def test_update_nodes_state_and_user(slurm_system: SlurmSystem) -> None:
     assert slurm_system.partitions[1].slurm_nodes[0] == node2
 
 
+def test_node_index_is_rebuilt_after_direct_modification(slurm_system: SlurmSystem) -> None:
+    partition = slurm_system.partitions[0]
+    partition.slurm_nodes.clear()
+    node = SlurmNode(name="node-036", partition="main", state=SlurmNodeState.IDLE)
+    partition.slurm_nodes.append(node)
+
+    assert partition.node_index == {"node-036": node}
+
+
+def test_node_index_is_rebuilt_after_replacing_nodes(slurm_system: SlurmSystem) -> None:
+    partition = slurm_system.partitions[0]
+    partition.slurm_nodes = [SlurmNode(name="node-033", partition="main", state=SlurmNodeState.IDLE)]
+    assert list(partition.node_index) == ["node-033"]
+
+    node = SlurmNode(name="node-036", partition="main", state=SlurmNodeState.IDLE)
+    partition.slurm_nodes = [node]
+
+    assert partition.node_index == {"node-036": node}
+
+
+class TestGroupsCache:
+    def test_cached_between_updates(self, slurm_system: SlurmSystem) -> None:
+        slurm_system.update_nodes_state_and_user(
+            [SlurmNode(name="node-033", partition="main", state=SlurmNodeState.IDLE)], insert_new=True
+        )
+        groups = slurm_system.groups
+        assert slurm_system.groups is groups
+
+        node = next(node for node in groups["main"]["group1"] if node.name == "node-033")
+        slurm_system.update_nodes_state_and_user(
+            [SlurmNode(name="node-033", partition="main", state=SlurmNodeState.DRAINED)]
+        )
+        assert slurm_system.groups is groups, "state updates do not rebuild groups"
+        assert node.state == SlurmNodeState.DRAINED
+
+    def test_invalidated_on_replaced_nodes(self, slurm_system: SlurmSystem) -> None:
+        partition = slurm_system.partitions[0]
+        partition.slurm_nodes = [SlurmNode(name="node-033", partition="main", state=SlurmNodeState.IDLE)]
+        assert slurm_system.groups["main"]["group1"][0].state == SlurmNodeState.IDLE
+
+        partition.slurm_nodes = [SlurmNode(name="node-033", partition="main", state=SlurmNodeState.DRAINED)]
+
+        assert slurm_system.groups["main"]["group1"][0].state == SlurmNodeState.DRAINED
+
+    def test_invalidated_on_new_nodes(self, slurm_system: SlurmSystem) -> None:
+        for partition in slurm_system.partitions:
+            partition.slurm_nodes.clear()
+        assert slurm_system.groups["main"]["group1"][0].state == SlurmNodeState.UNKNOWN_STATE
+
+        slurm_system.update_nodes_state_and_user(
+            [SlurmNode(name=f"node-0{i}", partition="main", state=SlurmNodeState.IDLE) for i in range(33, 49)],
+            insert_new=True,
+        )
+        assert {node.state for node in slurm_system.groups["main"]["group1"]} == {SlurmNodeState.IDLE}
+
+
 @pytest.fixture
 def grouped_nodes() -> dict[SlurmNodeState, list[SlurmNode]]:
     """
@@ -311,6 +368,75 @@ def test_is_job_running_exceeds_retries(slurm_system: SlurmSystem):
     assert slurm_system.cmd_shell.execute.call_count == 1
 
 
+class TestJobStatesSnapshot:
+    sacct_output = (
+        "1|job|RUNNING|0:0|2025-05-09T01:34:52|Unknown|10|sbatch a.sh|\n"
+        "1.batch|batch|RUNNING|0:0|2025-05-09T01:34:52|Unknown|10||\n"
+        "2|job|COMPLETED|0:0|2025-05-09T01:34:52|2025-05-09T01:59:27|1475|sbatch b.sh|\n"
+        "2.batch|batch|COMPLETED|0:0|2025-05-09T01:34:52|2025-05-09T01:59:27|1475||\n"
+        "3|job|CANCELLED by 42|0:0|2025-05-09T01:34:52|2025-05-09T01:59:27|1475|sbatch c.sh|\n"
+    )
+
+    @pytest.fixture
+    def refreshed(self, slurm_system: SlurmSystem) -> SlurmSystem:
+        pp = Mock()
+        pp.communicate = Mock(return_value=(self.sacct_output, ""))
+        slurm_system.cmd_shell.execute = Mock(return_value=pp)
+        slurm_system.refresh_job_states([1, 2, 3, 4])
+        slurm_system.cmd_shell.execute = Mock(side_effect=AssertionError("sacct must not be called"))
+        return slurm_system
+
+    def test_single_sacct_call(self, slurm_system: SlurmSystem):
+        pp = Mock()
+        pp.communicate = Mock(return_value=(self.sacct_output, ""))
+        slurm_system.cmd_shell.execute = Mock(return_value=pp)
+
+        slurm_system.refresh_job_states([1, 2, 3], since=datetime(2025, 5, 9, 1, 2, 3))
+
+        slurm_system.cmd_shell.execute.assert_called_once()
+        command = slurm_system.cmd_shell.execute.call_args.args[0]
+        assert command.startswith("sacct -j 1,2,3 ")
+        assert command.endswith(" -S 2025-05-09T01:02:03")
+
+    def test_states_served_from_snapshot(self, refreshed: SlurmSystem):
+        assert refreshed.is_job_running(BaseJob(test_run=Mock(), id=1)) is True
+        assert refreshed.is_job_completed(BaseJob(test_run=Mock(), id=1)) is False
+        assert refreshed.is_job_completed(BaseJob(test_run=Mock(), id=2)) is True
+        assert refreshed.is_job_completed(BaseJob(test_run=Mock(), id=3)) is True
+        assert [s.step_id for s in refreshed.get_job_status(BaseJob(test_run=Mock(), id=2))] == ["", "batch"]
+
+        assert refreshed.job_states.lookups == 5
+        assert refreshed.job_states.saved_calls == 4
+
+    def test_job_without_records_is_pending(self, refreshed: SlurmSystem):
+        job = BaseJob(test_run=Mock(), id=4)
+        assert refreshed.is_job_running(job) is False
+        assert refreshed.is_job_completed(job) is False
+
+    def test_unknown_job_falls_back_to_sacct(self, refreshed: SlurmSystem):
+        pp = Mock()
+        pp.communicate = Mock(return_value=("COMPLETED", ""))
+        refreshed.cmd_shell.execute = Mock(return_value=pp)
+
+        assert refreshed.is_job_completed(BaseJob(test_run=Mock(), id=5)) is True
+        refreshed.cmd_shell.execute.assert_called_once_with("sacct -j 5 --format=State --noheader")
+
+    def test_error_clears_snapshot(self, refreshed: SlurmSystem):
+        pp = Mock()
+        pp.communicate = Mock(return_value=("", "error"))
+        refreshed.cmd_shell.execute = Mock(return_value=pp)
+
+        refreshed.refresh_job_states([1, 2])
+
+        assert refreshed.job_states.records == {}
+        with pytest.raises(RuntimeError):
+            refreshed.is_job_completed(BaseJob(test_run=Mock(), id=1))
+
+    def test_empty_job_list_skips_query(self, refreshed: SlurmSystem):
+        refreshed.refresh_job_states([])
+        assert refreshed.job_states.records == {}
+
+
 def test_model_dump(slurm_system: SlurmSystem):
     sys_dict = slurm_system.model_dump()
     assert type(sys_dict["install_path"]) is str
@@ -115,6 +115,7 @@ class TestInDryRun:
             output_dir=tmp_path,
             enable_cache_without_check=False,
             single_sbatch=False,
+            stream_install=False,
             log_file="debug.log",
         )
         with (
@@ -18,7 +18,7 @@ from unittest.mock import MagicMock
 
 import pytest
 
-from cloudai.configurator import CloudAIGymEnv, GridSearchAgent
+from cloudai.configurator import CloudAIGymEnv, GridSearchAgent, HyperbandAgent, HyperbandAgentConfig
 
 
 @pytest.fixture
@@ -33,6 +33,7 @@ def mock_env():
         "minbytes": [512, 1024, 2048, 4096],
         "ngpus": [4],
     }
+    env.feasible_action_space.side_effect = lambda space: space
     return env
 
 
@@ -65,3 +66,112 @@ def test_grid_search_agent(mock_env):
     ]
 
     assert combinations == expected_combinations
+
+
+def test_grid_search_agent_select_actions(mock_env):
+    agent = GridSearchAgent(mock_env, GridSearchAgent.get_config_class()())
+
+    first = agent.select_actions(5)
+    rest = agent.select_actions(100)
+
+    assert [step for step, _ in first] == [1, 2, 3, 4, 5]
+    assert [step for step, _ in rest] == list(range(6, 17))
+    assert [action for _, action in first + rest] == agent.get_all_combinations()
+    assert agent.select_actions(3) == []
+
+
+@pytest.fixture
+def hyperband(mock_env) -> HyperbandAgent:
+    config = HyperbandAgentConfig(fidelity_param="iters", min_fidelity=1, max_fidelity=9, random_seed=0)
+    return HyperbandAgent(mock_env, config)
+
+
+def test_hyperband_plan(hyperband: HyperbandAgent):
+    assert "iters" not in hyperband.space.dimensions
+    assert hyperband.brackets == [[(8, 1), (2, 3), (1, 9)], [(5, 3), (1, 9)], [(3, 9)]]
+    assert hyperband.max_steps == 20
+
+
+def test_hyperband_promotes_best_trials(hyperband: HyperbandAgent):
+    first_rung = hyperband.select_actions(100)
+    assert len(first_rung) == 8
+    assert {action["iters"] for _, action in first_rung} == {1}
+    assert hyperband.select_actions(1) == [], "waits for the rung to complete"
+
+    for step, action in first_rung:
+        hyperband.update_policy({"trial_index": step, "value": action["minbytes"] * 10 + action["maxbytes"]})
+
+    second_rung = hyperband.select_actions(100)
+    assert [{k: v for k, v in action.items() if k != "ngpus"} for _, action in second_rung] == [
+        {"maxbytes": 2048, "minbytes": 4096, "iters": 3},
+        {"maxbytes": 1024, "minbytes": 4096, "iters": 3},
+    ]
+    assert [step for step, _ in second_rung] == [9, 10]
+
+
+def test_hyperband_should_stop_trial(hyperband: HyperbandAgent):
+    steps = [step for step, _ in hyperband.select_actions(100)]
+    for step, value in zip(steps[:2], [10.0, 5.0], strict=True):
+        assert hyperband.should_stop_trial(step, value, 10) is False
+        hyperband.update_policy({"trial_index": step, "value": value})
+
+    assert hyperband.should_stop_trial(steps[2], 4.0, 10) is True
+    assert hyperband.should_stop_trial(steps[3], 6.0, 10) is False
+    assert hyperband.should_stop_trial(steps[0], 0.0, 10) is False, "finished trials are never stopped"
+
+    for step in steps[2:]:
+        hyperband.update_policy({"trial_index": step, "value": 0.0})
+    assert hyperband.rung is not None
+    assert hyperband.rung.ranked()[-1] == steps[2], "stopped trials rank last"
+
+
+def test_hyperband_should_stop_trial_at_same_progress(hyperband: HyperbandAgent):
+    steps = [step for step, _ in hyperband.select_actions(100)]
+    for step, partials, final in zip(steps[:2], [{10: 1.0, 20: 3.0}, {10: 2.0, 20: 4.0}], [10.0, 20.0], strict=True):
+        for progress, partial in partials.items():
+            assert hyperband.should_stop_trial(step, partial, progress) is False
+        hyperband.update_policy({"trial_index": step, "value": final})
+
+    assert hyperband.should_stop_trial(steps[2], 1.5, 10) is False, "final rewards are not compared to partial ones"
+    assert hyperband.should_stop_trial(steps[2], 2.5, 20) is True
+    assert hyperband.should_stop_trial(steps[3], 3.5, 15) is False, "no finished trial was observed at this progress"
+
+
+def test_hyperband_polling_missed_a_report(hyperband: HyperbandAgent):
+    steps = [step for step, _ in hyperband.select_actions(100)]
+    for step, partials in zip(steps[:2], [{10: 1.0, 20: 5.0}, {10: 2.0, 20: 6.0}], strict=True):
+        for progress, partial in partials.items():
+            hyperband.should_stop_trial(step, partial, progress)
+        hyperband.update_policy({"trial_index": step, "value": partials[20]})
+
+    assert hyperband.should_stop_trial(steps[2], 4.0, 20) is True, "first seen at step 20, compared with step 20"
+    assert hyperband.should_stop_trial(steps[3], 1.5, 20) is True
+    assert hyperband.should_stop_trial(steps[4], 1.5, 10) is False
+
+
+def test_hyperband_repeated_rewards_are_distinct_reports(hyperband: HyperbandAgent):
+    steps = [step for step, _ in hyperband.select_actions(100)]
+    for step, partials in zip(steps[:2], [{10: 1.0, 20: 1.0}, {10: 2.0, 20: 2.0}], strict=True):
+        for progress, partial in partials.items():
+            hyperband.should_stop_trial(step, partial, progress)
+        hyperband.update_policy({"trial_index": step, "value": 3.0})
+
+    assert hyperband.should_stop_trial(steps[2], 1.5, 10) is False
+    assert hyperband.should_stop_trial(steps[2], 1.5, 10) is False, "polling the same report again"
+    assert hyperband.should_stop_trial(steps[2], 1.5, 20) is False
+    assert hyperband.should_stop_trial(steps[3], 0.5, 20) is True
+    assert hyperband.rung is not None
+    assert hyperband.rung.checkpoints[steps[0]] == {10: 1.0, 20: 1.0}
+
+
+def test_hyperband_trials_without_partial_results_are_not_stopped(hyperband: HyperbandAgent):
+    steps = [step for step, _ in hyperband.select_actions(100)]
+    for step, value in zip(steps[:2], [10.0, 5.0], strict=True):
+        hyperband.update_policy({"trial_index": step, "value": value})
+
+    assert hyperband.should_stop_trial(steps[2], 4.0, 10) is False
+
+
+def test_hyperband_config_validation():
+    with pytest.raises(ValueError, match="min_fidelity"):
+        HyperbandAgentConfig(fidelity_param="iters", min_fidelity=10, max_fidelity=1)
@@ -245,6 +245,33 @@ def test_system_installables_are_used(slurm_system: SlurmSystem):
     assert installer.mark_as_installed_one.call_count == len(slurm_system.system_installables())
 
 
+def test_install_runs_dependencies_first(slurm_system: SlurmSystem, caplog: pytest.LogCaptureFixture):
+    installer = MyInstaller(slurm_system)
+    installer.install_one = Mock(return_value=InstallStatusResult(True))
+    git = GitRepo(url="https://example.com/repo.git", commit="abc")
+    py = PythonExecutable(git_repo=git)
+
+    with caplog.at_level("INFO"):
+        res = installer.install([py])
+
+    assert res.success
+    installed = [call.args[0] for call in installer.install_one.call_args_list]
+    assert installed.index(git) < installed.index(py)
+    assert "Install critical path" in caplog.text
+
+
+def test_resource_classes(slurm_system: SlurmSystem):
+    installer = MyInstaller(slurm_system)
+    git = GitRepo(url="https://example.com/repo.git", commit="abc")
+
+    assert installer.resource_class(DockerImage("fake_url/img")) == "import"
+    assert installer.resource_class(git) == "network"
+    assert installer.resource_class(HFModel("some/model")) == "network"
+    assert installer.resource_class(PythonExecutable(git_repo=git)) == "cpu"
+    assert installer.resource_class(File(src=Path(__file__))) == "cpu"
+    assert set(MyInstaller.RESOURCE_LIMITS) == {"network", "import", "cpu"}
+
+
 class TestSuccessIsPopulated:
     @pytest.fixture
     def installer(self, slurm_system: SlurmSystem):
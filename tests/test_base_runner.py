@@ -14,13 +14,16 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 from copy import deepcopy
 from pathlib import Path
 from typing import cast
+from unittest.mock import patch
 
 import pytest
 from pydantic import ConfigDict
 
+from cloudai._core.exceptions import JobFailureError
 from cloudai.core import (
     BaseJob,
     BaseRunner,
@@ -159,3 +162,67 @@ class TestHandleDependencies:
         runner.handle_dependencies(BaseJob(tr_main, 0))
         assert len(runner.killed_by_dependency) == 1
         assert runner.killed_by_dependency[0].test_run == tr_dep
+
+
+class TestRunAsync:
+    @pytest.fixture
+    def live_runner(self, runner: MyRunner) -> MyRunner:
+        runner.mode = "run"
+        runner.monitor_interval = 0
+        return runner
+
+    def test_dependents_start_after_completion(self, live_runner: MyRunner):
+        tr_main = live_runner.test_scenario.test_runs[0]
+        tr_dep = deepcopy(tr_main)
+        tr_dep.name = "tr-dep"
+        tr_dep.dependencies = {"start_post_comp": TestDependency(tr_main)}
+        live_runner.test_scenario.test_runs.append(tr_dep)
+
+        with (
+            patch.object(SlurmSystem, "is_job_running", return_value=False),
+            patch.object(SlurmSystem, "is_job_completed", return_value=True),
+        ):
+            live_runner.run()
+
+        assert [tr.name for tr in live_runner.submitted_trs] == ["tr-name", "tr-dep"]
+        assert not live_runner.jobs
+        assert not live_runner.timers
+        assert live_runner.loop is None
+
+    def test_job_failure_stops_run(self, live_runner: MyRunner):
+        live_runner.runner_job_status_result = JobStatusResult(is_successful=False, error_message="failed")
+
+        with (
+            patch.object(SlurmSystem, "is_job_running", return_value=False),
+            patch.object(SlurmSystem, "is_job_completed", return_value=True),
+            patch.object(SlurmSystem, "kill"),
+            pytest.raises(JobFailureError),
+        ):
+            live_runner.run()
+
+        assert live_runner.shutting_down
+
+    def test_delayed_call_does_not_block(self, live_runner: MyRunner):
+        calls: list[str] = []
+
+        async def scenario() -> None:
+            live_runner.loop = asyncio.get_running_loop()
+            live_runner.call_later(0.01, calls.append, "delayed")
+            assert calls == []
+            assert len(live_runner.timers) == 1
+            await asyncio.gather(*live_runner.timers)
+
+        asyncio.run(scenario())
+        assert calls == ["delayed"]
+
+    def test_pending_submission_is_not_duplicated(self, live_runner: MyRunner):
+        tr_main = live_runner.test_scenario.test_runs[0]
+        tr_dep = deepcopy(tr_main)
+        tr_dep.name = "tr-dep"
+        tr_dep.dependencies = {"start_post_init": TestDependency(tr_main)}
+        live_runner.test_scenario.test_runs.append(tr_dep)
+        live_runner.scheduled_test_runs.append(tr_dep)
+
+        live_runner.check_and_schedule_start_post_init_dependent_tests(tr_main)
+
+        assert live_runner.submitted_trs == []
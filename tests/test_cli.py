@@ -22,6 +22,12 @@ from click.testing import CliRunner
 from cloudai.cli import main
 
 
+@pytest.fixture(autouse=True)
+def in_tmp_path(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Keep the log file the CLI writes to its working directory out of the repository."""
+    monkeypatch.chdir(tmp_path)
+
+
 @pytest.mark.parametrize("cli", ["-h", "--help"])
 def test_help(cli: str):
     runner = CliRunner()
@@ -19,6 +19,7 @@ from typing import cast
 from unittest.mock import MagicMock, PropertyMock, patch
 
 import pytest
+from pydantic import ValidationError, model_validator
 
 from cloudai.configurator import CloudAIGymEnv, GridSearchAgent, TrajectoryEntry
 from cloudai.core import BaseRunner, Runner, TestRun, TestScenario
@@ -271,12 +272,10 @@ def test_params_set_validated(setup_env: tuple[TestRun, Runner], nemorun: NeMoRu
     action_space = tr.param_space
     action_space["trainer.max_steps"] = "invalid"
 
-    with pytest.raises(UserWarning) as excinfo:
+    with pytest.raises(ValidationError) as excinfo:
         tr.apply_params_set(action_space)
 
-    assert excinfo.type is UserWarning
-    assert "Pydantic serializer warnings:" in str(excinfo.value)
-    assert "serialized value may not be as expected" in str(excinfo.value)
+    assert "max_steps" in str(excinfo.value)
     assert "input_value='invalid'" in str(excinfo.value)
 
 
@@ -346,3 +345,161 @@ def test_get_cached_trajectory_result(
         assert expected_step is None
     else:
         assert actual.step == expected_step
+
+
+def test_write_trajectory_out_of_order(base_tr: TestRun, tmp_path: Path):
+    runner = MagicMock()
+    runner.scenario_root = tmp_path / "scenario"
+    env = CloudAIGymEnv(test_run=base_tr, runner=runner)
+
+    for step in [1, 3, 2, 4]:
+        env.write_trajectory(TrajectoryEntry(step, {"x": step}, float(step), [step]))
+
+    assert [entry.step for entry in env.current_trajectory] == [1, 2, 3, 4]
+    lines = env.trajectory_file_path.read_text().splitlines()
+    assert lines[0] == "step,action,reward,observation"
+    assert [line.split(",")[0] for line in lines[1:]] == ["1", "2", "3", "4"]
+
+
+def test_run_trials(setup_env: tuple[TestRun, BaseRunner]):
+    test_run, runner = setup_env
+    env = CloudAIGymEnv(test_run=test_run, runner=runner)
+    agent = GridSearchAgent(env, GridSearchAgent.get_config_class()(max_parallel_trials=3))
+    agent.update_policy = MagicMock()
+
+    with patch.object(CloudAIGymEnv, "get_trial_observation", return_value=[1.0]):
+        env.run_trials(agent, 3)
+
+    trial_indices = sorted(call.args[0]["trial_index"] for call in agent.update_policy.call_args_list)
+    assert trial_indices == list(range(1, len(agent.action_combinations) + 1))
+    run_steps = [tr.step for tr in runner.test_scenario.test_runs]
+    assert len(run_steps) > 3 and run_steps == sorted(run_steps)
+    assert [entry.step for entry in env.current_trajectory] == run_steps
+    assert runner.completion_callbacks == []
+    assert runner.test_scenario.job_status_check is True
+
+
+def test_stop_unpromising_trials(setup_env: tuple[TestRun, BaseRunner]):
+    test_run, runner = setup_env
+    env = CloudAIGymEnv(test_run=test_run, runner=runner)
+    env.pending_trials = {1: {}, 2: {}}
+    test_runs = [MagicMock(step=step) for step in (1, 2, 3)]
+    for tr in test_runs:
+        tr.get_progress.return_value = 40
+    runner.jobs = [MagicMock(test_run=tr) for tr in test_runs]
+    agent = MagicMock()
+    agent.should_stop_trial.side_effect = lambda step, *_: step == 1
+
+    with (
+        patch.object(CloudAIGymEnv, "get_trial_observation", return_value=[1.0]),
+        patch.object(type(runner.system), "kill") as kill,
+    ):
+        env.stop_unpromising_trials(agent)
+        env.stop_unpromising_trials(agent)
+
+    kill.assert_called_once_with(runner.jobs[0])
+    assert env.stopped_trials == {1}
+    assert [call.args[0] for call in agent.should_stop_trial.call_args_list] == [1, 2, 2]
+    assert all(call.args[2] == 40 for call in agent.should_stop_trial.call_args_list)
+
+
+def test_trials_without_progress_are_not_stopped(setup_env: tuple[TestRun, BaseRunner]):
+    test_run, runner = setup_env
+    env = CloudAIGymEnv(test_run=test_run, runner=runner)
+    env.pending_trials = {1: {}}
+    tr = MagicMock(step=1)
+    tr.get_progress.return_value = None
+    runner.jobs = [MagicMock(test_run=tr)]
+    agent = MagicMock()
+
+    env.stop_unpromising_trials(agent)
+
+    agent.should_stop_trial.assert_not_called()
+
+
+@pytest.mark.parametrize("num_nodes", [1, [1, 2]])
+def test_feasible_combinations_match_constraint_check(
+    setup_env: tuple[TestRun, BaseRunner], num_nodes: int | list[int]
+):
+    tr, runner = setup_env
+    tr.num_nodes = num_nodes
+    tr.test.cmd_args.data.global_batch_size = [8, 12]
+
+    feasible = tr.feasible_combinations(runner.system)
+
+    expected = []
+    for action in tr.all_combinations:
+        point = tr.apply_params_set(action)
+        if point.test.constraint_check(point, runner.system):
+            expected.append(action)
+    assert 0 < len(feasible) < len(tr.all_combinations)
+    assert list(feasible) == expected
+
+
+class TestApplyParamsSetCopyOnWrite:
+    def test_base_is_not_modified(self, setup_env: tuple[TestRun, BaseRunner]):
+        tr, _ = setup_env
+        tr.test.extra_env_vars = {"VAR": ["a", "b"]}
+
+        new_tr = tr.apply_params_set({"trainer.strategy.tensor_model_parallel_size": 2, "extra_env_vars.VAR": "b"})
+
+        tdef = cast(NeMoRunTestDefinition, tr.test)
+        assert tdef.cmd_args.trainer.strategy.tensor_model_parallel_size == [1, 2]
+        assert tdef.extra_env_vars == {"VAR": ["a", "b"]}
+        assert new_tr.test.extra_env_vars == {"VAR": "b"}
+        assert new_tr.overrides == {"trainer.strategy.tensor_model_parallel_size": 2, "extra_env_vars.VAR": "b"}
+
+    def test_unchanged_models_are_shared(self, setup_env: tuple[TestRun, BaseRunner]):
+        tr, _ = setup_env
+
+        new_tr = tr.apply_params_set({"trainer.max_steps": 1000})
+
+        old_args, new_args = (
+            cast(NeMoRunTestDefinition, tr.test).cmd_args,
+            cast(NeMoRunTestDefinition, new_tr.test).cmd_args,
+        )
+        assert new_args.trainer is not old_args.trainer
+        assert new_args.trainer.strategy is old_args.trainer.strategy
+        assert new_args.data is old_args.data
+
+    def test_overrides_accumulate(self, setup_env: tuple[TestRun, BaseRunner]):
+        tr, _ = setup_env
+
+        new_tr = tr.apply_params_set({"trainer.max_steps": 1000}).apply_params_set({"data.micro_batch_size": 2})
+
+        assert new_tr.overrides == {"trainer.max_steps": 1000, "data.micro_batch_size": 2}
+
+    def test_materialize(self, setup_env: tuple[TestRun, BaseRunner]):
+        tr, runner = setup_env
+        new_tr = tr.apply_params_set({"trainer.max_steps": 1000})
+        assert new_tr.shares_test
+        assert tr.fork().shares_test
+
+        runner.get_cmd_gen_strategy(runner.system, new_tr)
+
+        assert not new_tr.shares_test
+        new_args = cast(NeMoRunTestDefinition, new_tr.test).cmd_args
+        new_args.data.micro_batch_size = 4
+        assert cast(NeMoRunTestDefinition, tr.test).cmd_args.data.micro_batch_size == [1, 2]
+
+    def test_models_on_path_are_validated(self, setup_env: tuple[TestRun, BaseRunner]):
+        tr, _ = setup_env
+        tdef = cast(NeMoRunTestDefinition, tr.test)
+        tdef.cmd_args.trainer = CheckedTrainer.model_validate(tdef.cmd_args.trainer.model_dump())
+
+        new_tr = tr.apply_params_set({"trainer.strategy.tensor_model_parallel_size": 2, "trainer.max_steps": 1000})
+        new_trainer = cast(NeMoRunTestDefinition, new_tr.test).cmd_args.trainer
+        assert isinstance(new_trainer, CheckedTrainer)
+        assert new_trainer.strategy.tensor_model_parallel_size == 2
+
+        with pytest.raises(ValidationError, match="tensor_model_parallel_size exceeds max_steps"):
+            tr.apply_params_set({"trainer.max_steps": 1, "trainer.strategy.tensor_model_parallel_size": 2})
+
+
+class CheckedTrainer(Trainer):
+    @model_validator(mode="after")
+    def check_parallelism(self) -> "CheckedTrainer":
+        tp, max_steps = self.strategy.tensor_model_parallel_size, self.max_steps
+        if isinstance(tp, int) and isinstance(max_steps, int) and tp > max_steps:
+            raise ValueError("tensor_model_parallel_size exceeds max_steps")
+        return self
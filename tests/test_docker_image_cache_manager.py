@@ -1,5 +1,5 @@
 # SPDX-FileCopyrightText: NVIDIA CORPORATION & AFFILIATES
-# Copyright (c) 2024-2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# Copyright (c) 2024-2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
 # SPDX-License-Identifier: Apache-2.0
 #
 # Licensed under the Apache License, Version 2.0 (the "License");
@@ -15,12 +15,16 @@
 # limitations under the License.
 
 import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from unittest.mock import patch
 
 import pytest
+import toml
 
 from cloudai.systems.slurm.docker_image_cache_manager import (
+    DockerImageCacheIndex,
     DockerImageCacheManager,
     DockerImageCacheResult,
     PrerequisiteCheckResult,
@@ -28,6 +32,11 @@ from cloudai.systems.slurm.docker_image_cache_manager import (
 from cloudai.systems.slurm.slurm_system import SlurmSystem
 
 
+def enroot_import(cmd: str, **kwargs) -> subprocess.CompletedProcess:
+    Path(cmd.split(" -o ")[1].split()[0]).write_text("image")
+    return subprocess.CompletedProcess(args=[cmd], returncode=0, stderr="")
+
+
 @patch("pathlib.Path.is_file")
 @patch("pathlib.Path.exists")
 @patch("os.access")
@@ -72,6 +81,7 @@ def test_ensure_docker_image_url_cache_enabled(mock_access, mock_exists, mock_is
 def test_cache_docker_image(
     mock_check_prerequisites, mock_run, mock_access, mock_exists, mock_is_file, slurm_system: SlurmSystem
 ):
+    slurm_system.install_path.mkdir(parents=True, exist_ok=True)
     manager = DockerImageCacheManager(slurm_system)
 
     # Test when cached file already exists
@@ -106,7 +116,7 @@ def test_cache_docker_image(
         True,
         True,
     ]  # Ensure all path checks return True
-    mock_run.return_value = subprocess.CompletedProcess(args=["cmd"], returncode=0, stderr="")
+    mock_run.side_effect = enroot_import
     result = manager.cache_docker_image("docker.io/hello-world", "image.tar.gz")
 
     assert mock_run.call_count == 1
@@ -115,7 +125,10 @@ def test_cache_docker_image(
     assert "--ntasks=1" in actual_command
     assert "-N1" in actual_command
     assert "--job-name=CloudAI_install_docker_image_" in actual_command
-    assert f"enroot import -o {slurm_system.install_path}/image.tar.gz docker://docker.io/hello-world" in actual_command
+    assert (
+        f"enroot import -o {slurm_system.install_path}/.image.tar.gz.partial docker://docker.io/hello-world"
+        in actual_command
+    )
     assert mock_run.call_args[1] == {"shell": True, "check": True, "capture_output": True, "text": True}
 
     assert result.success
@@ -211,7 +224,7 @@ def test_docker_import_with_extra_system_config(
     manager = DockerImageCacheManager(slurm_system)
     manager._check_prerequisites = lambda: PrerequisiteCheckResult(True, "All prerequisites are met.")
 
-    with patch("subprocess.run") as mock_run:
+    with patch("subprocess.run", side_effect=enroot_import) as mock_run:
         res = manager.cache_docker_image("docker.io/hello-world", "docker_image.sqsh")
         assert res.success
 
@@ -233,7 +246,7 @@ def test_docker_import_with_extra_system_config(
         assert "--gres=gpu:1" in actual_command
 
     assert (
-        f"enroot import -o {slurm_system.install_path}/docker_image.sqsh docker://docker.io/hello-world"
+        f"enroot import -o {slurm_system.install_path}/.docker_image.sqsh.partial docker://docker.io/hello-world"
         in actual_command
     )
 
@@ -247,8 +260,7 @@ def test_docker_import_with_extra_srun_args(slurm_system: SlurmSystem):
     manager = DockerImageCacheManager(slurm_system)
     manager._check_prerequisites = lambda: PrerequisiteCheckResult(True, "All prerequisites are met.")
 
-    with patch("subprocess.run") as mock_run:
-        mock_run.return_value = subprocess.CompletedProcess(args=["cmd"], returncode=0, stderr="")
+    with patch("subprocess.run", side_effect=enroot_import) as mock_run:
         res = manager.cache_docker_image("docker.io/hello-world", "docker_image.sqsh")
         assert res.success
 
@@ -263,3 +275,121 @@ def test_docker_import_with_extra_srun_args(slurm_system: SlurmSystem):
     expected_prefix = f"srun --export=ALL --partition={slurm_system.default_partition}"
     assert expected_prefix in actual_command
     assert "enroot import -o" in actual_command
+
+
+class TestDockerImageCacheIndex:
+    @pytest.fixture
+    def index(self, tmp_path: Path) -> DockerImageCacheIndex:
+        return DockerImageCacheIndex(tmp_path, max_size=10)
+
+    def add_image(self, index: DockerImageCacheIndex, name: str, size: int, last_used: float) -> None:
+        (index.root / name).write_bytes(b"x" * size)
+        index.record_use(name)
+        with index.locked() as entries:
+            entries[name]["last_used"] = last_used
+
+    def test_record_use(self, index: DockerImageCacheIndex):
+        (index.root / "a.sqsh").write_bytes(b"x" * 4)
+        index.record_use("a.sqsh")
+        index.record_use("missing.sqsh")
+
+        entries = toml.load(index.root / DockerImageCacheIndex.INDEX_FILE)
+        assert list(entries) == ["a.sqsh"]
+        assert entries["a.sqsh"]["size"] == 4
+
+    def test_evicts_least_recently_used(self, index: DockerImageCacheIndex):
+        self.add_image(index, "old.sqsh", 4, 1)
+        self.add_image(index, "new.sqsh", 4, 3)
+        self.add_image(index, "mid.sqsh", 4, 2)
+
+        assert index.evict() == ["old.sqsh"]
+        assert not (index.root / "old.sqsh").exists()
+        assert (index.root / "mid.sqsh").exists()
+        assert index.evict() == []
+
+    def test_pinned_images_are_kept(self, index: DockerImageCacheIndex):
+        self.add_image(index, "old.sqsh", 4, 1)
+        self.add_image(index, "new.sqsh", 4, 3)
+        self.add_image(index, "mid.sqsh", 4, 2)
+        index.pinned.add("old.sqsh")
+
+        assert index.evict() == ["mid.sqsh"]
+
+    def test_unrecorded_files_are_kept(self, index: DockerImageCacheIndex):
+        (index.root / "other.sqsh").write_bytes(b"x" * 100)
+        self.add_image(index, "a.sqsh", 4, 1)
+
+        assert index.evict() == []
+        assert (index.root / "other.sqsh").exists()
+
+    def test_no_budget(self, tmp_path: Path):
+        index = DockerImageCacheIndex(tmp_path)
+        self.add_image(index, "a.sqsh", 4, 1)
+        self.add_image(index, "b.sqsh", 4, 2)
+
+        assert index.evict() == []
+        assert index.evict(extra_space=4) == ["a.sqsh"]
+
+    def test_forget(self, index: DockerImageCacheIndex):
+        self.add_image(index, "a.sqsh", 4, 1)
+        index.forget("a.sqsh")
+        assert toml.load(index.root / DockerImageCacheIndex.INDEX_FILE) == {}
+
+
+class TestSharedCache:
+    @pytest.fixture
+    def manager(self, slurm_system: SlurmSystem) -> DockerImageCacheManager:
+        slurm_system.install_path.mkdir(parents=True, exist_ok=True)
+        manager = DockerImageCacheManager(slurm_system)
+        manager._check_prerequisites = lambda: PrerequisiteCheckResult(True, "All prerequisites are met.")
+        return manager
+
+    def test_concurrent_installs_import_once(self, manager: DockerImageCacheManager):
+        def slow_import(cmd: str, **kwargs) -> subprocess.CompletedProcess:
+            time.sleep(0.1)
+            return enroot_import(cmd, **kwargs)
+
+        with patch("subprocess.run", side_effect=slow_import) as mock_run, ThreadPoolExecutor(max_workers=2) as pool:
+            results = list(pool.map(lambda _: manager.cache_docker_image("docker.io/hello-world", "img.sqsh"), [1, 2]))
+
+        assert all(res.success for res in results)
+        assert mock_run.call_count == 1
+        assert (manager.system.install_path / "img.sqsh").read_text() == "image"
+        assert not list(manager.system.install_path.glob("*.partial"))
+
+    def test_import_failure_leaves_no_image(self, manager: DockerImageCacheManager):
+        def failed_import(cmd: str, **kwargs) -> subprocess.CompletedProcess:
+            enroot_import(cmd, **kwargs)
+            raise subprocess.CalledProcessError(1, cmd, stderr="network error")
+
+        with patch("subprocess.run", side_effect=failed_import):
+            res = manager.cache_docker_image("docker.io/hello-world", "img.sqsh")
+
+        assert not res.success
+        assert not (manager.system.install_path / "img.sqsh").exists()
+        assert not list(manager.system.install_path.glob("*.partial"))
+
+    def test_budget_evicts_after_import(self, manager: DockerImageCacheManager):
+        manager.index.max_size = 6
+        with patch("subprocess.run", side_effect=enroot_import):
+            manager.cache_docker_image("docker.io/first", "first.sqsh")
+            manager.cache_docker_image("docker.io/second", "second.sqsh")
+
+        assert not (manager.system.install_path / "first.sqsh").exists()
+        assert (manager.system.install_path / "second.sqsh").exists()
+
+    def test_quota_error_retries_after_eviction(self, manager: DockerImageCacheManager):
+        with patch("subprocess.run", side_effect=enroot_import):
+            manager.cache_docker_image("docker.io/first", "first.sqsh")
+
+        def quota_then_import(cmd: str, **kwargs) -> subprocess.CompletedProcess:
+            if mock_run.call_count == 1:
+                return subprocess.CompletedProcess(args=[cmd], returncode=0, stderr="Disk quota exceeded\n")
+            return enroot_import(cmd, **kwargs)
+
+        with patch("subprocess.run", side_effect=quota_then_import) as mock_run:
+            res = manager.cache_docker_image("docker.io/second", "second.sqsh")
+
+        assert res.success
+        assert mock_run.call_count == 2
+        assert not (manager.system.install_path / "first.sqsh").exists()
@@ -0,0 +1,141 @@
+# SPDX-FileCopyrightText: NVIDIA CORPORATION & AFFILIATES
+# Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from cloudai.configurator import CloudAIGymEnv, DSEResultCache
+from cloudai.core import TestRun
+from cloudai.systems.slurm import SlurmGroup, SlurmPartition, SlurmSystem
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> DSEResultCache:
+    return DSEResultCache(tmp_path / "cache" / DSEResultCache.FILE_NAME)
+
+
+class TestKey:
+    def test_same_config_same_key(self, base_tr: TestRun, slurm_system: SlurmSystem):
+        assert DSEResultCache.key(base_tr, slurm_system) == DSEResultCache.key(
+            base_tr.apply_params_set({}), slurm_system
+        )
+
+    def test_agent_settings_do_not_change_key(self, base_tr: TestRun, slurm_system: SlurmSystem):
+        key = DSEResultCache.key(base_tr, slurm_system)
+        base_tr.test.agent_steps = 100
+        base_tr.test.agent_config = {"random_seed": 1}
+        assert DSEResultCache.key(base_tr, slurm_system) == key
+
+    def test_params_change_key(self, base_tr: TestRun, slurm_system: SlurmSystem):
+        base_tr.test.extra_env_vars = {"VAR": "1"}
+        key = DSEResultCache.key(base_tr, slurm_system)
+        assert DSEResultCache.key(base_tr.apply_params_set({"extra_env_vars.VAR": "2"}), slurm_system) != key
+
+    def test_num_nodes_change_key(self, base_tr: TestRun, slurm_system: SlurmSystem):
+        key = DSEResultCache.key(base_tr, slurm_system)
+        base_tr.num_nodes = 2
+        assert DSEResultCache.key(base_tr, slurm_system) != key
+
+    def test_system_fingerprint_changes_key(self, base_tr: TestRun, slurm_system: SlurmSystem):
+        key = DSEResultCache.key(base_tr, slurm_system)
+        slurm_system.default_partition = "other"
+        assert DSEResultCache.key(base_tr, slurm_system) != key
+
+    def test_partition_from_nodes_changes_key(self, base_tr: TestRun, slurm_system: SlurmSystem):
+        slurm_system.partitions.append(SlurmPartition(name="other", groups=[SlurmGroup(name="g", nodes=["x[1-4]"])]))
+        base_tr.nodes = [f"{slurm_system.default_partition}:group1:2"]
+        key = DSEResultCache.key(base_tr, slurm_system)
+
+        base_tr.nodes = ["other:g:2"]
+        assert DSEResultCache.key(base_tr, slurm_system) != key
+
+    def test_explicit_nodes_resolve_partition(self, base_tr: TestRun, slurm_system: SlurmSystem):
+        slurm_system.partitions.append(SlurmPartition(name="other", groups=[SlurmGroup(name="g", nodes=["x[1-4]"])]))
+
+        base_tr.nodes = ["x[2-3]"]
+        key = DSEResultCache.key(base_tr, slurm_system)
+
+        assert slurm_system.placement(base_tr.nodes)["partitions"][0]["partition"] == "other"
+        base_tr.nodes = ["other:g:2"]
+        assert DSEResultCache.key(base_tr, slurm_system) != key
+
+    def test_gpu_type_changes_key(self, base_tr: TestRun, slurm_system: SlurmSystem):
+        key = DSEResultCache.key(base_tr, slurm_system)
+        slurm_system.partitions[0].gpu_type = "h100"
+        assert DSEResultCache.key(base_tr, slurm_system) != key
+
+
+def test_put_get(cache: DSEResultCache):
+    assert cache.get("k") is None
+    cache.put("k", [1.5, 2.0], 0.5)
+
+    cached = cache.get("k")
+    assert cached is not None
+    assert cached.observation == [1.5, 2.0]
+    assert cached.reward == 0.5
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_persists_across_instances(cache: DSEResultCache):
+    cache.put("k", [1.0], 1.0)
+    cache.close()
+
+    assert DSEResultCache(cache.path).get("k") is not None
+
+
+def test_ttl(cache: DSEResultCache):
+    cache.put("k", [1.0], 1.0)
+    cache.close()
+
+    with patch("cloudai.configurator.result_cache.time.time", return_value=10**12):
+        assert DSEResultCache(cache.path, ttl=60).get("k") is None
+    assert DSEResultCache(cache.path).get("k") is None, "expired entries are pruned on open"
+
+
+def test_invalidate(cache: DSEResultCache):
+    cache.put("a", [1.0], 1.0)
+    cache.put("b", [1.0], 1.0)
+
+    cache.invalidate("a")
+    assert cache.get("a") is None
+    assert cache.get("b") is not None
+
+    cache.invalidate()
+    assert cache.get("b") is None
+
+
+@pytest.mark.parametrize("observation,expected", [([1.0], True), ([1.0, -1.0], False), ([], False)])
+def test_is_cacheable(observation: list, expected: bool):
+    assert DSEResultCache.is_cacheable(observation) is expected
+
+
+def test_gym_uses_persistent_cache(base_tr: TestRun, slurm_system: SlurmSystem, tmp_path: Path, cache: DSEResultCache):
+    base_tr.step = 1
+    cache.put(DSEResultCache.key(base_tr.apply_params_set({}), slurm_system), [2.0], 0.5)
+
+    runner = MagicMock()
+    runner.system = slurm_system
+    runner.scenario_root = tmp_path / "scenario"
+    env = CloudAIGymEnv(test_run=base_tr, runner=runner)
+    env.result_cache = cache
+
+    observation, reward, *_ = env.step({})
+
+    assert (observation, reward) == ([2.0], 0.5)
+    runner.run.assert_not_called()
+    assert [entry.step for entry in env.current_trajectory] == [1]
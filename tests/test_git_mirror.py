@@ -0,0 +1,146 @@
+# SPDX-FileCopyrightText: NVIDIA CORPORATION & AFFILIATES
+# Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from cloudai.core import GitMirrorConfig, GitMirrorStore
+
+
+def git(*args: str, cwd: Path) -> str:
+    cmd = ["git", "-c", "user.name=cloudai", "-c", "user.email=cloudai@example.com", *args]
+    return subprocess.run(cmd, cwd=cwd, capture_output=True, text=True, check=True).stdout.strip()
+
+
+def commit(upstream: Path, content: str) -> str:
+    (upstream / "file.txt").write_text(content)
+    git("add", "file.txt", cwd=upstream)
+    git("commit", "-m", content, cwd=upstream)
+    return git("rev-parse", "HEAD", cwd=upstream)
+
+
+@pytest.fixture
+def upstream(tmp_path: Path) -> Path:
+    path = tmp_path / "upstream"
+    path.mkdir()
+    git("init", "-b", "main", cwd=path)
+    git("config", "uploadpack.allowAnySHA1InWant", "true", cwd=path)
+    git("config", "uploadpack.allowFilter", "true", cwd=path)
+    return path
+
+
+@pytest.fixture
+def url(upstream: Path) -> str:
+    return f"file://{upstream}"
+
+
+@pytest.fixture
+def store(tmp_path: Path) -> GitMirrorStore:
+    return GitMirrorStore(tmp_path / "mirrors", GitMirrorConfig())
+
+
+def test_mirror_path_is_unique_per_url(store: GitMirrorStore):
+    first = store.mirror_path("https://github.com/a/Megatron-LM.git")
+    second = store.mirror_path("https://github.com/b/Megatron-LM.git")
+    assert first.parent == store.root
+    assert first.name.startswith("Megatron-LM-") and first.suffix == ".git"
+    assert first != second
+
+
+def test_commits_share_one_mirror(store: GitMirrorStore, upstream: Path, url: str, tmp_path: Path):
+    first, second = commit(upstream, "first"), commit(upstream, "second")
+
+    assert store.add_worktree(url, first, tmp_path / "wt1").success
+    assert store.add_worktree(url, second, tmp_path / "wt2").success
+
+    assert [p.name for p in store.root.iterdir() if p.is_dir()] == [store.mirror_path(url).name]
+    assert git("rev-parse", "HEAD", cwd=tmp_path / "wt1") == first
+    assert git("rev-parse", "HEAD", cwd=tmp_path / "wt2") == second
+    assert (tmp_path / "wt1" / "file.txt").read_text() == "first"
+    assert (tmp_path / "wt1" / ".git").is_file()
+
+
+def test_mirror_is_fetched_incrementally(store: GitMirrorStore, upstream: Path, url: str, tmp_path: Path):
+    first = commit(upstream, "first")
+    assert store.add_worktree(url, first, tmp_path / "wt1").success
+
+    second = commit(upstream, "second")
+    assert store.add_worktree(url, second, tmp_path / "wt2").success
+    assert git("rev-parse", "HEAD", cwd=tmp_path / "wt2") == second
+
+
+def test_branch_name_resolves_in_worktree(store: GitMirrorStore, upstream: Path, url: str, tmp_path: Path):
+    head = commit(upstream, "first")
+
+    assert store.add_worktree(url, "main", tmp_path / "wt").success
+    assert git("rev-parse", "HEAD", cwd=tmp_path / "wt") == head
+    assert git("rev-parse", "main^{commit}", cwd=tmp_path / "wt") == head
+
+
+def test_unknown_commit(store: GitMirrorStore, upstream: Path, url: str, tmp_path: Path):
+    commit(upstream, "first")
+
+    res = store.add_worktree(url, "0" * 40, tmp_path / "wt")
+
+    assert not res.success
+    assert not (tmp_path / "wt").exists()
+
+
+def test_shallow_fetches_single_commit(tmp_path: Path, upstream: Path, url: str):
+    store = GitMirrorStore(tmp_path / "mirrors", GitMirrorConfig(shallow=True))
+    first, second = commit(upstream, "first"), commit(upstream, "second")
+
+    assert store.add_worktree(url, second, tmp_path / "wt").success
+
+    mirror = store.mirror_path(url)
+    assert (mirror / "shallow").read_text().split() == [second]
+    assert git("cat-file", "-t", second, cwd=mirror) == "commit"
+    with pytest.raises(subprocess.CalledProcessError):
+        git("cat-file", "-t", first, cwd=mirror)
+
+
+def test_partial_clone_filter(tmp_path: Path, upstream: Path, url: str):
+    store = GitMirrorStore(tmp_path / "mirrors", GitMirrorConfig(filter="blob:none"))
+    head = commit(upstream, "first")
+
+    assert store.add_worktree(url, head, tmp_path / "wt").success
+
+    mirror = store.mirror_path(url)
+    assert git("config", "remote.origin.partialclonefilter", cwd=mirror) == "blob:none"
+    assert (tmp_path / "wt" / "file.txt").read_text() == "first"
+
+
+def test_remove_worktree_keeps_mirror(store: GitMirrorStore, upstream: Path, url: str, tmp_path: Path):
+    head = commit(upstream, "first")
+    assert store.add_worktree(url, head, tmp_path / "wt").success
+
+    assert store.remove_worktree(url, tmp_path / "wt").success
+
+    mirror = store.mirror_path(url)
+    assert not (tmp_path / "wt").exists()
+    assert mirror.is_dir()
+    assert str(tmp_path / "wt") not in git("worktree", "list", cwd=mirror)
+    assert store.add_worktree(url, head, tmp_path / "wt").success
+
+
+def test_remove_worktree_without_mirror(store: GitMirrorStore, tmp_path: Path):
+    path = tmp_path / "wt"
+    path.mkdir()
+
+    assert store.remove_worktree("https://example.com/repo.git", path).success
+    assert not path.exists()
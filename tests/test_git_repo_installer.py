@@ -14,6 +14,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import subprocess
 from pathlib import Path
 from subprocess import CompletedProcess
 from typing import Any, Union
@@ -21,7 +22,7 @@ from unittest.mock import Mock, patch
 
 import pytest
 
-from cloudai.core import GitRepo, InstallStatusResult
+from cloudai.core import GitMirrorConfig, GitRepo, InstallStatusResult
 from cloudai.systems.kubernetes.kubernetes_installer import KubernetesInstaller
 from cloudai.systems.kubernetes.kubernetes_system import KubernetesSystem
 from cloudai.systems.slurm.slurm_installer import SlurmInstaller
@@ -322,3 +323,37 @@ class TestGitRepoInstaller:
         assert res.success
         assert not (installer.system.install_path / git.repo_name).exists()
         assert not git.installed_path
+
+
+class TestGitMirror:
+    @pytest.fixture
+    def upstream_repo(self, tmp_path: Path) -> GitRepo:
+        upstream = tmp_path / "upstream"
+        upstream.mkdir()
+        cmd = ["git", "-c", "user.name=cloudai", "-c", "user.email=cloudai@example.com"]
+        subprocess.run([*cmd, "init"], cwd=upstream, check=True, capture_output=True)
+        subprocess.run([*cmd, "commit", "--allow-empty", "-m", "init"], cwd=upstream, check=True, capture_output=True)
+        head = subprocess.run(["git", "rev-parse", "HEAD"], cwd=upstream, check=True, capture_output=True, text=True)
+        return GitRepo(url=f"file://{upstream}", commit=head.stdout.strip())
+
+    def test_install_and_uninstall(self, installer: Union[KubernetesInstaller, SlurmInstaller], upstream_repo: GitRepo):
+        installer.system.git_mirror = GitMirrorConfig()
+        assert installer.git_mirrors is not None
+        mirror = installer.git_mirrors.mirror_path(upstream_repo.url)
+        repo_path = installer.system.install_path / upstream_repo.repo_name
+
+        res = installer._install_one_git_repo(upstream_repo)
+
+        assert res.success, res.message
+        assert upstream_repo.installed_path == repo_path
+        assert mirror.parent == installer.system.install_path / ".git-mirrors"
+        assert installer._verify_commit(upstream_repo.commit, repo_path).success
+
+        res = installer._uninstall_git_repo(upstream_repo)
+
+        assert res.success
+        assert not repo_path.exists()
+        assert mirror.is_dir()
+
+    def test_disabled_by_default(self, installer: Union[KubernetesInstaller, SlurmInstaller]):
+        assert installer.git_mirrors is None
@@ -16,18 +16,20 @@
 
 import argparse
 from typing import Any, ClassVar, Iterator
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pandas as pd
 import pytest
 from pydantic import Field
 
-from cloudai.cli.handlers import handle_dse_job
+from cloudai.cli.handlers import _install_components, handle_dse_job
 from cloudai.core import (
     BaseAgent,
     BaseAgentConfig,
+    InstallStatusResult,
     Registry,
     Runner,
+    StreamingInstall,
     TestDependency,
     TestRun,
     TestScenario,
@@ -153,6 +155,17 @@ def test_dse_run_uses_agent_config(
     assert recorded.random_seed == expected["random_seed"]
 
 
+def test_dse_run_falls_back_to_sequential_trials(
+    slurm_system: SlurmSystem, dse_tr: TestRun, stub_agent_name: str, caplog: pytest.LogCaptureFixture
+) -> None:
+    dse_tr.test.agent = stub_agent_name
+    dse_tr.test.agent_config = {"max_parallel_trials": 4}
+    runner = Runner(mode="dry-run", system=slurm_system, test_scenario=TestScenario(name="ts", test_runs=[dse_tr]))
+
+    assert handle_dse_job(runner, argparse.Namespace(mode="dry-run")) == 0
+    assert f"Agent {stub_agent_name} does not support concurrent trials, running them one by one." in caplog.text
+
+
 def test_dse_run_cache(base_tr: TestRun, tmp_path, caplog: pytest.LogCaptureFixture):
     base_tr.test.cmd_args.candidate = [1, 1, 2]
     base_tr.test.agent = "grid_search"
@@ -191,6 +204,7 @@ def test_dse_run_cache(base_tr: TestRun, tmp_path, caplog: pytest.LogCaptureFixt
     reporter.load_test_runs()
 
     assert inner_runner.run.call_count == 2
+    inner_runner.release_resources.assert_called_once()
     assert (trajectory_dir / "1").exists()
     assert not (trajectory_dir / "2").exists()
     assert (trajectory_dir / "3").exists()
@@ -207,3 +221,35 @@ def test_dse_run_cache(base_tr: TestRun, tmp_path, caplog: pytest.LogCaptureFixt
     pd.testing.assert_frame_equal(actual_trajectory, expected_trajectory)
 
     assert [tr.step for tr in reporter.trs] == [1, 3]
+
+
+class TestInstallComponents:
+    @pytest.fixture
+    def scenario(self, base_tr: TestRun) -> TestScenario:
+        return TestScenario(name="scenario", test_runs=[base_tr])
+
+    def args(self, **kwargs: Any) -> argparse.Namespace:
+        defaults = {"mode": "run", "enable_cache_without_check": False, "single_sbatch": False, "stream_install": True}
+        return argparse.Namespace(**{**defaults, **kwargs})
+
+    def test_streams_missing_components(self, slurm_system: SlurmSystem, scenario: TestScenario):
+        with patch("cloudai.cli.handlers._check_installation", return_value=InstallStatusResult(False)):
+            ok, installation = _install_components(self.args(), slurm_system, [], scenario, has_dse=False)
+
+        assert ok
+        assert isinstance(installation, StreamingInstall)
+        assert not installation.thread.is_alive(), "installation starts with the run"
+
+    @pytest.mark.parametrize("kwargs,has_dse", [({"stream_install": False}, False), ({}, True)])
+    def test_installs_up_front(
+        self, slurm_system: SlurmSystem, scenario: TestScenario, kwargs: dict[str, Any], has_dse: bool
+    ):
+        with (
+            patch("cloudai.cli.handlers._check_installation", return_value=InstallStatusResult(False)),
+            patch("cloudai.core.BaseInstaller.install", return_value=InstallStatusResult(True)) as install,
+        ):
+            ok, installation = _install_components(self.args(**kwargs), slurm_system, [], scenario, has_dse)
+
+        assert ok
+        assert installation is None
+        install.assert_called_once()
@@ -0,0 +1,174 @@
+# SPDX-FileCopyrightText: NVIDIA CORPORATION & AFFILIATES
+# Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+from cloudai._core.install_manifest import InstallManifest, git_head
+from cloudai.core import (
+    BaseInstaller,
+    DockerImage,
+    GitRepo,
+    HFModel,
+    Installable,
+    InstallStatusResult,
+    PythonExecutable,
+)
+from cloudai.systems.slurm import SlurmSystem
+
+SHA = "a" * 40
+
+
+def make_checkout(path: Path, head: str = SHA) -> Path:
+    (path / ".git").mkdir(parents=True)
+    (path / ".git" / "HEAD").write_text(f"{head}\n")
+    return path
+
+
+class TestGitHead:
+    def test_detached(self, tmp_path: Path):
+        assert git_head(make_checkout(tmp_path)) == SHA
+
+    def test_branch(self, tmp_path: Path):
+        make_checkout(tmp_path, "ref: refs/heads/main")
+        (tmp_path / ".git" / "refs" / "heads").mkdir(parents=True)
+        (tmp_path / ".git" / "refs" / "heads" / "main").write_text(SHA)
+
+        assert git_head(tmp_path) == SHA
+
+    def test_worktree(self, tmp_path: Path):
+        make_checkout(tmp_path / "main")
+        (tmp_path / "wt").mkdir()
+        (tmp_path / "wt" / ".git").write_text("gitdir: ../main/.git\n")
+
+        assert git_head(tmp_path / "wt") == SHA
+
+
+class TestInstallManifest:
+    @pytest.fixture
+    def repo(self, tmp_path: Path) -> GitRepo:
+        return GitRepo(url="https://host/repo.git", commit=SHA, installed_path=make_checkout(tmp_path / "repo"))
+
+    def test_roundtrip(self, tmp_path: Path, repo: GitRepo):
+        manifest = InstallManifest(tmp_path, "installer")
+        manifest.record(repo)
+        manifest.save()
+
+        fresh = GitRepo(url=repo.url, commit=repo.commit)
+        assert InstallManifest(tmp_path, "installer").load().confirm(fresh)
+        assert fresh.installed_path == repo.installed_path
+        assert not InstallManifest(tmp_path, "other").load().confirm(fresh)
+
+    def test_changed_head(self, tmp_path: Path, repo: GitRepo):
+        manifest = InstallManifest(tmp_path, "installer")
+        manifest.record(repo)
+        assert repo.installed_path
+        (repo.installed_path / ".git" / "HEAD").write_text("b" * 40)
+
+        assert not manifest.confirm(GitRepo(url=repo.url, commit=repo.commit))
+
+    def test_removed_installation(self, tmp_path: Path, repo: GitRepo):
+        manifest = InstallManifest(tmp_path, "installer")
+        manifest.record(repo)
+        assert repo.installed_path
+        (repo.installed_path / ".git" / "HEAD").unlink()
+
+        assert not manifest.confirm(repo)
+
+    def test_python_executable(self, tmp_path: Path, repo: GitRepo):
+        venv = tmp_path / "venv"
+        venv.mkdir()
+        (venv / "pyvenv.cfg").write_text("home = /usr/bin\n")
+        manifest = InstallManifest(tmp_path, "installer")
+        manifest.record(PythonExecutable(git_repo=repo, venv_path=venv))
+
+        fresh = PythonExecutable(git_repo=GitRepo(url=repo.url, commit=repo.commit))
+        assert manifest.confirm(fresh)
+        assert (fresh.git_repo.installed_path, fresh.venv_path) == (repo.installed_path, venv)
+
+        (venv / "pyvenv.cfg").write_text("home = /usr/local/bin\n")
+        assert not manifest.confirm(fresh)
+
+    def test_hf_model(self, tmp_path: Path):
+        model = HFModel(model_name="org/model")
+        model.installed_path = tmp_path / "snapshot"
+        model.installed_path.mkdir()
+        manifest = InstallManifest(tmp_path, "installer")
+        manifest.record(model)
+
+        assert manifest.confirm(HFModel(model_name="org/model"))
+        (model.installed_path / "weights.bin").touch()
+        assert not manifest.confirm(HFModel(model_name="org/model"))
+
+    def test_cheap_checks_are_not_recorded(self, tmp_path: Path):
+        manifest = InstallManifest(tmp_path, "installer")
+        manifest.record(DockerImage(url="docker.io/hello-world"))
+        manifest.save()
+
+        assert manifest.entries == {}
+        assert not manifest.path.exists()
+
+
+class CheckingInstaller(BaseInstaller):
+    def __init__(self, system: SlurmSystem, repo_path: Path):
+        super().__init__(system)
+        self.repo_path = repo_path
+        self.checked = Mock()
+
+    def install_one(self, item: Installable) -> InstallStatusResult:
+        return InstallStatusResult(True)
+
+    def uninstall_one(self, item: Installable) -> InstallStatusResult:
+        return InstallStatusResult(True)
+
+    def is_installed_one(self, item: Installable) -> InstallStatusResult:
+        self.checked(item)
+        if isinstance(item, GitRepo):
+            item.installed_path = self.repo_path
+        return InstallStatusResult(True)
+
+    def mark_as_installed_one(self, item: Installable) -> InstallStatusResult:
+        return InstallStatusResult(True)
+
+
+class TestInstallerManifest:
+    @pytest.fixture
+    def installer(self, slurm_system: SlurmSystem, tmp_path: Path) -> CheckingInstaller:
+        return CheckingInstaller(slurm_system, make_checkout(tmp_path / "repo"))
+
+    def test_unchanged_items_are_not_checked_again(self, installer: CheckingInstaller):
+        items = [GitRepo(url="https://host/repo.git", commit=SHA), DockerImage(url="docker.io/hello-world")]
+        assert installer.is_installed(items).success
+        installer.checked.reset_mock()
+
+        fresh = [GitRepo(url="https://host/repo.git", commit=SHA), DockerImage(url="docker.io/hello-world")]
+        assert installer.is_installed(fresh).success
+
+        checked = [call.args[0] for call in installer.checked.call_args_list]
+        assert fresh[1] in checked and fresh[0] not in checked
+        assert fresh[0].installed_path == installer.repo_path
+
+    def test_uninstall_forgets_items(self, installer: CheckingInstaller):
+        repo = GitRepo(url="https://host/repo.git", commit=SHA)
+        installer.is_installed([repo])
+        installer.uninstall([repo])
+        installer.checked.reset_mock()
+
+        installer.is_installed([repo])
+
+        installer.checked.assert_any_call(repo)
@@ -0,0 +1,150 @@
+# SPDX-FileCopyrightText: NVIDIA CORPORATION & AFFILIATES
+# Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from cloudai.core import DockerImage, GitRepo, Installable, InstallPlan, InstallStatusResult, PythonExecutable
+
+
+def resource_of(item: Installable) -> str:
+    return "import" if isinstance(item, DockerImage) else "network"
+
+
+@pytest.fixture
+def git() -> GitRepo:
+    return GitRepo(url="https://example.com/repo.git", commit="abc")
+
+
+@pytest.fixture
+def py(git: GitRepo) -> PythonExecutable:
+    return PythonExecutable(git_repo=GitRepo(url=git.url, commit=git.commit))
+
+
+def run(plan: InstallPlan, install_one) -> dict[Installable, InstallStatusResult]:
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        return plan.run(executor, install_one)
+
+
+def test_dependencies_are_added(py: PythonExecutable, git: GitRepo):
+    plan = InstallPlan([py], resource_of, {"network": 1})
+
+    assert list(plan.nodes) == [py, git]
+    assert plan.nodes[py].dependencies == [plan.nodes[git]]
+
+
+def test_shared_dependency_is_one_node(py: PythonExecutable, git: GitRepo):
+    plan = InstallPlan([git, py], resource_of, {"network": 1})
+
+    assert len(plan.nodes) == 2
+    assert plan.nodes[git].dependents == [plan.nodes[py]]
+
+
+def test_dependency_is_installed_first(py: PythonExecutable, git: GitRepo):
+    order: list[Installable] = []
+
+    def install_one(item: Installable) -> InstallStatusResult:
+        order.append(item)
+        return InstallStatusResult(True)
+
+    results = run(InstallPlan([py], resource_of, {"network": 4}), install_one)
+
+    assert order == [git, py]
+    assert all(res.success for res in results.values())
+    assert set(results) == {git, py}
+
+
+def test_failed_dependency_skips_dependents(py: PythonExecutable, git: GitRepo):
+    installed: list[Installable] = []
+
+    def install_one(item: Installable) -> InstallStatusResult:
+        installed.append(item)
+        return InstallStatusResult(not isinstance(item, GitRepo), "clone failed")
+
+    results = run(InstallPlan([py], resource_of, {"network": 4}), install_one)
+
+    assert installed == [git]
+    assert not results[py].success
+    assert results[py].message == f"Dependency {git!r} failed to install."
+
+
+def test_exception_is_a_failure(git: GitRepo):
+    def install_one(item: Installable) -> InstallStatusResult:
+        raise RuntimeError("boom")
+
+    results = run(InstallPlan([git], resource_of, {"network": 1}), install_one)
+
+    assert not results[git].success
+    assert results[git].message == "boom"
+
+
+def test_resource_limit(git: GitRepo):
+    items = [GitRepo(url=git.url, commit=str(i)) for i in range(6)]
+    lock, active, peak = threading.Lock(), [0], [0]
+
+    def install_one(item: Installable) -> InstallStatusResult:
+        with lock:
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+        time.sleep(0.01)
+        with lock:
+            active[0] -= 1
+        return InstallStatusResult(True)
+
+    results = run(InstallPlan(items, resource_of, {"network": 2}), install_one)
+
+    assert len(results) == 6
+    assert peak[0] == 2
+
+
+def test_dependents_do_not_wait_for_other_classes(py: PythonExecutable):
+    docker = DockerImage("fake_url/img")
+    py_done = threading.Event()
+
+    def install_one(item: Installable) -> InstallStatusResult:
+        if isinstance(item, DockerImage):
+            return InstallStatusResult(py_done.wait(timeout=5))
+        if isinstance(item, PythonExecutable):
+            py_done.set()
+        return InstallStatusResult(True)
+
+    results = run(InstallPlan([docker, py], resource_of, {"network": 1, "import": 1}), install_one)
+
+    assert results[docker].success, "PythonExecutable was not installed while the image import was running"
+
+
+def test_critical_path(py: PythonExecutable, git: GitRepo, caplog: pytest.LogCaptureFixture):
+    docker = DockerImage("fake_url/img")
+
+    def install_one(item: Installable) -> InstallStatusResult:
+        time.sleep(0.02 if isinstance(item, (GitRepo, PythonExecutable)) else 0)
+        return InstallStatusResult(True)
+
+    plan = InstallPlan([docker, py], resource_of, {"network": 1, "import": 1})
+    run(plan, install_one)
+
+    assert [node.item for node in plan.critical_path()] == [git, py]
+    with caplog.at_level("INFO"):
+        plan.log_critical_path()
+    assert "Install critical path" in caplog.text
+    assert f"{git} (" in caplog.text and f"{py} (" in caplog.text
+
+
+def test_no_critical_path_for_empty_plan():
+    assert InstallPlan([], resource_of, {}).critical_path() == []
@@ -0,0 +1,119 @@
+# SPDX-FileCopyrightText: NVIDIA CORPORATION & AFFILIATES
+# Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import itertools
+import random
+
+import pytest
+
+from cloudai.core import ParameterSpace
+
+DIMENSIONS = {"a": [1, 2], "b": ["x", "y", "z"], "c": [True, False]}
+
+
+@pytest.fixture
+def space() -> ParameterSpace:
+    return ParameterSpace(DIMENSIONS)
+
+
+def expected_points() -> list[dict]:
+    return [dict(zip(DIMENSIONS, values, strict=True)) for values in itertools.product(*DIMENSIONS.values())]
+
+
+def test_len(space: ParameterSpace):
+    assert len(space) == 12
+
+
+def test_empty():
+    space = ParameterSpace({})
+    assert len(space) == 0
+    assert list(space) == []
+    with pytest.raises(IndexError):
+        space[0]
+
+
+def test_matches_itertools_product(space: ParameterSpace):
+    assert list(space) == expected_points()
+    assert [space[i] for i in range(len(space))] == expected_points()
+
+
+def test_negative_index(space: ParameterSpace):
+    assert space[-1] == expected_points()[-1]
+
+
+@pytest.mark.parametrize("index", [12, -13])
+def test_index_out_of_range(space: ParameterSpace, index: int):
+    with pytest.raises(IndexError):
+        space[index]
+
+
+@pytest.mark.parametrize("sl", [slice(2, 7), slice(None, None, 5), slice(-3, None), slice(10, 2, -3)])
+def test_slicing(space: ParameterSpace, sl: slice):
+    assert space[sl] == expected_points()[sl]
+
+
+def test_encode_and_contains(space: ParameterSpace):
+    for index, point in enumerate(expected_points()):
+        assert space.encode(point) == index
+        assert point in space
+
+    assert {"a": 3, "b": "x", "c": True} not in space
+    assert {"a": 1, "b": "x"} not in space
+
+
+def test_sample(space: ParameterSpace):
+    sample = space.sample(5, random.Random(0))
+    assert len(sample) == 5
+    assert all(point in space for point in sample)
+    assert len({space.encode(point) for point in sample}) == 5
+
+
+def test_huge_space_is_not_materialized():
+    space = ParameterSpace({f"p{i}": list(range(10)) for i in range(12)})
+    assert len(space) == 10**12
+    assert space[-1] == {f"p{i}": 9 for i in range(12)}
+    assert space[123] == {**{f"p{i}": 0 for i in range(9)}, "p9": 1, "p10": 2, "p11": 3}
+    assert len(space.sample(3)) == 3
+
+
+class TestFeasible:
+    def test_mask(self, space: ParameterSpace):
+        feasible = space.feasible([lambda c: c["a"] == 2, lambda c: c["b"] != "y"], {})
+
+        assert list(feasible) == [p for p in expected_points() if p["a"] == 2 and p["b"] != "y"]
+        assert len(feasible) == 4
+        assert feasible.grid_size == 12
+        assert feasible[-1] == {"a": 2, "b": "z", "c": False}
+        assert feasible[1:3] == list(feasible)[1:3]
+
+    def test_uses_values_of_non_swept_parameters(self, space: ParameterSpace):
+        assert len(space.feasible([lambda c: c["a"] * c["n"] > 2], {"n": 2})) == 6
+
+    def test_encode_restricted(self, space: ParameterSpace):
+        feasible = space.feasible([lambda c: c["a"] == 2], {})
+        assert feasible.encode({"a": 2, "b": "x", "c": True}) == 0
+        assert {"a": 1, "b": "x", "c": True} not in feasible
+
+    def test_constraint_that_cannot_be_vectorized_is_skipped(self):
+        space = ParameterSpace({"a": [1, None]})
+        assert len(space.feasible([lambda c: c["a"] > 0], {})) == 2
+
+    def test_restrict_again(self, space: ParameterSpace):
+        feasible = space.feasible([lambda c: c["a"] == 2], {}).feasible([lambda c: c["c"]], {})
+        assert list(feasible) == [p for p in expected_points() if p["a"] == 2 and p["c"]]
+
+    def test_no_constraints(self, space: ParameterSpace):
+        assert space.feasible([], {}) is space
@@ -19,7 +19,7 @@ import csv
 import tarfile
 from dataclasses import asdict
 from pathlib import Path
-from typing import Any
+from typing import Any, Optional
 
 import pytest
 import toml
@@ -313,6 +313,30 @@ class TestSlurmReportItem:
         [report_item] = ReportItem.from_test_runs([tr], slurm_system.output_path)
         assert report_item.nodes == slurm_metadata.slurm.node_list
 
+    @pytest.mark.parametrize("exit_code,state", [(None, None), ("0", "completed"), ("3", "failed (exit code 3)")])
+    def test_single_sbatch_step_state(
+        self, slurm_system: SlurmSystem, exit_code: Optional[str], state: Optional[str]
+    ) -> None:
+        run_dir = slurm_system.output_path / "run_dir"
+        run_dir.mkdir(parents=True, exist_ok=True)
+        if exit_code is not None:
+            (run_dir / "step-exit-code.txt").write_text(f"{exit_code}\n")
+        tr = TestRun(
+            name="run_dir",
+            test=NCCLTestDefinition(
+                name="nccl",
+                description="NCCL test",
+                test_template_name="NcclTest",
+                cmd_args=NCCLCmdArgs(docker_image_url="fake://url/nccl"),
+            ),
+            num_nodes=1,
+            nodes=["node1"],
+            output_path=run_dir,
+        )
+
+        [report_item] = ReportItem.from_test_runs([tr], slurm_system.output_path)
+        assert report_item.state == state
+
     def test_metadata_for_single_sbatch(self, slurm_system: SlurmSystem, slurm_metadata: SlurmSystemMetadata) -> None:
         run_dir = slurm_system.output_path / "run_dir"
         run_dir.mkdir(parents=True, exist_ok=True)
@@ -25,7 +25,7 @@ import pytest
 import toml
 
 from cloudai.core import Registry, System, TestRun, TestScenario
-from cloudai.systems.slurm import SingleSbatchRunner, SlurmJob, SlurmJobMetadata, SlurmSystem
+from cloudai.systems.slurm import SingleSbatchRunner, SlurmJob, SlurmJobMetadata, SlurmSystem, read_step_exit_code
 from cloudai.workloads.nccl_test import NCCLCmdArgs, NCCLTestDefinition
 from cloudai.workloads.nccl_test.slurm_command_gen_strategy import NcclTestSlurmCommandGenStrategy
 from cloudai.workloads.sleep import SleepCmdArgs, SleepTestDefinition
@@ -231,6 +231,42 @@ class TestTimeLimit:
         assert runner.build_time_limit() == "1-00:10:30"
 
 
+class TestStepPacking:
+    @pytest.fixture
+    def runner(self, sleep_tr: TestRun, slurm_system: SlurmSystem) -> SingleSbatchRunner:
+        slurm_system.step_packing = True
+        sleep_tr.time_limit = "00:10:00"
+        wide_tr = copy.deepcopy(sleep_tr)
+        wide_tr.name, wide_tr.num_nodes, wide_tr.time_limit = "wide", 2, "00:30:00"
+        short_tr = copy.deepcopy(sleep_tr)
+        short_tr.name, short_tr.time_limit = "short", "00:05:00"
+        tc = TestScenario(name="tc", test_runs=[sleep_tr, wide_tr, short_tr])
+        return SingleSbatchRunner(
+            mode="run", system=slurm_system, test_scenario=tc, output_path=slurm_system.output_path
+        )
+
+    def test_steps_run_concurrently(self, runner: SingleSbatchRunner) -> None:
+        sbatch = runner.gen_sbatch_content()
+
+        assert 'CLOUDAI_NODES=($(scontrol show hostnames "$SLURM_JOB_NODELIST"))' in sbatch
+        assert sbatch.count("} &") == 3
+        assert sbatch.count("\nwait\n") == 2
+        first_wave = sbatch.split("# wave 1 of 2")[1].split("wait")[0]
+        assert "--nodelist=${CLOUDAI_NODES[0]} --time=00:10:00" in first_wave
+        assert "--nodelist=${CLOUDAI_NODES[1]} --time=00:05:00" in first_wave
+        second_wave = sbatch.split("# wave 2 of 2")[1]
+        assert "--nodelist=${CLOUDAI_NODES[0]},${CLOUDAI_NODES[1]} --time=00:30:00" in second_wave
+
+    def test_time_limit_is_critical_path(self, runner: SingleSbatchRunner) -> None:
+        assert runner.build_time_limit() == "00:40:00"
+
+    def test_disabled(self, runner: SingleSbatchRunner) -> None:
+        runner.system.step_packing = False
+
+        assert runner.build_time_limit() == "00:45:00"
+        assert "} &" not in runner.gen_sbatch_content()
+
+
 class TestAuxCommands:
     def test_bare_metal(self, sleep_tr: TestRun, slurm_system: SlurmSystem) -> None:
         tc = TestScenario(name="tc", test_runs=[sleep_tr])
@@ -341,6 +377,54 @@ def test_unroll_dse(nccl_tr: TestRun, slurm_system: SlurmSystem) -> None:
     assert dse_runs[1].test.extra_env_vars["NCCL_VAR"] == "v2"
 
 
+class TestExecutionPlan:
+    def test_dse_unrolled_once(self, nccl_tr: TestRun, slurm_system: SlurmSystem) -> None:
+        nccl_tr.test.extra_env_vars["NCCL_VAR"] = ["v1", "v2"]
+        tc = TestScenario(name="tc", test_runs=[nccl_tr])
+        runner = SingleSbatchRunner(
+            mode="run", system=slurm_system, test_scenario=tc, output_path=slurm_system.output_path
+        )
+
+        with patch.object(TestRun, "apply_params_set", autospec=True, side_effect=TestRun.apply_params_set) as apply:
+            runner.gen_sbatch_content()
+            runner.completed_test_runs(SlurmJob(nccl_tr, id=1))
+            runner.build_time_limit()
+
+        assert apply.call_count == 2
+
+    def test_records_steps(self, nccl_tr: TestRun, sleep_tr: TestRun, slurm_system: SlurmSystem) -> None:
+        nccl_tr.test.extra_env_vars["NCCL_VAR"] = ["v1", "v2"]
+        tc = TestScenario(name="tc", test_runs=[nccl_tr, sleep_tr])
+        runner = SingleSbatchRunner(
+            mode="run", system=slurm_system, test_scenario=tc, output_path=slurm_system.output_path
+        )
+
+        plan = runner.plan
+
+        assert runner.plan is plan
+        assert [(run.source, run.step) for run in plan.runs] == [(nccl_tr, 1), (nccl_tr, 2), (sleep_tr, 0)]
+        assert [run.action for run in plan.dse_steps] == [
+            {"extra_env_vars.NCCL_VAR": "v1"},
+            {"extra_env_vars.NCCL_VAR": "v2"},
+        ]
+        assert [run.output_path for run in plan.runs] == [
+            runner.scenario_root / nccl_tr.name / "0" / "1",
+            runner.scenario_root / nccl_tr.name / "0" / "2",
+            runner.scenario_root / sleep_tr.name / "0",
+        ]
+        assert runner.all_trs == [run.tr for run in plan.runs]
+
+    def test_constraint_failures_are_not_scheduled(self, nccl_tr: TestRun, slurm_system: SlurmSystem) -> None:
+        nccl_tr.test.extra_env_vars.update({"NCCL_VAR": ["v1", "v2"], "CONSTRAINT": "1"})
+        tc = TestScenario(name="tc", test_runs=[nccl_tr])
+        runner = SingleSbatchRunner(
+            mode="run", system=slurm_system, test_scenario=tc, output_path=slurm_system.output_path
+        )
+
+        assert runner.all_trs == []
+        assert [run.step for run in runner.plan.dse_steps] == [1, 2]
+
+
 def test_unroll_dse_constraint_check(nccl_tr: TestRun, slurm_system: SlurmSystem) -> None:
     nccl_tr.test.extra_env_vars["CONSTRAINT"] = "1"
     tc = TestScenario(name="tc", test_runs=[nccl_tr])
@@ -392,8 +476,10 @@ class TestSbatch:
                 runner.get_global_env_vars(),
                 "",
                 runner.get_single_tr_block(nccl_tr),
+                runner.step_exit_code_cmd(nccl_tr),
                 "",
                 runner.get_single_tr_block(sleep_tr),
+                runner.step_exit_code_cmd(sleep_tr),
                 "",
             ]
         )
@@ -433,8 +519,10 @@ class TestSbatch:
                 runner.get_global_env_vars(),
                 "",
                 runner.get_single_tr_block(dse_runs[0]),
+                runner.step_exit_code_cmd(dse_runs[0]),
                 "",
                 runner.get_single_tr_block(dse_runs[1]),
+                runner.step_exit_code_cmd(dse_runs[1]),
                 "",
             ]
         )
@@ -473,10 +561,13 @@ class TestSbatch:
                 runner.get_global_env_vars(),
                 "",
                 runner.get_single_tr_block(dse_runs[0]),
+                runner.step_exit_code_cmd(dse_runs[0]),
                 "",
                 runner.get_single_tr_block(dse_runs[1]),
+                runner.step_exit_code_cmd(dse_runs[1]),
                 "",
                 runner.get_single_tr_block(nccl_tr),
+                runner.step_exit_code_cmd(nccl_tr),
                 "",
             ]
         )
@@ -569,3 +660,39 @@ def test_trajectory_saved(dse_tr: TestRun, slurm_system: SlurmSystem) -> None:
     df = pd.read_csv(trajectory_path)
     assert df.shape[0] == len(dse_tr.all_combinations)
     assert df["step"].tolist() == list(range(1, len(dse_tr.all_combinations) + 1))
+
+
+class TestStepProgress:
+    def test_trajectory_written_when_steps_end(self, dse_tr: TestRun, slurm_system: SlurmSystem) -> None:
+        tc = TestScenario(name="tc", test_runs=[dse_tr])
+        runner = SingleSbatchRunner(
+            mode="run", system=slurm_system, test_scenario=tc, output_path=slurm_system.output_path
+        )
+        trajectory_path = runner.scenario_root / dse_tr.name / "0" / "trajectory.csv"
+        trajectory_path.unlink(missing_ok=True)
+        runs = runner.plan.runs
+
+        runner.handle_completed_steps()
+        assert not trajectory_path.exists()
+
+        (runs[1].output_path / "step-exit-code.txt").write_text("0\n")
+        runner.handle_completed_steps()
+        runner.handle_completed_steps()
+
+        assert pd.read_csv(trajectory_path)["step"].tolist() == [2]
+        assert (runner.scenario_root / f"{tc.name}.html").exists()
+
+        runner.handle_dse()
+
+        assert pd.read_csv(trajectory_path)["step"].tolist() == [run.step for run in runs]
+
+    def test_exit_code_recorded_by_script(self, sleep_tr: TestRun, slurm_system: SlurmSystem) -> None:
+        tc = TestScenario(name="tc", test_runs=[sleep_tr])
+        runner = SingleSbatchRunner(
+            mode="run", system=slurm_system, test_scenario=tc, output_path=slurm_system.output_path
+        )
+
+        sbatch = runner.gen_sbatch_content()
+
+        assert f"echo $? > {sleep_tr.output_path.absolute()}/step-exit-code.txt" in sbatch.splitlines()
+        assert read_step_exit_code(sleep_tr.output_path) is None
@@ -0,0 +1,179 @@
+# SPDX-FileCopyrightText: NVIDIA CORPORATION & AFFILIATES
+# Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+from pathlib import Path
+from typing import cast
+
+import pytest
+
+from cloudai.core import (
+    BaseInstaller,
+    DockerImage,
+    Installable,
+    InstallStatusResult,
+    StreamingInstall,
+    TestRun,
+    TestScenario,
+)
+from cloudai.models.workload import CmdArgs
+from cloudai.systems.slurm import SlurmSystem
+
+from .test_base_runner import MyRunner, MyWorkload
+
+
+class ImageWorkload(MyWorkload):
+    image: DockerImage
+
+    @property
+    def installables(self) -> list[Installable]:
+        return [self.image]
+
+
+class GatedInstaller(BaseInstaller):
+    """Installs items once their gate is opened, images named 'broken' fail."""
+
+    def __init__(self, system: SlurmSystem):
+        super().__init__(system)
+        self.gates: dict[str, threading.Event] = {}
+        self.installed: list[Installable] = []
+
+    def install_one(self, item: Installable) -> InstallStatusResult:
+        if isinstance(item, DockerImage):
+            if not self.gates.setdefault(item.url, threading.Event()).wait(timeout=5):
+                return InstallStatusResult(False, "gate timeout")
+            if item.url == "broken":
+                return InstallStatusResult(False, "import failed")
+        self.installed.append(item)
+        return InstallStatusResult(True)
+
+    def uninstall_one(self, item: Installable) -> InstallStatusResult:
+        return InstallStatusResult(True)
+
+    def is_installed_one(self, item: Installable) -> InstallStatusResult:
+        return InstallStatusResult(True)
+
+    def mark_as_installed_one(self, item: Installable) -> InstallStatusResult:
+        if isinstance(item, DockerImage):
+            item.installed_path = Path("/cache") / item.cache_filename
+        return InstallStatusResult(True)
+
+
+@pytest.fixture
+def installer(slurm_system: SlurmSystem) -> GatedInstaller:
+    installer = GatedInstaller(slurm_system)
+    installer._check_low_thread_environment = lambda threshold=None: False
+    return installer
+
+
+def image_test_run(name: str, image: str) -> TestRun:
+    test = ImageWorkload(
+        name=name, description="d", test_template_name="wrk", cmd_args=CmdArgs(), image=DockerImage(image)
+    )
+    return TestRun(name, test, 1, [])
+
+
+def make_runner(slurm_system: SlurmSystem, installation: StreamingInstall, trs: list[TestRun]) -> MyRunner:
+    runner = MyRunner("dry-run", slurm_system, TestScenario(name="scenario", test_runs=trs), slurm_system.output_path)
+    runner.installation = installation
+    return runner
+
+
+class TestStreamingInstall:
+    def test_status_follows_installation(self, installer: GatedInstaller):
+        tr = image_test_run("tr", "fake/img")
+        installation = StreamingInstall(installer, tr.test.installables)
+
+        installation.start()
+        assert installation.status(tr) is None
+
+        installer.gates.setdefault("fake/img", threading.Event()).set()
+        assert installation.wait().success
+        status = installation.status(tr)
+        assert status is not None and status.success
+        assert cast(ImageWorkload, tr.test).image.installed_path is not None
+
+    def test_status_of_failed_item(self, installer: GatedInstaller):
+        tr = image_test_run("tr", "broken")
+        installer.gates["broken"] = threading.Event()
+        installer.gates["broken"].set()
+        installation = StreamingInstall(installer, tr.test.installables)
+
+        installation.start()
+        assert not installation.wait().success
+
+        status = installation.status(tr)
+        assert status is not None and not status.success
+        assert "import failed" in status.message
+
+    def test_status_when_installation_stopped_early(self, installer: GatedInstaller):
+        tr = image_test_run("tr", "fake/img")
+        installer._check_prerequisites = lambda: InstallStatusResult(False, "no git")
+        installation = StreamingInstall(installer, tr.test.installables)
+
+        installation.start()
+        installation.wait()
+
+        status = installation.status(tr)
+        assert status is not None and not status.success
+        assert status.message == "no git"
+
+
+class TestRunnerWithStreamingInstall:
+    def test_ready_test_starts_before_others_are_installed(self, installer: GatedInstaller, slurm_system: SlurmSystem):
+        fast, slow = image_test_run("fast", "fast/img"), image_test_run("slow", "slow/img")
+        installer.gates["fast/img"] = threading.Event()
+        installer.gates["fast/img"].set()
+        installer.gates["slow/img"] = threading.Event()
+        installation = StreamingInstall(installer, [*fast.test.installables, *slow.test.installables])
+        runner = make_runner(slurm_system, installation, [fast, slow])
+        submit = runner._submit_test
+
+        def submit_and_open_gate(tr: TestRun):
+            installer.gates["slow/img"].set()
+            return submit(tr)
+
+        runner._submit_test = submit_and_open_gate
+
+        installation.start()
+        runner.run()
+
+        assert [tr.name for tr in runner.submitted_trs] == ["fast", "slow"]
+        assert installation.wait().success
+        assert not runner.awaiting_install
+
+    def test_failed_install_skips_only_its_test(self, installer: GatedInstaller, slurm_system: SlurmSystem):
+        good, bad = image_test_run("good", "good/img"), image_test_run("bad", "broken")
+        for url in ("good/img", "broken"):
+            installer.gates[url] = threading.Event()
+            installer.gates[url].set()
+        installation = StreamingInstall(installer, [*good.test.installables, *bad.test.installables])
+        runner = make_runner(slurm_system, installation, [good, bad])
+
+        installation.start()
+        runner.run()
+
+        assert [tr.name for tr in runner.submitted_trs] == ["good"]
+        assert not installation.wait().success
+
+    def test_waiting_test_is_scheduled(self, installer: GatedInstaller, slurm_system: SlurmSystem):
+        tr = image_test_run("tr", "slow/img")
+        runner = make_runner(slurm_system, StreamingInstall(installer, tr.test.installables), [tr])
+
+        assert runner.installed_test_runs([tr]) == []
+        assert runner.is_scheduled_or_submitted(tr)
+        assert runner.installed_test_runs([tr]) == []
+        assert runner.awaiting_install == [tr]
@@ -0,0 +1,140 @@
+# SPDX-FileCopyrightText: NVIDIA CORPORATION & AFFILIATES
+# Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from pathlib import Path
+from subprocess import CompletedProcess
+from unittest.mock import patch
+
+import pytest
+
+from cloudai.core import UvConfig, UvEnvBuilder
+
+
+@pytest.fixture
+def cache_dir(tmp_path: Path) -> Path:
+    return tmp_path / ".uv-cache"
+
+
+@pytest.fixture
+def venv(tmp_path: Path) -> Path:
+    return tmp_path / "venv"
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> Path:
+    path = tmp_path / "project"
+    path.mkdir()
+    (path / "requirements.txt").write_text("numpy\n")
+    return path
+
+
+def run_uv(builder: UvEnvBuilder, method: str, *args: Path, returncode: int = 0) -> tuple:
+    with (
+        patch("shutil.which", return_value="/usr/bin/uv"),
+        patch("subprocess.run", return_value=CompletedProcess(args=[], returncode=returncode, stderr="err")) as run,
+    ):
+        res = getattr(builder, method)(*args)
+    return res, [call.args[0] for call in run.call_args_list]
+
+
+class TestUvEnvBuilder:
+    def test_create_venv(self, cache_dir: Path, venv: Path):
+        builder = UvEnvBuilder(cache_dir, UvConfig(python="python3.12"))
+
+        res, cmds = run_uv(builder, "create_venv", venv)
+
+        assert res.success
+        assert cmds == [["uv", "--cache-dir", str(cache_dir), "venv", "--seed", "--python", "python3.12", str(venv)]]
+
+    def test_create_venv_from_wheelhouse(self, cache_dir: Path, venv: Path, tmp_path: Path):
+        builder = UvEnvBuilder(cache_dir, UvConfig(wheelhouse=tmp_path / "wheels"))
+
+        _, cmds = run_uv(builder, "create_venv", venv)
+
+        assert cmds[0][3:6] == ["venv", "--seed", "--python"]
+        assert cmds[0][-5:] == ["--offline", "--no-index", "--find-links", str(tmp_path / "wheels"), str(venv)]
+
+    def test_create_venv_without_uv(self, cache_dir: Path, venv: Path):
+        with patch("shutil.which", return_value=None):
+            res = UvEnvBuilder(cache_dir, UvConfig()).create_venv(venv)
+
+        assert not res.success
+        assert "uv is not found in PATH" in res.message
+
+    def test_create_venv_failure_cleans_up(self, cache_dir: Path, venv: Path):
+        venv.mkdir()
+
+        res, _ = run_uv(UvEnvBuilder(cache_dir, UvConfig()), "create_venv", venv, returncode=1)
+
+        assert not res.success
+        assert "uv venv failed" in res.message
+        assert not venv.exists()
+
+    def test_install_requirements(self, cache_dir: Path, venv: Path, project: Path):
+        builder = UvEnvBuilder(cache_dir, UvConfig())
+
+        res, cmds = run_uv(builder, "install_requirements", venv, project / "requirements.txt")
+
+        assert res.success
+        assert cmds == [
+            [
+                *["uv", "--cache-dir", str(cache_dir), "pip", "install"],
+                *["--python", str(venv / "bin" / "python"), "--link-mode", "hardlink"],
+                *["-r", str(project / "requirements.txt")],
+            ]
+        ]
+
+    def test_wheelhouse_is_offline(self, cache_dir: Path, venv: Path, project: Path, tmp_path: Path):
+        builder = UvEnvBuilder(cache_dir, UvConfig(wheelhouse=tmp_path / "wheels"))
+
+        _, cmds = run_uv(builder, "install_pyproject", venv, project)
+
+        assert cmds[0][-5:] == ["--offline", "--no-index", "--find-links", str(tmp_path / "wheels"), str(project)]
+
+    def test_requirements_lockfile_is_synced(self, cache_dir: Path, venv: Path, project: Path):
+        (project / "requirements.lock").write_text("numpy==2.0.0\n")
+        builder = UvEnvBuilder(cache_dir, UvConfig(lockfile="requirements.lock"))
+
+        res, cmds = run_uv(builder, "install_requirements", venv, project / "requirements.txt")
+
+        assert res.success
+        assert len(cmds) == 1
+        assert cmds[0][3:5] == ["pip", "sync"]
+        assert cmds[0][-1] == str(project / "requirements.lock")
+
+    def test_pyproject_lockfile_installs_project_without_deps(self, cache_dir: Path, venv: Path, project: Path):
+        (project / "requirements.lock").write_text("numpy==2.0.0\n")
+        builder = UvEnvBuilder(cache_dir, UvConfig(lockfile="requirements.lock"))
+
+        res, cmds = run_uv(builder, "install_pyproject", venv, project)
+
+        assert res.success
+        assert [cmd[3:5] for cmd in cmds] == [["pip", "sync"], ["pip", "install"]]
+        assert cmds[1][-2:] == ["--no-deps", str(project)]
+
+    def test_missing_lockfile_falls_back_to_resolution(self, cache_dir: Path, venv: Path, project: Path):
+        builder = UvEnvBuilder(cache_dir, UvConfig(lockfile="requirements.lock"))
+
+        res, cmds = run_uv(builder, "install_requirements", venv, project / "requirements.txt")
+
+        assert res.success
+        assert cmds[0][3:5] == ["pip", "install"]
+
+    def test_step_timing_is_logged(self, cache_dir: Path, venv: Path, caplog: pytest.LogCaptureFixture):
+        with caplog.at_level("INFO"):
+            run_uv(UvEnvBuilder(cache_dir, UvConfig()), "create_venv", venv)
+
+        assert f"uv venv for {venv.name} took" in caplog.text
@@ -105,3 +105,63 @@ class TestNeMoRunSlurmCommandGenStrategy:
         with caplog.at_level(logging.WARNING):
             cmd_gen_strategy.generate_test_command()
         assert "Mismatch in num_nodes" in caplog.text
+
+
+class TestNeMoRunConstraints:
+    @pytest.fixture
+    def test_run(self, tmp_path: Path) -> TestRun:
+        tdef = NeMoRunTestDefinition(
+            name="t1",
+            description="desc1",
+            test_template_name="tt",
+            cmd_args=NeMoRunCmdArgs(
+                docker_image_url="nvcr.io/nvidia/nemo:24.09",
+                task="pretrain",
+                recipe_name="llama_3b",
+                num_layers=8,
+                trainer=Trainer(strategy=TrainerStrategy(context_parallel_size=1)),
+                data=Data(global_batch_size=16),
+            ),
+        )
+        return TestRun(test=tdef, num_nodes=2, nodes=[], output_path=tmp_path / "output", name="test-job")
+
+    def test_grid_constraints_use_num_nodes_of_test_run(self, test_run: TestRun) -> None:
+        test_run.test.cmd_args.trainer.strategy.tensor_model_parallel_size = [8, 16, 32]
+
+        feasible = test_run.feasible_combinations(None)
+
+        assert list(feasible) == [
+            {"trainer.strategy.tensor_model_parallel_size": 8},
+            {"trainer.strategy.tensor_model_parallel_size": 16},
+        ]
+        for combination in feasible:
+            trial = test_run.apply_params_set(combination)
+            assert trial.test.constraint_check(trial, None)
+
+    def test_grid_constraints_reject_zero_model_parallel(self, test_run: TestRun) -> None:
+        test_run.test.cmd_args.trainer.strategy.tensor_model_parallel_size = [0, 2]
+        test_run.test.cmd_args.trainer.strategy.pipeline_model_parallel_size = [0, 1]
+
+        feasible = test_run.feasible_combinations(None)
+
+        assert list(feasible) == [
+            {"trainer.strategy.tensor_model_parallel_size": 2, "trainer.strategy.pipeline_model_parallel_size": 1}
+        ]
+
+    def test_grid_constraints_reject_zero_pipeline_with_virtual_pipeline(self, test_run: TestRun) -> None:
+        test_run.test.cmd_args.trainer.strategy.pipeline_model_parallel_size = [0, 2]
+        test_run.test.cmd_args.trainer.strategy.virtual_pipeline_model_parallel_size = [0, 2, 3]
+
+        feasible = test_run.feasible_combinations(None)
+
+        assert list(feasible) == [
+            {
+                "trainer.strategy.pipeline_model_parallel_size": 2,
+                "trainer.strategy.virtual_pipeline_model_parallel_size": 2,
+            }
+        ]
+
+    def test_constraint_check_rejects_zero_sizes(self, test_run: TestRun) -> None:
+        test_run.test.cmd_args.trainer.strategy.pipeline_model_parallel_size = 0
+
+        assert test_run.test.constraint_check(test_run, None) is False
@@ -162,6 +162,26 @@ def test_extract_timings_valid_file(tmp_path: Path) -> None:
     assert timings == [12.65, 12.66], "Timings extraction failed for valid file."
 
 
+def test_extract_timings_of_growing_file(tmp_path: Path) -> None:
+    stdout_file = tmp_path / "stdout.txt"
+    stdout_file.write_text("Training epoch 0, iteration 17/99 | train_step_timing in s: 12.64 | global_step: 17\n")
+    assert extract_timings(stdout_file) == []
+
+    with stdout_file.open("a") as f:
+        f.write("Training epoch 0, iteration 18/99 | train_step_timing in s: 12.65 | global_step: 18\n")
+
+    assert extract_timings(stdout_file) == [12.65], "partial results are parsed again once the file grows"
+
+
+def test_get_progress(slurm_system: SlurmSystem, nemo_tr: TestRun) -> None:
+    strategy = NeMoRunReportGenerationStrategy(slurm_system, nemo_tr)
+    assert strategy.get_progress() == 28
+    assert nemo_tr.get_progress(slurm_system) == 28
+
+    (nemo_tr.output_path / "stdout.txt").write_text("Starting training\n")
+    assert strategy.get_progress() is None
+
+
 def test_extract_timings_missing_file(tmp_path: Path) -> None:
     stdout_file = tmp_path / "missing_stdout.txt"
 
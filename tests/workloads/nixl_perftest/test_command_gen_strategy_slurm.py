@@ -200,6 +200,21 @@ def test_constraint_check(
     assert nixl_perftest.constraint_check(test_run, None) is res
 
 
+def test_grid_constraints(nixl_perftest: NixlPerftestTestDefinition, test_run: TestRun) -> None:
+    nixl_perftest.cmd_args.decode_tp = [1, 2, 4]
+    nixl_perftest.cmd_args.num_decode_nodes = [1, 2]
+    nixl_perftest.cmd_args.prefill_tp = [1, 2]
+
+    feasible = test_run.feasible_combinations(None)
+
+    assert list(feasible) == [
+        {"decode_tp": 1, "num_decode_nodes": 1, "prefill_tp": 1},
+        {"decode_tp": 2, "num_decode_nodes": 1, "prefill_tp": 2},
+        {"decode_tp": 2, "num_decode_nodes": 2, "prefill_tp": 1},
+        {"decode_tp": 4, "num_decode_nodes": 2, "prefill_tp": 2},
+    ]
+
+
 def test_get_etcd_srun_command_with_etcd_image(test_run: TestRun, slurm_system: SlurmSystem):
     strategy = NixlPerftestSlurmCommandGenStrategy(slurm_system, test_run)
     tdef: NixlPerftestTestDefinition = cast(NixlPerftestTestDefinition, test_run.test)